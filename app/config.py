@@ -1,4 +1,5 @@
 import os
+from typing import List, Optional
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -30,6 +31,131 @@ class Settings(BaseSettings):
 
     print("DATABASE_URL:", DATABASE_URL)
 
+    # 워커(프로세스)당 DB 연결 풀 크기
+    DB_POOL_MIN_SIZE: int = int(os.getenv("DB_POOL_MIN_SIZE", "5"))
+    DB_POOL_MAX_SIZE: int = int(os.getenv("DB_POOL_MAX_SIZE", "20"))
+    # 종료 시 사용 중인 연결 반환을 기다리는 최대 시간 (초), 넘으면 강제로 끊음
+    DB_POOL_CLOSE_TIMEOUT_SECONDS: float = float(
+        os.getenv("DB_POOL_CLOSE_TIMEOUT_SECONDS", "10")
+    )
+
+    # 프로덕션 서버(python -m app.server) 워커 수 (0이면 사용 가능한 CPU 수)
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "0"))
+    # 모든 워커가 합쳐서 열 수 있는 최대 DB 연결 수 (0이면 Postgres max_connections에서 계산)
+    # 워커당 풀 max_size = min(DB_POOL_MAX_SIZE, DB_CONNECTION_BUDGET // 워커 수)
+    DB_CONNECTION_BUDGET: int = int(os.getenv("DB_CONNECTION_BUDGET", "0"))
+    # 예산을 계산할 때 남겨 둘 연결 수 (마이그레이션, psql, 다른 서비스 등)
+    DB_CONNECTION_RESERVE: int = int(os.getenv("DB_CONNECTION_RESERVE", "10"))
+    # 워커 종료 / 재시작 시 처리 중인 요청을 기다리는 최대 시간 (초)
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: float = float(
+        os.getenv("SERVER_GRACEFUL_TIMEOUT_SECONDS", "30")
+    )
+
+    # 요청 처리 시간 예산 (초). 클라이언트는 X-Request-Timeout-Ms 헤더로 더 짧게만 지정 가능
+    REQUEST_TIMEOUT_SECONDS: float = float(os.getenv("REQUEST_TIMEOUT_SECONDS", "10"))
+    # 외부 AI 검증(Vision / Gemini)을 거치는 요청의 처리 시간 예산 (초)
+    AI_REQUEST_TIMEOUT_SECONDS: float = float(
+        os.getenv("AI_REQUEST_TIMEOUT_SECONDS", "30")
+    )
+
+    # 비용이 큰 경로 그룹별 동시 실행 수 / 대기열 크기 (워커 프로세스 단위)
+    ADMISSION_UPLOAD_CONCURRENCY: int = int(
+        os.getenv("ADMISSION_UPLOAD_CONCURRENCY", "4")
+    )
+    ADMISSION_UPLOAD_QUEUE_SIZE: int = int(
+        os.getenv("ADMISSION_UPLOAD_QUEUE_SIZE", "16")
+    )
+    ADMISSION_RANDOM_DRAW_CONCURRENCY: int = int(
+        os.getenv("ADMISSION_RANDOM_DRAW_CONCURRENCY", "8")
+    )
+    ADMISSION_RANDOM_DRAW_QUEUE_SIZE: int = int(
+        os.getenv("ADMISSION_RANDOM_DRAW_QUEUE_SIZE", "32")
+    )
+    ADMISSION_LOGIN_CONCURRENCY: int = int(
+        os.getenv("ADMISSION_LOGIN_CONCURRENCY", "4")
+    )
+    ADMISSION_LOGIN_QUEUE_SIZE: int = int(os.getenv("ADMISSION_LOGIN_QUEUE_SIZE", "32"))
+    # 내보내기는 끝날 때까지 DB 연결을 하나씩 점유
+    ADMISSION_EXPORT_CONCURRENCY: int = int(
+        os.getenv("ADMISSION_EXPORT_CONCURRENCY", "2")
+    )
+    ADMISSION_EXPORT_QUEUE_SIZE: int = int(
+        os.getenv("ADMISSION_EXPORT_QUEUE_SIZE", "4")
+    )
+    # 대기열에서 기다리는 최대 시간 (초), 넘으면 503
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = float(
+        os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "5")
+    )
+
+    # 내보내기(스트리밍 응답)에서 서버 측 커서로 한 번에 읽는 행 수
+    EXPORT_CHUNK_ROWS: int = int(os.getenv("EXPORT_CHUNK_ROWS", "1000"))
+
+    # Idempotency-Key 결과 보관 시간 (초), 지나면 같은 키로 다시 처리
+    IDEMPOTENCY_KEY_TTL_SECONDS: float = float(
+        os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400")
+    )
+    # 처리 중인 채로 이 시간을 넘긴 키는 중단된 것으로 보고 다른 요청이 이어받음 (초)
+    # AI_REQUEST_TIMEOUT_SECONDS보다 길게 설정할 것
+    IDEMPOTENCY_LOCK_TIMEOUT_SECONDS: float = float(
+        os.getenv("IDEMPOTENCY_LOCK_TIMEOUT_SECONDS", "60")
+    )
+    # 완료된 결과를 메모리에 보관할 최대 개수 (워커 프로세스 단위)
+    IDEMPOTENCY_CACHE_SIZE: int = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000"))
+
+    # 동기화(GET /api/sync) 삭제 기록 보관 기간 (일)
+    # 이보다 오래 동기화하지 않은 클라이언트는 전체 데이터를 다시 받음 (reset)
+    SYNC_TOMBSTONE_RETENTION_DAYS: float = float(
+        os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30")
+    )
+
+    # 스탬프 리더보드: 워커 메모리 순위표를 점수 테이블로 다시 만드는 간격 (초)
+    # 같은 워커에서 생긴 스탬프는 바로, 다른 워커의 스탬프는 이 간격 안에 반영됨
+    LEADERBOARD_REBUILD_SECONDS: float = float(
+        os.getenv("LEADERBOARD_REBUILD_SECONDS", "60")
+    )
+
+    # 조회 결과 캐시
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() in ("1", "true")
+    # 캐시 값 유지 시간 (초). 쓰기 시 태그 무효화로 바로 지워짐
+    CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+    # 공유 캐시 Redis URL (비어 있으면 워커 프로세스 메모리 캐시만 사용)
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
+    # 프로세스 메모리 캐시 최대 개수 / 유지 시간 (초)
+    # 다른 워커의 무효화는 보이지 않으므로 짧게 유지
+    CACHE_LOCAL_MAX_ENTRIES: int = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "10000"))
+    CACHE_LOCAL_TTL_SECONDS: float = float(os.getenv("CACHE_LOCAL_TTL_SECONDS", "5"))
+    # 조기 갱신 강도 (클수록 만료 전에 더 일찍 다시 계산, 0이면 사용 안 함)
+    CACHE_EARLY_REFRESH_BETA: float = float(os.getenv("CACHE_EARLY_REFRESH_BETA", "1"))
+
+    # 워커 간 캐시 무효화 버스 (Postgres LISTEN/NOTIFY, 워커마다 DB 연결 1개 추가 사용)
+    # 연결되어 있는 동안은 프로세스 메모리 캐시도 CACHE_TTL_SECONDS까지 유지
+    CACHE_INVALIDATION_BUS_ENABLED: bool = os.getenv(
+        "CACHE_INVALIDATION_BUS_ENABLED", "true"
+    ).lower() in ("1", "true")
+    # LISTEN 연결 상태 확인 간격 (초)
+    CACHE_INVALIDATION_BUS_CHECK_INTERVAL_SECONDS: float = float(
+        os.getenv("CACHE_INVALIDATION_BUS_CHECK_INTERVAL_SECONDS", "5")
+    )
+
+    # 디버그 모드 (요청별 DB 사용량을 응답 헤더로 노출)
+    DEBUG: bool = os.getenv("DEBUG", "false").lower() in ("1", "true")
+
+    # 읽기 전용 복제본 DSN 목록 (쉼표로 구분, 비어 있으면 모든 쿼리가 primary로)
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")
+    # 이보다 지연된 복제본은 읽기에서 제외 (초)
+    REPLICA_MAX_LAG_SECONDS: float = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = float(
+        os.getenv("REPLICA_LAG_CHECK_INTERVAL_SECONDS", "1")
+    )
+    # 지연 측정(연결 / 쿼리) 제한 시간 (초). 넘기면 응답하지 않는 복제본으로 보고 읽기에서 제외
+    REPLICA_LAG_CHECK_TIMEOUT_SECONDS: float = float(
+        os.getenv("REPLICA_LAG_CHECK_TIMEOUT_SECONDS", "1")
+    )
+    # 쓰기 직후 이 시간 동안은 해당 사용자의 읽기를 primary로 (read-your-writes)
+    # REPLICA_MAX_LAG_SECONDS + REPLICA_LAG_CHECK_INTERVAL_SECONDS 이상으로 설정할 것
+    # 다른 워커가 받은 다음 요청에는 서명된 쿠키로 쓰기 시각을 전달 (ReadYourWritesMiddleware)
+    REPLICA_STICKY_SECONDS: float = float(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+
     # 테스트용 SQLite 데이터베이스 URL
     TEST_DATABASE_URL: str = "sqlite:///./test.db"
 
@@ -37,6 +163,16 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY") or "this-is-a-super-secret-key"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 리프레시 토큰 세션 유지 기간 (일, 갱신해도 연장되지 않음)
+    REFRESH_TOKEN_EXPIRE_DAYS: float = float(
+        os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14")
+    )
+    # 교체된 직전 리프레시 토큰의 재시도를 탈취로 보지 않는 시간 (초)
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: float = float(
+        os.getenv("REFRESH_TOKEN_REUSE_GRACE_SECONDS", "10")
+    )
+    # 워커마다 기억하는 최근 갱신 결과 수
+    SESSION_CACHE_SIZE: int = int(os.getenv("SESSION_CACHE_SIZE", "10000"))
 
     # GOOGLE OAuth 설정
     GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID") or ""
@@ -44,12 +180,27 @@ class Settings(BaseSettings):
     GOOGLE_REDIRECT_URI: str = (
         os.getenv("GOOGLE_REDIRECT_URI") or "http://localhost:8000/api/google/callback"
     )
+    # OpenID discovery 문서 (JWKS / 토큰 엔드포인트 위치, 응답 캐시 헤더만큼 캐시)
+    GOOGLE_DISCOVERY_URL: str = os.getenv(
+        "GOOGLE_DISCOVERY_URL",
+        "https://accounts.google.com/.well-known/openid-configuration",
+    )
+    # discovery 문서 / JWKS 요청 timeout (초)
+    GOOGLE_OPENID_TIMEOUT_SECONDS: float = float(
+        os.getenv("GOOGLE_OPENID_TIMEOUT_SECONDS", "5")
+    )
 
     # SESSION 미들웨어 설정
     SESSION_SECRET_KEY: str = os.getenv("SESSION_SECRET_KEY", "default-secret-key")
 
     # Gemini
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+    GOOGLE_API_KEY: Optional[str] = os.getenv("GOOGLE_API_KEY")
+
+    @property
+    def replica_urls(self) -> List[str]:
+        return [
+            dsn.strip() for dsn in self.DATABASE_REPLICA_URLS.split(",") if dsn.strip()
+        ]
 
 
 settings = Settings()
@@ -7,6 +7,7 @@ from fastapi import (
     Depends,
     File,
     Form,
+    Header,
     HTTPException,
     Response,
     UploadFile,
@@ -19,6 +20,7 @@ from app.core.auth import (
     get_current_superuser,
     verify_superuser_token,
 )
+from app.core.etag import is_not_modified, make_etag, not_modified, set_etag
 from app.models.challenge_model import (
     ChallengeCreate,
     ChallengeCreateResponse,
@@ -33,9 +35,10 @@ from app.models.decoration_model import (
     LandscapeType,
 )
 from app.models.stamp_model import StampType
-from app.models.user_model import User
+from app.models.user_model import TokenUser
 from app.services.challenge_service import ChallengeService
 from app.services.decoration_service import DecorationService
+from app.services.user_data_version_service import UserDataVersionService
 
 router = APIRouter(
     prefix="/api/challenges",
@@ -49,7 +52,7 @@ router = APIRouter(
 )
 async def create_challenge(
     challenge_data: ChallengeCreate,
-    user: User = Depends(get_current_active_user),
+    user: TokenUser = Depends(get_current_active_user),
 ) -> Optional[ChallengeCreateResponse]:
     """Challenge 생성 엔드포인트"""
 
@@ -92,19 +95,30 @@ async def create_challenge(
 # Form 데이터는 따로 Request model을 만들지 않음.
 @router.get("/", response_model=List[ChallengeResponse], status_code=status.HTTP_200_OK)
 async def get_challenges(
-    user: User = Depends(get_current_active_user),
+    response: Response,
+    user: TokenUser = Depends(get_current_active_user),
+    if_none_match: Optional[str] = Header(None),
 ) -> Union[List[ChallengeResponse], Response]:
     """
     Challenge 조회 엔드포인트
+    - 응답에 ETag(사용자 챌린지 데이터 버전)를 붙이고, If-None-Match가 일치하면 조인 없이 304
     """
     # 챌린지 및 스탬프 한 번에 조회 (uid로)
     # uid로부터 챌린지 테이블을 먼저 조회하니 ChallengeService에서 처리
     try:
+        versions = await UserDataVersionService.get_by_uid(user.id)
+        etag = make_etag("challenges", user.id, versions.challenges_version)
+        if is_not_modified(if_none_match, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
         challenge_with_stamps = await ChallengeService.get_challenge_response_by_uid(
-            user.id
+            user.id, version=versions.challenges_version
         )
         if not challenge_with_stamps:
-            return Response(status_code=status.HTTP_204_NO_CONTENT)
+            return Response(
+                status_code=status.HTTP_204_NO_CONTENT, headers=response.headers
+            )
     except Exception as e:
         print(f"ERROR: {traceback.format_exc()}")
         raise HTTPException(
@@ -1,9 +1,11 @@
 import traceback
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 
 from app.core.auth import get_current_active_user
+from app.core.etag import is_not_modified, make_etag, not_modified, set_etag
+from app.core.idempotency import IDEMPOTENCY_KEY_HEADER, fingerprint, run_idempotent
 from app.models.decoration_model import DecorationInDB, DecorationReference
 from app.models.decoration_user_model import (
     CreateDecorationUserResponse,
@@ -11,8 +13,9 @@ from app.models.decoration_user_model import (
     GetDecorationUserResponse,
     UIDDecorationUserRequest,
 )
-from app.models.user_model import User
+from app.models.user_model import TokenUser
 from app.services.decoration_user_service import DecorationUserService
+from app.services.user_data_version_service import UserDataVersionService
 
 router = APIRouter(
     prefix="/api/users/decorations",  # localhost:80
@@ -25,12 +28,25 @@ router = APIRouter(
 # 유저가 소유한 것이니 api/users/decorations/로 접근
 @router.get("/", response_model=GetDecorationUserResponse)
 async def get_user_decorations(
-    user: User = Depends(get_current_active_user),
-) -> GetDecorationUserResponse:
-    """사용자의 장식 목록 조회 엔드포인트"""
+    response: Response,
+    user: TokenUser = Depends(get_current_active_user),
+    if_none_match: Optional[str] = Header(None),
+) -> Union[GetDecorationUserResponse, Response]:
+    """
+    사용자의 장식 목록 조회 엔드포인트
+    - 응답에 ETag(사용자 장식 데이터 버전)를 붙이고, If-None-Match가 일치하면 304
+    """
     uid_request = UIDDecorationUserRequest(uid=user.id)
     try:
-        decorations = await DecorationUserService.get_by_user_id(uid_request.uid)
+        versions = await UserDataVersionService.get_by_uid(uid_request.uid)
+        etag = make_etag("decorations", uid_request.uid, versions.decorations_version)
+        if is_not_modified(if_none_match, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
+        decorations = await DecorationUserService.get_by_user_id(
+            uid_request.uid, version=versions.decorations_version
+        )
         return GetDecorationUserResponse(decorations=decorations)
     except Exception as e:
         print(f"ERROR: {traceback.format_exc()}")
@@ -44,7 +60,7 @@ async def get_user_decorations(
 async def add_decoration_user(
     uid_request: UIDDecorationUserRequest,
     decoration_ref: DecorationReference,
-    user: User = Depends(get_current_active_user),
+    user: TokenUser = Depends(get_current_active_user),
 ) -> CreateDecorationUserResponse:
     """장식 생성 엔드포인트"""
 
@@ -76,13 +92,15 @@ async def add_decoration_user(
 @router.post("/random", response_model=DecorationInDB)
 async def draw_random_decoration(
     uid_request: UIDDecorationUserRequest,
-    user: User = Depends(get_current_active_user),
+    user: TokenUser = Depends(get_current_active_user),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER),
 ) -> DecorationInDB:
     """
     사용자가 갖지 않은 랜덤 장식 뽑기 엔드포인트
     - uid, token 필요
     - return: 사용자가 얻은 랜덤 장식
     - 랜덤 장식은 DecorationInDB 모델로 반환
+    - Idempotency-Key 헤더를 보내면 같은 키의 재시도는 다시 뽑지 않고 처음 뽑은 장식을 반환
     """
 
     if user.id != uid_request.uid:
@@ -90,6 +108,18 @@ async def draw_random_decoration(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="사용자 ID가 일치하지 않습니다.",
         )
+    return await run_idempotent(
+        user.id,
+        idempotency_key,
+        fingerprint("draw_random_decoration", uid_request.uid),
+        lambda: _draw_random_decoration(uid_request),
+    )
+
+
+async def _draw_random_decoration(
+    uid_request: UIDDecorationUserRequest,
+) -> DecorationInDB:
+    """랜덤 장식 뽑기 + 유저 장식 추가 처리"""
     try:
         random_decoration = await DecorationUserService.draw_random_decoration(
             uid_request.uid
@@ -133,7 +163,7 @@ async def draw_random_decoration(
 async def equip_decoration_user(
     uid_request: UIDDecorationUserRequest,
     decoration_ref: DecorationReference,
-    user: User = Depends(get_current_active_user),
+    user: TokenUser = Depends(get_current_active_user),
 ) -> DecorationUserInDB:
     """장식 장착, 해제 엔드포인트"""
 
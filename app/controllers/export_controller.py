@@ -0,0 +1,43 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.core.auth import get_current_superuser
+from app.models.export_model import ExportDataset
+from app.models.user_model import TokenUser
+from app.services.export_service import ExportService
+
+router = APIRouter(
+    prefix="/api/exports",
+    tags=["exports"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: ExportDataset,
+    start: Optional[date] = Query(None, description="시작일 (UTC, 포함)"),
+    end: Optional[date] = Query(None, description="종료일 (UTC, 포함)"),
+    user: TokenUser = Depends(get_current_superuser),
+) -> StreamingResponse:
+    """
+    운영 분석용 CSV 내보내기 엔드포인트 (관리자 전용)
+    - stamps: 스탬프, challenges: 챌린지 달성 현황, decorations: 장식 보유 현황
+    - Postgres COPY 결과를 받는 대로 chunked 응답으로 전달 (헤더 행 포함, 타임스탬프는 UTC)
+    """
+    try:
+        body = ExportService.export_csv(dataset, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    filename = "_".join(
+        [dataset.value] + [day.isoformat() for day in (start, end) if day is not None]
+    )
+    return StreamingResponse(
+        body,
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}.csv"'},
+    )
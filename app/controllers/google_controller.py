@@ -1,10 +1,13 @@
 import secrets
 from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException, Request
+import httpx
+from authlib.integrations.base_client import OAuthError
+from fastapi import APIRouter, HTTPException, Request, status
 from starlette.responses import RedirectResponse
 
-from app.core.oauth import oauth
+from app.core.google_openid import InvalidIdToken, get_google_openid
+from app.core.oauth import load_google_metadata, oauth
 from app.services.google_service import GoogleAuthService
 
 router = APIRouter(prefix="/api/google", tags=["Google Auth"])
@@ -22,6 +25,15 @@ async def google_login(request: Request) -> Any:
     # state를 세션에 저장
     print("저장된 state:", state)
 
+    try:
+        await load_google_metadata()
+    except httpx.HTTPError as e:
+        print(f"Error loading google metadata: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Google 인증 서버에 연결할 수 없습니다.",
+        )
+
     redirect_uri = request.url_for("google_callback")
     return await oauth.google.authorize_redirect(
         request, redirect_uri, state=state, nonce=nonce
@@ -30,45 +42,74 @@ async def google_login(request: Request) -> Any:
 
 @router.get("/callback")
 async def google_callback(request: Request) -> Dict[str, Any]:
-    session_state = request.session.get("state")
-    session_nonce = request.session.get("nonce")
+    session_state = request.session.pop("state", None)
+    session_nonce = request.session.pop("nonce", None)
+    query_state = request.query_params.get("state")
 
-    if not session_state or session_state != request.query_params.get("state"):
+    if not session_state or session_state != query_state:
         raise HTTPException(status_code=400, detail="CSRF Warning! State mismatch.")
-    # 디버깅용
-    # print("받은 state:", state)
-    print("세션 state:", request.session.get("state"))
-    print("쿼리파라미터 state:", request.query_params.get("state"))
+    # authlib이 authorize_redirect에서 저장한 값 (검증은 아래에서 직접 하므로 지움)
+    await oauth.google.framework.clear_state_data(request.session, query_state)
 
-    token = await oauth.google.authorize_access_token(
-        request
-    )  # 구글이 준 인증코드로 토큰 요청
-    print("받은 token:", token)
+    code = request.query_params.get("code")
+    if not code:
+        raise HTTPException(
+            status_code=400,
+            detail=request.query_params.get("error", "인증 코드가 없습니다."),
+        )
+
+    # 구글이 준 인증코드로 토큰 요청 (id_token 검증은 authlib 대신 캐시된 JWKS로)
+    try:
+        await load_google_metadata()
+        token = await oauth.google.fetch_access_token(
+            redirect_uri=str(request.url_for("google_callback")), code=code
+        )
+    except (httpx.HTTPError, OAuthError) as e:
+        print(f"Error exchanging google code: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Google 토큰 발급에 실패했습니다.",
+        )
 
     if not token or "id_token" not in token:
         raise HTTPException(
             status_code=400, detail="Google에서 id_token을 반환하지 않았습니다."
         )
 
-    # claims = await oauth.google.parse_id_token(token=token, request=request, nonce=session_nonce)
-    # print("받은 claims:", claims)
+    try:
+        claims = await get_google_openid().verify_id_token(
+            token["id_token"], session_nonce, token.get("access_token")
+        )
+    except InvalidIdToken as e:
+        print(f"Invalid google id_token: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 Google id_token입니다.",
+        )
+    except httpx.HTTPError as e:
+        print(f"Error loading google jwks: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Google 인증 서버에 연결할 수 없습니다.",
+        )
 
-    # user_info = {
-    #     "email": claims.get("email"),
-    #     "name": claims.get("name"),
-    #     "picture": claims.get("picture"),
-    #     "sub": claims.get("sub")
-    # }
-    user_info = await oauth.google.userinfo(token=token)
-    print("user_info:", user_info)
+    if not claims.get("email") or not claims.get("email_verified", False):
+        raise HTTPException(
+            status_code=400, detail="Google 계정의 이메일이 인증되지 않았습니다."
+        )
 
-    jwt_token = await GoogleAuthService.login_or_register(
+    tokens = await GoogleAuthService.login_or_register(
         {
-            "email": user_info.get("email"),
-            "name": user_info.get("name"),
-            "picture": user_info.get("picture"),
-            "sub": user_info.get("sub"),
+            "email": claims.get("email"),
+            "name": claims.get("name"),
+            "picture": claims.get("picture"),
+            "sub": claims.get("sub"),
         }
     )
+    if not tokens:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="로그인할 수 없는 계정입니다.",
+        )
 
-    return {"access_token": jwt_token, "token_type": "bearer"}
+    return tokens
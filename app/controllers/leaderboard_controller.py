@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, Query, status
+
+from app.core.auth import get_current_active_user
+from app.models.leaderboard_model import LeaderboardPeriod, LeaderboardResponse
+from app.models.user_model import TokenUser
+from app.services.leaderboard_service import LeaderboardService
+
+router = APIRouter(
+    prefix="/api/leaderboard",
+    tags=["leaderboard"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("", response_model=LeaderboardResponse, status_code=status.HTTP_200_OK)
+async def get_leaderboard(
+    period: LeaderboardPeriod = Query(
+        LeaderboardPeriod.WEEKLY, description="weekly: 이번 주, all: 전체 기간"
+    ),
+    limit: int = Query(10, ge=1, le=100, description="상위 몇 명까지"),
+    user: TokenUser = Depends(get_current_active_user),
+) -> LeaderboardResponse:
+    """
+    스탬프 리더보드 엔드포인트
+    - 인증된(챌린지에 연결된) 텀블러 + 주문 내역 스탬프 수로 순위 (같은 점수는 같은 순위)
+    - 상위 limit명과 내 순위(me)를 함께 반환
+    - 다른 서버 워커에서 막 생긴 스탬프는 최대 LEADERBOARD_REBUILD_SECONDS 늦게 반영될 수 있음
+    """
+    return await LeaderboardService.get_leaderboard(period, limit, user.id)
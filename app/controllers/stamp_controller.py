@@ -1,12 +1,13 @@
 import traceback
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from fastapi import (
     APIRouter,
     Depends,
     File,
     Form,
+    Header,
     HTTPException,
     Response,
     UploadFile,
@@ -19,6 +20,9 @@ from app.core.auth import (
     get_current_superuser,
     verify_superuser_token,
 )
+from app.core.deadline import run_blocking
+from app.core.etag import is_not_modified, make_etag, not_modified, set_etag
+from app.core.idempotency import IDEMPOTENCY_KEY_HEADER, fingerprint, run_idempotent
 from app.models.challenge_model import ChallengeCreate, ChallengeInDB, ChallengeResponse
 from app.models.stamp_model import (
     OrderDetails,
@@ -28,9 +32,10 @@ from app.models.stamp_model import (
     StampType,
     Tumbler,
 )
-from app.models.user_model import User
+from app.models.user_model import TokenUser
 from app.services.challenge_service import ChallengeService
 from app.services.stamp_service import StampService
+from app.services.user_data_version_service import UserDataVersionService
 from app.services.vision_service import VisionService
 
 
@@ -74,13 +79,15 @@ async def create_stamp(
     uid: int = Form(...),
     challenges_ids_json: str = Form(...),  # JSON 문자열로 받음
     file: UploadFile = File(...),
-    user: User = Depends(get_current_active_user),
+    user: TokenUser = Depends(get_current_active_user),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER),
 ) -> Optional[List[ChallengeResponse]]:
     """
     stamp 생성 엔드포인트
     - stamp_type: 스탬프 타입 (order_details, tumbler)
 
     ** challenges_json은 1,2,3 와 같은 challenge ids를 쉼표(,) 형태로 연결되도록 전달됨.
+    ** Idempotency-Key 헤더를 보내면 같은 키의 재시도는 AI 검증 / DB 저장 없이 처음 응답을 그대로 반환
 
     1. stamp_type에 따른 stamp 선인증 (google vision api)
     2. stamp DB 생성 (url은 임시로 넣기)
@@ -96,8 +103,35 @@ async def create_stamp(
             detail="사용자 ID가 일치하지 않습니다.",
         )
 
+    # 파일 내용은 읽지 않고 메타데이터만 비교 (재시도는 같은 파일을 다시 보냄)
+    request_fingerprint = fingerprint(
+        "create_stamp",
+        stamp_type,
+        saved_at,
+        challenges_ids_json,
+        file.filename,
+        file.size,
+    )
+    return await run_idempotent(
+        user.id,
+        idempotency_key,
+        request_fingerprint,
+        lambda: _create_stamp(stamp_type, saved_at, challenges_ids_json, file, user),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+async def _create_stamp(
+    stamp_type: StampType,
+    saved_at: datetime,
+    challenges_ids_json: str,
+    file: UploadFile,
+    user: TokenUser,
+) -> List[ChallengeResponse]:
+    """stamp 생성 처리 (create_stamp의 1~5단계)"""
     # 1. stamp_type에 따른 stamp 선인증 (google vision api)
-    vision_api_verify_result = vision_api_verify(file, stamp_type)
+    # 외부 AI 호출은 스레드에서 실행: deadline을 넘기면 요청은 바로 취소되고 이벤트 루프도 막지 않음
+    vision_api_verify_result = await run_blocking(vision_api_verify, file, stamp_type)
     print(f"COMPLETED: vision_api_verify_result: {vision_api_verify_result}")
     if not vision_api_verify_result:
         raise HTTPException(
@@ -190,15 +224,29 @@ async def create_stamp(
 
 @router.get("/", response_model=List[StampResponse], status_code=status.HTTP_200_OK)
 async def get_stamp(
-    user: User = Depends(get_current_active_user),
-) -> Optional[List[StampResponse]]:
+    response: Response,
+    user: TokenUser = Depends(get_current_active_user),
+    if_none_match: Optional[str] = Header(None),
+) -> Union[List[StampResponse], Response]:
     """
     Stamp 조회 엔드포인트
+    - 응답에 ETag(사용자 스탬프 데이터 버전)를 붙이고, If-None-Match가 일치하면 304
     """
     try:
-        stamps = await StampService.get_stamp_by_uid(user.id)
+        versions = await UserDataVersionService.get_by_uid(user.id)
+        etag = make_etag("stamps", user.id, versions.stamps_version)
+        if is_not_modified(if_none_match, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
+        stamps = await StampService.get_stamp_by_uid(
+            user.id, version=versions.stamps_version
+        )
         if not stamps:
-            raise HTTPException(status_code=status.HTTP_204_NO_CONTENT)
+            # 빈 목록도 ETag와 함께 204 (HTTPException은 아래 except에서 400으로 바뀜)
+            return Response(
+                status_code=status.HTTP_204_NO_CONTENT, headers=response.headers
+            )
     except Exception as e:
         print(f"ERROR: {traceback.format_exc()}")
         raise HTTPException(
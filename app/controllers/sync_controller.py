@@ -0,0 +1,84 @@
+import traceback
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.core.auth import get_current_active_user
+from app.models.challenge_model import ChallengeResponse
+from app.models.stamp_model import StampResponse
+from app.models.sync_model import SyncDeleted, SyncResponse
+from app.models.user_model import TokenUser
+from app.services.sync_service import SyncService
+
+router = APIRouter(
+    prefix="/api/sync",
+    tags=["sync"],
+    responses={404: {"description": "Not found"}},
+)
+
+# 삭제 기록 entity -> SyncDeleted 필드
+_DELETED_FIELDS = {
+    "challenge": "challenges",
+    "stamp": "stamps",
+    "decoration": "decorations",
+}
+
+
+@router.get("", response_model=SyncResponse, status_code=status.HTTP_200_OK)
+async def sync(
+    since: int = Query(0, ge=0, description="이전 응답의 cursor (처음이면 0)"),
+    user: TokenUser = Depends(get_current_active_user),
+) -> SyncResponse:
+    """
+    동기화 엔드포인트
+    - since 이후 생성 / 변경 / 삭제된 챌린지, 스탬프, 보유 장식만 반환
+    - 응답의 cursor를 다음 요청의 since로 사용
+    - reset이 True면 전체 데이터 (since가 0이거나 삭제 기록 보관 기간보다 오래된 경우)
+    """
+    try:
+        changes = await SyncService.get_changes(user.id, since)
+    except Exception as e:
+        print(f"ERROR: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"동기화 중 오류가 발생했습니다: {str(e)}",
+        )
+
+    deleted = SyncDeleted()
+    for tombstone in changes.tombstones:
+        field = _DELETED_FIELDS.get(tombstone.entity)
+        if field is not None:
+            getattr(deleted, field).append(tombstone.entity_id)
+
+    return SyncResponse(
+        cursor=changes.cursor,
+        reset=changes.reset,
+        challenges=[
+            ChallengeResponse.timestamp_to_datestr(
+                id=challenge.id,
+                uid=challenge.uid,
+                title=challenge.title,
+                description=challenge.description,
+                is_done=challenge.is_done,
+                od_obj=challenge.od_obj,
+                od_ach=challenge.od_ach,
+                tb_obj=challenge.tb_obj,
+                tb_ach=challenge.tb_ach,
+                start_at=challenge.start_at,
+                due_at=challenge.due_at,
+                stamps=challenge.stamps,
+                type=challenge.type,
+            )
+            for challenge in changes.challenges
+        ],
+        stamps=[
+            StampResponse.timestamp_to_datestr(
+                id=stamp.id,
+                saved_at=stamp.saved_at,
+                save_url=stamp.save_url,
+                type=stamp.type,
+            )
+            for stamp in changes.stamps
+        ],
+        decorations=changes.decorations,
+        deleted=deleted,
+    )
@@ -1,6 +1,7 @@
 from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.core.auth import (
@@ -8,7 +9,8 @@ from app.core.auth import (
     get_current_superuser,
     get_current_user,
 )
-from app.models.user_model import User, UserCreate, UserLogin, UserUpdate
+from app.models.session_model import TokenRefresh
+from app.models.user_model import TokenUser, User, UserCreate, UserLogin, UserUpdate
 from app.services.user_service import UserService
 
 # 라우터 설정
@@ -19,6 +21,18 @@ router = APIRouter(
 )
 
 
+async def _get_profile(current_user: TokenUser) -> User:
+    """토큰 사용자의 프로필 조회 (토큰 claim에는 이름 / 생성일 등이 없음)"""
+    user = await UserService.get_user_by_email(current_user.email)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 인증 정보",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
 @router.post("/", response_model=User, status_code=status.HTTP_201_CREATED)
 async def create_user(user_data: UserCreate) -> Optional[User]:
     """사용자 생성 엔드포인트"""
@@ -32,24 +46,48 @@ async def create_user(user_data: UserCreate) -> Optional[User]:
 
 @router.get("/", response_model=List[User])
 async def get_all_users(
-    current_user: User = Depends(get_current_active_user),
+    response: Response,
+    after: int = Query(0, ge=0, description="이전 페이지 마지막 사용자의 ID"),
+    limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+    current_user: TokenUser = Depends(get_current_active_user),
 ) -> List[User]:
-    """모든 사용자 조회 엔드포인트"""
-    print(f"current user: {current_user}")
-    return await UserService.get_all_users()
+    """
+    사용자 목록 조회 엔드포인트 (ID 순 keyset 페이지)
+    - 다음 페이지가 있을 수 있으면 Link 헤더(rel="next")로 다음 요청 경로를 알려줌
+    - 전체 목록은 GET /api/users/export (관리자, NDJSON 스트리밍)
+    """
+    users = await UserService.get_users_page(after, limit)
+    if len(users) == limit:
+        response.headers["Link"] = (
+            f'</api/users/?after={users[-1].id}&limit={limit}>; rel="next"'
+        )
+    return users
+
+
+@router.get("/export")
+async def export_users(
+    current_user: TokenUser = Depends(get_current_superuser),
+) -> StreamingResponse:
+    """
+    전체 사용자 내보내기 엔드포인트 (관리자 전용)
+    서버 측 커서로 읽는 대로 한 줄에 사용자 하나씩(NDJSON) 스트리밍
+    """
+    return StreamingResponse(
+        UserService.export_users_ndjson(), media_type="application/x-ndjson"
+    )
 
 
 @router.get("/me", response_model=User)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_active_user),
+    current_user: TokenUser = Depends(get_current_active_user),
 ) -> User:
     """현재 로그인한 사용자 정보 조회"""
-    return current_user
+    return await _get_profile(current_user)
 
 
 @router.get("/{user_id}", response_model=User)
 async def get_user(
-    user_id: int, current_user: User = Depends(get_current_active_user)
+    user_id: int, current_user: TokenUser = Depends(get_current_active_user)
 ) -> Optional[User]:
     # =Depends(get_current_active_user)
     """ID로 사용자 조회 엔드포인트"""
@@ -67,7 +105,7 @@ async def get_user(
 async def update_user(
     user_id: int,
     user_data: UserUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: TokenUser = Depends(get_current_active_user),
 ) -> Optional[User]:
     """사용자 정보 업데이트 엔드포인트"""
     # 자신의 정보만 업데이트 가능 (관리자 제외)
@@ -91,7 +129,7 @@ async def update_user(
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
-    user_id: int, current_user: User = Depends(get_current_active_user)
+    user_id: int, current_user: TokenUser = Depends(get_current_active_user)
 ) -> None:
     """사용자 삭제 엔드포인트"""
     # 자신의 계정만 삭제 가능 (관리자 제외)
@@ -126,10 +164,31 @@ async def login_for_access_token(
 
     return {
         "access_token": auth_result["access_token"],
+        "refresh_token": auth_result["refresh_token"],
         "token_type": auth_result["token_type"],
     }
 
 
+# /api/users/token으로 시작하면 로그인(bcrypt) 동시 실행 제한을 받으므로 별도 경로 사용
+@router.post("/refresh")
+async def refresh_access_token(token_data: TokenRefresh) -> Optional[dict]:
+    """리프레시 토큰으로 토큰 갱신 엔드포인트 (리프레시 토큰도 새로 발급)"""
+    tokens = await UserService.refresh_access_token(token_data.refresh_token)
+    if not tokens:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 리프레시 토큰입니다. 다시 로그인해주세요.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return tokens
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(token_data: TokenRefresh) -> None:
+    """로그아웃 엔드포인트 (리프레시 토큰 세션 폐기)"""
+    await UserService.logout(token_data.refresh_token)
+
+
 @router.post("/login", response_model=User)
 async def login(user_data: UserLogin) -> Union[User, Any]:
     """사용자 로그인 엔드포인트"""
@@ -174,7 +233,7 @@ async def get_fake_decorations_by_id(user_id: int) -> Optional[List[Any]]:
 @router.get("/test", response_model=User)
 async def test_user(
     uid: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: TokenUser = Depends(get_current_active_user),
 ) -> User:
     """테스트용 엔드포인트"""
     if uid != current_user.id:
@@ -183,4 +242,4 @@ async def test_user(
             detail="사용자 ID가 일치하지 않습니다.",
         )
 
-    return current_user
+    return await _get_profile(current_user)
@@ -3,8 +3,8 @@ import shutil
 import uuid
 import os
 from typing import Literal
-from app.services.vision_service import detect_spoon_fork_from_image, detect_tumbler_in_image
-from app.services.gemini_service import VisionService
+from app.core.deadline import run_blocking
+from app.services.vision_service import VisionService
 
 # vision 관련 라우터
 router = APIRouter(
@@ -21,7 +21,8 @@ async def analyze_spoon_fork(file: UploadFile = File(...)) -> dict[str, Literal[
         with open(temp_file_name, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
 
-        result = detect_spoon_fork_from_image(temp_file_name)
+        file.file.seek(0)
+        result = await run_blocking(VisionService.detect_spoon_fork_from_image, file)
         return {"result": result}
 
     except Exception as e:
@@ -41,7 +42,7 @@ async def detect_tumbler(file: UploadFile = File(...)) -> dict[str, Literal["Tum
         with open(temp_file_name, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
 
-        result = VisionService.detect_tumbler_in_image(temp_file_name)
+        result = await run_blocking(VisionService.detect_tumbler_in_image, temp_file_name)
         return {"result": result}
 
     except Exception as e:
@@ -0,0 +1,212 @@
+import asyncio
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.core.deadline import remaining
+from app.core.metrics import MetricFamily, register_collector
+
+# 서비스 시간 이동 평균 가중치 (Retry-After 추정용)
+_SERVICE_TIME_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 찼거나 대기 시간 안에 차례가 오지 않아 요청을 거절"""
+
+    def __init__(self, status_code: int, retry_after: int, reason: str) -> None:
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class ConcurrencyLimiter:
+    """
+    경로 그룹(route class)별 동시 실행 수 제한 + 크기가 정해진 대기열 (워커 프로세스 단위)
+    - 빈 자리가 있으면 바로 실행, 없으면 대기열에서 FIFO로 대기
+    - 대기열이 가득 차면 429, 대기 시간을 넘기면 503 (둘 다 Retry-After 포함)
+    """
+
+    def __init__(
+        self, name: str, limit: int, queue_size: int, queue_timeout: float
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._avg_service_time = 0.0
+
+        # 메트릭
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "queue_timeout": 0}
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """지금 대기열이 모두 처리될 때까지의 예상 시간 (초, 최소 1)"""
+        expected = (self.queue_depth + 1) * self._avg_service_time / self.limit
+        return max(1, math.ceil(expected))
+
+    async def acquire(self) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+
+        if self.queue_depth >= self.queue_size:
+            self.rejected["queue_full"] += 1
+            raise AdmissionRejected(429, self.retry_after(), "queue_full")
+
+        # 요청 deadline이 더 짧으면 그 안에서만 대기
+        timeout = self.queue_timeout
+        left = remaining()
+        if left is not None:
+            timeout = min(timeout, left)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            # release()가 자리를 넘겨주면 완료 (active는 그대로 유지)
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            self.rejected["queue_timeout"] += 1
+            raise AdmissionRejected(503, self.retry_after(), "queue_timeout")
+        except BaseException:
+            # 취소되기 직전에 자리를 넘겨받았다면 다음 대기자에게 돌려줌
+            self._discard(waiter)
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        self.admitted += 1
+
+    def release(self, service_time: Optional[float] = None) -> None:
+        if service_time is not None:
+            self._avg_service_time += _SERVICE_TIME_ALPHA * (
+                service_time - self._avg_service_time
+            )
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+def route_classes() -> List[Tuple[str, str, str]]:
+    """
+    비용이 큰 경로 그룹 (메서드, 경로 prefix, 그룹 이름). 먼저 일치하는 항목 사용
+    일치하지 않는 경로(카탈로그 조회 등)는 제한 없이 바로 실행
+    """
+    return [
+        # AI 검증 + 파일 I/O
+        ("POST", "/api/stamps/", "upload"),
+        ("POST", "/api/vision/", "upload"),
+        ("POST", "/api/decorations/assets/", "upload"),
+        ("POST", "/api/decorations/landscapes/", "upload"),
+        ("POST", "/api/users/decorations/random", "random_draw"),
+        # bcrypt
+        ("POST", "/api/users/token", "login"),
+        ("POST", "/api/users/login", "login"),
+        # 스트리밍 내보내기 (응답이 끝날 때까지 DB 연결 점유)
+        ("GET", "/api/users/export", "export"),
+        ("GET", "/api/exports/", "export"),
+    ]
+
+
+# 그룹별 limiter (처음 사용할 때 settings로부터 생성)
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+
+
+def get_limiter(name: str) -> ConcurrencyLimiter:
+    if name not in _limiters:
+        limit, queue_size = {
+            "upload": (
+                settings.ADMISSION_UPLOAD_CONCURRENCY,
+                settings.ADMISSION_UPLOAD_QUEUE_SIZE,
+            ),
+            "random_draw": (
+                settings.ADMISSION_RANDOM_DRAW_CONCURRENCY,
+                settings.ADMISSION_RANDOM_DRAW_QUEUE_SIZE,
+            ),
+            "login": (
+                settings.ADMISSION_LOGIN_CONCURRENCY,
+                settings.ADMISSION_LOGIN_QUEUE_SIZE,
+            ),
+            "export": (
+                settings.ADMISSION_EXPORT_CONCURRENCY,
+                settings.ADMISSION_EXPORT_QUEUE_SIZE,
+            ),
+        }[name]
+        _limiters[name] = ConcurrencyLimiter(
+            name, limit, queue_size, settings.ADMISSION_QUEUE_TIMEOUT_SECONDS
+        )
+    return _limiters[name]
+
+
+def limiter_for(method: str, path: str) -> Optional[ConcurrencyLimiter]:
+    """경로가 속한 그룹의 limiter (제한 대상이 아니면 None)"""
+    for route_method, prefix, name in route_classes():
+        if method == route_method and path.startswith(prefix):
+            return get_limiter(name)
+    return None
+
+
+@register_collector
+def collect_admission_metrics() -> List[MetricFamily]:
+    limiters = list(_limiters.values())
+    return [
+        MetricFamily(
+            "admission_queue_depth",
+            "gauge",
+            "현재 대기열에서 기다리는 요청 수",
+            [
+                ({"route_class": limiter.name}, limiter.queue_depth)
+                for limiter in limiters
+            ],
+        ),
+        MetricFamily(
+            "admission_queue_depth_max",
+            "gauge",
+            "프로세스 시작 후 최대 대기열 길이",
+            [
+                ({"route_class": limiter.name}, limiter.max_queue_depth)
+                for limiter in limiters
+            ],
+        ),
+        MetricFamily(
+            "admission_active",
+            "gauge",
+            "실행 중인 요청 수",
+            [({"route_class": limiter.name}, limiter.active) for limiter in limiters],
+        ),
+        MetricFamily(
+            "admission_admitted_total",
+            "counter",
+            "실행을 허용한 요청 수",
+            [({"route_class": limiter.name}, limiter.admitted) for limiter in limiters],
+        ),
+        MetricFamily(
+            "admission_rejected_total",
+            "counter",
+            "거절한 요청 수 (queue_full: 429, queue_timeout: 503)",
+            [
+                ({"route_class": limiter.name, "reason": reason}, count)
+                for limiter in limiters
+                for reason, count in limiter.rejected.items()
+            ],
+        ),
+    ]
@@ -2,18 +2,20 @@ from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 
-from app.config import settings
-from app.models.user_model import User
+from app.database.database import bind_session_user
+from app.models.user_model import TokenUser
 from app.services.user_service import UserService
 
 # OAuth2 인증 스키마 - 모든 라우터에서 공통으로 사용
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/users/token")
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
-    """JWT 토큰에서 현재 사용자 정보 가져오기"""
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenUser:
+    """
+    JWT 토큰에서 현재 사용자 정보 가져오기
+    활성 / 관리자 여부는 토큰 claim을 사용하고, 폐기 여부만 캐시된 토큰 버전으로 확인
+    """
     user = await UserService.get_current_user(token)
     if not user:
         raise HTTPException(
@@ -21,12 +23,14 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
             detail="유효하지 않은 인증 정보",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    # 요청 단위 사용자 설정 (복제본 read-your-writes 라우팅 기준)
+    bind_session_user(user.id)
     return user
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: TokenUser = Depends(get_current_user),
+) -> TokenUser:
     """현재 사용자가 활성 상태인지 확인"""
     if not current_user.is_active:
         raise HTTPException(
@@ -37,8 +41,8 @@ async def get_current_active_user(
 
 # admin 계정인지 확인하는 의존성
 async def get_current_superuser(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
+    current_user: TokenUser = Depends(get_current_active_user),
+) -> TokenUser:
     """현재 사용자가 관리자인지 확인"""
     if not current_user.is_superuser:
         raise HTTPException(
@@ -51,32 +55,7 @@ async def get_current_superuser(
 async def verify_superuser_token(token: str = Depends(oauth2_scheme)) -> Optional[bool]:
     """관리자 권한을 가진 사용자만 접근할 수 있는 엔드포인트"""
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        email: str = payload.get("sub")
-
-        if email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        user = await UserService.get_user_by_email(email)
-        if not user or not user.is_active or not user.is_superuser:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return True
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        user = await UserService.get_current_user(token)
     except Exception as e:
         print(f"Error verifying superuser token: {e}")
         raise HTTPException(
@@ -84,3 +63,12 @@ async def verify_superuser_token(token: str = Depends(oauth2_scheme)) -> Optiona
             detail="Internal server error",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    if not user or not user.is_active or not user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    bind_session_user(user.id)
+    return True
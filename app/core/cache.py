@@ -0,0 +1,412 @@
+import functools
+import inspect
+import json
+import math
+import random
+import time
+import typing
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import TypeAdapter
+
+from app.config import settings
+from app.core.metrics import MetricFamily, register_collector
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # redis extra 미설치 시 프로세스 메모리 캐시만 사용
+    redis_asyncio = None
+
+T = TypeVar("T")
+
+# 태그 버전: 태그별로 무효화할 때마다 1씩 증가
+TagVersions = Tuple[int, ...]
+
+# 반환 타입을 알 수 없는 값 (JSON 기본 타입만 그대로 복원됨)
+ANY_ADAPTER: TypeAdapter = TypeAdapter(Any)
+
+
+class CacheEntry(NamedTuple):
+    """캐시에 저장되는 값"""
+
+    value: Any
+    expires_at: float  # time.time() 기준
+    delta: float  # 값을 계산하는 데 걸린 시간 (초, 조기 갱신 확률 계산용)
+    tag_versions: TagVersions  # 값을 읽기 시작할 때의 태그 버전
+
+
+class MemoryTier:
+    """
+    프로세스 메모리 캐시 (LRU, 워커 프로세스 단위)
+    다른 워커에서 한 무효화는 무효화 버스가 연결되어 있을 때만 전달되므로
+    그 외에는 TTL을 CACHE_LOCAL_TTL_SECONDS 이하로 제한
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._tag_versions: Dict[str, int] = {}
+        # clear()마다 증가: 비우기 전에 읽기 시작한 값이 비운 뒤에 저장되지 않도록
+        self._epoch = 0
+
+    def tag_versions(self, tags: Sequence[str]) -> TagVersions:
+        return (self._epoch,) + tuple(self._tag_versions.get(tag, 0) for tag in tags)
+
+    def get(self, key: str, tags: Sequence[str]) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time() or entry.tag_versions != self.tag_versions(
+            tags
+        ):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, tags: Sequence[str]) -> None:
+        for tag in tags:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tag_versions.clear()
+        self._epoch += 1
+
+
+class RedisTier:
+    """
+    Redis 프로토콜 캐시 (모든 워커가 공유)
+    값은 JSON으로 저장 (pydantic 모델은 JSON 모드로 dump, 읽을 때 반환 타입의 TypeAdapter로 복원)
+    Redis에 쓸 수 있는 누구도 워커에서 코드를 실행할 수 없도록 pickle은 사용하지 않음
+    태그 버전은 별도 키(INCR)로 관리해 읽을 때 함께 비교
+    Redis 오류나 복원할 수 없는 값은 캐시 miss로 처리 (요청은 DB에서 그대로 처리)
+    """
+
+    def __init__(self, client: Any, prefix: str = "kkook:cache:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    async def tag_versions(self, tags: Sequence[str]) -> Optional[TagVersions]:
+        if not tags:
+            return ()
+        try:
+            versions = await self.client.mget([self._tag_key(tag) for tag in tags])
+        except Exception as e:
+            print(f"[WARNING] redis cache unavailable: {e}")
+            return None
+        return tuple(int(version or 0) for version in versions)
+
+    @staticmethod
+    def _encode(entry: CacheEntry, adapter: TypeAdapter) -> bytes:
+        return json.dumps(
+            {
+                "value": adapter.dump_python(entry.value, mode="json"),
+                "expires_at": entry.expires_at,
+                "delta": entry.delta,
+                "tag_versions": list(entry.tag_versions),
+            }
+        ).encode()
+
+    @staticmethod
+    def _decode(raw: bytes, adapter: TypeAdapter) -> CacheEntry:
+        document = json.loads(raw)
+        return CacheEntry(
+            adapter.validate_python(document["value"]),
+            float(document["expires_at"]),
+            float(document["delta"]),
+            tuple(int(version) for version in document["tag_versions"]),
+        )
+
+    async def get(
+        self, key: str, tags: Sequence[str], adapter: TypeAdapter = ANY_ADAPTER
+    ) -> Optional[CacheEntry]:
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.get(self._key(key))
+                if tags:
+                    pipe.mget([self._tag_key(tag) for tag in tags])
+                results = await pipe.execute()
+            if results[0] is None:
+                return None
+            entry = self._decode(results[0], adapter)
+        except Exception as e:
+            print(f"[WARNING] redis cache unavailable: {e}")
+            return None
+
+        versions = tuple(int(v or 0) for v in results[1]) if tags else ()
+        if entry.tag_versions != versions:
+            return None
+        return entry
+
+    async def set(
+        self, key: str, entry: CacheEntry, adapter: TypeAdapter = ANY_ADAPTER
+    ) -> None:
+        ttl = max(1, math.ceil(entry.expires_at - time.time()))
+        try:
+            await self.client.set(self._key(key), self._encode(entry, adapter), ex=ttl)
+        except Exception as e:
+            print(f"[WARNING] redis cache unavailable: {e}")
+
+    async def invalidate(self, tags: Sequence[str]) -> None:
+        if not tags:
+            return
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.incr(self._tag_key(tag))
+                await pipe.execute()
+        except Exception as e:
+            print(f"[WARNING] redis cache invalidation failed: {e}")
+
+
+class FamilyStats:
+    """키 family별 캐시 사용량"""
+
+    __slots__ = ("hits", "misses", "early_refreshes")
+
+    def __init__(self) -> None:
+        self.hits: Dict[str, int] = {"memory": 0, "redis": 0}
+        self.misses = 0
+        self.early_refreshes = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        hits = sum(self.hits.values())
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+
+class Cache:
+    """
+    2단계 캐시 (프로세스 메모리 -> Redis)
+    - 태그 무효화: 태그 버전을 올려 그 태그가 붙은 값을 모두 무효화
+      값을 읽는 도중에 무효화되면 읽은 값은 저장하지 않음 (쓰기 직전 값이 남지 않도록)
+    - 조기 갱신: 만료가 가까울수록 높은 확률로 한 요청이 미리 다시 계산 (XFetch)
+      만료 순간 한꺼번에 DB로 몰리는 것을 막음
+    """
+
+    def __init__(self, local: MemoryTier, remote: Optional[RedisTier] = None) -> None:
+        self.local = local
+        self.remote = remote
+        self.stats: Dict[str, FamilyStats] = {}
+        # 다른 워커의 무효화를 받고 있는지 (무효화 버스가 연결되어 있을 때 True)
+        self.synchronized = False
+
+    def _stats(self, family: str) -> FamilyStats:
+        if family not in self.stats:
+            self.stats[family] = FamilyStats()
+        return self.stats[family]
+
+    @staticmethod
+    def _should_refresh(entry: CacheEntry) -> bool:
+        """XFetch: 남은 시간이 계산 시간 * beta * Exp(1) 보다 짧으면 미리 갱신"""
+        beta = settings.CACHE_EARLY_REFRESH_BETA
+        jitter = -math.log(1.0 - random.random())
+        return time.time() + entry.delta * beta * jitter >= entry.expires_at
+
+    async def get_or_load(
+        self,
+        family: str,
+        key: str,
+        tags: Sequence[str],
+        ttl: float,
+        loader: Callable[[], Awaitable[T]],
+        adapter: TypeAdapter = ANY_ADAPTER,
+    ) -> T:
+        """adapter: Redis에 저장한 JSON을 값으로 복원할 TypeAdapter (값의 타입)"""
+        stats = self._stats(family)
+
+        entry = self.local.get(key, tags)
+        tier = "memory"
+        if entry is None and self.remote is not None:
+            entry = await self.remote.get(key, tags, adapter)
+            tier = "redis"
+            if entry is not None:
+                self._set_local(key, entry, tags)
+
+        if entry is not None:
+            if not self._should_refresh(entry):
+                stats.hits[tier] += 1
+                return entry.value
+            stats.early_refreshes += 1
+        else:
+            stats.misses += 1
+
+        # 읽기 전 태그 버전 (읽는 동안 무효화되었는지 확인)
+        local_versions = self.local.tag_versions(tags)
+        remote_versions = None
+        if self.remote is not None:
+            remote_versions = await self.remote.tag_versions(tags)
+
+        started = time.perf_counter()
+        value = await loader()
+        delta = time.perf_counter() - started
+
+        if self.local.tag_versions(tags) != local_versions:
+            return value
+        expires_at = time.time() + ttl
+        if self.remote is not None and remote_versions is not None:
+            await self.remote.set(
+                key, CacheEntry(value, expires_at, delta, remote_versions), adapter
+            )
+        self._set_local(key, CacheEntry(value, expires_at, delta, local_versions), tags)
+        return value
+
+    def _set_local(self, key: str, entry: CacheEntry, tags: Sequence[str]) -> None:
+        expires_at = entry.expires_at
+        if not self.synchronized:
+            expires_at = min(expires_at, time.time() + settings.CACHE_LOCAL_TTL_SECONDS)
+        self.local.set(
+            key,
+            entry._replace(
+                expires_at=expires_at, tag_versions=self.local.tag_versions(tags)
+            ),
+        )
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        self.local.invalidate(tags)
+        if self.remote is not None:
+            await self.remote.invalidate(tags)
+        for publisher in list(_publishers):
+            await publisher(tags)
+
+    def clear(self) -> None:
+        """프로세스 메모리 캐시 비우기 (Redis는 그대로)"""
+        self.local.clear()
+
+
+# 프로세스 전역 캐시 (처음 사용할 때 settings로부터 생성)
+_cache: Optional[Cache] = None
+
+Publisher = Callable[[Sequence[str]], Awaitable[None]]
+
+# 무효화한 태그를 다른 워커에 전달하는 함수 (무효화 버스가 시작될 때 등록)
+_publishers: List[Publisher] = []
+
+
+def register_publisher(publisher: Publisher) -> Publisher:
+    if publisher not in _publishers:
+        _publishers.append(publisher)
+    return publisher
+
+
+def unregister_publisher(publisher: Publisher) -> None:
+    if publisher in _publishers:
+        _publishers.remove(publisher)
+
+
+def get_cache() -> Cache:
+    global _cache
+    if _cache is None:
+        remote = None
+        if settings.REDIS_URL:
+            if redis_asyncio is None:
+                print("[WARNING] REDIS_URL is set but redis is not installed")
+            else:
+                remote = RedisTier(redis_asyncio.from_url(settings.REDIS_URL))
+        _cache = Cache(MemoryTier(settings.CACHE_LOCAL_MAX_ENTRIES), remote)
+    return _cache
+
+
+async def invalidate_tags(*tags: str) -> None:
+    """태그가 붙은 캐시 값을 모두 무효화 (쓰기가 끝난 뒤 호출)"""
+    await get_cache().invalidate_tags(*tags)
+
+
+def cached(
+    family: str, key: str, ttl: float, tags: Sequence[str] = ()
+) -> Callable[[Callable[..., Awaitable[T]]], Any]:
+    """
+    비동기 조회 함수의 결과를 캐시 (@staticmethod 아래에 붙여 사용)
+    - key / tags는 함수 인자 이름으로 채우는 format 문자열 (예: "user:{uid}:challenges")
+    - family는 메트릭 라벨이자 키 prefix
+    - Redis에는 JSON으로 저장하고 함수의 반환 타입 annotation으로 복원 (반환 타입을 꼭 적을 것)
+    캐시된 객체는 여러 요청이 함께 사용하므로 호출자는 결과를 수정하지 말 것
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(func)
+        adapter = TypeAdapter(typing.get_type_hints(func).get("return", Any))
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            if not settings.CACHE_ENABLED:
+                return await func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            cache_key = f"{family}:{key.format(**bound.arguments)}"
+            cache_tags = [tag.format(**bound.arguments) for tag in tags]
+            return await get_cache().get_or_load(
+                family,
+                cache_key,
+                cache_tags,
+                ttl,
+                lambda: func(*args, **kwargs),
+                adapter,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+@register_collector
+def collect_cache_metrics() -> List[MetricFamily]:
+    if _cache is None:
+        return []
+    families = list(_cache.stats.items())
+    return [
+        MetricFamily(
+            "cache_hits_total",
+            "counter",
+            "캐시 hit 수 (tier: memory / redis)",
+            [
+                ({"family": family, "tier": tier}, count)
+                for family, stats in families
+                for tier, count in stats.hits.items()
+            ],
+        ),
+        MetricFamily(
+            "cache_misses_total",
+            "counter",
+            "캐시 miss 수",
+            [({"family": family}, stats.misses) for family, stats in families],
+        ),
+        MetricFamily(
+            "cache_early_refreshes_total",
+            "counter",
+            "만료 전에 미리 다시 계산한 수",
+            [({"family": family}, stats.early_refreshes) for family, stats in families],
+        ),
+        MetricFamily(
+            "cache_hit_ratio",
+            "gauge",
+            "프로세스 시작 후 hit 비율",
+            [({"family": family}, stats.hit_ratio) for family, stats in families],
+        ),
+    ]
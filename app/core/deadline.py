@@ -0,0 +1,101 @@
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+import anyio
+
+from app.config import settings
+
+T = TypeVar("T")
+
+# 클라이언트가 요청 처리 시간 예산을 지정하는 헤더 (밀리초, 서버 설정보다 길게는 불가)
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout-Ms"
+
+# 현재 요청의 deadline (time.monotonic 기준 절대 시각, None이면 제한 없음)
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """요청 처리 시간 예산을 모두 쓴 경우"""
+
+
+def route_timeouts() -> List[Tuple[str, str, Optional[float]]]:
+    """
+    경로별 처리 시간 예산 (메서드, 경로 prefix, 초). 먼저 일치하는 항목 사용, None이면 제한 없음
+    일치하는 항목이 없으면 settings.REQUEST_TIMEOUT_SECONDS
+    """
+    return [
+        # 외부 AI(Vision / Gemini) 검증을 거치는 요청
+        ("POST", "/api/stamps/", settings.AI_REQUEST_TIMEOUT_SECONDS),
+        ("POST", "/api/vision/", settings.AI_REQUEST_TIMEOUT_SECONDS),
+        # 스트리밍 내보내기: 테이블 크기에 비례 (chunk마다 진행하므로 멈춘 요청은 아님)
+        ("GET", "/api/users/export", None),
+        ("GET", "/api/exports/", None),
+    ]
+
+
+def route_timeout(method: str, path: str) -> Optional[float]:
+    """경로의 처리 시간 예산 (초)"""
+    for route_method, prefix, timeout in route_timeouts():
+        if method == route_method and path.startswith(prefix):
+            return timeout
+    return settings.REQUEST_TIMEOUT_SECONDS
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[None]:
+    """
+    블록 안에서 timeout초 뒤를 deadline으로 설정 (None이면 제한 없음)
+    바깥에 더 이른 deadline이 있으면 그대로 유지
+    """
+    current = _deadline.get()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    if current is not None and (deadline is None or current < deadline):
+        deadline = current
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def without_deadline() -> Iterator[None]:
+    """블록 안에서는 deadline 없이 실행 (요청이 취소된 뒤의 정리 작업용)"""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def is_expired() -> bool:
+    """deadline이 지났는지"""
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def remaining() -> Optional[float]:
+    """
+    deadline까지 남은 시간 (초, 제한이 없으면 None)
+    DB 쿼리(timeout=)와 외부 API 호출의 timeout으로 사용하며, 이미 지났으면 DeadlineExceeded
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded("요청 처리 시간 예산을 초과했습니다.")
+    return left
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """
+    블로킹 함수(외부 AI SDK 호출 등)를 스레드에서 실행
+    deadline으로 요청이 취소되면 결과를 기다리지 않고 바로 반환 (스레드는 자체 timeout까지 실행)
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args), cancellable=True
+    )
@@ -0,0 +1,43 @@
+from typing import Optional
+
+from fastapi import Response, status
+
+# 조건부 조회 응답 헤더 (브라우저 / 앱 캐시가 매번 ETag로 재검증하도록)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(kind: str, uid: int, version: int) -> str:
+    """
+    사용자 데이터 버전으로 만든 ETag (예: W/"challenges-1-42")
+    버전이 같으면 응답 본문이 같다는 의미이므로 weak ETag로 표시
+    """
+    return f'W/"{kind}-{uid}-{version}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """weak 비교용: W/ prefix를 뗀 태그"""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표로 구분된 목록 또는 *)에 현재 ETag가 있는지 (weak 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == current for tag in if_none_match.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """응답에 ETag와 재검증용 Cache-Control 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """304 응답 (본문 없이 ETag만)"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
@@ -0,0 +1,255 @@
+import asyncio
+import email.utils
+import re
+import time
+from contextlib import suppress
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import httpx
+from jose import JWTError, jwt
+
+from app.config import settings
+from app.core.metrics import MetricFamily, register_collector
+
+# Google이 발급하는 id_token의 iss 값
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+
+# 캐시 헤더가 없을 때 유지 시간 / 헤더 값과 상관없이 지키는 범위 (초)
+_DEFAULT_MAX_AGE_SECONDS = 3600.0
+_MIN_MAX_AGE_SECONDS = 60.0
+_MAX_MAX_AGE_SECONDS = 86400.0
+# 유지 시간의 이 비율이 지나면 요청은 캐시로 처리하고 백그라운드에서 다시 받음
+_REFRESH_AFTER_RATIO = 0.8
+# 모르는 kid(키 교체 직후)로 JWKS를 강제로 다시 받는 최소 간격 (초)
+_FORCED_REFRESH_INTERVAL_SECONDS = 60.0
+_MAX_AGE_PATTERN = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+class InvalidIdToken(Exception):
+    """id_token 서명 / claim 검증 실패"""
+
+
+class CachedDocument(NamedTuple):
+    """캐시된 discovery 문서 / JWKS (time.monotonic 기준)"""
+
+    value: Dict[str, Any]
+    fetched_at: float
+    expires_at: float
+
+    @property
+    def refresh_at(self) -> float:
+        return (
+            self.fetched_at + (self.expires_at - self.fetched_at) * _REFRESH_AFTER_RATIO
+        )
+
+
+def cache_lifetime(headers: httpx.Headers) -> float:
+    """
+    응답 캐시 헤더로 유지 시간 계산 (초)
+    Cache-Control max-age(- Age) -> Expires(- Date) 순. no-store / no-cache는 최소 유지 시간
+    """
+    cache_control = headers.get("cache-control", "")
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return _MIN_MAX_AGE_SECONDS
+
+    lifetime: Optional[float] = None
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    if match:
+        age = headers.get("age", "0")
+        lifetime = float(match.group(1)) - (float(age) if age.isdigit() else 0.0)
+    elif "expires" in headers:
+        try:
+            expires = email.utils.parsedate_to_datetime(headers["expires"])
+            now = time.time()
+            if "date" in headers:
+                now = email.utils.parsedate_to_datetime(headers["date"]).timestamp()
+            lifetime = expires.timestamp() - now
+        except (TypeError, ValueError):
+            # 잘못된 날짜 형식 (Expires: 0 등)은 이미 만료된 것으로
+            lifetime = 0.0
+
+    if lifetime is None:
+        return _DEFAULT_MAX_AGE_SECONDS
+    return min(max(lifetime, _MIN_MAX_AGE_SECONDS), _MAX_MAX_AGE_SECONDS)
+
+
+class GoogleOpenID:
+    """
+    Google OpenID Connect discovery 문서 / JWKS 캐시와 id_token 로컬 검증
+    - 두 문서 모두 응답 캐시 헤더만큼 유지하고, 유지 시간이 80% 지나면 백그라운드에서 다시 받음
+    - 다시 받지 못하면 이전 값을 계속 사용 (Google이 잠시 느리거나 실패해도 로그인은 처리)
+    - id_token은 캐시된 JWKS로 서명 / iss / aud / exp / nonce를 확인 (userinfo 호출 없음)
+    """
+
+    def __init__(
+        self,
+        discovery_url: str,
+        client_id: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.discovery_url = discovery_url
+        self.client_id = client_id
+        self._transport = transport
+        self._metadata: Optional[CachedDocument] = None
+        self._jwks: Optional[CachedDocument] = None
+        self._locks = {"metadata": asyncio.Lock(), "jwks": asyncio.Lock()}
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self._forced_refresh_at = float("-inf")
+
+        # 메트릭
+        self.fetches: Dict[str, int] = {"metadata": 0, "jwks": 0}
+        self.fetch_errors: Dict[str, int] = {"metadata": 0, "jwks": 0}
+
+    async def _fetch(self, kind: str, url: str) -> CachedDocument:
+        self.fetches[kind] += 1
+        try:
+            async with httpx.AsyncClient(
+                transport=self._transport,
+                timeout=settings.GOOGLE_OPENID_TIMEOUT_SECONDS,
+            ) as client:
+                response = await client.get(url)
+                response.raise_for_status()
+                value = response.json()
+        except (httpx.HTTPError, ValueError):
+            self.fetch_errors[kind] += 1
+            raise
+        now = time.monotonic()
+        return CachedDocument(value, now, now + cache_lifetime(response.headers))
+
+    async def _load(self, kind: str, force: bool = False) -> Dict[str, Any]:
+        """
+        캐시된 문서 반환 (없거나 만료되면 받아옴, 동시에 한 번만)
+        만료된 문서를 다시 받지 못하면 만료된 값을 그대로 사용
+        """
+        cached = self._metadata if kind == "metadata" else self._jwks
+        now = time.monotonic()
+        if cached is not None and not force:
+            if now < cached.refresh_at:
+                return cached.value
+            if now < cached.expires_at:
+                self._refresh_in_background(kind)
+                return cached.value
+
+        async with self._locks[kind]:
+            current = self._metadata if kind == "metadata" else self._jwks
+            if current is not cached and current is not None:
+                return current.value
+            try:
+                url = self.discovery_url
+                if kind == "jwks":
+                    url = (await self._load("metadata"))["jwks_uri"]
+                document = await self._fetch(kind, url)
+            except (httpx.HTTPError, ValueError, KeyError) as e:
+                if cached is None:
+                    raise
+                print(f"[WARNING] google {kind} refresh failed, using cached: {e}")
+                return cached.value
+            if kind == "metadata":
+                self._metadata = document
+            else:
+                self._jwks = document
+            return document.value
+
+    def _refresh_in_background(self, kind: str) -> None:
+        task = self._refreshes.get(kind)
+        if task is not None and not task.done():
+            return
+        self._refreshes[kind] = asyncio.ensure_future(self._load(kind, force=True))
+        # 실패는 _load가 기록 / 경고하므로 결과를 확인하지 않아도 되도록
+        self._refreshes[kind].add_done_callback(
+            lambda t: None if t.cancelled() else t.exception()
+        )
+
+    async def get_metadata(self) -> Dict[str, Any]:
+        """discovery 문서 (authorization_endpoint, token_endpoint, jwks_uri 등)"""
+        return await self._load("metadata")
+
+    async def _get_key(self, kid: Optional[str]) -> Dict[str, Any]:
+        keys: List[Dict[str, Any]] = (await self._load("jwks")).get("keys", [])
+        for key in keys:
+            if key.get("kid") == kid:
+                return key
+
+        # Google이 키를 교체한 직후일 수 있음: 간격을 두고 한 번만 다시 받음
+        now = time.monotonic()
+        if now - self._forced_refresh_at >= _FORCED_REFRESH_INTERVAL_SECONDS:
+            self._forced_refresh_at = now
+            keys = (await self._load("jwks", force=True)).get("keys", [])
+            for key in keys:
+                if key.get("kid") == kid:
+                    return key
+        raise InvalidIdToken(f"unknown signing key: {kid}")
+
+    async def verify_id_token(
+        self, id_token: str, nonce: Optional[str], access_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """id_token 서명 / claim 검증 후 claim 반환 (실패하면 InvalidIdToken)"""
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except JWTError as e:
+            raise InvalidIdToken(str(e)) from e
+
+        key = await self._get_key(header.get("kid"))
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=[key.get("alg", "RS256")],
+                audience=self.client_id,
+                issuer=GOOGLE_ISSUERS,
+                access_token=access_token,
+            )
+        except JWTError as e:
+            raise InvalidIdToken(str(e)) from e
+
+        if nonce is not None and claims.get("nonce") != nonce:
+            raise InvalidIdToken("nonce mismatch")
+        return dict(claims)
+
+    async def close(self) -> None:
+        for task in self._refreshes.values():
+            task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await task
+        self._refreshes.clear()
+
+
+# 프로세스 전역 인스턴스 (처음 사용할 때 settings로부터 생성)
+_google_openid: Optional[GoogleOpenID] = None
+
+
+def get_google_openid() -> GoogleOpenID:
+    global _google_openid
+    if _google_openid is None:
+        _google_openid = GoogleOpenID(
+            settings.GOOGLE_DISCOVERY_URL, settings.GOOGLE_CLIENT_ID
+        )
+    return _google_openid
+
+
+async def close_google_openid() -> None:
+    global _google_openid
+    if _google_openid is not None:
+        await _google_openid.close()
+        _google_openid = None
+
+
+@register_collector
+def collect_google_openid_metrics() -> List[MetricFamily]:
+    if _google_openid is None:
+        return []
+    kinds = ("metadata", "jwks")
+    return [
+        MetricFamily(
+            "google_openid_fetches_total",
+            "counter",
+            "Google discovery 문서 / JWKS를 받아온 횟수",
+            [({"document": kind}, _google_openid.fetches[kind]) for kind in kinds],
+        ),
+        MetricFamily(
+            "google_openid_fetch_errors_total",
+            "counter",
+            "Google discovery 문서 / JWKS를 받지 못한 횟수 (캐시된 값이 있으면 계속 사용)",
+            [({"document": kind}, _google_openid.fetch_errors[kind]) for kind in kinds],
+        ),
+    ]
@@ -0,0 +1,276 @@
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+from app.core.deadline import without_deadline
+from app.core.metrics import MetricFamily, register_collector
+from app.models.idempotency_model import IdempotencyRecord
+from app.repositories.idempotency_repository import IdempotencyRepository
+
+# 클라이언트가 재시도 시 같은 값을 보내는 헤더
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+# 저장된 결과를 그대로 돌려준 응답에 붙는 헤더
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+_MAX_KEY_LENGTH = 255
+# 다른 워커가 처리 중인 키의 결과를 확인하는 간격 (초)
+_POLL_INTERVAL_SECONDS = 0.1
+# 키를 이만큼 새로 처리할 때마다 만료된 행 정리
+_PURGE_EVERY = 1000
+
+CacheKey = Tuple[int, str]
+
+# 완료된 결과 (LRU, 워커 프로세스 단위)
+_completed: "OrderedDict[CacheKey, IdempotencyRecord]" = OrderedDict()
+# 같은 워커에서 처리 중인 키 -> (fingerprint, 결과 future)
+# future 결과가 None이면 처리가 실패해 저장된 결과가 없음 (기다리던 요청이 다시 시도)
+_in_flight: Dict[CacheKey, Tuple[bytes, asyncio.Future]] = {}
+_claims_since_purge = 0
+
+# 메트릭
+_stats: Dict[str, int] = {
+    "executed": 0,
+    "replayed_memory": 0,
+    "replayed_database": 0,
+    "waited": 0,
+}
+
+
+def fingerprint(*parts: Any) -> bytes:
+    """요청 본문을 구분하는 sha256 (같은 키로 다른 요청을 보냈는지 확인)"""
+    encoded = json.dumps(jsonable_encoder(parts), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode()).digest()
+
+
+def _is_expired(record: IdempotencyRecord) -> bool:
+    ttl = timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS)
+    return datetime.now(timezone.utc) - record.created_at >= ttl
+
+
+def _cached(cache_key: CacheKey) -> Optional[IdempotencyRecord]:
+    record = _completed.get(cache_key)
+    if record is None:
+        return None
+    if _is_expired(record):
+        del _completed[cache_key]
+        return None
+    _completed.move_to_end(cache_key)
+    return record
+
+
+def _remember(record: IdempotencyRecord) -> None:
+    cache_key = (record.uid, record.key)
+    _completed[cache_key] = record
+    _completed.move_to_end(cache_key)
+    while len(_completed) > settings.IDEMPOTENCY_CACHE_SIZE:
+        _completed.popitem(last=False)
+
+
+def _check_fingerprint(stored: bytes, requested: bytes) -> None:
+    if stored != requested:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="같은 Idempotency-Key가 다른 요청에 사용되었습니다.",
+        )
+
+
+def _replay(record: IdempotencyRecord) -> Any:
+    """저장된 결과를 응답으로 (3xx / 4xx 결과는 같은 HTTPException으로)"""
+    headers = {IDEMPOTENT_REPLAYED_HEADER: "true"}
+    if record.status_code >= 300:
+        detail = (record.response or {}).get("detail")
+        raise HTTPException(
+            status_code=record.status_code, detail=detail, headers=headers
+        )
+    return JSONResponse(
+        status_code=record.status_code, content=record.response, headers=headers
+    )
+
+
+async def _claim_or_wait(
+    uid: int, key: str, request_fingerprint: bytes
+) -> Optional[IdempotencyRecord]:
+    """
+    DB에서 키 처리 권한을 얻으면 None, 다른 워커가 이미 처리했으면 저장된 결과
+    다른 워커가 처리 중이면 끝날 때까지 기다림 (요청 deadline까지, 중단된 키는 lock timeout 뒤 인계)
+    """
+    global _claims_since_purge
+    while True:
+        claimed = await IdempotencyRepository.claim(
+            uid,
+            key,
+            request_fingerprint,
+            settings.IDEMPOTENCY_LOCK_TIMEOUT_SECONDS,
+            settings.IDEMPOTENCY_KEY_TTL_SECONDS,
+        )
+        if claimed:
+            _claims_since_purge += 1
+            if _claims_since_purge >= _PURGE_EVERY:
+                _claims_since_purge = 0
+                await IdempotencyRepository.delete_expired(
+                    settings.IDEMPOTENCY_KEY_TTL_SECONDS
+                )
+            return None
+
+        record = await IdempotencyRepository.get(uid, key)
+        if record is None:
+            # 처리하던 요청이 실패해 키가 지워짐 -> 다시 시도
+            continue
+        _check_fingerprint(record.fingerprint, request_fingerprint)
+        if record.is_completed:
+            return record
+        await asyncio.sleep(_POLL_INTERVAL_SECONDS)
+
+
+async def _release(uid: int, key: str) -> None:
+    """처리 실패 시 키 삭제 (요청이 deadline으로 취소된 뒤에도 실행되도록 deadline 없이)"""
+    try:
+        with without_deadline():
+            await IdempotencyRepository.release(uid, key)
+    except Exception as e:
+        # 지우지 못한 키는 lock timeout 뒤 다음 요청이 인계
+        print(f"[WARNING] idempotency key release failed: {e}")
+
+
+async def _complete(
+    uid: int, key: str, status_code: int, response: Any
+) -> Optional[IdempotencyRecord]:
+    try:
+        return await IdempotencyRepository.complete(uid, key, status_code, response)
+    except Exception as e:
+        # 결과는 그대로 응답하고, 재시도는 다시 처리되도록 키만 지움
+        print(f"[WARNING] idempotency result could not be stored: {e}")
+        await _release(uid, key)
+        return None
+
+
+async def _execute(
+    uid: int,
+    key: str,
+    handler: Callable[[], Awaitable[Any]],
+    status_code: int,
+) -> Tuple[Any, Optional[IdempotencyRecord]]:
+    """
+    핸들러를 실행하고 결과 저장
+    - 성공 응답과 3xx 결과(스탬프 인증 실패 등)는 저장해 재시도에 그대로 돌려줌
+    - 4xx / 5xx / 예외 / 취소는 저장하지 않고 키를 지워 재시도 시 다시 처리
+    """
+    _stats["executed"] += 1
+    try:
+        result = await handler()
+    except HTTPException as e:
+        if e.status_code < status.HTTP_400_BAD_REQUEST:
+            stored = await _complete(uid, key, e.status_code, {"detail": e.detail})
+            if stored is not None:
+                _remember(stored)
+        else:
+            await _release(uid, key)
+        raise
+    except BaseException:
+        await _release(uid, key)
+        raise
+
+    record = await _complete(uid, key, status_code, jsonable_encoder(result))
+    return result, record
+
+
+async def run_idempotent(
+    uid: int,
+    key: Optional[str],
+    request_fingerprint: bytes,
+    handler: Callable[[], Awaitable[Any]],
+    status_code: int = status.HTTP_200_OK,
+) -> Any:
+    """
+    Idempotency-Key가 있으면 같은 (사용자, 키)의 요청을 한 번만 처리
+    - 완료된 키: 메모리 -> DB 순으로 찾아 저장된 응답을 그대로 반환 (Idempotent-Replayed: true)
+    - 처리 중인 키: 같은 워커면 future로, 다른 워커면 DB를 확인하며 결과를 기다림
+    - 같은 키로 다른 본문을 보내면 422
+    키가 없으면 handler를 그대로 실행
+    """
+    if key is None:
+        return await handler()
+    if not key or len(key) > _MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Idempotency-Key는 1~{_MAX_KEY_LENGTH}자여야 합니다.",
+        )
+
+    cache_key = (uid, key)
+    while True:
+        record = _cached(cache_key)
+        if record is not None:
+            _check_fingerprint(record.fingerprint, request_fingerprint)
+            _stats["replayed_memory"] += 1
+            return _replay(record)
+
+        in_flight = _in_flight.get(cache_key)
+        if in_flight is None:
+            break
+        # 같은 워커에서 처리 중: 결과를 기다림 (기다리던 요청이 취소돼도 처리는 계속)
+        in_flight_fingerprint, future = in_flight
+        _check_fingerprint(in_flight_fingerprint, request_fingerprint)
+        _stats["waited"] += 1
+        await asyncio.shield(future)
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[cache_key] = (request_fingerprint, future)
+    record = None
+    try:
+        record = await _claim_or_wait(uid, key, request_fingerprint)
+        if record is not None:
+            _stats["replayed_database"] += 1
+            return _replay(record)
+        result, record = await _execute(uid, key, handler, status_code)
+        return result
+    except HTTPException as e:
+        if record is None and e.status_code < status.HTTP_400_BAD_REQUEST:
+            # _execute가 저장한 3xx 결과를 기다리던 요청에도 전달
+            record = _cached(cache_key)
+        raise
+    finally:
+        del _in_flight[cache_key]
+        if record is not None:
+            _remember(record)
+        future.set_result(record)
+
+
+@register_collector
+def collect_idempotency_metrics() -> List[MetricFamily]:
+    return [
+        MetricFamily(
+            "idempotency_executed_total",
+            "counter",
+            "Idempotency-Key 요청을 실제로 처리한 횟수",
+            [({}, _stats["executed"])],
+        ),
+        MetricFamily(
+            "idempotency_replayed_total",
+            "counter",
+            "저장된 응답을 돌려준 횟수 (source: memory / database)",
+            [
+                ({"source": "memory"}, _stats["replayed_memory"]),
+                ({"source": "database"}, _stats["replayed_database"]),
+            ],
+        ),
+        MetricFamily(
+            "idempotency_waited_total",
+            "counter",
+            "같은 워커에서 처리 중인 요청을 기다린 횟수",
+            [({}, _stats["waited"])],
+        ),
+        MetricFamily(
+            "idempotency_in_flight",
+            "gauge",
+            "처리 중인 키 수",
+            [({}, len(_in_flight))],
+        ),
+    ]
@@ -0,0 +1,246 @@
+import asyncio
+import json
+import uuid
+from contextlib import suppress
+from typing import Any, List, Optional, Sequence
+
+import asyncpg
+
+from app.config import settings
+from app.core.cache import (
+    Cache,
+    get_cache,
+    register_publisher,
+    unregister_publisher,
+)
+from app.core.metrics import MetricFamily, register_collector
+from app.database.database import execute_query
+
+# 캐시 무효화 이벤트를 주고받는 채널
+CHANNEL = "cache_invalidation"
+# NOTIFY payload 최대 크기(8000 bytes)보다 작게 나눠 보냄
+_MAX_PAYLOAD_BYTES = 7000
+# 재연결 대기 시간 (초, 실패할 때마다 2배)
+_RECONNECT_MIN_SECONDS = 0.5
+_RECONNECT_MAX_SECONDS = 30.0
+# 발행 / 상태 확인 쿼리 timeout (초)
+_QUERY_TIMEOUT_SECONDS = 2.0
+
+
+def _payloads(origin: str, tags: Sequence[str]) -> List[str]:
+    """태그 목록을 NOTIFY payload 크기 제한에 맞게 나눔 ({"o": 보낸 워커, "t": 태그 목록})"""
+    payloads: List[str] = []
+    chunk: List[str] = []
+    for tag in tags:
+        candidate = json.dumps({"o": origin, "t": chunk + [tag]}, separators=(",", ":"))
+        if chunk and len(candidate.encode()) > _MAX_PAYLOAD_BYTES:
+            payloads.append(
+                json.dumps({"o": origin, "t": chunk}, separators=(",", ":"))
+            )
+            chunk = []
+        chunk.append(tag)
+    if chunk:
+        payloads.append(json.dumps({"o": origin, "t": chunk}, separators=(",", ":")))
+    return payloads
+
+
+class InvalidationBus:
+    """
+    워커 간 캐시 무효화 버스 (Postgres LISTEN/NOTIFY, 워커마다 전용 연결 1개)
+    - 이 워커에서 무효화한 태그를 NOTIFY로 발행하고, 다른 워커는 받은 태그의 메모리 캐시를 무효화
+    - 연결이 끊기면 재연결하고, 끊겨 있는 동안 놓친 알림이 있을 수 있으므로 메모리 캐시 전체를 비움
+    - 연결되어 있는 동안만 메모리 캐시를 CACHE_TTL_SECONDS까지 유지 (cache.synchronized)
+    - 발행에 실패하면(리스너 연결과 연결 풀 모두) 메모리 캐시를 비우고 다시 성공할 때까지 짧은 TTL
+    """
+
+    def __init__(self, dsn: str, cache: Cache) -> None:
+        self.dsn = dsn
+        self.cache = cache
+        self.origin = uuid.uuid4().hex[:12]
+        self._conn: Optional[asyncpg.Connection] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.connected = asyncio.Event()
+
+        # 메트릭
+        self.published = 0
+        self.received = 0
+        self.reconnects = 0
+        self.flushes = 0
+
+    async def start(self) -> None:
+        """리스너 시작 (첫 연결을 잠시 기다리고, 실패해도 백그라운드에서 재시도)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.connected.wait(), _QUERY_TIMEOUT_SECONDS)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def publish(self, tags: Sequence[str]) -> None:
+        """
+        태그 무효화 발행 (쓰기가 커밋된 뒤 호출)
+        리스너 연결이 끊겨 있거나 응답이 없으면 DB 연결 풀로 발행해 다른 워커가 놓치지 않도록 함
+        쓰기는 이미 커밋되었으므로 발행에 실패해도 예외를 올리지 않고 메모리 캐시를 비움
+        """
+        if not tags:
+            return
+        for payload in _payloads(self.origin, tags):
+            try:
+                if self._conn is None:
+                    raise ConnectionError("invalidation bus is not connected")
+                async with self._lock:
+                    await self._conn.execute(
+                        "SELECT pg_notify($1, $2)",
+                        CHANNEL,
+                        payload,
+                        timeout=_QUERY_TIMEOUT_SECONDS,
+                    )
+                if self.connected.is_set():
+                    # 이전 발행 실패로 짧은 TTL로 바꿔 두었다면 되돌림
+                    self.cache.synchronized = True
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                asyncpg.PostgresError,
+                asyncpg.InterfaceError,
+            ) as e:
+                print(f"[WARNING] invalidation bus publish via pool: {e!r}")
+                if not await self._publish_via_pool(payload):
+                    # 다른 워커에 전달되지 않음 -> 다시 발행에 성공할 때까지 짧은 TTL로 전환
+                    self._flush()
+                    return
+            self.published += 1
+
+    async def _publish_via_pool(self, payload: str) -> bool:
+        """DB 연결 풀로 발행 (실패는 로그만 남기고 False)"""
+        try:
+            await asyncio.wait_for(
+                execute_query("SELECT pg_notify($1, $2)", (CHANNEL, payload)),
+                _QUERY_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            print(f"[WARNING] invalidation bus publish failed: {e!r}")
+            return False
+        return True
+
+    def _on_notify(self, conn: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            print(f"[WARNING] invalid invalidation payload: {payload[:100]}")
+            return
+        if message.get("o") == self.origin:
+            return
+        self.received += 1
+        self.cache.local.invalidate(message.get("t", []))
+
+    def _flush(self) -> None:
+        self.cache.synchronized = False
+        self.cache.clear()
+        self.flushes += 1
+
+    async def _run(self) -> None:
+        delay = _RECONNECT_MIN_SECONDS
+        was_connected = False
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(self.dsn, timeout=_QUERY_TIMEOUT_SECONDS)
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _: lost.set())
+                await conn.add_listener(CHANNEL, self._on_notify)
+                if was_connected:
+                    # 끊겨 있는 동안 놓친 알림이 있을 수 있음
+                    self.reconnects += 1
+                    self._flush()
+                was_connected = True
+                self._conn = conn
+                self.cache.synchronized = True
+                self.connected.set()
+                delay = _RECONNECT_MIN_SECONDS
+                await self._watch(conn, lost)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[WARNING] invalidation bus connection lost: {e}")
+            finally:
+                self._conn = None
+                self.connected.clear()
+                if was_connected and self.cache.synchronized:
+                    # 재연결 전까지의 쓰기를 받지 못하므로 바로 비우고 짧은 TTL로 전환
+                    self._flush()
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+
+    async def _watch(self, conn: asyncpg.Connection, lost: asyncio.Event) -> None:
+        """연결 종료 이벤트를 기다리면서 주기적으로 상태 확인 (응답 없는 연결 감지)"""
+        while not lost.is_set():
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    lost.wait(), settings.CACHE_INVALIDATION_BUS_CHECK_INTERVAL_SECONDS
+                )
+                return
+            async with self._lock:
+                await conn.fetchval("SELECT 1", timeout=_QUERY_TIMEOUT_SECONDS)
+
+
+# 프로세스 전역 버스 (lifespan에서 시작)
+_bus: Optional[InvalidationBus] = None
+
+
+async def start_invalidation_bus() -> None:
+    global _bus
+    if not settings.CACHE_INVALIDATION_BUS_ENABLED or _bus is not None:
+        return
+    _bus = InvalidationBus(settings.DATABASE_URL, get_cache())
+    register_publisher(_bus.publish)
+    await _bus.start()
+
+
+async def stop_invalidation_bus() -> None:
+    global _bus
+    if _bus is None:
+        return
+    unregister_publisher(_bus.publish)
+    await _bus.stop()
+    _bus = None
+
+
+@register_collector
+def collect_invalidation_bus_metrics() -> List[MetricFamily]:
+    if _bus is None:
+        return []
+    return [
+        MetricFamily(
+            "cache_invalidation_bus_connected",
+            "gauge",
+            "LISTEN 연결 상태 (1: 연결됨)",
+            [({}, int(_bus.connected.is_set()))],
+        ),
+        MetricFamily(
+            "cache_invalidation_published_total",
+            "counter",
+            "발행한 무효화 이벤트 수",
+            [({}, _bus.published)],
+        ),
+        MetricFamily(
+            "cache_invalidation_received_total",
+            "counter",
+            "다른 워커에게서 받은 무효화 이벤트 수",
+            [({}, _bus.received)],
+        ),
+        MetricFamily(
+            "cache_invalidation_bus_flushes_total",
+            "counter",
+            "연결이 끊겨 메모리 캐시 전체를 비운 횟수",
+            [({}, _bus.flushes)],
+        ),
+    ]
@@ -0,0 +1,54 @@
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+# Prometheus text exposition format 콘텐츠 타입
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricFamily(NamedTuple):
+    """같은 이름의 메트릭 묶음 (라벨별 값)"""
+
+    name: str
+    type: str  # "counter" | "gauge"
+    help: str
+    samples: List[Tuple[Dict[str, str], float]]
+
+
+Collector = Callable[[], List[MetricFamily]]
+
+# GET /metrics에서 호출할 수집 함수 (각 모듈이 import 시 등록)
+_collectors: List[Collector] = []
+
+
+def register_collector(collector: Collector) -> Collector:
+    """메트릭 수집 함수 등록 (데코레이터로 사용 가능)"""
+    if collector not in _collectors:
+        _collectors.append(collector)
+    return collector
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{key}="{_escape(str(value))}"' for key, value in sorted(labels.items())
+    )
+    return "{" + pairs + "}"
+
+
+def render_metrics() -> str:
+    """
+    등록된 모든 메트릭을 Prometheus text format으로 출력
+    값은 워커 프로세스 단위이므로 멀티 워커에서는 요청을 받은 워커의 값만 보인다.
+    """
+    lines = []
+    for collector in _collectors:
+        for family in collector():
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for labels, value in family.samples:
+                lines.append(f"{family.name}{_format_labels(labels)} {value}")
+    return "\n".join(lines) + "\n"
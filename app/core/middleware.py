@@ -0,0 +1,288 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import math
+import time
+from http.cookies import SimpleCookie
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.core.admission import AdmissionRejected, limiter_for
+from app.core.deadline import (
+    REQUEST_TIMEOUT_HEADER,
+    DeadlineExceeded,
+    deadline_scope,
+    is_expired,
+    route_timeout,
+)
+from app.database.database import track_queries, track_writes
+
+# 디버그 모드에서 노출하는 요청별 DB 사용량 헤더
+DB_QUERIES_HEADER = "X-DB-Queries"
+DB_ROUND_TRIPS_HEADER = "X-DB-Round-Trips"
+DB_TIME_HEADER = "X-DB-Time-Ms"
+
+
+class QueryStatsMiddleware:
+    """
+    요청별 DB 쿼리 수 / 왕복 수 / DB 시간 집계 미들웨어
+    - 디버그 모드: 응답 헤더(X-DB-*)로 노출
+    - 운영 모드: DB를 사용한 요청마다 key=value 형식 로그로 출력
+    N+1 패턴은 같은 엔드포인트의 쿼리 수가 데이터 크기에 따라 늘어나는 것으로 드러난다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if settings.DEBUG:
+                        # 헤더는 응답 시작 시점까지의 집계 (스트리밍 응답은 로그에서 최종값 확인)
+                        headers = MutableHeaders(scope=message)
+                        headers.append(DB_QUERIES_HEADER, str(stats.queries))
+                        headers.append(DB_ROUND_TRIPS_HEADER, str(stats.round_trips))
+                        headers.append(DB_TIME_HEADER, f"{stats.db_time * 1000:.3f}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                if not settings.DEBUG and stats.round_trips:
+                    print(
+                        f"[DB] method={scope['method']} path={scope['path']} "
+                        f"status={status_code} queries={stats.queries} "
+                        f"round_trips={stats.round_trips} "
+                        f"db_time_ms={stats.db_time * 1000:.3f} "
+                        f"elapsed_ms={(time.perf_counter() - started) * 1000:.3f}"
+                    )
+
+
+class DeadlineMiddleware:
+    """
+    요청별 처리 시간 예산(deadline) 미들웨어
+    - 예산: 경로별 설정(route_timeout), 클라이언트가 X-Request-Timeout-Ms 헤더로 더 짧게 지정 가능
+    - 남은 시간은 contextvar로 DB 헬퍼(timeout=)와 외부 AI 호출에 전달
+    - deadline이 지나면 핸들러를 취소하고 504 응답 (실행 중인 쿼리는 asyncpg가 서버에서 취소)
+      -> 멈춘 요청이 연결 풀과 요청 슬롯을 계속 붙잡지 않음
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    @staticmethod
+    def request_timeout(scope: Scope) -> Optional[float]:
+        """경로 예산과 클라이언트 헤더 중 더 짧은 값 (초)"""
+        timeout = route_timeout(scope["method"], scope["path"])
+        header = Headers(scope=scope).get(REQUEST_TIMEOUT_HEADER)
+        if header is not None:
+            try:
+                client_timeout = max(float(header), 0) / 1000
+            except ValueError:
+                client_timeout = None
+            if client_timeout is not None and (
+                timeout is None or client_timeout < timeout
+            ):
+                timeout = client_timeout
+        return timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = self.request_timeout(scope)
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_before_deadline(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                # deadline 이후에 만들어진 응답(쿼리 timeout을 잡아 400 등으로 바꾼 응답 포함)은 버림
+                if is_expired():
+                    raise DeadlineExceeded()
+                response_started = True
+            await send(message)
+
+        with deadline_scope(timeout):
+            try:
+                await asyncio.wait_for(
+                    self.app(scope, receive, send_before_deadline), timeout
+                )
+            except (asyncio.TimeoutError, DeadlineExceeded):
+                if response_started or not is_expired():
+                    raise
+                print(
+                    f"[DEADLINE] method={scope['method']} path={scope['path']} "
+                    f"timeout_ms={timeout * 1000:.0f}"
+                )
+                await self._send_timeout(send)
+
+    @staticmethod
+    async def _send_timeout(send: Send) -> None:
+        body = json.dumps(
+            {"detail": "요청 처리 시간을 초과했습니다."}, ensure_ascii=False
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 504,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """
+    비용이 큰 경로 그룹(업로드, 랜덤 뽑기, 로그인)별 동시 실행 수 제한 미들웨어
+    - 그룹마다 정해진 수만 동시에 실행하고 나머지는 크기가 정해진 대기열에서 대기
+    - 대기열이 가득 차면 429, 대기 시간을 넘기면 503을 Retry-After와 함께 바로 응답
+    - 그 외 경로는 제한 없이 통과 -> 업로드가 몰려도 조회 요청은 영향을 받지 않음
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = limiter_for(scope["method"], scope["path"])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await limiter.acquire()
+        except AdmissionRejected as e:
+            print(
+                f"[ADMISSION] method={scope['method']} path={scope['path']} "
+                f"route_class={limiter.name} status={e.status_code} reason={e.reason} "
+                f"queue_depth={limiter.queue_depth}"
+            )
+            await self._send_rejected(send, e)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(time.perf_counter() - started)
+
+    @staticmethod
+    async def _send_rejected(send: Send, rejected: AdmissionRejected) -> None:
+        body = json.dumps(
+            {"detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."},
+            ensure_ascii=False,
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": rejected.status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(rejected.retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class ReadYourWritesMiddleware:
+    """
+    워커 간 read-your-writes 미들웨어
+    - 요청 중 쓰기가 있으면 사용자와 쓰기 시각을 서명한 쿠키를 REPLICA_STICKY_SECONDS 동안 내려줌
+    - 다음 요청이 다른 워커로 가도 쿠키의 쓰기 시각으로 해당 사용자의 읽기를 primary로 보냄
+    쿠키는 같은 사용자로 인증된 요청에서만 쓰이므로 다른 사용자의 쿠키를 보내도 영향이 없다.
+    """
+
+    COOKIE_NAME = "kkook_last_write"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    @staticmethod
+    def _sign(payload: str) -> str:
+        return hmac.new(
+            settings.SECRET_KEY.encode(), payload.encode(), hashlib.sha256
+        ).hexdigest()
+
+    @classmethod
+    def encode(cls, uid: int, written_at: float) -> str:
+        """쿠키 값 (uid:쓰기 시각(ms):서명)"""
+        payload = f"{uid}:{int(written_at * 1000)}"
+        return f"{payload}:{cls._sign(payload)}"
+
+    @classmethod
+    def decode(cls, value: str) -> Optional[Tuple[int, float]]:
+        """서명이 맞으면 (uid, 쓰기 시각), 아니면 None"""
+        payload, _, signature = value.rpartition(":")
+        if not hmac.compare_digest(signature, cls._sign(payload)):
+            return None
+        uid, _, written_ms = payload.partition(":")
+        try:
+            return int(uid), int(written_ms) / 1000
+        except ValueError:
+            return None
+
+    @classmethod
+    def _last_write(cls, scope: Scope) -> Optional[Tuple[int, float]]:
+        header = Headers(scope=scope).get("cookie")
+        if not header:
+            return None
+        cookies: SimpleCookie = SimpleCookie()
+        try:
+            cookies.load(header)
+        except Exception:
+            return None
+        morsel = cookies.get(cls.COOKIE_NAME)
+        return cls.decode(morsel.value) if morsel is not None else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        uid, written_at = self._last_write(scope) or (None, None)
+        with track_writes(uid, written_at) as tracker:
+
+            async def send_with_cookie(message: Message) -> None:
+                if (
+                    message["type"] == "http.response.start"
+                    and tracker.wrote
+                    and settings.replica_urls
+                ):
+                    cookie = (
+                        f"{self.COOKIE_NAME}="
+                        f"{self.encode(tracker.uid, tracker.written_at)}; "
+                        f"Max-Age={math.ceil(settings.REPLICA_STICKY_SECONDS)}; "
+                        "Path=/; HttpOnly; SameSite=lax"
+                    )
+                    MutableHeaders(scope=message).append("set-cookie", cookie)
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
@@ -1,12 +1,18 @@
 from authlib.integrations.starlette_client import OAuth
 
 from app.config import settings
+from app.core.google_openid import get_google_openid
 
 oauth = OAuth()
+# discovery 문서는 authlib이 받지 않고 캐시된 값을 사용 (load_google_metadata)
 oauth.register(
     name="google",
     client_id=settings.GOOGLE_CLIENT_ID,
     client_secret=settings.GOOGLE_CLIENT_SECRET,
-    server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
     client_kwargs={"scope": "openid email profile"},
 )
+
+
+async def load_google_metadata() -> None:
+    """캐시된 Google discovery 문서(인증 / 토큰 엔드포인트)를 authlib 클라이언트에 반영"""
+    oauth.google.server_metadata.update(await get_google_openid().get_metadata())
@@ -0,0 +1,121 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 트리를 처음 만들 때 / 점수가 넘칠 때 키우는 최소 크기
+_MIN_CAPACITY = 64
+
+
+class RankIndex:
+    """
+    사용자 점수 순위표 (워커 프로세스 메모리)
+    - 점수별 사용자 수를 Fenwick 트리로 유지: 점수 변경 / 순위 조회 O(log S) (S: 최고 점수)
+    - 순위는 공동 순위 (1 + 나보다 점수가 높은 사용자 수), 0점 이하는 순위에 넣지 않음
+    - 상위 N명은 k번째로 높은 점수를 트리에서 찾아 같은 점수의 사용자를 uid 순으로 나열
+    """
+
+    def __init__(self, scores: Optional[Iterable[Tuple[int, int]]] = None) -> None:
+        self._scores: Dict[int, int] = {}
+        self._members: Dict[int, Set[int]] = {}
+        self._capacity = _MIN_CAPACITY
+        self._tree: List[int] = [0] * (self._capacity + 1)
+        if scores is not None:
+            self._load(scores)
+
+    def __len__(self) -> int:
+        """순위에 있는 사용자 수"""
+        return len(self._scores)
+
+    def _load(self, scores: Iterable[Tuple[int, int]]) -> None:
+        """(uid, 점수) 목록으로 한 번에 구성 O(n + S)"""
+        self._scores = {}
+        self._members = {}
+        for uid, score in scores:
+            if score > 0:
+                self._scores[uid] = score
+                self._members.setdefault(score, set()).add(uid)
+        top = max(self._members, default=0)
+        while self._capacity < top:
+            self._capacity *= 2
+        tree = [0] * (self._capacity + 1)
+        for score, members in self._members.items():
+            tree[score] = len(members)
+        for i in range(1, self._capacity + 1):
+            parent = i + (i & -i)
+            if parent <= self._capacity:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _update(self, score: int, delta: int) -> None:
+        i = score
+        while i <= self._capacity:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _count_at_most(self, score: int) -> int:
+        """점수가 score 이하인 사용자 수"""
+        total = 0
+        i = min(score, self._capacity)
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _kth_lowest(self, k: int) -> int:
+        """k번째로 낮은 점수 (1부터)"""
+        position = 0
+        step = 1 << self._capacity.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= self._capacity and self._tree[nxt] < k:
+                position = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        return position + 1
+
+    def score(self, uid: int) -> int:
+        return self._scores.get(uid, 0)
+
+    def set(self, uid: int, score: int) -> None:
+        """사용자 점수 변경"""
+        previous = self._scores.pop(uid, 0)
+        if previous > 0:
+            self._update(previous, -1)
+            members = self._members[previous]
+            members.discard(uid)
+            if not members:
+                del self._members[previous]
+        if score <= 0:
+            return
+        if score > self._capacity:
+            # 트리를 두 배씩 키워 다시 구성 (점수는 1씩 오르므로 드물게 일어남)
+            self._load(list(self._scores.items()) + [(uid, score)])
+            return
+        self._scores[uid] = score
+        self._members.setdefault(score, set()).add(uid)
+        self._update(score, 1)
+
+    def add(self, uid: int, delta: int) -> int:
+        """사용자 점수를 delta만큼 바꾸고 바뀐 점수 반환"""
+        score = self.score(uid) + delta
+        self.set(uid, score)
+        return max(score, 0)
+
+    def rank(self, uid: int) -> Optional[int]:
+        """사용자 순위 (순위에 없으면 None)"""
+        score = self._scores.get(uid)
+        if score is None:
+            return None
+        return 1 + len(self._scores) - self._count_at_most(score)
+
+    def top(self, limit: int) -> List[Tuple[int, int, int]]:
+        """상위 limit명의 (순위, uid, 점수)"""
+        result: List[Tuple[int, int, int]] = []
+        total = len(self._scores)
+        rank = 1
+        while rank <= total and len(result) < limit:
+            score = self._kth_lowest(total - rank + 1)
+            members = self._members[score]
+            for uid in heapq.nsmallest(limit - len(result), members):
+                result.append((rank, uid, score))
+            rank += len(members)
+        return result
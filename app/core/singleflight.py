@@ -0,0 +1,100 @@
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+from app.core.metrics import MetricFamily, register_collector
+from app.database import database
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    동시에 들어온 같은 조회를 한 번만 실행하고 결과를 공유 (워커 프로세스 단위)
+    - 결과를 보관하지 않으므로 오래된 값을 돌려주지 않음: 실행 중인 조회에만 합류
+    - 호출자가 마지막 쓰기 이전에 시작된 조회에는 합류하지 않음 (read-your-writes)
+    - 조회는 별도 태스크로 실행되어 먼저 온 요청이 취소돼도 기다리는 요청은 결과를 받음
+    결과 객체를 여러 요청이 함께 사용하므로 호출자는 결과를 수정하지 말 것
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._flights: Dict[Hashable, Tuple[float, asyncio.Task]] = {}
+
+        # 메트릭
+        self.executed = 0
+        self.shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        flight = self._flights.get(key)
+        written_at = database.last_write_at()
+        if flight is not None and (written_at is None or written_at <= flight[0]):
+            self.shared += 1
+            return await asyncio.shield(flight[1])
+
+        # 컨텍스트(요청 deadline, 쿼리 집계 등)는 처음 요청의 것을 복사해 사용
+        task = asyncio.ensure_future(func())
+        self._flights[key] = (time.monotonic(), task)
+        task.add_done_callback(functools.partial(self._finish, key))
+        self.executed += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight[1] is task:
+            del self._flights[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 처리되지 않았다는 경고가 남지 않도록
+        if not task.cancelled():
+            task.exception()
+
+
+# 이름별 SingleFlight (메트릭 라벨)
+_groups: Dict[str, SingleFlight] = {}
+
+
+def single_flight(name: str) -> Callable[[Callable[..., Awaitable[T]]], Any]:
+    """
+    비동기 조회 함수에 single-flight 적용 (인자가 같은 동시 호출은 한 번만 실행)
+    인자는 hash 가능해야 함. @staticmethod 아래에 붙여 사용
+    """
+    group = _groups.setdefault(name, SingleFlight(name))
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = (args, tuple(sorted(kwargs.items())))
+            return await group.do(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+@register_collector
+def collect_single_flight_metrics() -> List[MetricFamily]:
+    groups = list(_groups.values())
+    return [
+        MetricFamily(
+            "single_flight_executed_total",
+            "counter",
+            "실제로 실행한 조회 수",
+            [({"name": group.name}, group.executed) for group in groups],
+        ),
+        MetricFamily(
+            "single_flight_shared_total",
+            "counter",
+            "실행 중인 조회에 합류해 결과를 공유한 호출 수",
+            [({"name": group.name}, group.shared) for group in groups],
+        ),
+        MetricFamily(
+            "single_flight_in_flight",
+            "gauge",
+            "실행 중인 조회 수",
+            [({"name": group.name}, group.in_flight) for group in groups],
+        ),
+    ]
@@ -1,26 +1,333 @@
 import asyncio
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+import itertools
+import re
+import time
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import asyncpg
 
 from app.config import settings
+from app.core.deadline import remaining
 
 # 전역 연결 풀
 pool = None
+# 연결 풀 워밍업이 끝나 요청을 받을 수 있는 상태인지 (readiness 체크용)
+_ready = False
+
+# execute_many 한 번의 executemany로 보내는 최대 행 수
+EXECUTE_MANY_BATCH_SIZE = 1000
+# stream_copy가 받아 두는 COPY 데이터 조각 수 (가득 차면 Postgres에서 더 읽지 않음)
+COPY_STREAM_BUFFER_CHUNKS = 16
+
+
+class QueryStats:
+    """요청 단위 DB 사용량 (쿼리 수, 왕복 수, DB 시간)"""
+
+    __slots__ = ("queries", "round_trips", "db_time")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.round_trips = 0
+        self.db_time = 0.0  # 초
+
+    def record(self, queries: int, round_trips: int, elapsed: float) -> None:
+        self.queries += queries
+        self.round_trips += round_trips
+        self.db_time += elapsed
+
+
+# 현재 컨텍스트에서 집계 중인 QueryStats들 (요청 미들웨어, 테스트 등 중첩 가능)
+_query_stats: ContextVar[Tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 DB 헬퍼 호출을 집계
+    asyncio.gather 등으로 만든 하위 태스크도 컨텍스트를 복사하므로 같은 QueryStats에 집계된다.
+    """
+    stats = QueryStats()
+    token = _query_stats.set(_query_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def _record_query(started: float, queries: int = 1, round_trips: int = 1) -> None:
+    elapsed = time.perf_counter() - started
+    for stats in _query_stats.get():
+        stats.record(queries, round_trips, elapsed)
+
+
+# 새 연결마다 미리 실행해 둘 자주 쓰는 조회 쿼리 (리포지토리 모듈 import 시 등록)
+_warmup_queries: List[str] = []
+_PARAM_PATTERN = re.compile(r"\$(\d+)")
+
+
+def register_warmup_query(query: str) -> str:
+    """
+    연결 워밍업 대상 쿼리 등록 후 쿼리를 그대로 반환
+    파라미터를 모두 NULL로 넣어 실행하므로 부작용 없는 SELECT만 등록할 것
+    """
+    if query not in _warmup_queries:
+        _warmup_queries.append(query)
+    return query
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    풀이 새 연결을 열 때마다 호출 (create_pool의 init)
+    등록된 쿼리를 한 번씩 실행해 연결의 prepared statement 캐시와 타입 codec(enum 등)을 미리 채운다.
+    """
+    for query in _warmup_queries:
+        params = [int(n) for n in _PARAM_PATTERN.findall(query)]
+        try:
+            await conn.fetch(query, *([None] * max(params, default=0)))
+        except asyncpg.PostgresError as e:
+            print(f"[WARNING] connection warm-up query failed: {e}")
+
+
+def _pool_options() -> Dict[str, Any]:
+    """primary / 복제본 공통 풀 설정 (워커 프로세스 단위)"""
+    return {
+        "min_size": settings.DB_POOL_MIN_SIZE,
+        "max_size": settings.DB_POOL_MAX_SIZE,
+        "init": _init_connection,
+    }
 
 
 async def get_pool() -> asyncpg.Pool:
     """비동기 데이터베이스 연결 풀 가져오기"""
     global pool
     if pool is None:
+        # create_pool은 min_size개의 연결을 미리 열고 각각 init(워밍업)을 실행한 뒤 반환
         pool = await asyncpg.create_pool(
             dsn=settings.DATABASE_URL,
-            min_size=5,
-            max_size=20,  # [Modified by 정환 2025-04-12-17:00]record_class=dict
+            **_pool_options(),  # [Modified by 정환 2025-04-12-17:00]record_class=dict
         )
     return pool
 
 
+def is_ready() -> bool:
+    """연결 풀 워밍업이 끝났고 아직 종료 중이 아닌지"""
+    return _ready and pool is not None
+
+
+class ReplicaPool:
+    """읽기 전용 복제본 연결 풀과 마지막으로 측정한 복제 지연"""
+
+    # 복제본이 primary를 얼마나 따라잡았는지 (초). primary에 연결되면 0
+    LAG_QUERY = """
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        END
+    """
+
+    def __init__(self, dsn: str) -> None:
+        self.dsn = dsn
+        self.pool: Optional[asyncpg.Pool] = None
+        self.lag: Optional[float] = None  # None: 측정 실패 / 아직 측정 전
+
+    def is_healthy(self) -> bool:
+        return (
+            self.pool is not None
+            and self.lag is not None
+            and self.lag <= settings.REPLICA_MAX_LAG_SECONDS
+        )
+
+    async def check_lag(self) -> Optional[float]:
+        """
+        복제 지연 측정 (실패 시 unhealthy로 표시되어 읽기가 primary로 감)
+        연결을 거부하지 않고 멈춘 복제본도 REPLICA_LAG_CHECK_TIMEOUT_SECONDS 안에 실패로 처리
+        """
+        was_healthy = self.is_healthy()
+        timeout = settings.REPLICA_LAG_CHECK_TIMEOUT_SECONDS
+        try:
+            if self.pool is None:
+                self.pool = await asyncio.wait_for(
+                    asyncpg.create_pool(dsn=self.dsn, **_pool_options()), timeout
+                )
+            async with self.pool.acquire(timeout=timeout) as conn:
+                self.lag = float(await conn.fetchval(self.LAG_QUERY, timeout=timeout))
+        except Exception as e:
+            # timeout / 끊긴 연결(InterfaceError) 등 어떤 실패든 측정 전까지 읽기에서 제외
+            print(f"[WARNING] replica lag check failed: {e!r}")
+            self.lag = None
+
+        if was_healthy and not self.is_healthy():
+            print(f"[WARNING] replica excluded from reads (lag: {self.lag})")
+        return self.lag
+
+
+# 복제본 목록 (settings.DATABASE_REPLICA_URLS로부터 처음 사용할 때 생성)
+replicas: Optional[List[ReplicaPool]] = None
+_replica_cursor = itertools.count()
+# 요청 안에서 처음 고른 복제본 (같은 요청의 읽기는 같은 복제본에서)
+# 데이터 버전(ETag)과 데이터를 지연이 다른 복제본에서 읽으면 데이터가 버전보다 오래될 수 있음
+_request_replica: ContextVar[Optional[ReplicaPool]] = ContextVar(
+    "request_replica", default=None
+)
+_replica_monitor: Optional[asyncio.Task] = None
+
+# read-your-writes: 사용자별 마지막 쓰기 시각 (time.monotonic, 워커 프로세스 단위)
+_last_write_at: Dict[int, float] = {}
+_LAST_WRITE_PRUNE_SIZE = 10_000
+# 현재 요청의 사용자 (인증 의존성에서 설정)
+_session_uid: ContextVar[Optional[int]] = ContextVar("session_uid", default=None)
+
+
+class WriteTracker:
+    """
+    요청 단위 read-your-writes 기록 (워커 간 전달용, time.time 기준)
+    ReadYourWritesMiddleware가 요청 쿠키의 쓰기 시각으로 채우고, 요청 중 쓰기가 있으면 응답 쿠키로 내보냄
+    """
+
+    __slots__ = ("uid", "written_at", "wrote")
+
+    def __init__(
+        self, uid: Optional[int] = None, written_at: Optional[float] = None
+    ) -> None:
+        self.uid = uid
+        self.written_at = written_at
+        self.wrote = False  # 이번 요청에서 쓰기를 했는지
+
+
+_write_tracker: ContextVar[Optional[WriteTracker]] = ContextVar(
+    "write_tracker", default=None
+)
+
+
+@contextmanager
+def track_writes(
+    uid: Optional[int] = None, written_at: Optional[float] = None
+) -> Iterator[WriteTracker]:
+    """블록 안의 쓰기를 WriteTracker에 기록 (uid / written_at: 이전 요청에서 전달받은 쓰기)"""
+    tracker = WriteTracker(uid, written_at)
+    token = _write_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _write_tracker.reset(token)
+
+
+def bind_session_user(uid: int) -> None:
+    """현재 요청의 사용자 설정 (쓰기 기록 및 읽기 라우팅 기준)"""
+    _session_uid.set(uid)
+
+
+def _is_write(query: str) -> bool:
+    return not query.lstrip().upper().startswith("SELECT")
+
+
+def _mark_write(query: str) -> None:
+    """현재 사용자가 primary에 쓰기를 했다면 시각 기록"""
+    uid = _session_uid.get()
+    if uid is None or not _is_write(query):
+        return
+    now = time.monotonic()
+    _last_write_at[uid] = now
+    tracker = _write_tracker.get()
+    if tracker is not None:
+        tracker.uid, tracker.written_at, tracker.wrote = uid, time.time(), True
+    if len(_last_write_at) > _LAST_WRITE_PRUNE_SIZE:
+        # 고정 시간이 지난 기록 정리
+        for stale_uid, written_at in list(_last_write_at.items()):
+            if now - written_at > settings.REPLICA_STICKY_SECONDS:
+                del _last_write_at[stale_uid]
+
+
+def last_write_at() -> Optional[float]:
+    """현재 사용자가 이 워커에서 마지막으로 쓰기를 한 시각 (time.monotonic, 없으면 None)"""
+    uid = _session_uid.get()
+    if uid is None:
+        return None
+    return _last_write_at.get(uid)
+
+
+def _is_sticky() -> bool:
+    """
+    최근에 쓰기를 한 사용자인지 (자신의 쓰기를 복제 지연 없이 읽어야 함)
+    이 워커의 기록 또는 다른 워커에서 쓰기 후 쿠키로 전달받은 기록(WriteTracker)으로 판단
+    """
+    uid = _session_uid.get()
+    if uid is None:
+        return False
+    written_at = _last_write_at.get(uid)
+    if (
+        written_at is not None
+        and time.monotonic() - written_at <= settings.REPLICA_STICKY_SECONDS
+    ):
+        return True
+    tracker = _write_tracker.get()
+    return (
+        tracker is not None
+        and tracker.uid == uid
+        and tracker.written_at is not None
+        and time.time() - tracker.written_at <= settings.REPLICA_STICKY_SECONDS
+    )
+
+
+async def get_replicas() -> List[ReplicaPool]:
+    """설정된 복제본 목록 (첫 호출 시 풀 생성 및 지연 측정)"""
+    global replicas
+    if replicas is None:
+        replicas = [ReplicaPool(dsn) for dsn in settings.replica_urls]
+        await asyncio.gather(*(replica.check_lag() for replica in replicas))
+    return replicas
+
+
+async def get_replica_pool() -> Optional[asyncpg.Pool]:
+    """
+    지연 허용치 이내인 복제본 풀 (요청마다 라운드 로빈, 요청 안에서는 같은 복제본). 없으면 None
+    """
+    pinned = _request_replica.get()
+    if pinned is not None:
+        # 고른 복제본이 빠지면 더 뒤처진 복제본 대신 primary로
+        return pinned.pool if pinned.is_healthy() else None
+    healthy = [replica for replica in await get_replicas() if replica.is_healthy()]
+    if not healthy:
+        return None
+    replica = healthy[next(_replica_cursor) % len(healthy)]
+    _request_replica.set(replica)
+    return replica.pool
+
+
+async def _get_read_pool(read_only: bool) -> asyncpg.Pool:
+    """read_only 조회는 복제본으로. 그 외 / 최근 쓰기 사용자 / 쓸 수 있는 복제본이 없으면 primary로"""
+    if read_only and settings.replica_urls and not _is_sticky():
+        replica_pool = await get_replica_pool()
+        if replica_pool is not None:
+            return replica_pool
+    return await get_pool()
+
+
+async def monitor_replica_lag() -> None:
+    """복제 지연을 주기적으로 측정하는 백그라운드 작업 (한 번 실패해도 계속 측정)"""
+    while True:
+        try:
+            await asyncio.gather(
+                *(replica.check_lag() for replica in await get_replicas())
+            )
+        except Exception as e:
+            print(f"[WARNING] replica lag monitor iteration failed: {e!r}")
+        await asyncio.sleep(settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS)
+
+
 async def get_db() -> AsyncGenerator[asyncpg.Pool, None]:
     """FastAPI 의존성 주입을 위한 데이터베이스 연결 제공"""
     pool = await get_pool()
@@ -33,58 +340,186 @@ async def get_db() -> AsyncGenerator[asyncpg.Pool, None]:
 async def execute_query(query: str, values: Optional[tuple] = None) -> Any:
     """
     SQL 쿼리 실행 (INSERT, UPDATE, DELETE)
+    요청 deadline이 있으면 연결 대기와 쿼리 모두 남은 시간 안에서만 실행 (모든 헬퍼 공통)
+    시간을 넘기면 asyncpg가 서버에서 실행 중인 쿼리를 취소하고 asyncio.TimeoutError
     """
     pool = await get_pool()
-    async with pool.acquire() as conn:
-        if values:
-            return await conn.execute(query, *values)
-        return await conn.execute(query)
+    async with pool.acquire(timeout=remaining()) as conn:
+        started = time.perf_counter()
+        try:
+            if values:
+                return await conn.execute(query, *values, timeout=remaining())
+            return await conn.execute(query, timeout=remaining())
+        finally:
+            _record_query(started)
+            _mark_write(query)
 
 
 async def fetch_one(
-    query: str, values: Optional[tuple] = None
+    query: str, values: Optional[tuple] = None, read_only: bool = False
 ) -> Union[Any, Dict[str, Any]]:
     """
     단일 레코드 조회
+    read_only=True면 복제본에서 읽을 수 있음 (복제 지연을 감수할 수 있는 조회에만 사용)
     """
-    pool = await get_pool()
-    async with pool.acquire() as conn:
-        if values:
-            return await conn.fetchrow(query, *values)
-        return await conn.fetchrow(query)
+    pool = await _get_read_pool(read_only)
+    async with pool.acquire(timeout=remaining()) as conn:
+        started = time.perf_counter()
+        try:
+            if values:
+                return await conn.fetchrow(query, *values, timeout=remaining())
+            return await conn.fetchrow(query, timeout=remaining())
+        finally:
+            _record_query(started)
+            if not read_only:
+                _mark_write(query)
 
 
 async def fetch_all(
-    query: str, values: Optional[tuple] = None
+    query: str, values: Optional[tuple] = None, read_only: bool = False
 ) -> Union[Any, List[Dict[str, Any]]]:
     """
     여러 레코드 조회
+    read_only=True면 복제본에서 읽을 수 있음 (복제 지연을 감수할 수 있는 조회에만 사용)
     """
-    pool = await get_pool()
-    async with pool.acquire() as conn:
-        if values:
-            return await conn.fetch(query, *values)
-        return await conn.fetch(query)
+    pool = await _get_read_pool(read_only)
+    async with pool.acquire(timeout=remaining()) as conn:
+        started = time.perf_counter()
+        try:
+            if values:
+                return await conn.fetch(query, *values, timeout=remaining())
+            return await conn.fetch(query, timeout=remaining())
+        finally:
+            _record_query(started)
+            if not read_only:
+                _mark_write(query)
 
 
-async def execute_many(query: str, list_values: List[tuple]) -> None:
+async def stream_rows(
+    query: str,
+    values: Optional[tuple] = None,
+    chunk_size: Optional[int] = None,
+    read_only: bool = False,
+) -> AsyncIterator[List[asyncpg.Record]]:
+    """
+    서버 측 커서로 chunk_size개씩 조회 (기본 settings.EXPORT_CHUNK_ROWS, 결과 전체를 메모리에 올리지 않음)
+    - 커서는 트랜잭션 안에서만 유지되므로 다 읽을 때까지 연결 하나를 점유
+    - 요청 deadline은 각 chunk 조회에 적용 (긴 내보내기는 경로 예산을 None으로 둘 것)
+    - 소비하는 쪽이 중간에 멈추면(클라이언트 연결 끊김 등) 트랜잭션을 닫고 연결 반환
+    """
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_ROWS
+    pool = await _get_read_pool(read_only)
+    async with pool.acquire(timeout=remaining()) as conn:
+        started = time.perf_counter()
+        chunks = 0
+        try:
+            async with conn.transaction(readonly=True):
+                cursor = await conn.cursor(query, *(values or ()), timeout=remaining())
+                while True:
+                    chunks += 1
+                    rows = await cursor.fetch(chunk_size, timeout=remaining())
+                    if not rows:
+                        break
+                    yield rows
+                    if len(rows) < chunk_size:
+                        break
+        finally:
+            # BEGIN / DECLARE / COMMIT 포함
+            _record_query(started, round_trips=chunks + 3)
+
+
+async def stream_copy(
+    query: str,
+    values: Optional[tuple] = None,
+    read_only: bool = False,
+    **copy_options: Any,
+) -> AsyncIterator[bytes]:
+    """
+    COPY (query) TO STDOUT 결과를 받는 대로 조각(bytes) 단위로 전달 (copy_options: format, header 등)
+    - 조각은 크기가 정해진 큐를 거치므로, 소비하는 쪽(HTTP 클라이언트)이 느리면 Postgres에서 읽는 것도 멈춤
+      -> 결과 크기와 상관없이 메모리 사용량이 일정
+    - 타임스탬프는 UTC / ISO 8601로 출력 (읽기 전용 트랜잭션 안에서 SET LOCAL)
+    - 소비하는 쪽이 중간에 멈추면 COPY를 취소하고 연결 반환
+    """
+    pool = await _get_read_pool(read_only)
+    async with pool.acquire(timeout=remaining()) as conn:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=COPY_STREAM_BUFFER_CHUNKS)
+
+        async def copy() -> None:
+            try:
+                async with conn.transaction(readonly=True):
+                    await conn.execute(
+                        "SET LOCAL TIME ZONE 'UTC'; SET LOCAL DateStyle = 'ISO'"
+                    )
+                    await conn.copy_from_query(
+                        query,
+                        *(values or ()),
+                        output=queue.put,
+                        timeout=remaining(),
+                        **copy_options,
+                    )
+            except Exception:
+                # 오류도 끝 표시 후 전달 (취소된 경우에는 기다리는 쪽이 없으므로 넣지 않음)
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        started = time.perf_counter()
+        task = asyncio.ensure_future(copy())
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                # asyncpg는 bytearray로 전달
+                yield bytes(chunk)
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+            # BEGIN / SET / (인자가 있으면 prepare + 인자 변환) / COPY / COMMIT
+            _record_query(started, round_trips=6 if values else 4)
+
+
+async def execute_many(
+    query: str,
+    list_values: List[tuple],
+    batch_size: int = EXECUTE_MANY_BATCH_SIZE,
+) -> None:
     """
     여러 쿼리 일괄 실행: None 반환함...
+    하나의 트랜잭션 안에서 batch_size개씩 executemany로 파이프라이닝 -> 전부 성공하거나 전부 롤백
+    (행을 돌려받아야 하면 unnest 배열을 사용하는 단일 INSERT ... RETURNING을 사용할 것)
     """
+    if not list_values:
+        return None
+
     pool = await get_pool()
-    async with pool.acquire() as conn:
-        await conn.executemany(query, list_values)
+    async with pool.acquire(timeout=remaining()) as conn:
+        started = time.perf_counter()
+        batches = 0
+        try:
+            async with conn.transaction():
+                for start in range(0, len(list_values), batch_size):
+                    batches += 1
+                    await conn.executemany(
+                        query,
+                        list_values[start : start + batch_size],
+                        timeout=remaining(),
+                    )
+        finally:
+            # BEGIN / COMMIT 포함
+            _record_query(started, queries=len(list_values), round_trips=batches + 2)
+            _mark_write(query)
         return None
-        # 트랜잭션 사용 -> 이제 Atomic하게 처리됨!
-        # async with conn.transaction():
-        #     # executemany 대신 prepare와 execute 조합 사용
-        #     stmt = await conn.prepare(query)
-        #     await asyncio.gather(*[stmt.execute(*value) for value in values])
 
 
 async def init_db() -> None:
     """
     데이터베이스 초기화 함수
+    연결 풀(및 복제본) 워밍업이 끝나면 ready로 표시
     """
     # try:
     #     pool = await get_pool()
@@ -107,4 +542,48 @@ async def init_db() -> None:
     #         print("Database initialized successfully")
     # except Exception as e:
     #     print(f"Database initialization error: {e}")
-    pass
+
+    global _replica_monitor, _ready
+
+    # 첫 요청이 연결 비용을 치르지 않도록 풀을 미리 만들고 min_size개 연결을 워밍업
+    await get_pool()
+
+    # 복제본이 설정되어 있으면 복제본 풀 워밍업 + 복제 지연 모니터링 시작
+    if settings.replica_urls and _replica_monitor is None:
+        await get_replicas()
+        _replica_monitor = asyncio.create_task(monitor_replica_lag())
+
+    _ready = True
+
+
+async def _close_pool(target: asyncpg.Pool, timeout: float) -> None:
+    """사용 중인 연결이 반환될 때까지 기다렸다가 닫고, timeout을 넘기면 강제 종료"""
+    try:
+        await asyncio.wait_for(target.close(), timeout)
+    except asyncio.TimeoutError:
+        print(f"[WARNING] database pool did not close within {timeout}s, terminating")
+        target.terminate()
+
+
+async def close_db(timeout: Optional[float] = None) -> None:
+    """
+    데이터베이스 종료 함수
+    readiness를 먼저 내린 뒤 primary / 복제본 풀을 timeout 안에 정리한다.
+    """
+    global pool, replicas, _replica_monitor, _ready
+    _ready = False
+
+    if _replica_monitor is not None:
+        _replica_monitor.cancel()
+        with suppress(asyncio.CancelledError):
+            await _replica_monitor
+        _replica_monitor = None
+
+    if timeout is None:
+        timeout = settings.DB_POOL_CLOSE_TIMEOUT_SECONDS
+    pools = [pool] + [replica.pool for replica in replicas or []]
+    pool = None
+    replicas = None
+    await asyncio.gather(
+        *(_close_pool(target, timeout) for target in pools if target is not None)
+    )
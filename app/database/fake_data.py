@@ -1,8 +1,3 @@
-FAKE_USERS = {
-    1: {"id": 1, "email": "test1@example.com", "username": "테스트유저1"},
-    2: {"id": 2, "email": "test2@example.com", "username": "테스트유저2"},
-}
-
 FAKE_CHALLENGES = {
     1: [
         {"id": 1, "title": "텀블러 사용하기", "completed": True},
@@ -18,17 +13,3 @@ FAKE_DECORATIONS = {
     ],
     2: [{"id": 3, "type": "아이콘", "name": "에코 워리어"}],
 }
-
-from datetime import datetime
-
-from app.models.user_model import User
-
-
-def get_fake_user_info(user_info: dict) -> User:
-    return User(
-        id=1,
-        email=user_info["email"],
-        username=user_info.get("name", "google_user"),
-        is_active=True,
-        created_at=datetime.utcnow(),
-    )
@@ -0,0 +1,75 @@
+"""
+운영 분석용 데이터 CSV 내보내기 (GET /api/exports/{dataset}와 같은 쿼리)
+
+사용법:
+    python -m app.export stamps --start 2026-01-01 --end 2026-01-31 -o stamps.csv
+    python -m app.export challenges | gzip > challenges.csv.gz
+
+- 데이터셋: stamps / challenges / decorations
+- 기간은 UTC 날짜 (둘 다 포함), 생략하면 전체
+- Postgres COPY 결과를 받는 대로 파일(기본: 표준 출력)에 기록 (복제본이 있으면 복제본에서 읽음)
+"""
+
+import argparse
+import asyncio
+import sys
+from contextlib import redirect_stdout
+from datetime import date
+from typing import BinaryIO, List, Optional
+
+# 설정을 읽으며 출력하는 안내 메시지가 표준 출력(CSV)에 섞이지 않도록
+with redirect_stdout(sys.stderr):
+    from app.config import settings
+    from app.database.database import close_db
+    from app.models.export_model import ExportDataset
+    from app.services.export_service import ExportService
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("dataset", choices=[dataset.value for dataset in ExportDataset])
+    parser.add_argument(
+        "--start", type=date.fromisoformat, help="시작일 (YYYY-MM-DD, 포함)"
+    )
+    parser.add_argument(
+        "--end", type=date.fromisoformat, help="종료일 (YYYY-MM-DD, 포함)"
+    )
+    parser.add_argument(
+        "-o", "--output", help="저장할 파일 경로 (기본: 표준 출력)", default=None
+    )
+    return parser.parse_args(argv)
+
+
+async def export(
+    dataset: ExportDataset,
+    start: Optional[date],
+    end: Optional[date],
+    output: BinaryIO,
+) -> int:
+    """내보낸 바이트 수 반환"""
+    written = 0
+    try:
+        async for chunk in ExportService.export_csv(dataset, start, end):
+            output.write(chunk)
+            written += len(chunk)
+    finally:
+        await close_db()
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    # 내보내기는 연결 하나만 사용
+    settings.DB_POOL_MIN_SIZE = settings.DB_POOL_MAX_SIZE = 1
+
+    dataset = ExportDataset(args.dataset)
+    if args.output is None:
+        written = asyncio.run(export(dataset, args.start, args.end, sys.stdout.buffer))
+    else:
+        with open(args.output, "wb") as output:
+            written = asyncio.run(export(dataset, args.start, args.end, output))
+    print(f"[EXPORT] dataset={dataset.value} bytes={written}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import asyncio
-from typing import Any, Optional, cast
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, cast
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
@@ -13,14 +14,47 @@ from app.controllers import (
     challenge_controller,
     decoration_controller,
     decoration_user_controller,
+    export_controller,
     google_controller,
+    leaderboard_controller,
     stamp_controller,
+    sync_controller,
     user_controller,
     vision_controller,
 )
-from app.database.database import init_db
+from app.core.google_openid import close_google_openid
+from app.core.invalidation_bus import start_invalidation_bus, stop_invalidation_bus
+from app.core.metrics import METRICS_CONTENT_TYPE, render_metrics
+from app.core.middleware import (
+    AdmissionMiddleware,
+    DeadlineMiddleware,
+    QueryStatsMiddleware,
+    ReadYourWritesMiddleware,
+)
+from app.database.database import close_db, init_db, is_ready
 
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.PROJECT_VERSION)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """애플리케이션 수명 주기: 시작 시 DB 연결 풀 워밍업 + 무효화 버스 연결, 종료 시 정리"""
+    await init_db()
+    # 다른 워커의 쓰기로 인한 캐시 무효화 수신 (LISTEN 전용 연결)
+    await start_invalidation_bus()
+    print("Application started, database initialized")
+    try:
+        yield
+    finally:
+        await stop_invalidation_bus()
+        # Google JWKS 백그라운드 갱신 중지
+        await close_google_openid()
+        # 서버가 처리 중인 요청을 마친 뒤 호출됨: 남은 연결은 DB_POOL_CLOSE_TIMEOUT_SECONDS 안에 정리
+        await close_db()
+        print("Application stopped, database pool closed")
+
+
+app = FastAPI(
+    title=settings.PROJECT_NAME, version=settings.PROJECT_VERSION, lifespan=lifespan
+)
 
 # 세션 미들웨어 (authlib 사용)
 app.add_middleware(
@@ -30,6 +64,9 @@ app.add_middleware(
     https_only=False,
 )
 
+# 비용이 큰 경로 그룹별 동시 실행 수 제한 (거절 응답에도 CORS 헤더가 붙도록 CORS 안쪽)
+app.add_middleware(AdmissionMiddleware)
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
@@ -39,6 +76,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 처리 시간 예산 (초과 시 핸들러 취소 + 504)
+app.add_middleware(DeadlineMiddleware)
+
+# 쓰기 시각을 쿠키로 주고받아 다른 워커에서도 read-your-writes 보장
+app.add_middleware(ReadYourWritesMiddleware)
+
+# 요청별 DB 사용량 집계 (가장 바깥에서 인증 쿼리까지 포함하도록 마지막에 추가)
+app.add_middleware(QueryStatsMiddleware)
+
 # 정적 파일 서빙
 app.mount("/static", StaticFiles(directory="static"), name="static")  # 정적 파일 경로
 
@@ -49,7 +95,10 @@ app.include_router(decoration_controller.router)
 app.include_router(decoration_user_controller.router)
 app.include_router(challenge_controller.router)
 app.include_router(stamp_controller.router)
+app.include_router(sync_controller.router)
 app.include_router(vision_controller.router)
+app.include_router(export_controller.router)
+app.include_router(leaderboard_controller.router)
 
 @app.get("/")
 def read_root() -> dict:
@@ -63,12 +112,19 @@ def health_check() -> dict:
     return {"status": "healthy"}
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """애플리케이션 시작 시 이벤트"""
-    # 데이터베이스 초기화
-    await init_db()
-    print("Application started, database initialized")
+@app.get("/metrics")
+def metrics() -> Response:
+    """워커 프로세스 단위 메트릭 (Prometheus text format)"""
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/health/ready")
+def readiness_check(response: Response) -> dict:
+    """준비 상태 체크 엔드포인트 (DB 연결 풀 워밍업이 끝나기 전 / 종료 중에는 503)"""
+    if not is_ready():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "not ready"}
+    return {"status": "ready"}
 
 
 # swagger에서 bearer token 인증 추가
@@ -13,3 +13,4 @@ class ChallengeStampInDB(BaseModel):
 
     cid: int = Field(..., description="챌린지 ID")
     sid: int = Field(..., description="스탬프 ID")
+    xid: Optional[int] = Field(None, description="생성한 트랜잭션 ID (생성 시에만)")
@@ -0,0 +1,12 @@
+import enum
+
+
+class ExportDataset(str, enum.Enum):
+    """운영 분석용 내보내기 대상"""
+
+    # 스탬프 (saved_at 기준 기간)
+    STAMPS = "stamps"
+    # 챌린지 달성 현황 (due_at 기준 기간)
+    CHALLENGES = "challenges"
+    # 장식 보유 현황 (acquired_at 기준 기간)
+    DECORATIONS = "decorations"
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class IdempotencyRecord(BaseModel):
+    """Idempotency-Key로 저장된 요청 결과 모델"""
+
+    uid: int = Field(..., description="사용자 ID")
+    key: str = Field(..., description="클라이언트가 보낸 Idempotency-Key")
+    fingerprint: bytes = Field(..., description="요청 본문의 sha256")
+    status_code: Optional[int] = Field(
+        None, description="응답 상태 코드 (처리 중이면 None)"
+    )
+    response: Optional[Any] = Field(None, description="응답 본문 (JSON)")
+    created_at: datetime = Field(..., description="처리 시작 시간")
+
+    @property
+    def is_completed(self) -> bool:
+        return self.status_code is not None
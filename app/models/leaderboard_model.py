@@ -0,0 +1,37 @@
+import enum
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class LeaderboardPeriod(str, enum.Enum):
+    """리더보드 집계 기간"""
+
+    # 이번 주 (Asia/Seoul 기준 월요일부터)
+    WEEKLY = "weekly"
+    # 전체 기간
+    ALL = "all"
+
+
+class LeaderboardEntry(BaseModel):
+    """리더보드 한 줄 (점수: 인증된 텀블러 + 주문 내역 스탬프 수)"""
+
+    rank: int = Field(..., description="순위 (같은 점수는 같은 순위)")
+    uid: int = Field(..., description="사용자 ID")
+    username: Optional[str] = Field(None, description="사용자 이름")
+    tumbler: int = Field(0, description="텀블러 스탬프 수")
+    order_details: int = Field(0, description="주문 내역 스탬프 수")
+    score: int = Field(0, description="점수")
+
+
+class LeaderboardResponse(BaseModel):
+    """리더보드 조회 응답"""
+
+    period: LeaderboardPeriod
+    week_start: Optional[date] = Field(None, description="주간 집계 시작일 (월요일)")
+    total_users: int = Field(0, description="순위에 있는 사용자 수")
+    entries: List[LeaderboardEntry] = Field(default_factory=list)
+    me: Optional[LeaderboardEntry] = Field(
+        None, description="내 순위 (스탬프가 없으면 null)"
+    )
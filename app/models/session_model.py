@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+from app.models.user_model import TokenUser
+
+
+class TokenRefresh(BaseModel):
+    """리프레시 토큰 요청 모델 (갱신 / 로그아웃)"""
+
+    refresh_token: str = Field(..., description="로그인 / 갱신 시 받은 리프레시 토큰")
+
+
+class SessionRotation(BaseModel):
+    """리프레시 토큰 갱신 결과 모델"""
+
+    user: TokenUser = Field(..., description="새 액세스 토큰에 담을 사용자 claim")
+    refresh_token: str = Field(..., description="새로 발급된 리프레시 토큰")
@@ -0,0 +1,64 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.models.challenge_model import ChallengeResponse
+from app.models.decoration_user_model import DecorationUserWithDetails
+from app.models.stamp_model import StampInDB, StampResponse
+
+
+class SyncCursor(BaseModel):
+    """사용자별 동기화 커서 모델"""
+
+    uid: int = Field(..., description="사용자 ID")
+    cursor: int = Field(0, description="마지막으로 발급한 동기화 순번")
+    floor: int = Field(
+        0, description="정리된 삭제 기록의 최대 순번 (이보다 오래된 커서는 전체 동기화)"
+    )
+
+
+class SyncTombstone(BaseModel):
+    """삭제 기록 모델"""
+
+    entity: str = Field(..., description="challenge / stamp / decoration")
+    entity_id: int = Field(..., description="삭제된 챌린지 / 스탬프 / 장식 ID")
+    sync_seq: int = Field(..., description="삭제 시 발급된 동기화 순번")
+
+
+class SyncChanges(BaseModel):
+    """커서 이후 변경분 (서비스 -> 컨트롤러)"""
+
+    cursor: int
+    reset: bool
+    challenges: List[ChallengeResponse] = []
+    stamps: List[StampInDB] = []
+    decorations: List[DecorationUserWithDetails] = []
+    tombstones: List[SyncTombstone] = []
+
+
+class SyncDeleted(BaseModel):
+    """커서 이후 삭제된 항목 ID"""
+
+    challenges: List[int] = Field([], description="삭제된 챌린지 ID")
+    stamps: List[int] = Field([], description="삭제된 스탬프 ID")
+    decorations: List[int] = Field([], description="삭제된 보유 장식 ID (did)")
+
+
+class SyncResponse(BaseModel):
+    """
+    동기화 응답 모델
+    - cursor: 다음 요청의 since로 보낼 값
+    - reset: True면 변경분이 아닌 전체 데이터 (클라이언트는 로컬 데이터를 교체)
+    - 클라이언트는 deleted를 먼저 반영한 뒤 나머지를 upsert
+    """
+
+    cursor: int = Field(..., description="다음 동기화 요청의 since")
+    reset: bool = Field(..., description="전체 데이터 여부")
+    challenges: List[ChallengeResponse] = Field(
+        [], description="생성 / 변경된 챌린지 (스탬프 포함)"
+    )
+    stamps: List[StampResponse] = Field([], description="생성 / 변경된 스탬프")
+    decorations: List[DecorationUserWithDetails] = Field(
+        [], description="생성 / 변경된 보유 장식"
+    )
+    deleted: SyncDeleted = Field(default_factory=SyncDeleted)
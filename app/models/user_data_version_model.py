@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+
+class UserDataVersion(BaseModel):
+    """사용자별 데이터 버전 모델 (챌린지 / 스탬프 / 장식이 바뀔 때마다 증가)"""
+
+    uid: int = Field(..., description="사용자 ID")
+    challenges_version: int = Field(0, description="챌린지 목록 버전 (스탬프 포함)")
+    stamps_version: int = Field(0, description="스탬프 목록 버전")
+    decorations_version: int = Field(0, description="보유 장식 목록 버전")
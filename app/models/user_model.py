@@ -35,6 +35,7 @@ class UserInDB(UserBase):
     is_superuser: bool = False
     created_at: datetime
     updated_at: Optional[datetime] = None
+    token_version: int = 0
 
 
 class User(UserBase):
@@ -47,6 +48,19 @@ class User(UserBase):
     updated_at: Optional[datetime] = None
 
 
+class TokenUser(BaseModel):
+    """
+    액세스 토큰으로 인증된 사용자 (토큰 claim에서 만들며 DB를 조회하지 않음)
+    프로필(username, created_at 등)이 필요하면 UserService로 따로 조회
+    """
+
+    id: int
+    email: EmailStr
+    is_active: bool = True
+    is_superuser: bool = False
+    token_version: int = 0
+
+
 class UserLogin(BaseModel):
     """사용자 로그인 모델"""
 
@@ -2,7 +2,12 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from app.database.database import execute_query, fetch_all, fetch_one
+from app.database.database import (
+    execute_query,
+    fetch_all,
+    fetch_one,
+    register_warmup_query,
+)
 from app.models.challenge_model import ChallengeCreate, ChallengeInDB, ChallengeResponse
 from app.models.stamp_model import StampInDB, StampResponse, StampType
 from app.repositories.stamp_repository import StampRepository
@@ -11,6 +16,17 @@ from app.repositories.stamp_repository import StampRepository
 class ChallengeRepository:
     """Challenge 데이터 처리를 담당하는 리포지토리 클래스"""
 
+    # 요청마다 실행되는 조회: 새 연결마다 미리 prepare (연결 워밍업)
+    GET_CHALLENGE_RESPONSE_BY_UID_QUERY = register_warmup_query(
+        """
+        SELECT s.id AS sid, s.type, s.saved_at, s.save_url, c.*
+        FROM challenges AS c
+        LEFT JOIN challenge_stamp AS cs ON c.id = cs.cid
+        LEFT JOIN stamps AS s ON cs.sid = s.id
+        WHERE c.uid = $1
+        """
+    )
+
     @staticmethod
     def _map_row_to_challenge_in_db(
         row: Dict[str, Any],
@@ -139,7 +155,7 @@ class ChallengeRepository:
             SELECT * FROM challenges WHERE uid = $1
         """
         values = (uid,)
-        rows = await fetch_all(query, values)
+        rows = await fetch_all(query, values, read_only=True)
         if not rows:
             return None
         return [
@@ -152,15 +168,9 @@ class ChallengeRepository:
     async def get_challenge_response_by_uid(uid: int) -> Optional[List[ChallengeInDB]]:
         """uid로 챌린지 및 스탬프 조회 메서드"""
         # 챌린지와 챌린지_스탬프, 스탬프 테이블을 조인하여 조회
-        query = """
-            SELECT s.id AS sid, s.type, s.saved_at, s.save_url, c.*
-            FROM challenges AS c
-            LEFT JOIN challenge_stamp AS cs ON c.id = cs.cid
-            LEFT JOIN stamps AS s ON cs.sid = s.id
-            WHERE c.uid = $1
-        """
+        query = ChallengeRepository.GET_CHALLENGE_RESPONSE_BY_UID_QUERY
         values = (uid,)
-        rows = await fetch_all(query, values)
+        rows = await fetch_all(query, values, read_only=True)
         if not rows:
             return None
 
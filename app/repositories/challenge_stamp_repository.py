@@ -18,6 +18,7 @@ class ChallengeStampRepository:
         return ChallengeStampInDB(
             cid=row["cid"],
             sid=row["sid"],
+            xid=row.get("xid"),
         )
 
     @staticmethod
@@ -25,18 +26,18 @@ class ChallengeStampRepository:
         challenge_ids: List[int],
         stamp_id: int,
     ) -> Optional[List[ChallengeStampInDB]]:
-        """챌린지 스탬프 생성 메서드"""
-        challenge_stamp_data = [(cid, stamp_id) for cid in challenge_ids]
-
+        """챌린지 스탬프 생성 메서드
+        챌린지 수와 관계없이 unnest로 한 번에 INSERT (왕복 1회, 전부 성공하거나 전부 실패)
+        xid: 연결한 트랜잭션 ID (리더보드 재구성 스냅샷에 포함되었는지 판단)
+        """
         query = """
             INSERT INTO challenge_stamp (cid, sid)
-            VALUES ($1, $2)
-            RETURNING *
+            SELECT cid, $2
+            FROM unnest($1::BIGINT[]) AS cid
+            RETURNING *, txid_current() AS xid
         """
-
-        affected_rows = []
-        for entity in challenge_stamp_data:
-            affected_rows.append(await fetch_one(query, entity))
+        values = (challenge_ids, stamp_id)
+        affected_rows = await fetch_all(query, values)
 
         if not affected_rows:
             return None
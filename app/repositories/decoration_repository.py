@@ -126,5 +126,5 @@ class DecorationRepository:
             SELECT id, name, version, type, rarity, color
             FROM decorations
         """
-        rows = await fetch_all(query)
+        rows = await fetch_all(query, read_only=True)
         return [DecorationRepository._map_row_to_decoration_in_db(row) for row in rows]
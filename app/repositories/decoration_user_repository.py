@@ -3,7 +3,12 @@ from typing import Any, Dict, List, Optional
 
 import asyncpg
 
-from app.database.database import execute_query, fetch_all, fetch_one
+from app.database.database import (
+    execute_query,
+    fetch_all,
+    fetch_one,
+    register_warmup_query,
+)
 from app.models.decoration_model import DecorationInDB, DecorationType
 from app.models.decoration_user_model import (
     DecorationUserInDB,
@@ -15,6 +20,16 @@ from app.models.user_model import User, UserCreate, UserInDB, UserUpdate
 class DecorationUserRepository:
     """DecorationUser 데이터 처리를 담당하는 리포지토리 클래스"""
 
+    # 요청마다 실행되는 조회: 새 연결마다 미리 prepare (연결 워밍업)
+    GET_BY_USER_ID_QUERY = register_warmup_query(
+        """
+        SELECT du.did, du.acquired_at, du.is_equipped, du.type, d.name, d.version, d.color
+        FROM decoration_user AS du
+        INNER JOIN decorations AS d ON du.did = d.id
+        WHERE du.uid = $1
+        """
+    )
+
     @staticmethod
     def _map_row_to_decoration_user_in_db(
         row: Dict[str, Any],
@@ -50,14 +65,9 @@ class DecorationUserRepository:
     @staticmethod
     async def get_by_user_id(user_id: int) -> List[Optional[DecorationUserWithDetails]]:
         """사용자 ID로 DecorationUser 및 Decoration 조인 후 조회 메서드"""
-        query = """
-            SELECT du.did, du.acquired_at, du.is_equipped, du.type, d.name, d.version, d.color
-            FROM decoration_user AS du
-            INNER JOIN decorations AS d ON du.did = d.id
-            WHERE du.uid = $1
-        """
+        query = DecorationUserRepository.GET_BY_USER_ID_QUERY
         values = (user_id,)
-        rows = await fetch_all(query, values)
+        rows = await fetch_all(query, values, read_only=True)
         return [
             DecorationUserRepository._map_row_to_decoration_user_with_details(row)
             for row in rows
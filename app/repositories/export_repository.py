@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.database.database import stream_copy
+from app.models.export_model import ExportDataset
+
+
+class ExportRepository:
+    """운영 분석용 내보내기 (COPY TO STDOUT) 쿼리를 담당하는 리포지토리 클래스"""
+
+    # 데이터셋 -> (기간 조건 자리({where})가 있는 쿼리, 기간 기준 컬럼)
+    EXPORT_QUERIES: Dict[ExportDataset, Tuple[str, str]] = {
+        ExportDataset.STAMPS: (
+            """
+            SELECT s.id, s.uid, s.type, s.saved_at, s.updated_at
+            FROM stamps s
+            {where}
+            ORDER BY s.saved_at, s.id
+            """,
+            "s.saved_at",
+        ),
+        ExportDataset.CHALLENGES: (
+            """
+            SELECT c.id, c.uid, c.is_done, c.od_obj, c.od_ach, c.tb_obj, c.tb_ach,
+                   c.start_at, c.due_at, c.updated_at,
+                   (SELECT COUNT(*) FROM challenge_stamp cs WHERE cs.cid = c.id) AS stamp_count
+            FROM challenges c
+            {where}
+            ORDER BY c.due_at, c.id
+            """,
+            "c.due_at",
+        ),
+        ExportDataset.DECORATIONS: (
+            """
+            SELECT du.uid, du.did, d.name, d.version, du.type, d.rarity,
+                   du.is_equipped, du.acquired_at
+            FROM decoration_user du
+            JOIN decorations d ON d.id = du.did
+            {where}
+            ORDER BY du.acquired_at, du.uid, du.did
+            """,
+            "du.acquired_at",
+        ),
+    }
+
+    @staticmethod
+    def copy_csv(
+        dataset: ExportDataset,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        데이터셋을 헤더가 있는 CSV로 조각 단위 조회 (기간: start 이상 end 미만, None이면 제한 없음)
+        복제본이 있으면 복제본에서 읽음 (운영 트래픽이 쓰는 primary에 부담을 주지 않도록)
+        """
+        query, column = ExportRepository.EXPORT_QUERIES[dataset]
+
+        # COPY는 인자를 쿼리 문자열에 넣어 실행하므로(NULL 인자 불가) 주어진 조건만 추가
+        conditions: List[str] = []
+        values: List[Any] = []
+        if start is not None:
+            values.append(start)
+            conditions.append(f"{column} >= ${len(values)}")
+        if end is not None:
+            values.append(end)
+            conditions.append(f"{column} < ${len(values)}")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        return stream_copy(
+            query.format(where=where),
+            tuple(values),
+            read_only=True,
+            format="csv",
+            header=True,
+        )
@@ -0,0 +1,102 @@
+import json
+from typing import Any, Dict, Optional
+
+from app.database.database import execute_query, fetch_one
+from app.models.idempotency_model import IdempotencyRecord
+
+
+class IdempotencyRepository:
+    """Idempotency-Key 처리 결과 저장을 담당하는 리포지토리 클래스"""
+
+    @staticmethod
+    def _map_row_to_idempotency_record(
+        row: Dict[str, Any],
+    ) -> Optional[IdempotencyRecord]:
+        """데이터베이스 행을 IdempotencyRecord 모델로 변환"""
+        if not row:
+            return None
+        return IdempotencyRecord(
+            uid=row["uid"],
+            key=row["key"],
+            fingerprint=row["fingerprint"],
+            status_code=row["status_code"],
+            response=json.loads(row["response"]) if row["response"] else None,
+            created_at=row["created_at"],
+        )
+
+    @staticmethod
+    async def claim(
+        uid: int,
+        key: str,
+        fingerprint: bytes,
+        lock_timeout_seconds: float,
+        ttl_seconds: float,
+    ) -> bool:
+        """
+        키 처리 권한 획득 메서드 (한 문장으로 INSERT 또는 인계)
+        - 처음 보는 키면 처리 중(status_code NULL) 행을 만들고 True
+        - 처리 중인 채로 lock_timeout을 넘긴 행(워커 종료 등)이나 만료된 행은 새로 가져감
+        - 그 외에는 False (다른 요청이 처리 중이거나 결과가 이미 저장됨)
+        """
+        query = """
+        INSERT INTO idempotency_keys (uid, key, fingerprint)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (uid, key) DO UPDATE
+        SET fingerprint = EXCLUDED.fingerprint,
+            status_code = NULL,
+            response = NULL,
+            created_at = now()
+        WHERE (
+                idempotency_keys.status_code IS NULL
+                AND idempotency_keys.created_at < now() - make_interval(secs => $4)
+            )
+            OR idempotency_keys.created_at < now() - make_interval(secs => $5)
+        RETURNING uid
+        """
+        values = (uid, key, fingerprint, lock_timeout_seconds, ttl_seconds)
+        row = await fetch_one(query, values)
+        return row is not None
+
+    @staticmethod
+    async def get(uid: int, key: str) -> Optional[IdempotencyRecord]:
+        """저장된 키 조회 메서드 (처리 중인 다른 워커의 결과 확인용이라 primary에서 조회)"""
+        query = """
+        SELECT uid, key, fingerprint, status_code, response::text AS response, created_at
+        FROM idempotency_keys
+        WHERE uid = $1 AND key = $2
+        """
+        row = await fetch_one(query, (uid, key))
+        return IdempotencyRepository._map_row_to_idempotency_record(row)
+
+    @staticmethod
+    async def complete(
+        uid: int, key: str, status_code: int, response: Any
+    ) -> Optional[IdempotencyRecord]:
+        """처리 결과 저장 메서드"""
+        query = """
+        UPDATE idempotency_keys
+        SET status_code = $3, response = $4::jsonb
+        WHERE uid = $1 AND key = $2 AND status_code IS NULL
+        RETURNING uid, key, fingerprint, status_code, response::text AS response, created_at
+        """
+        values = (uid, key, status_code, json.dumps(response))
+        row = await fetch_one(query, values)
+        return IdempotencyRepository._map_row_to_idempotency_record(row)
+
+    @staticmethod
+    async def release(uid: int, key: str) -> None:
+        """처리에 실패한 키 삭제 메서드 (같은 키로 다시 시도할 수 있도록)"""
+        query = """
+        DELETE FROM idempotency_keys
+        WHERE uid = $1 AND key = $2 AND status_code IS NULL
+        """
+        await execute_query(query, (uid, key))
+
+    @staticmethod
+    async def delete_expired(ttl_seconds: float) -> None:
+        """만료된 키 정리 메서드"""
+        query = """
+        DELETE FROM idempotency_keys
+        WHERE created_at < now() - make_interval(secs => $1)
+        """
+        await execute_query(query, (ttl_seconds,))
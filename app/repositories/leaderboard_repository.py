@@ -0,0 +1,44 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.database.database import fetch_all
+
+
+class LeaderboardRepository:
+    """
+    리더보드 점수 조회를 담당하는 리포지토리 클래스
+    stamp_scores / stamp_weekly_scores는 stamps 트리거가 같은 트랜잭션 안에서 갱신하므로 읽기만 함
+    """
+
+    @staticmethod
+    async def get_scores(
+        week_start: Optional[date] = None,
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        점수가 있는 사용자 전체의 스탬프 수 조회 (순위표 재구성용)
+        week_start가 없으면 전체 기간, 있으면 해당 주 (탈퇴한 사용자는 제외)
+        점수를 읽은 것과 같은 스냅샷(txid_current_snapshot)을 마지막 행으로 함께 받아 (스냅샷, 행 목록)으로 반환
+        """
+        if week_start is None:
+            query = """
+            SELECT s.uid, u.username, s.tumbler, s.order_details, NULL::text AS snapshot
+            FROM stamp_scores s
+            JOIN users u ON u.id = s.uid
+            WHERE s.tumbler + s.order_details > 0
+            UNION ALL
+            SELECT NULL, NULL, NULL, NULL, txid_current_snapshot()::text
+            """
+            rows = await fetch_all(query, read_only=True)
+        else:
+            query = """
+            SELECT s.uid, u.username, s.tumbler, s.order_details, NULL::text AS snapshot
+            FROM stamp_weekly_scores s
+            JOIN users u ON u.id = s.uid
+            WHERE s.week_start = $1 AND s.tumbler + s.order_details > 0
+            UNION ALL
+            SELECT NULL, NULL, NULL, NULL, txid_current_snapshot()::text
+            """
+            rows = await fetch_all(query, (week_start,), read_only=True)
+
+        snapshot = next(row["snapshot"] for row in rows if row["uid"] is None)
+        return snapshot, [row for row in rows if row["uid"] is not None]
@@ -0,0 +1,110 @@
+from typing import Any, Dict, Optional
+
+from app.database.database import execute_query, fetch_one
+from app.models.user_model import TokenUser
+
+
+class SessionRepository:
+    """리프레시 토큰 세션 저장을 담당하는 리포지토리 클래스"""
+
+    @staticmethod
+    def _map_row_to_token_user(row: Dict[str, Any]) -> Optional[TokenUser]:
+        """갱신 결과 행을 TokenUser 모델로 변환"""
+        if not row:
+            return None
+        return TokenUser(
+            id=row["uid"],
+            email=row["email"],
+            is_active=row["is_active"],
+            is_superuser=row["is_superuser"],
+            token_version=row["token_version"],
+        )
+
+    @staticmethod
+    async def create(
+        session_id: bytes,
+        uid: int,
+        secret_hash: bytes,
+        token_version: int,
+        ttl_seconds: float,
+    ) -> None:
+        """세션 생성 메서드"""
+        query = """
+        INSERT INTO user_sessions (id, uid, secret_hash, token_version, expires_at)
+        VALUES ($1, $2, $3, $4, now() + make_interval(secs => $5))
+        """
+        await execute_query(
+            query, (session_id, uid, secret_hash, token_version, ttl_seconds)
+        )
+
+    @staticmethod
+    async def rotate(
+        session_id: bytes, secret_hash: bytes, new_secret_hash: bytes
+    ) -> Optional[TokenUser]:
+        """
+        비밀 값 교체 메서드 (한 문장으로 확인 + 교체 + 사용자 claim 조회)
+        폐기 / 만료된 세션, 비활성 사용자, 발급 후 토큰 버전이 바뀐 사용자는 None
+        같은 비밀 값으로 동시에 갱신하면 한 요청만 성공
+        """
+        query = """
+        UPDATE user_sessions AS s
+        SET secret_hash = $3, previous_hash = s.secret_hash, rotated_at = now()
+        FROM users AS u
+        WHERE s.id = $1
+            AND s.secret_hash = $2
+            AND s.revoked_at IS NULL
+            AND s.expires_at > now()
+            AND u.id = s.uid
+            AND u.is_active
+            AND u.token_version = s.token_version
+        RETURNING s.uid, u.email, u.is_active, u.is_superuser, u.token_version
+        """
+        row = await fetch_one(query, (session_id, secret_hash, new_secret_hash))
+        return SessionRepository._map_row_to_token_user(row)
+
+    @staticmethod
+    async def revoke_reused(
+        session_id: bytes, secret_hash: bytes, grace_seconds: float
+    ) -> Optional[int]:
+        """
+        교체된 직전 비밀 값이 다시 쓰인 세션 폐기 메서드 (폐기한 세션의 사용자 ID, 아니면 None)
+        교체 후 grace_seconds 안의 재사용은 응답을 받지 못한 재시도로 보고 유지
+        모르는 비밀 값은 세션 ID만 아는 요청일 수 있으므로 폐기하지 않음
+        """
+        query = """
+        UPDATE user_sessions
+        SET revoked_at = now()
+        WHERE id = $1
+            AND revoked_at IS NULL
+            AND previous_hash = $2
+            AND rotated_at <= now() - make_interval(secs => $3)
+        RETURNING uid
+        """
+        row = await fetch_one(query, (session_id, secret_hash, grace_seconds))
+        return row["uid"] if row else None
+
+    @staticmethod
+    async def revoke(session_id: bytes, secret_hash: bytes) -> Optional[int]:
+        """
+        세션 폐기 메서드 (폐기한 세션의 사용자 ID, 없거나 이미 폐기됐으면 None)
+        현재 또는 직전 비밀 값을 가진 경우만 폐기
+        """
+        query = """
+        UPDATE user_sessions
+        SET revoked_at = now()
+        WHERE id = $1
+            AND revoked_at IS NULL
+            AND $2 IN (secret_hash, previous_hash)
+        RETURNING uid
+        """
+        row = await fetch_one(query, (session_id, secret_hash))
+        return row["uid"] if row else None
+
+    @staticmethod
+    async def delete_expired() -> None:
+        """만료된 세션 삭제 메서드"""
+        query = """
+        DELETE FROM user_sessions
+        WHERE expires_at < now()
+        """
+        await execute_query(query)
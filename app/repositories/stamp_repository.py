@@ -2,7 +2,12 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
-from app.database.database import execute_query, fetch_all, fetch_one
+from app.database.database import (
+    execute_query,
+    fetch_all,
+    fetch_one,
+    register_warmup_query,
+)
 from app.models.challenge_model import ChallengeCreate, ChallengeInDB, ChallengeResponse
 from app.models.stamp_model import (
     StampBase,
@@ -16,6 +21,17 @@ from app.models.stamp_model import (
 class StampRepository:
     """Stamp 데이터 처리를 담당하는 리포지토리 클래스"""
 
+    # 요청마다 실행되는 조회: 새 연결마다 미리 prepare (연결 워밍업)
+    GET_STAMP_BY_UID_QUERY = register_warmup_query(
+        """
+        SELECT s.*
+        FROM stamps AS s
+        INNER JOIN challenge_stamp AS cs ON s.id = cs.sid
+        INNER JOIN challenges AS c ON cs.cid = c.id
+        WHERE c.uid = $1
+        """
+    )
+
     @staticmethod
     def _type_string_mapper(
         stamp_type: Union[StampType, str],
@@ -69,15 +85,9 @@ class StampRepository:
         uid: int,
     ) -> Optional[List[StampInDB]]:
         """스탬프 조회 메서드"""
-        query = """
-            SELECT s.*
-            FROM stamps AS s
-            INNER JOIN challenge_stamp AS cs ON s.id = cs.sid
-            INNER JOIN challenges AS c ON cs.cid = c.id
-            WHERE c.uid = $1
-        """
+        query = StampRepository.GET_STAMP_BY_UID_QUERY
         values = (uid,)
-        rows = await fetch_all(query, values)
+        rows = await fetch_all(query, values, read_only=True)
         if not rows:
             return None
         # 스탬프를 StampInDB 모델로 변환
@@ -0,0 +1,153 @@
+from typing import Any, Dict, List
+
+from app.database.database import (
+    fetch_all,
+    fetch_one,
+    register_warmup_query,
+)
+from app.models.challenge_model import ChallengeResponse
+from app.models.decoration_user_model import DecorationUserWithDetails
+from app.models.stamp_model import StampInDB
+from app.models.sync_model import SyncCursor, SyncTombstone
+from app.repositories.challenge_repository import ChallengeRepository
+from app.repositories.decoration_user_repository import DecorationUserRepository
+from app.repositories.stamp_repository import StampRepository
+
+
+class SyncRepository:
+    """
+    동기화(커서 이후 변경분) 조회를 담당하는 리포지토리 클래스
+    순번(sync_seq) / 삭제 기록은 트리거가 관리하므로 여기서는 읽기와 오래된 삭제 기록 정리만 함
+    모든 조회는 (uid, sync_seq) 인덱스로 커서 이후 행만 읽음 (since가 -1이면 전체)
+    """
+
+    GET_CURSOR_QUERY = register_warmup_query(
+        """
+        SELECT sync_seq, sync_floor FROM user_data_versions WHERE uid = $1
+        """
+    )
+
+    # 챌린지 자체가 바뀌었거나, 연결된 스탬프가 커서 이후에 연결 / 변경된 챌린지
+    GET_CHALLENGES_SINCE_QUERY = """
+        SELECT s.id AS sid, s.type, s.saved_at, s.save_url, c.*
+        FROM challenges AS c
+        LEFT JOIN challenge_stamp AS cs ON c.id = cs.cid
+        LEFT JOIN stamps AS s ON cs.sid = s.id
+        WHERE c.uid = $1
+            AND (
+                c.sync_seq > $2
+                OR c.id IN (
+                    SELECT changed_cs.cid
+                    FROM stamps AS changed
+                    INNER JOIN challenge_stamp AS changed_cs ON changed_cs.sid = changed.id
+                    WHERE changed.uid = $1 AND changed.sync_seq > $2
+                )
+            )
+    """
+
+    # 챌린지에 연결된 스탬프만 (연결 전 / 연결이 모두 끊긴 스탬프는 제외)
+    GET_STAMPS_SINCE_QUERY = """
+        SELECT s.*
+        FROM stamps AS s
+        WHERE s.uid = $1
+            AND s.sync_seq > $2
+            AND EXISTS (SELECT 1 FROM challenge_stamp AS cs WHERE cs.sid = s.id)
+    """
+
+    GET_DECORATIONS_SINCE_QUERY = """
+        SELECT du.did, du.acquired_at, du.is_equipped, du.type, d.name, d.version, d.color
+        FROM decoration_user AS du
+        INNER JOIN decorations AS d ON du.did = d.id
+        WHERE du.uid = $1 AND du.sync_seq > $2
+    """
+
+    GET_TOMBSTONES_SINCE_QUERY = """
+        SELECT entity, entity_id, sync_seq
+        FROM sync_tombstones
+        WHERE uid = $1 AND sync_seq > $2
+    """
+
+    @staticmethod
+    def _map_row_to_sync_cursor(uid: int, row: Dict[str, Any]) -> SyncCursor:
+        """데이터베이스 행을 SyncCursor 모델로 변환 (행이 없으면 커서 0)"""
+        if not row:
+            return SyncCursor(uid=uid)
+        return SyncCursor(uid=uid, cursor=row["sync_seq"], floor=row["sync_floor"])
+
+    @staticmethod
+    async def get_cursor(uid: int) -> SyncCursor:
+        """
+        사용자의 현재 동기화 커서 조회 메서드
+        변경분보다 먼저 읽어야 함: 커서 이하의 순번은 모두 커밋된 상태이므로 이후 조회에 보임
+        """
+        query = SyncRepository.GET_CURSOR_QUERY
+        row = await fetch_one(query, (uid,), read_only=True)
+        return SyncRepository._map_row_to_sync_cursor(uid, row)
+
+    @staticmethod
+    async def get_challenges_since(uid: int, since: int) -> List[ChallengeResponse]:
+        """커서 이후 생성 / 변경된 챌린지 및 스탬프 조회 메서드"""
+        query = SyncRepository.GET_CHALLENGES_SINCE_QUERY
+        rows = await fetch_all(query, (uid, since), read_only=True)
+        if not rows:
+            return []
+        return ChallengeRepository._map_rows_to_challenge_with_stamps(rows)
+
+    @staticmethod
+    async def get_stamps_since(uid: int, since: int) -> List[StampInDB]:
+        """커서 이후 생성 / 변경된 스탬프 조회 메서드"""
+        query = SyncRepository.GET_STAMPS_SINCE_QUERY
+        rows = await fetch_all(query, (uid, since), read_only=True)
+        return [StampRepository._map_row_to_stamp_in_db(row) for row in rows]
+
+    @staticmethod
+    async def get_decorations_since(
+        uid: int, since: int
+    ) -> List[DecorationUserWithDetails]:
+        """커서 이후 생성 / 변경된 보유 장식 조회 메서드"""
+        query = SyncRepository.GET_DECORATIONS_SINCE_QUERY
+        rows = await fetch_all(query, (uid, since), read_only=True)
+        return [
+            DecorationUserRepository._map_row_to_decoration_user_with_details(row)
+            for row in rows
+        ]
+
+    @staticmethod
+    async def get_tombstones_since(uid: int, since: int) -> List[SyncTombstone]:
+        """커서 이후 삭제 기록 조회 메서드"""
+        query = SyncRepository.GET_TOMBSTONES_SINCE_QUERY
+        rows = await fetch_all(query, (uid, since), read_only=True)
+        return [
+            SyncTombstone(
+                entity=row["entity"],
+                entity_id=row["entity_id"],
+                sync_seq=row["sync_seq"],
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    async def delete_expired_tombstones(retention_seconds: float) -> int:
+        """
+        보관 기간이 지난 삭제 기록 정리 메서드 (정리한 행 수 반환)
+        지운 순번까지 sync_floor를 올려 그보다 오래된 커서는 전체 동기화하도록 함
+        """
+        query = """
+            WITH pruned AS (
+                DELETE FROM sync_tombstones
+                WHERE deleted_at < now() - make_interval(secs => $1)
+                RETURNING uid, sync_seq
+            ), floors AS (
+                SELECT uid, max(sync_seq) AS floor, count(*) AS pruned
+                FROM pruned
+                GROUP BY uid
+            ), updated AS (
+                UPDATE user_data_versions AS v
+                SET sync_floor = GREATEST(v.sync_floor, floors.floor)
+                FROM floors
+                WHERE v.uid = floors.uid
+            )
+            SELECT COALESCE(sum(pruned), 0)::BIGINT AS pruned FROM floors
+        """
+        row = await fetch_one(query, (retention_seconds,))
+        return row["pruned"] if row else 0
@@ -0,0 +1,40 @@
+from typing import Any, Dict
+
+from app.database.database import fetch_one, register_warmup_query
+from app.models.user_data_version_model import UserDataVersion
+
+
+class UserDataVersionRepository:
+    """
+    사용자별 데이터 버전 조회를 담당하는 리포지토리 클래스
+    버전은 challenges / challenge_stamp / stamps / decoration_user 트리거가
+    같은 트랜잭션 안에서 올리므로 여기서는 읽기만 함
+    """
+
+    # 조건부 조회(If-None-Match)마다 실행되는 PK 조회
+    GET_BY_UID_QUERY = register_warmup_query(
+        """
+        SELECT uid, challenges_version, stamps_version, decorations_version
+        FROM user_data_versions
+        WHERE uid = $1
+        """
+    )
+
+    @staticmethod
+    def _map_row_to_user_data_version(uid: int, row: Dict[str, Any]) -> UserDataVersion:
+        """데이터베이스 행을 UserDataVersion 모델로 변환 (행이 없으면 모두 0)"""
+        if not row:
+            return UserDataVersion(uid=uid)
+        return UserDataVersion(
+            uid=row["uid"],
+            challenges_version=row["challenges_version"],
+            stamps_version=row["stamps_version"],
+            decorations_version=row["decorations_version"],
+        )
+
+    @staticmethod
+    async def get_by_uid(uid: int) -> UserDataVersion:
+        """사용자 ID로 데이터 버전 조회 메서드"""
+        query = UserDataVersionRepository.GET_BY_UID_QUERY
+        row = await fetch_one(query, (uid,), read_only=True)
+        return UserDataVersionRepository._map_row_to_user_data_version(uid, row)
@@ -1,22 +1,69 @@
-from datetime import datetime
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional
 
 import asyncpg
 from passlib.context import CryptContext
 
-from app.database.database import execute_query, fetch_all, fetch_one
+from app.database.database import (
+    execute_query,
+    fetch_all,
+    fetch_one,
+    register_warmup_query,
+    stream_rows,
+)
 
 # 더미 데이터
-from app.database.fake_data import FAKE_CHALLENGES, FAKE_DECORATIONS, FAKE_USERS
+from app.database.fake_data import FAKE_CHALLENGES, FAKE_DECORATIONS
 from app.models.user_model import User, UserCreate, UserInDB, UserUpdate
 
 # 비밀번호 암호화를 위한 컨텍스트
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 비밀번호 없이 가입한 사용자(Google 로그인)의 hashed_password (어떤 비밀번호와도 일치하지 않음)
+UNUSABLE_PASSWORD = "!"
+
+# users 테이블의 UNIQUE 제약 이름 -> 중복 안내 메시지
+_UNIQUE_VIOLATION_MESSAGES = {
+    "users_email_key": "이미 존재하는 이메일입니다.",
+    "users_username_key": "이미 존재하는 사용자 이름입니다.",
+}
+
+
+class DuplicateUserError(ValueError):
+    """이메일 / 사용자 이름이 이미 사용 중 (UNIQUE 제약 위반)"""
+
+    @classmethod
+    def from_violation(
+        cls, e: asyncpg.exceptions.UniqueViolationError
+    ) -> "DuplicateUserError":
+        return cls(
+            _UNIQUE_VIOLATION_MESSAGES.get(
+                e.constraint_name or "", "이미 존재하는 사용자입니다."
+            )
+        )
+
 
 class UserRepository:
     """사용자 데이터 처리를 담당하는 리포지토리 클래스"""
 
+    # 요청마다 실행되는 조회: 새 연결마다 미리 prepare (연결 워밍업)
+    GET_USER_BY_EMAIL_QUERY = register_warmup_query(
+        """
+        SELECT id, email, username, hashed_password, is_active, is_superuser, created_at, updated_at,
+               token_version
+        FROM users
+        WHERE email = $1
+        """
+    )
+
+    # 토큰 claim으로 인증할 때 토큰 폐기 여부 확인용 PK 조회
+    GET_TOKEN_VERSION_QUERY = register_warmup_query(
+        """
+        SELECT token_version
+        FROM users
+        WHERE id = $1
+        """
+    )
+
     @staticmethod
     def _hash_password(password: str) -> str:
         """비밀번호를 해시 처리"""
@@ -25,7 +72,11 @@ class UserRepository:
     @staticmethod
     def _verify_password(plain_password: str, hashed_password: str) -> bool:
         """비밀번호 검증"""
-        return bool(pwd_context.verify(plain_password, hashed_password))
+        try:
+            return bool(pwd_context.verify(plain_password, hashed_password))
+        except ValueError:
+            # UNUSABLE_PASSWORD 등 해시가 아닌 값
+            return False
 
     @staticmethod
     def _map_row_to_user(row: Mapping[str, Any]) -> Optional[User]:
@@ -58,56 +109,84 @@ class UserRepository:
             is_superuser=row["is_superuser"],
             created_at=row["created_at"],
             updated_at=row["updated_at"],
+            token_version=row["token_version"],
         )
 
     @staticmethod
     async def create_user(user_data: UserCreate) -> Optional[User]:
-        """사용자 생성"""
-        try:
-            hashed_password = UserRepository._hash_password(user_data.password)
+        """
+        사용자 생성 (INSERT 한 문장)
+        중복 확인은 UNIQUE 제약에 맡기고, 위반하면 제약 이름으로 DuplicateUserError
+        """
+        hashed_password = UserRepository._hash_password(user_data.password)
 
-            query = """
-                INSERT INTO users (email, username, hashed_password)
-                VALUES ($1, $2, $3)
-                RETURNING id, email, username, hashed_password, is_active, is_superuser, created_at, updated_at
-            """
-            values = (user_data.email, user_data.username, hashed_password)
+        query = """
+            INSERT INTO users (email, username, hashed_password)
+            VALUES ($1, $2, $3)
+            RETURNING id, email, username, is_active, is_superuser, created_at, updated_at
+        """
+        values = (user_data.email, user_data.username, hashed_password)
 
+        try:
             row = await fetch_one(query, values)
             return UserRepository._map_row_to_user(row)
-        except asyncpg.exceptions.UniqueViolationError:
-            # 중복 이메일 또는 사용자 이름
-            return None
+        except asyncpg.exceptions.UniqueViolationError as e:
+            raise DuplicateUserError.from_violation(e) from e
         except Exception as e:
             print(f"Error creating user: {e}")
             return None
 
     @staticmethod
-    async def get_user_by_id(user_id: int) -> Optional[User]:
-        """ID로 사용자 조회"""
-        # query = """
-        #     SELECT id, email, username, hashed_password, is_active, is_superuser, created_at, updated_at
-        #     FROM users
-        #     WHERE id = $1
-        # """
-        # row = await fetch_one(query, (user_id,))
-        user_data = FAKE_USERS.get(user_id)
-        if not user_data:
+    async def upsert_google_user(email: str, username: str) -> Optional[UserInDB]:
+        """
+        Google 로그인 사용자 생성 또는 조회 (한 문장)
+        같은 계정의 첫 로그인이 동시에 들어와도 ON CONFLICT가 기다렸다가 같은 행을 반환
+        (DO NOTHING은 다른 트랜잭션이 막 넣은 행을 RETURNING으로 돌려주지 않음)
+        사용자 이름이 이미 있으면 None
+        """
+        query = """
+            INSERT INTO users (email, username, hashed_password)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (email) DO UPDATE SET email = users.email
+            RETURNING id, email, username, hashed_password, is_active, is_superuser, created_at, updated_at,
+                      token_version
+        """
+        try:
+            row = await fetch_one(query, (email, username, UNUSABLE_PASSWORD))
+        except asyncpg.exceptions.UniqueViolationError as e:
+            print(f"Error upserting google user: {e}")
             return None
-        return UserRepository._map_row_to_user(user_data)  # row
+        return UserRepository._map_row_to_user_in_db(row)
 
     @staticmethod
-    async def get_user_by_email(email: str) -> Optional[UserInDB]:
-        """이메일로 사용자 조회 (비밀번호 해시 포함)"""
+    async def get_user_by_id(user_id: int) -> Optional[User]:
+        """ID로 사용자 조회"""
         query = """
-            SELECT id, email, username, hashed_password, is_active, is_superuser, created_at, updated_at
+            SELECT id, email, username, is_active, is_superuser, created_at, updated_at
             FROM users
-            WHERE email = $1
+            WHERE id = $1
         """
+        row = await fetch_one(query, (user_id,))
+        return UserRepository._map_row_to_user(row)
+
+    @staticmethod
+    async def get_user_by_email(email: str) -> Optional[UserInDB]:
+        """이메일로 사용자 조회 (비밀번호 해시 포함)"""
+        query = UserRepository.GET_USER_BY_EMAIL_QUERY
         row = await fetch_one(query, (email,))  # dict,
 
         return UserRepository._map_row_to_user_in_db(row)
 
+    @staticmethod
+    async def get_token_version(user_id: int) -> Optional[int]:
+        """
+        사용자의 현재 토큰 버전 조회 (사용자가 없으면 None)
+        폐기 직후의 토큰을 거부해야 하므로 복제본이 아닌 primary에서 읽음
+        """
+        query = UserRepository.GET_TOKEN_VERSION_QUERY
+        row = await fetch_one(query, (user_id,))
+        return row["token_version"] if row else None
+
     @staticmethod
     async def get_user_by_username(username: str) -> Optional[User]:
         """사용자 이름으로 사용자 조회"""
@@ -141,13 +220,38 @@ class UserRepository:
         # return [user for row in rows if row and (user := UserRepository._map_row_to_user(row)) is not None]
 
     @staticmethod
-    async def update_user(user_id: int, user_data: UserUpdate) -> Optional[User]:
-        """사용자 정보 업데이트"""
-        # 현재 사용자 정보 가져오기
-        current_user = await UserRepository.get_user_by_id(user_id)
-        if not current_user:
-            return None
+    async def get_users_page(after_id: int, limit: int) -> List[User]:
+        """
+        ID 순 사용자 목록 한 페이지 (keyset: after_id보다 큰 ID부터 limit개)
+        OFFSET과 달리 PK 인덱스에서 바로 시작하므로 뒤쪽 페이지도 비용이 같음
+        """
+        query = """
+            SELECT id, email, username, is_active, is_superuser, created_at, updated_at
+            FROM users
+            WHERE id > $1
+            ORDER BY id
+            LIMIT $2
+        """
+        rows = await fetch_all(query, (after_id, limit), read_only=True)
+        return [UserRepository._map_row_to_user(row) for row in rows]
 
+    @staticmethod
+    async def iter_users() -> AsyncIterator[List[User]]:
+        """전체 사용자를 ID 순으로 chunk 단위 조회 (서버 측 커서, 내보내기용)"""
+        query = """
+            SELECT id, email, username, is_active, is_superuser, created_at, updated_at
+            FROM users
+            ORDER BY id
+        """
+        async for rows in stream_rows(query, read_only=True):
+            yield [UserRepository._map_row_to_user(row) for row in rows]
+
+    @staticmethod
+    async def update_user(user_id: int, user_data: UserUpdate) -> Optional[User]:
+        """
+        사용자 정보 업데이트 (UPDATE 한 문장, 사용자가 없으면 None)
+        중복 이메일 / 사용자 이름은 제약 이름으로 DuplicateUserError
+        """
         # 업데이트할 필드 구성
         update_fields: list[str] = []
         update_values: list[Any] = []
@@ -168,29 +272,25 @@ class UserRepository:
             update_fields.append("is_active = $%d" % (len(update_values) + 1))
             update_values.append(user_data.is_active)
 
-        # updated_at 필드 업데이트
-        update_fields.append("updated_at = $%d" % (len(update_values) + 1))
-        update_values.append(datetime.now())
+        if not update_fields:
+            # 바꿀 내용이 없으면 현재 사용자 반환
+            return await UserRepository.get_user_by_id(user_id)
 
         # user_id를 마지막 매개변수로 추가
         update_values.append(user_id)
 
-        if not update_fields:
-            return current_user  # 업데이트할 내용이, 없으면 현재 사용자 반환
+        query = f"""
+            UPDATE users
+            SET {", ".join(update_fields)}, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ${len(update_values)}
+            RETURNING id, email, username, is_active, is_superuser, created_at, updated_at
+        """
 
         try:
-            query = f"""
-                UPDATE users
-                SET {", ".join(update_fields)}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ${len(update_values)}
-                RETURNING id, email, username, hashed_password, is_active, is_superuser, created_at, updated_at
-            """
-
             row = await fetch_one(query, tuple(update_values))
             return UserRepository._map_row_to_user(row)
-        except asyncpg.exceptions.UniqueViolationError:
-            # 중복 이메일 또는 사용자 이름
-            return None
+        except asyncpg.exceptions.UniqueViolationError as e:
+            raise DuplicateUserError.from_violation(e) from e
         except Exception as e:
             print(f"Error updating user: {e}")
             return None
@@ -207,14 +307,22 @@ class UserRepository:
         return row is not None
 
     @staticmethod
-    async def verify_user(email: str, password: str) -> Optional[User]:
-        """사용자 이메일/비밀번호 확인"""
+    async def get_verified_user(email: str, password: str) -> Optional[UserInDB]:
+        """사용자 이메일/비밀번호 확인 (토큰 발급용, 토큰 버전 포함)"""
         user_in_db = await UserRepository.get_user_by_email(email)
         if not user_in_db:
             return None
 
         if not UserRepository._verify_password(password, user_in_db.hashed_password):
             return None
+        return user_in_db
+
+    @staticmethod
+    async def verify_user(email: str, password: str) -> Optional[User]:
+        """사용자 이메일/비밀번호 확인"""
+        user_in_db = await UserRepository.get_verified_user(email, password)
+        if not user_in_db:
+            return None
 
         # 비밀번호가 맞으면 User 모델로 변환하여 반환 (비밀번호 해시 제외)
         return User(
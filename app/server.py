@@ -0,0 +1,124 @@
+"""
+프로덕션 서버 실행 (멀티 워커)
+
+사용법:
+    python -m app.server                 # 사용 가능한 CPU 수만큼 워커 (WEB_CONCURRENCY로 고정 가능)
+    python -m app.server --workers 4
+    kill -HUP <부모 프로세스 pid>          # graceful reload: 워커를 하나씩 재시작
+
+- uvicorn 워커 프로세스 N개가 같은 소켓을 공유 (uvloop + httptools)
+- 워커당 DB 풀 max_size는 전체 연결 예산을 워커 수로 나눈 값 이하로 제한해
+  워커 수를 늘려도 Postgres max_connections를 넘지 않는다.
+- SIGHUP을 받으면 워커를 하나씩 종료(처리 중인 요청 마무리 + 풀 정리) 후 새로 띄운다.
+  나머지 워커가 계속 요청을 받고, 새 워커는 풀 워밍업이 끝난 뒤 요청을 받는다.
+  (워커가 1개면 재시작하는 동안 잠깐 요청을 받지 못함)
+"""
+
+import argparse
+import asyncio
+import os
+from typing import List, Optional, Tuple
+
+import asyncpg
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from app.config import settings
+
+
+def available_cpus() -> int:
+    """이 프로세스가 사용할 수 있는 CPU 수 (컨테이너 cpuset 반영)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS 등
+        return os.cpu_count() or 1
+
+
+def resolve_workers(requested: int) -> int:
+    """워커 수 결정 (0 이하면 CPU 수)"""
+    return requested if requested > 0 else available_cpus()
+
+
+async def fetch_connection_budget(dsn: str) -> int:
+    """Postgres max_connections에서 superuser 예약분과 DB_CONNECTION_RESERVE를 뺀 연결 수"""
+    conn = await asyncpg.connect(dsn)
+    try:
+        max_connections = int(await conn.fetchval("SHOW max_connections"))
+        reserved = int(await conn.fetchval("SHOW superuser_reserved_connections"))
+    finally:
+        await conn.close()
+    return max_connections - reserved - settings.DB_CONNECTION_RESERVE
+
+
+def plan_pool_sizes(
+    budget: int, workers: int, min_size: int, max_size: int
+) -> Tuple[int, int]:
+    """
+    전체 연결 예산을 워커에 나눠 워커당 (min_size, max_size) 결정
+    설정된 풀 크기가 예산보다 작으면 그대로 사용
+    """
+    per_worker = budget // workers
+    if per_worker < 1:
+        raise ValueError(
+            f"DB 연결 예산({budget})이 워커 수({workers})보다 작습니다. "
+            "워커 수를 줄이거나 DB_CONNECTION_BUDGET을 늘리세요."
+        )
+    max_size = min(max_size, per_worker)
+    return min(min_size, max_size), max_size
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="프로덕션 서버 실행 (멀티 워커)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.WEB_CONCURRENCY,
+        help="워커 프로세스 수 (기본: WEB_CONCURRENCY, 0이면 CPU 수)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    workers = resolve_workers(args.workers)
+
+    budget = settings.DB_CONNECTION_BUDGET or asyncio.run(
+        fetch_connection_budget(settings.DATABASE_URL)
+    )
+    # 캐시 무효화 버스는 워커마다 풀 밖에서 LISTEN 연결 1개를 사용
+    listen_connections = workers if settings.CACHE_INVALIDATION_BUS_ENABLED else 0
+    min_size, max_size = plan_pool_sizes(
+        budget - listen_connections,
+        workers,
+        settings.DB_POOL_MIN_SIZE,
+        settings.DB_POOL_MAX_SIZE,
+    )
+    # 워커 프로세스는 새로 import하면서 환경변수로 설정을 읽음
+    os.environ["DB_POOL_MIN_SIZE"] = str(min_size)
+    os.environ["DB_POOL_MAX_SIZE"] = str(max_size)
+    print(
+        f"[SERVER] workers={workers} connection_budget={budget} "
+        f"pool_min_size={min_size} pool_max_size={max_size} "
+        f"max_connections_used={workers * max_size + listen_connections}"
+    )
+
+    config = uvicorn.Config(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        timeout_graceful_shutdown=int(settings.SERVER_GRACEFUL_TIMEOUT_SECONDS),
+    )
+    server = uvicorn.Server(config)
+    sock = config.bind_socket()
+    # 워커가 1개여도 supervisor를 거쳐야 SIGHUP(graceful reload)과 워커 재시작이 동작
+    Multiprocess(config, target=server.run, sockets=[sock]).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ from typing import List, Optional, Tuple
 
 from fastapi import UploadFile
 
+from app.config import settings
+from app.core.cache import cached, invalidate_tags
+from app.core.singleflight import single_flight
 from app.models.challenge_model import ChallengeCreate, ChallengeInDB, ChallengeResponse
 from app.models.stamp_model import StampBase, StampCreate, StampInDB
 from app.repositories.challenge_repository import ChallengeRepository
@@ -18,7 +21,9 @@ class ChallengeService:
     ) -> Optional[ChallengeInDB]:
         """챌린지 생성 메서드"""
         # 챌린지 생성
-        return await ChallengeRepository.create_challenge(challenge_data)
+        challenge = await ChallengeRepository.create_challenge(challenge_data)
+        await invalidate_tags(f"user:{challenge_data.uid}:challenges")
+        return challenge
 
     @staticmethod
     async def get_challenge_by_uid(uid: int) -> Optional[List[ChallengeInDB]]:
@@ -26,10 +31,21 @@ class ChallengeService:
         return await ChallengeRepository.get_challenge_by_uid(uid)
 
     @staticmethod
+    @cached(
+        "challenge_response_by_uid",
+        key="{uid}:{version}",
+        ttl=settings.CACHE_TTL_SECONDS,
+        tags=("user:{uid}", "user:{uid}:challenges"),
+    )
+    @single_flight("challenge_response_by_uid")
     async def get_challenge_response_by_uid(
         uid: int,
+        version: Optional[int] = None,
     ) -> Optional[List[ChallengeResponse]]:
-        """챌린지 ID로 챌린지 스탬프 조회 메서드"""
+        """
+        챌린지 ID로 챌린지 스탬프 조회 메서드
+        version: 응답 ETag의 데이터 버전 (캐시 키에 포함해 ETag보다 오래된 값을 돌려주지 않도록)
+        """
         return await ChallengeRepository.get_challenge_response_by_uid(uid)
 
     @staticmethod
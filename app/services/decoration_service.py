@@ -4,6 +4,8 @@ from typing import List, Optional, Tuple
 
 from fastapi import UploadFile
 
+from app.config import settings
+from app.core.cache import cached, invalidate_tags
 from app.models.decoration_model import Asset, DecorationInDB, Landscape
 from app.repositories.decoration_repository import DecorationRepository
 
@@ -81,6 +83,7 @@ class DecorationService:
 
         # print("asset 성공", asset)
         # 모두 성공하면 Asset 반환
+        await invalidate_tags("decorations")
         return asset
 
     @staticmethod
@@ -109,9 +112,13 @@ class DecorationService:
         except Exception as e:
             raise ValueError(f"파일 저장 실패: {str(e)}")
         # 모두 성공하면 Landscape 반환
+        await invalidate_tags("decorations")
         return landscape
 
     @staticmethod
+    @cached(
+        "decorations", key="all", ttl=settings.CACHE_TTL_SECONDS, tags=("decorations",)
+    )
     async def get_all_decorations() -> List[DecorationInDB]:
         """모든 장식 조회 메서드"""
         try:
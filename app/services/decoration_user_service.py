@@ -2,6 +2,9 @@ from datetime import datetime, timezone
 from typing import List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+from app.config import settings
+from app.core.cache import cached, invalidate_tags
+from app.core.singleflight import single_flight
 from app.models.decoration_model import DecorationInDB, DecorationType
 from app.models.decoration_user_model import (
     DecorationUserInDB,
@@ -14,8 +17,20 @@ class DecorationUserService:
     """DecorationUserService는 유저가 가진 장식 관련 비즈니스 로직을 처리하는 서비스입니다."""
 
     @staticmethod
-    async def get_by_user_id(user_id: int) -> List[DecorationUserWithDetails]:
-        """사용자 ID로 장식 조회 메서드"""
+    @cached(
+        "decoration_user_by_user_id",
+        key="{user_id}:{version}",
+        ttl=settings.CACHE_TTL_SECONDS,
+        tags=("user:{user_id}", "user:{user_id}:decorations"),
+    )
+    @single_flight("decoration_user_by_user_id")
+    async def get_by_user_id(
+        user_id: int, version: Optional[int] = None
+    ) -> List[DecorationUserWithDetails]:
+        """
+        사용자 ID로 장식 조회 메서드
+        version: ETag로 내보낼 decorations_version (캐시 키에 포함)
+        """
         user_decoration = await DecorationUserRepository.get_by_user_id(user_id)
         filtered: List[DecorationUserWithDetails] = [
             decoration_with_details
@@ -40,6 +55,7 @@ class DecorationUserService:
         )
         if not decoration_user:
             raise ValueError("장식 생성에 실패했습니다.")
+        await invalidate_tags(f"user:{uid}:decorations")
         return decoration_user
 
     @staticmethod
@@ -65,6 +81,7 @@ class DecorationUserService:
         )
         if not decoration_user:
             raise ValueError("장식 장착 여부 업데이트에 실패했습니다.")
+        await invalidate_tags(f"user:{uid}:decorations")
         return decoration_user
 
     # 전부 다 디버깅 필요.
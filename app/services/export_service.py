@@ -0,0 +1,32 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import AsyncIterator, Optional
+
+from app.models.export_model import ExportDataset
+from app.repositories.export_repository import ExportRepository
+
+
+def _day_start(day: Optional[date]) -> Optional[datetime]:
+    """날짜의 시작 시각 (UTC)"""
+    if day is None:
+        return None
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+class ExportService:
+    """운영 분석용 내보내기 비즈니스 로직을 담당하는 서비스 클래스"""
+
+    @staticmethod
+    def export_csv(
+        dataset: ExportDataset,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        데이터셋 CSV 내보내기 서비스
+        - 기간: start일 0시(UTC)부터 end일 24시까지 (둘 다 포함, 없으면 제한 없음)
+        - Postgres가 만든 CSV를 그대로 전달하므로 Python에서 행을 만들거나 모아 두지 않음
+        """
+        if start is not None and end is not None and start > end:
+            raise ValueError("시작일이 종료일보다 늦습니다.")
+        end_at = _day_start(end + timedelta(days=1)) if end is not None else None
+        return ExportRepository.copy_csv(dataset, _day_start(start), end_at)
@@ -1,5 +1,6 @@
 import google.generativeai as genai
 from app.config import settings
+from app.core.deadline import remaining
 
 genai.configure(api_key=settings.GOOGLE_API_KEY)
 model = genai.GenerativeModel("gemini-pro-vision")
@@ -9,7 +10,12 @@ class GeminiService:
     def detect_tumbler(image_path: str) -> str:
         with open(image_path, "rb") as img_file:
             prompt = "이 이미지에 텀블러가 포함되어 있습니까? 'Tumbler' 또는 'Not Tumbler'로만 대답하세요."
-            response = model.generate_content([prompt, img_file])
+            # 요청 deadline이 있으면 남은 시간만큼만 기다림
+            timeout = remaining()
+            request_options = {} if timeout is None else {"timeout": timeout}
+            response = model.generate_content(
+                [prompt, img_file], request_options=request_options
+            )
             result = response.text.strip()
 
             if result not in ["Tumbler", "Not Tumbler"]:
@@ -1,33 +1,38 @@
-from datetime import datetime
+from typing import Dict, Optional
 
-# for fake user
-from app.database.fake_data import get_fake_user_info
-from app.models.user_model import User, UserCreate
 from app.repositories.user_repository import UserRepository
+from app.services.session_service import SessionService
 from app.services.user_service import UserService
 
-# class GoogleAuthService:
-#     @staticmethod
-#     async def login_or_register(user_info: dict) -> str:
-#         email = user_info["email"]
-#         username = user_info.get("name", "google_user")
+# User 모델의 username 최대 길이
+_USERNAME_MAX_LENGTH = 50
 
-#         user = await UserRepository.get_user_by_email(email)
-#         # DB에 존재하지 않는 사용자일 경우
-#         if not user:
-#             user = await UserRepository.create_user(UserCreate(
-#                 email = email,
-#                 username = username,
-#                 password = "placeholder_PW_google"
-#             ))
-#         return UserService.create_access_token(data={"sub":user.id})
+
+def _google_username(name: Optional[str], sub: str) -> str:
+    """
+    Google 계정으로 가입하는 사용자의 이름 (표시 이름_sub)
+    sub는 Google 계정마다 고유하므로 같은 표시 이름의 다른 계정과 겹치지 않음
+    """
+    prefix = (name or "google").strip() or "google"
+    return f"{prefix[: _USERNAME_MAX_LENGTH - len(sub) - 1]}_{sub}"
 
 
 class GoogleAuthService:
     @staticmethod
-    async def login_or_register(user_info: dict) -> str:
-        # 실제 DB 연동은 생략하고, 가짜 유저 객체 생성
-        fake_user = get_fake_user_info(user_info)
+    async def login_or_register(user_info: dict) -> Optional[Dict]:
+        """
+        검증된 Google 계정으로 로그인 (처음이면 가입) 후 토큰 발급
+        비활성화된 사용자이거나 가입할 수 없으면 None
+        """
+        user = await UserRepository.upsert_google_user(
+            user_info["email"],
+            _google_username(user_info.get("name"), user_info["sub"]),
+        )
+        if not user or not user.is_active:
+            return None
 
-        token = UserService.create_access_token(data={"sub": str(fake_user.id)})
-        return token
+        return {
+            "access_token": UserService.create_user_token(user),
+            "refresh_token": await SessionService.create(user.id, user.token_version),
+            "token_type": "bearer",
+        }
@@ -0,0 +1,248 @@
+import asyncio
+import time
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from zoneinfo import ZoneInfo
+
+from app.config import settings
+from app.core.metrics import MetricFamily, register_collector
+from app.core.ranking import RankIndex
+from app.models.leaderboard_model import (
+    LeaderboardEntry,
+    LeaderboardPeriod,
+    LeaderboardResponse,
+)
+from app.models.stamp_model import StampType
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.services.user_service import UserService
+
+# 주간 집계 기준 시간대 (migrations/sql/015의 트리거와 같아야 함)
+LEADERBOARD_TIMEZONE = ZoneInfo("Asia/Seoul")
+
+
+def week_start_of(moment: datetime) -> date:
+    """시각이 속한 주의 월요일 (LEADERBOARD_TIMEZONE 기준, 시간대가 없으면 UTC로 봄)"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    day = moment.astimezone(LEADERBOARD_TIMEZONE).date()
+    return day - timedelta(days=day.weekday())
+
+
+class XidSnapshot(NamedTuple):
+    """txid_current_snapshot() 값 (xmin:xmax:진행 중인 xid 목록)"""
+
+    xmin: int
+    xmax: int
+    xip: FrozenSet[int]
+
+    @classmethod
+    def parse(cls, text: str) -> "XidSnapshot":
+        xmin, xmax, xip = text.split(":")
+        return cls(int(xmin), int(xmax), frozenset(int(x) for x in xip.split(",") if x))
+
+    def is_visible(self, xid: int) -> bool:
+        """커밋된 트랜잭션이 이 스냅샷에 보였는지 (txid_visible_in_snapshot과 같은 규칙)"""
+        return xid < self.xmin or (xid < self.xmax and xid not in self.xip)
+
+
+class Leaderboard:
+    """
+    기간 하나의 순위표 (워커 프로세스 메모리)
+    점수 테이블을 한 번 읽어 만들고, 이후 이 워커에서 생긴 스탬프는 바로 반영
+    점수를 읽은 스냅샷에 이미 포함된 스탬프는 다시 세지 않음
+    """
+
+    def __init__(
+        self,
+        period: LeaderboardPeriod,
+        week_start: Optional[date],
+        rows: Sequence[Mapping[str, Any]],
+        snapshot: XidSnapshot,
+    ) -> None:
+        self.period = period
+        self.week_start = week_start
+        self.snapshot = snapshot
+        self.built_at = time.monotonic()
+        # uid -> [텀블러, 주문 내역]
+        self.counts: Dict[int, List[int]] = {
+            row["uid"]: [row["tumbler"], row["order_details"]] for row in rows
+        }
+        self.usernames: Dict[int, str] = {row["uid"]: row["username"] for row in rows}
+        self.index = RankIndex((uid, sum(c)) for uid, c in self.counts.items())
+
+    def record(self, uid: int, stamp_type: StampType, xid: Optional[int]) -> None:
+        if xid is not None and self.snapshot.is_visible(xid):
+            return
+        counts = self.counts.setdefault(uid, [0, 0])
+        counts[0 if stamp_type == StampType.TUMBLER else 1] += 1
+        self.index.add(uid, 1)
+
+    def entry(self, uid: int, rank: int) -> LeaderboardEntry:
+        tumbler, order_details = self.counts.get(uid, (0, 0))
+        return LeaderboardEntry(
+            rank=rank,
+            uid=uid,
+            username=self.usernames.get(uid),
+            tumbler=tumbler,
+            order_details=order_details,
+            score=tumbler + order_details,
+        )
+
+
+# 기간별 현재 순위표 / 재구성 잠금 / 백그라운드 재구성 태스크
+_boards: Dict[LeaderboardPeriod, Leaderboard] = {}
+_locks: Dict[LeaderboardPeriod, asyncio.Lock] = {}
+_refreshes: Dict[LeaderboardPeriod, "asyncio.Future[Leaderboard]"] = {}
+_rebuilds = {period: 0 for period in LeaderboardPeriod}
+# 최근 REPLICA_STICKY_SECONDS 동안 이 워커에서 기록한 스탬프 (기록 시각, xid, uid, 종류, 주)
+# 재구성 중이거나 복제 지연으로 스냅샷에 빠진 스탬프를 새 순위표에 다시 반영
+_recent_stamps: Deque[Tuple[float, Optional[int], int, StampType, date]] = deque()
+
+
+class LeaderboardService:
+    """
+    주간 / 전체 기간 스탬프 리더보드 비즈니스 로직을 처리하는 서비스
+    - 사용자별 스탬프 수는 DB 트리거가 유지하고(stamp_scores), 워커는 이를 읽어 메모리 순위표를 만듦
+    - 순위표가 LEADERBOARD_REBUILD_SECONDS보다 오래되면 기존 순위표로 응답하고 백그라운드에서 다시 만듦
+    - 다른 워커에서 생긴 스탬프는 다음 재구성 때 반영됨
+    - 재구성하는 동안 기록된 스탬프는 점수를 읽은 스냅샷(xid)과 비교해 빠지거나 두 번 세지 않음
+    """
+
+    @staticmethod
+    def clear() -> None:
+        """메모리 순위표 비우기 (다음 조회에서 다시 만듦)"""
+        _boards.clear()
+        _locks.clear()
+        _refreshes.clear()
+        _recent_stamps.clear()
+
+    @staticmethod
+    async def _rebuild(
+        period: LeaderboardPeriod, week_start: Optional[date]
+    ) -> Leaderboard:
+        snapshot, rows = await LeaderboardRepository.get_scores(week_start)
+        board = Leaderboard(period, week_start, rows, XidSnapshot.parse(snapshot))
+        # 스냅샷 이후에 커밋된 최근 스탬프 반영 (교체 전까지 await가 없어 그 사이 기록은 없음)
+        # (xid를 모르는 스탬프는 스냅샷에 있었는지 알 수 없으므로 다시 세지 않음)
+        for _, xid, uid, stamp_type, stamp_week in _recent_stamps:
+            if xid is not None and week_start in (None, stamp_week):
+                board.record(uid, stamp_type, xid)
+        _boards[period] = board
+        _rebuilds[period] += 1
+        return board
+
+    @staticmethod
+    async def get_board(period: LeaderboardPeriod) -> Leaderboard:
+        """기간의 현재 순위표 (없거나 주가 바뀌었으면 만들어서, 동시에 한 번만)"""
+        week_start = None
+        if period == LeaderboardPeriod.WEEKLY:
+            week_start = week_start_of(datetime.now(timezone.utc))
+
+        board = _boards.get(period)
+        if board is not None and board.week_start == week_start:
+            if (
+                time.monotonic() - board.built_at
+                >= settings.LEADERBOARD_REBUILD_SECONDS
+            ):
+                LeaderboardService._rebuild_in_background(period, week_start)
+            return board
+
+        async with _locks.setdefault(period, asyncio.Lock()):
+            board = _boards.get(period)
+            if board is not None and board.week_start == week_start:
+                return board
+            return await LeaderboardService._rebuild(period, week_start)
+
+    @staticmethod
+    def _rebuild_in_background(
+        period: LeaderboardPeriod, week_start: Optional[date]
+    ) -> None:
+        task = _refreshes.get(period)
+        if task is not None and not task.done():
+            return
+        _refreshes[period] = asyncio.ensure_future(
+            LeaderboardService._rebuild(period, week_start)
+        )
+
+        def _log_failure(task: "asyncio.Future[Leaderboard]") -> None:
+            # 실패해도 기존 순위표를 계속 사용 (다음 조회에서 다시 시도)
+            if not task.cancelled() and task.exception() is not None:
+                print(f"[WARNING] leaderboard rebuild failed: {task.exception()}")
+
+        _refreshes[period].add_done_callback(_log_failure)
+
+    @staticmethod
+    def record_stamp(
+        uid: int, stamp_type: StampType, saved_at: datetime, xid: Optional[int]
+    ) -> None:
+        """
+        챌린지에 연결된(인증된) 스탬프를 이 워커의 순위표에 바로 반영 O(log S)
+        DB 점수는 트리거가 이미 올렸으므로 메모리만 갱신
+        xid: 스탬프를 챌린지에 연결한 트랜잭션 (순위표 스냅샷에 이미 있으면 건너뜀)
+        """
+        week_start = week_start_of(saved_at)
+        now = time.monotonic()
+        _recent_stamps.append((now, xid, uid, stamp_type, week_start))
+        while now - _recent_stamps[0][0] > settings.REPLICA_STICKY_SECONDS:
+            _recent_stamps.popleft()
+        for board in list(_boards.values()):
+            if board.week_start is None or board.week_start == week_start:
+                board.record(uid, stamp_type, xid)
+
+    @staticmethod
+    async def get_leaderboard(
+        period: LeaderboardPeriod, limit: int, uid: int
+    ) -> LeaderboardResponse:
+        """상위 limit명과 내 순위 조회 서비스"""
+        board = await LeaderboardService.get_board(period)
+        entries = [board.entry(u, rank) for rank, u, _ in board.index.top(limit)]
+        rank = board.index.rank(uid)
+        me = board.entry(uid, rank) if rank is not None else None
+
+        # 재구성 이후 처음 스탬프를 받은 사용자는 이름이 없음
+        for entry in entries + ([me] if me is not None else []):
+            if entry.username is None:
+                user = await UserService.get_user_by_id(entry.uid)
+                if user is not None:
+                    entry.username = board.usernames[entry.uid] = user.username
+
+        return LeaderboardResponse(
+            period=period,
+            week_start=board.week_start,
+            total_users=len(board.index),
+            entries=entries,
+            me=me,
+        )
+
+
+@register_collector
+def collect_leaderboard_metrics() -> List[MetricFamily]:
+    return [
+        MetricFamily(
+            "leaderboard_users",
+            "gauge",
+            "워커 메모리 순위표에 있는 사용자 수",
+            [
+                ({"period": period.value}, len(board.index))
+                for period, board in _boards.items()
+            ],
+        ),
+        MetricFamily(
+            "leaderboard_rebuilds_total",
+            "counter",
+            "점수 테이블로 순위표를 다시 만든 횟수",
+            [({"period": period.value}, count) for period, count in _rebuilds.items()],
+        ),
+    ]
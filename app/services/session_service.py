@@ -0,0 +1,180 @@
+import base64
+import binascii
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.core.metrics import MetricFamily, register_collector
+from app.models.session_model import SessionRotation
+from app.repositories.session_repository import SessionRepository
+
+_SESSION_ID_BYTES = 16
+_SECRET_BYTES = 32
+# 세션을 이만큼 새로 만들 때마다 만료된 세션 정리 (워커 프로세스 단위)
+_PURGE_EVERY = 1000
+_sessions_since_purge = 0
+
+# 최근 갱신 결과 (LRU, 워커 프로세스 단위): 제출된 토큰의 sha256 -> (결과, 만료 시각)
+# - 성공: 같은 토큰의 재시도에 같은 리프레시 토큰을 돌려줌 (REFRESH_TOKEN_REUSE_GRACE_SECONDS 동안)
+# - 거부(None): 폐기 / 교체된 토큰은 다시 유효해지지 않으므로 쿼리 없이 거부
+_recent: "OrderedDict[bytes, Tuple[Optional[SessionRotation], float]]" = OrderedDict()
+
+# 메트릭
+_stats: Dict[str, int] = {"rotated": 0, "replayed": 0, "rejected": 0, "revoked": 0}
+
+
+def _encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _hash(secret: bytes) -> bytes:
+    return hashlib.sha256(secret).digest()
+
+
+def _parse(refresh_token: str) -> Optional[Tuple[bytes, bytes]]:
+    """리프레시 토큰을 (세션 ID, 비밀 값)으로 (형식이 맞지 않으면 None)"""
+    session_part, _, secret_part = refresh_token.partition(".")
+    try:
+        session_id, secret = _decode(session_part), _decode(secret_part)
+    except (binascii.Error, ValueError):
+        return None
+    if len(session_id) != _SESSION_ID_BYTES or len(secret) != _SECRET_BYTES:
+        return None
+    return session_id, secret
+
+
+def _cached(token_key: bytes) -> Tuple[bool, Optional[SessionRotation]]:
+    """(찾았는지, 결과)"""
+    entry = _recent.get(token_key)
+    if entry is None:
+        return False, None
+    rotation, expires_at = entry
+    if expires_at <= time.monotonic():
+        del _recent[token_key]
+        return False, None
+    _recent.move_to_end(token_key)
+    return True, rotation
+
+
+def _remember(token_key: bytes, rotation: Optional[SessionRotation]) -> None:
+    ttl = settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS if rotation else float("inf")
+    _recent[token_key] = (rotation, time.monotonic() + ttl)
+    _recent.move_to_end(token_key)
+    while len(_recent) > settings.SESSION_CACHE_SIZE:
+        _recent.popitem(last=False)
+
+
+class SessionService:
+    """
+    SessionService는 리프레시 토큰 세션(발급 / 교체 / 폐기)을 처리하는 서비스입니다.
+    갱신은 bcrypt나 외부 OAuth 없이 세션 행 UPDATE 한 번으로 처리합니다.
+    """
+
+    @staticmethod
+    async def create(uid: int, token_version: int) -> str:
+        """세션을 만들고 리프레시 토큰 반환"""
+        await SessionService._purge_expired_sessions()
+
+        session_id = secrets.token_bytes(_SESSION_ID_BYTES)
+        secret = secrets.token_bytes(_SECRET_BYTES)
+        await SessionRepository.create(
+            session_id,
+            uid,
+            _hash(secret),
+            token_version,
+            settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400,
+        )
+        return f"{_encode(session_id)}.{_encode(secret)}"
+
+    @staticmethod
+    async def rotate(refresh_token: str) -> Optional[SessionRotation]:
+        """
+        리프레시 토큰을 새 토큰으로 교체 (유효하지 않으면 None)
+        - 교체된 이전 토큰이 다시 쓰이면 탈취로 보고 세션을 폐기 (새 토큰도 함께 무효)
+        - 비밀 값이 현재 / 직전 어느 것과도 맞지 않으면 세션은 그대로 두고 거부만 함
+        - 응답을 받지 못한 클라이언트의 재시도는 유예 시간 동안 폐기하지 않음
+          같은 워커면 같은 결과를 돌려주고, 다른 워커면 거부만 함
+        """
+        parsed = _parse(refresh_token)
+        if parsed is None:
+            return None
+        session_id, secret = parsed
+        token_key = _hash(refresh_token.encode())
+
+        found, rotation = _cached(token_key)
+        if found:
+            _stats["replayed" if rotation else "rejected"] += 1
+            return rotation
+
+        new_secret = secrets.token_bytes(_SECRET_BYTES)
+        user = await SessionRepository.rotate(
+            session_id, _hash(secret), _hash(new_secret)
+        )
+        if user is None:
+            revoked_uid = await SessionRepository.revoke_reused(
+                session_id, _hash(secret), settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS
+            )
+            if revoked_uid is not None:
+                _stats["revoked"] += 1
+                print(f"[WARNING] refresh session revoked for user {revoked_uid}")
+            _stats["rejected"] += 1
+            _remember(token_key, None)
+            return None
+
+        rotation = SessionRotation(
+            user=user, refresh_token=f"{_encode(session_id)}.{_encode(new_secret)}"
+        )
+        _stats["rotated"] += 1
+        _remember(token_key, rotation)
+        return rotation
+
+    @staticmethod
+    async def revoke(refresh_token: str) -> None:
+        """로그아웃: 리프레시 토큰의 세션 폐기 (비밀 값이 맞지 않거나 없는 세션이면 무시)"""
+        parsed = _parse(refresh_token)
+        if parsed is None:
+            return
+        session_id, secret = parsed
+        await SessionRepository.revoke(session_id, _hash(secret))
+        _remember(_hash(refresh_token.encode()), None)
+
+    @staticmethod
+    async def _purge_expired_sessions() -> None:
+        global _sessions_since_purge
+        _sessions_since_purge += 1
+        if _sessions_since_purge < _PURGE_EVERY:
+            return
+        _sessions_since_purge = 0
+        try:
+            await SessionRepository.delete_expired()
+        except Exception as e:
+            # 정리는 다음 차례에 다시 시도하고 로그인은 그대로 처리
+            print(f"[WARNING] expired session purge failed: {e}")
+
+
+@register_collector
+def collect_session_metrics() -> List[MetricFamily]:
+    return [
+        MetricFamily(
+            "session_refresh_total",
+            "counter",
+            "리프레시 토큰 갱신 결과 (result: rotated / replayed / rejected)",
+            [
+                ({"result": result}, _stats[result])
+                for result in ("rotated", "replayed", "rejected")
+            ],
+        ),
+        MetricFamily(
+            "session_revoked_total",
+            "counter",
+            "재사용 / 무효 토큰으로 폐기한 세션 수",
+            [({}, _stats["revoked"])],
+        ),
+    ]
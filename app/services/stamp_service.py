@@ -4,11 +4,15 @@ from typing import List, Optional, Tuple
 
 from fastapi import UploadFile
 
+from app.config import settings
+from app.core.cache import cached, invalidate_tags
+from app.core.singleflight import single_flight
 from app.models.challenge_model import ChallengeCreate, ChallengeInDB, ChallengeResponse
 from app.models.stamp_model import StampBase, StampCreate, StampInDB, StampResponse
 from app.repositories.challenge_repository import ChallengeRepository
 from app.repositories.challenge_stamp_repository import ChallengeStampRepository
 from app.repositories.stamp_repository import StampRepository
+from app.services.leaderboard_service import LeaderboardService
 
 
 class StampService:
@@ -67,14 +71,32 @@ class StampService:
                 raise Exception(
                     f"Failed to create challenge stamp / Deleted stamp: detail: {e}"
                 )
+        else:
+            # 챌린지에 연결된(인증된) 스탬프: DB 점수는 트리거가 올렸으므로 이 워커의 순위표만 갱신
+            LeaderboardService.record_stamp(
+                uid, stamp_data.type, stamp.saved_at, challenge_stamp[0].xid
+            )
 
+        # 챌린지 달성 수와 스탬프 목록이 바뀜
+        await invalidate_tags(f"user:{uid}:challenges", f"user:{uid}:stamps")
         return stamp
 
     @staticmethod
+    @cached(
+        "stamp_by_uid",
+        key="{uid}:{version}",
+        ttl=settings.CACHE_TTL_SECONDS,
+        tags=("user:{uid}", "user:{uid}:stamps"),
+    )
+    @single_flight("stamp_by_uid")
     async def get_stamp_by_uid(
         uid: int,
+        version: Optional[int] = None,
     ) -> Optional[List[StampInDB]]:
-        """UID로 스탬프 조회 메서드"""
+        """
+        UID로 스탬프 조회 메서드
+        version: ETag로 내보낼 stamps_version (캐시 키에 포함)
+        """
         stamps = await StampRepository.get_stamp_by_uid(uid)
         if not stamps:
             return None
@@ -0,0 +1,56 @@
+from app.config import settings
+from app.models.sync_model import SyncChanges
+from app.repositories.sync_repository import SyncRepository
+
+# 동기화 요청을 이만큼 처리할 때마다 보관 기간이 지난 삭제 기록 정리 (워커 프로세스 단위)
+_PURGE_EVERY = 1000
+_syncs_since_purge = 0
+
+
+class SyncService:
+    """SyncService는 오프라인 이후 변경분 동기화를 처리하는 서비스입니다."""
+
+    @staticmethod
+    async def get_changes(uid: int, since: int) -> SyncChanges:
+        """
+        커서(since) 이후 생성 / 변경 / 삭제된 챌린지, 스탬프, 보유 장식 조회 메서드
+        - since가 0 이하이거나 삭제 기록이 정리된 범위보다 오래되면 전체 데이터 (reset)
+        - 변경이 없으면 커서 조회 한 번으로 끝남
+        """
+        await SyncService._purge_expired_tombstones()
+
+        current = await SyncRepository.get_cursor(uid)
+        reset = since <= 0 or since < current.floor
+        if not reset and since >= current.cursor:
+            # 복제 지연으로 클라이언트 커서가 더 앞설 수 있음: 커서를 되돌리지 않음
+            return SyncChanges(cursor=since, reset=False)
+
+        # 전체 동기화는 순번 0(마이그레이션 이전 행)부터
+        start = -1 if reset else since
+        return SyncChanges(
+            cursor=current.cursor,
+            reset=reset,
+            challenges=await SyncRepository.get_challenges_since(uid, start),
+            stamps=await SyncRepository.get_stamps_since(uid, start),
+            decorations=await SyncRepository.get_decorations_since(uid, start),
+            tombstones=(
+                [] if reset else await SyncRepository.get_tombstones_since(uid, start)
+            ),
+        )
+
+    @staticmethod
+    async def _purge_expired_tombstones() -> None:
+        global _syncs_since_purge
+        _syncs_since_purge += 1
+        if _syncs_since_purge < _PURGE_EVERY:
+            return
+        _syncs_since_purge = 0
+        retention_seconds = settings.SYNC_TOMBSTONE_RETENTION_DAYS * 86400
+        try:
+            pruned = await SyncRepository.delete_expired_tombstones(retention_seconds)
+        except Exception as e:
+            # 정리는 다음 차례에 다시 시도하고 동기화 요청은 그대로 처리
+            print(f"[WARNING] sync tombstone purge failed: {e}")
+            return
+        if pruned:
+            print(f"[INFO] pruned {pruned} sync tombstones")
@@ -0,0 +1,28 @@
+from app.config import settings
+from app.core.cache import cached
+from app.core.singleflight import single_flight
+from app.models.user_data_version_model import UserDataVersion
+from app.repositories.user_data_version_repository import (
+    UserDataVersionRepository,
+)
+
+
+class UserDataVersionService:
+    """UserDataVersionService는 조건부 조회(ETag)에 쓰는 사용자 데이터 버전을 제공하는 서비스입니다."""
+
+    @staticmethod
+    @cached(
+        "user_data_version_by_uid",
+        key="{uid}",
+        ttl=settings.CACHE_TTL_SECONDS,
+        tags=(
+            "user:{uid}",
+            "user:{uid}:challenges",
+            "user:{uid}:stamps",
+            "user:{uid}:decorations",
+        ),
+    )
+    @single_flight("user_data_version_by_uid")
+    async def get_by_uid(uid: int) -> UserDataVersion:
+        """사용자 ID로 데이터 버전 조회 메서드"""
+        return await UserDataVersionRepository.get_by_uid(uid)
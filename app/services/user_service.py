@@ -1,11 +1,23 @@
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from jose import JWTError, jwt
+from pydantic import ValidationError
 
 from app.config import settings
-from app.models.user_model import User, UserCreate, UserInDB, UserLogin, UserUpdate
+from app.core.cache import cached, invalidate_tags
+from app.core.singleflight import single_flight
+from app.models.session_model import SessionRotation
+from app.models.user_model import (
+    TokenUser,
+    User,
+    UserCreate,
+    UserInDB,
+    UserLogin,
+    UserUpdate,
+)
 from app.repositories.user_repository import UserRepository
+from app.services.session_service import SessionService
 
 
 class UserService:
@@ -13,19 +25,10 @@ class UserService:
 
     @staticmethod
     async def create_user(user_data: UserCreate) -> Optional[User]:
-        """사용자 생성 서비스"""
-        # 이메일 중복 확인
-        existing_user = await UserRepository.get_user_by_email(user_data.email)
-        if existing_user:
-            raise ValueError("이미 존재하는 이메일입니다.")
-
-        # 사용자 이름 중복 확인
-        existing_username = await UserRepository.get_user_by_username(
-            user_data.username
-        )
-        if existing_username:
-            raise ValueError("이미 존재하는 사용자 이름입니다.")
-
+        """
+        사용자 생성 서비스
+        이메일 / 사용자 이름 중복은 INSERT의 UNIQUE 제약 위반으로 확인 (DuplicateUserError)
+        """
         user = await UserRepository.create_user(user_data)
         if not user:
             raise ValueError("사용자 생성에 실패했습니다.")
@@ -33,6 +36,13 @@ class UserService:
         return user
 
     @staticmethod
+    @cached(
+        "user_by_id",
+        key="{user_id}",
+        ttl=settings.CACHE_TTL_SECONDS,
+        tags=("user:{user_id}", "user:{user_id}:profile"),
+    )
+    @single_flight("user_by_id")
     async def get_user_by_id(user_id: int) -> Optional[User]:
         """ID로 사용자 조회 서비스"""
         return await UserRepository.get_user_by_id(user_id)
@@ -56,57 +66,110 @@ class UserService:
         )
 
     @staticmethod
-    async def get_all_users() -> List[User]:
-        """모든 사용자 조회 서비스"""
-        return await UserRepository.get_all_users()
+    async def get_users_page(after_id: int, limit: int) -> List[User]:
+        """사용자 목록 한 페이지 조회 서비스 (다음 페이지는 마지막 사용자의 ID 이후부터)"""
+        return await UserRepository.get_users_page(after_id, limit)
 
     @staticmethod
-    async def update_user(user_id: int, user_data: UserUpdate) -> Optional[User]:
-        """사용자 정보 업데이트 서비스"""
-        # 모델 유효성 검사 후 비어있지 않은 필드만 사용
-        update_data = UserUpdate(
-            **{k: v for k, v in user_data.model_dump().items() if v is not None}
-        )
+    async def export_users_ndjson() -> AsyncIterator[bytes]:
+        """
+        전체 사용자를 NDJSON(한 줄에 사용자 하나)으로 내보내기
+        chunk 단위로 읽고 보내므로 메모리 사용량은 사용자 수와 무관
+        """
+        async for users in UserRepository.iter_users():
+            yield b"".join(user.model_dump_json().encode() + b"\n" for user in users)
 
-        if not any(user_data.model_dump().values()):
+    @staticmethod
+    async def update_user(user_id: int, user_data: UserUpdate) -> Optional[User]:
+        """
+        사용자 정보 업데이트 서비스
+        중복 확인은 create_user와 같이 UPDATE의 UNIQUE 제약 위반으로
+        """
+        # is_active=False처럼 falsy인 값도 변경 대상이므로 None만 제외
+        if not user_data.model_dump(exclude_none=True):
             raise ValueError("업데이트할 데이터가 없습니다.")
 
-        # 이메일 업데이트 시 중복 확인
-        if update_data.email:
-            existing_user = await UserRepository.get_user_by_email(update_data.email)
-            if existing_user and existing_user.id != user_id:
-                raise ValueError("이미 존재하는 이메일입니다.")
-
-        # 사용자 이름 업데이트 시 중복 확인
-        if update_data.username:
-            existing_user = await UserRepository.get_user_by_username(
-                update_data.username
-            )
-            if existing_user and existing_user.id != user_id:
-                raise ValueError("이미 존재하는 사용자 이름입니다.")
-
-        user = await UserRepository.update_user(user_id, update_data)
+        user = await UserRepository.update_user(user_id, user_data)
         if not user:
             return None
 
+        # 활성 상태 / 이메일 / 비밀번호가 바뀌면 트리거가 토큰 버전을 올림
+        await invalidate_tags(f"user:{user_id}:profile", f"user:{user_id}:token")
         return user
 
     @staticmethod
     async def delete_user(user_id: int) -> bool:
         """사용자 삭제 서비스"""
-        return await UserRepository.delete_user(user_id)
+        deleted = await UserRepository.delete_user(user_id)
+        # 챌린지 / 스탬프 / 장식이 CASCADE로 함께 삭제됨
+        await invalidate_tags(f"user:{user_id}")
+        return deleted
 
     @staticmethod
     async def authenticate_user(credentials: UserLogin) -> Optional[Dict]:
         """사용자 인증 및 토큰 생성 서비스"""
-        user = await UserRepository.verify_user(credentials.email, credentials.password)
-        if not user:
+        user_in_db = await UserRepository.get_verified_user(
+            credentials.email, credentials.password
+        )
+        if not user_in_db:
             return None
 
-        # 액세스 토큰 생성
-        access_token = UserService.create_access_token(data={"sub": user.email})
+        # 액세스 토큰 / 리프레시 토큰 생성
+        access_token = UserService.create_user_token(user_in_db)
+        refresh_token = await SessionService.create(
+            user_in_db.id, user_in_db.token_version
+        )
 
-        return {"access_token": access_token, "token_type": "bearer", "user": user}
+        # 비밀번호 해시 / 토큰 버전 제외
+        user = User(
+            id=user_in_db.id,
+            email=user_in_db.email,
+            username=user_in_db.username,
+            is_active=user_in_db.is_active,
+            is_superuser=user_in_db.is_superuser,
+            created_at=user_in_db.created_at,
+            updated_at=user_in_db.updated_at,
+        )
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer",
+            "user": user,
+        }
+
+    @staticmethod
+    async def refresh_access_token(refresh_token: str) -> Optional[Dict]:
+        """리프레시 토큰으로 새 액세스 토큰 / 리프레시 토큰 발급 서비스 (비밀번호 확인 없음)"""
+        rotation: Optional[SessionRotation] = await SessionService.rotate(refresh_token)
+        if rotation is None:
+            return None
+        return {
+            "access_token": UserService.create_user_token(rotation.user),
+            "refresh_token": rotation.refresh_token,
+            "token_type": "bearer",
+        }
+
+    @staticmethod
+    async def logout(refresh_token: str) -> None:
+        """리프레시 토큰 세션 폐기 서비스 (발급된 액세스 토큰은 만료될 때까지 유효)"""
+        await SessionService.revoke(refresh_token)
+
+    @staticmethod
+    def create_user_token(user: Union[UserInDB, TokenUser]) -> str:
+        """
+        사용자 claim을 담은 액세스 토큰 생성
+        - sub: 이메일, uid: 사용자 ID, active / superuser: 권한 확인용 플래그
+        - tv: 발급 시점의 토큰 버전 (DB의 버전이 올라가면 토큰 폐기)
+        """
+        return UserService.create_access_token(
+            data={
+                "sub": user.email,
+                "uid": user.id,
+                "active": user.is_active,
+                "superuser": user.is_superuser,
+                "tv": user.token_version,
+            }
+        )
 
     @staticmethod
     def create_access_token(data: Dict) -> str:
@@ -122,8 +185,23 @@ class UserService:
         )
 
     @staticmethod
-    async def get_current_user(token: str) -> Optional[User]:
-        """토큰에서 현재 사용자 가져오기"""
+    @cached(
+        "user_token_version",
+        key="{user_id}",
+        ttl=settings.CACHE_TTL_SECONDS,
+        tags=("user:{user_id}", "user:{user_id}:token"),
+    )
+    @single_flight("user_token_version")
+    async def get_token_version(user_id: int) -> Optional[int]:
+        """사용자의 현재 토큰 버전 조회 서비스 (사용자가 없으면 None)"""
+        return await UserRepository.get_token_version(user_id)
+
+    @staticmethod
+    async def get_current_user(token: str) -> Optional[TokenUser]:
+        """
+        토큰에서 현재 사용자 가져오기
+        캐시된 토큰 버전만 확인 (대부분 쿼리 없음). claim(uid / tv)이 없는 토큰은 거부
+        """
         try:
             payload = jwt.decode(
                 token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -134,20 +212,20 @@ class UserService:
         except JWTError:
             return None
 
-        user = await UserRepository.get_user_by_email(email)
-        if user is None:
+        try:
+            token_user = TokenUser(
+                id=payload["uid"],
+                email=email,
+                is_active=payload.get("active", True),
+                is_superuser=payload.get("superuser", False),
+                token_version=payload["tv"],
+            )
+        except (KeyError, ValidationError):
             return None
-
-        # UserInDB를 User로 변환
-        return User(
-            id=user.id,
-            email=user.email,
-            username=user.username,
-            is_active=user.is_active,
-            is_superuser=user.is_superuser,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        current_version = await UserService.get_token_version(token_user.id)
+        if current_version != token_user.token_version:
+            return None
+        return token_user
 
     @staticmethod
     async def get_fake_challenges_by_id(user_id: int) -> Optional[List[Dict[str, Any]]]:
@@ -1,16 +1,25 @@
 from difflib import get_close_matches
-from typing import Literal
+from typing import Literal, Optional
 
 from fastapi import UploadFile
 from google.cloud import vision
 
-from google.cloud import vision
+from app.core.deadline import remaining
 from app.services.gemini_service import GeminiService
 
-# 기존 client = vision.ImageAnnotatorClient() 대신 다음과 같이 수정
-client = vision.ImageAnnotatorClient()
-print(f"client: {client.__dict__}")
-"""Google Cloud Vision API 클라이언트 초기화"""
+_client: Optional[vision.ImageAnnotatorClient] = None
+
+
+def get_client() -> vision.ImageAnnotatorClient:
+    """Google Cloud Vision API 클라이언트 초기화
+    import 시점에 생성하면 인증 정보가 없는 환경(테스트, 벤치마크)에서 앱 자체를 띄울 수 없으므로
+    처음 사용할 때 생성한다.
+    """
+    global _client
+    if _client is None:
+        _client = vision.ImageAnnotatorClient()
+        print(f"client: {_client.__dict__}")
+    return _client
 
 
 class VisionService:
@@ -24,7 +33,12 @@ class VisionService:
         return: 'O', 'X'
         """
         image = vision.Image(content=file.file.read())
-        response = client.text_detection(image=image)
+        # 요청 deadline이 있으면 남은 시간만큼만 기다림
+        timeout = remaining()
+        if timeout is None:
+            response = get_client().text_detection(image=image)
+        else:
+            response = get_client().text_detection(image=image, timeout=timeout)
 
         if not response.text_annotations:
             return "X"  # 아무 텍스트도 인식 안됐을 때
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+핵심 사용자 여정(user journey) 엔드투엔드 HTTP 벤치마크
+
+사용법:
+    python -m benchmarks.seed --users 10000 --stamps 1000000   # 먼저 데이터셋 적재
+    python -m benchmarks.http_journeys --concurrency 1 8 32 64
+    python -m benchmarks.http_journeys --compare benchmarks/results/<이전 결과>.json
+
+- 실제 app.main:app을 httpx ASGITransport로 직접 구동 (네트워크/uvicorn 없이 앱 + DB 비용만 측정)
+- DB는 settings.DATABASE_URL의 로컬 Postgres (benchmarks.seed로 적재한 bench 사용자 사용)
+- 스탬프 검증(Vision/Gemini)은 외부 API 대신 로컬 검증기로 대체
+- 여정 x 동시성 단계별 처리량(req/s)과 p50/p95/p99 지연시간을 출력하고 JSON으로 저장
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+
+# 현재 파일 기준 프로젝트 루트 디렉토리 sys.path에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.models.stamp_model import StampType
+from benchmarks.seed import BENCHMARK_EMAIL_FORMAT, BENCHMARK_PASSWORD
+
+RESULTS_DIR = os.path.join(project_root, "benchmarks", "results")
+
+# 1x1 투명 PNG (장식 파일 및 스탬프 업로드 본문)
+TINY_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c63000100000500010d0a2db40000000049454e44ae426082"
+)
+# 챌린지 목표 수 (SMALLINT 범위 내에서 벤치마크 도중 완료되지 않도록 크게)
+BENCHMARK_CHALLENGE_OBJECTIVE = 30_000
+
+
+class BenchmarkConfig(BaseModel):
+    """HTTP 벤치마크 설정"""
+
+    concurrency: List[int] = Field(default=[1, 8, 32, 64], description="동시성 단계")
+    requests: int = Field(default=200, ge=1, description="단계별 측정 요청 수")
+    login_requests: int = Field(
+        default=40, ge=1, description="로그인 단계별 요청 수 (bcrypt 비용이 커서 별도)"
+    )
+    warmup: int = Field(default=10, ge=0, description="단계별 워밍업 요청 수")
+    actors: int = Field(
+        default=20, ge=1, description="요청을 나눠 보낼 bench 사용자 수"
+    )
+    assets: int = Field(default=20, ge=1, description="파일 조회에 사용할 장식 수")
+    journeys: List[str] = Field(..., description="실행할 여정 이름")
+    verifier_latency_ms: float = Field(
+        default=0.0, ge=0, description="로컬 검증기의 모의 지연시간 (ms)"
+    )
+
+
+class Actor(BaseModel):
+    """벤치마크 요청을 보내는 bench 사용자"""
+
+    uid: int
+    email: str
+    token: str
+    challenge_ids: Dict[StampType, int]
+
+
+class AssetFile(BaseModel):
+    """파일 조회 여정에 사용하는 장식 파일"""
+
+    type: str
+    version: int
+    name: str
+
+
+class BenchmarkContext(BaseModel):
+    """여정 함수에 전달되는 준비된 사용자/장식 목록"""
+
+    actors: List[Actor]
+    assets: List[AssetFile]
+
+
+JourneyCall = Callable[
+    [httpx.AsyncClient, BenchmarkContext, int], Awaitable[httpx.Response]
+]
+
+
+def _auth(actor: Actor) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {actor.token}"}
+
+
+async def journey_login(
+    client: httpx.AsyncClient, context: BenchmarkContext, i: int
+) -> httpx.Response:
+    actor = context.actors[i % len(context.actors)]
+    return await client.post(
+        "/api/users/token",
+        data={"username": actor.email, "password": BENCHMARK_PASSWORD},
+    )
+
+
+async def journey_challenges(
+    client: httpx.AsyncClient, context: BenchmarkContext, i: int
+) -> httpx.Response:
+    actor = context.actors[i % len(context.actors)]
+    return await client.get("/api/challenges/", headers=_auth(actor))
+
+
+async def journey_stamp(
+    client: httpx.AsyncClient, context: BenchmarkContext, i: int
+) -> httpx.Response:
+    actor = context.actors[i % len(context.actors)]
+    # order_details와 tumbler를 번갈아 가며 생성
+    stamp_type = StampType.ORDER_DETAILS if i % 2 == 0 else StampType.TUMBLER
+    return await client.post(
+        f"/api/stamps/{stamp_type.value}",
+        headers=_auth(actor),
+        data={
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "uid": str(actor.uid),
+            "challenges_ids_json": str(actor.challenge_ids[stamp_type]),
+        },
+        files={"file": ("stamp.png", TINY_PNG, "image/png")},
+    )
+
+
+async def journey_decorations(
+    client: httpx.AsyncClient, context: BenchmarkContext, i: int
+) -> httpx.Response:
+    actor = context.actors[i % len(context.actors)]
+    return await client.get("/api/users/decorations/", headers=_auth(actor))
+
+
+async def journey_random_draw(
+    client: httpx.AsyncClient, context: BenchmarkContext, i: int
+) -> httpx.Response:
+    actor = context.actors[i % len(context.actors)]
+    return await client.post(
+        "/api/users/decorations/random", headers=_auth(actor), json={"uid": actor.uid}
+    )
+
+
+async def journey_asset(
+    client: httpx.AsyncClient, context: BenchmarkContext, i: int
+) -> httpx.Response:
+    asset = context.assets[i % len(context.assets)]
+    return await client.get(
+        f"/api/decorations/{asset.type}/{asset.version}/{asset.name}"
+    )
+
+
+# 여정 이름: (호출 함수, 기대 상태 코드)
+JOURNEYS: Dict[str, tuple] = {
+    "login": (journey_login, 200),
+    "challenges": (journey_challenges, 200),
+    "stamp": (journey_stamp, 201),
+    "decorations": (journey_decorations, 200),
+    "random_draw": (journey_random_draw, 200),
+    "asset": (journey_asset, 200),
+}
+
+
+def make_local_verifier(latency_ms: float) -> Callable[[Any, StampType], bool]:
+    """
+    stamp_controller.vision_api_verify를 대체하는 로컬 검증기
+    실제 검증 함수와 같이 동기 함수이므로, 지연시간을 주면 이벤트 루프를 그대로 막는다.
+    """
+
+    def local_verifier(file: Any, stamp_type: StampType) -> bool:
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+        return True
+
+    return local_verifier
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """nearest-rank 방식 백분위수 (sorted_values는 오름차순 정렬되어 있어야 함)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(
+    journey: str,
+    concurrency: int,
+    latencies: List[float],
+    errors: int,
+    elapsed: float,
+) -> Dict[str, Any]:
+    """단계별 측정값을 결과 dict로 요약 (지연시간은 ms)"""
+    ordered = sorted(latencies)
+    return {
+        "journey": journey,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+            "p50": round(percentile(ordered, 50) * 1000, 3),
+            "p95": round(percentile(ordered, 95) * 1000, 3),
+            "p99": round(percentile(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        },
+    }
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    context: BenchmarkContext,
+    journey: str,
+    concurrency: int,
+    total: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    """concurrency개의 워커가 total개의 요청을 나눠 보내며 지연시간을 측정"""
+    call, expected_status = JOURNEYS[journey]
+    for i in range(warmup):
+        await call(client, context, i)
+
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            try:
+                response = await call(client, context, warmup + i)
+                ok = response.status_code == expected_status
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return summarize(journey, concurrency, latencies, errors, elapsed)
+
+
+def prepare_static_dir(workdir: str, assets: List[AssetFile]) -> None:
+    """임시 작업 디렉토리에 static/{type}/{version}/{name}.png 장식 파일 생성"""
+    os.makedirs(os.path.join(workdir, "static"), exist_ok=True)
+    for asset in assets:
+        asset_dir = os.path.join(workdir, "static", asset.type, str(asset.version))
+        os.makedirs(asset_dir, exist_ok=True)
+        with open(os.path.join(asset_dir, f"{asset.name}.png"), "wb") as f:
+            f.write(TINY_PNG)
+
+
+async def load_assets(limit: int) -> List[AssetFile]:
+    from app.database.database import fetch_all
+
+    rows = await fetch_all(
+        "SELECT name, version, type FROM decorations ORDER BY id LIMIT $1", (limit,)
+    )
+    return [
+        AssetFile(type=r["type"], version=r["version"], name=r["name"]) for r in rows
+    ]
+
+
+async def prepare_actors(client: httpx.AsyncClient, count: int) -> List[Actor]:
+    """
+    bench 사용자로 로그인하여 토큰을 받고, 벤치마크 전용 챌린지를 API로 생성
+    (스탬프 여정이 기존 데이터의 달성 수에 막히지 않도록 목표 수를 크게 잡음)
+    """
+    from app.database.database import fetch_all
+
+    rows = await fetch_all(
+        "SELECT id, email FROM users WHERE email LIKE 'bench%@example.com' "
+        "ORDER BY id LIMIT $1",
+        (count,),
+    )
+    if not rows:
+        raise RuntimeError(
+            "bench 사용자가 없습니다. 먼저 python -m benchmarks.seed를 실행하세요."
+        )
+
+    now = datetime.now(timezone.utc)
+    actors = []
+    for row in rows:
+        assert row["email"] == BENCHMARK_EMAIL_FORMAT.format(uid=row["id"])
+        response = await client.post(
+            "/api/users/token",
+            data={"username": row["email"], "password": BENCHMARK_PASSWORD},
+        )
+        response.raise_for_status()
+        token = response.json()["access_token"]
+
+        challenge_ids = {}
+        for stamp_type, prefix in (
+            (StampType.ORDER_DETAILS, "od"),
+            (StampType.TUMBLER, "tb"),
+        ):
+            response = await client.post(
+                "/api/challenges/",
+                headers={"Authorization": f"Bearer {token}"},
+                json={
+                    "uid": row["id"],
+                    "title": f"benchmark {stamp_type.value}",
+                    "description": "http_journeys benchmark challenge",
+                    f"{prefix}_obj": BENCHMARK_CHALLENGE_OBJECTIVE,
+                    f"{prefix}_ach": 0,
+                    "start_at": (now - timedelta(days=1)).isoformat(),
+                    "due_at": (now + timedelta(days=30)).isoformat(),
+                },
+            )
+            response.raise_for_status()
+            challenge_ids[stamp_type] = response.json()["id"]
+
+        actors.append(
+            Actor(
+                uid=row["id"],
+                email=row["email"],
+                token=token,
+                challenge_ids=challenge_ids,
+            )
+        )
+    return actors
+
+
+async def cleanup_actors(actors: List[Actor]) -> None:
+    """벤치마크 전용 챌린지와 그 챌린지에만 연결된 스탬프 삭제"""
+    from app.database.database import execute_query
+
+    challenge_ids = [cid for actor in actors for cid in actor.challenge_ids.values()]
+    await execute_query(
+        """
+        DELETE FROM stamps WHERE id IN (
+            SELECT sid FROM challenge_stamp WHERE cid = ANY($1)
+        )
+        """,
+        (challenge_ids,),
+    )
+    await execute_query("DELETE FROM challenges WHERE id = ANY($1)", (challenge_ids,))
+
+
+async def run_benchmark(config: BenchmarkConfig, verbose: bool) -> List[Dict[str, Any]]:
+    """임시 작업 디렉토리에서 앱을 띄워 모든 여정 x 동시성 단계를 실행"""
+    original_cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix="kkook-bench-")
+    # app.main은 import 시점에 상대경로 static 디렉토리를 마운트하므로 먼저 이동
+    os.makedirs(os.path.join(workdir, "static"), exist_ok=True)
+    os.chdir(workdir)
+    try:
+        from app.controllers import stamp_controller
+        from app.main import app
+
+        original_verifier = stamp_controller.vision_api_verify
+        stamp_controller.vision_api_verify = make_local_verifier(
+            config.verifier_latency_ms
+        )
+        results = []
+        transport = httpx.ASGITransport(app=app)
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(
+                transport=transport, base_url="http://benchmark"
+            ) as client,
+        ):
+            with _app_output(verbose):
+                assets = await load_assets(config.assets)
+                prepare_static_dir(workdir, assets)
+                actors = await prepare_actors(client, config.actors)
+            context = BenchmarkContext(actors=actors, assets=assets)
+            try:
+                for journey in config.journeys:
+                    total = (
+                        config.login_requests if journey == "login" else config.requests
+                    )
+                    for concurrency in config.concurrency:
+                        with _app_output(verbose):
+                            result = await run_level(
+                                client,
+                                context,
+                                journey,
+                                concurrency,
+                                total,
+                                config.warmup,
+                            )
+                        print_result(result)
+                        results.append(result)
+            finally:
+                with _app_output(verbose):
+                    await cleanup_actors(actors)
+                stamp_controller.vision_api_verify = original_verifier
+        return results
+    finally:
+        os.chdir(original_cwd)
+
+
+def _app_output(verbose: bool) -> Any:
+    return contextlib.nullcontext() if verbose else _silence_stdout()
+
+
+@contextlib.contextmanager
+def _silence_stdout() -> Any:
+    """앱의 print 로그는 측정에 포함하되 터미널 출력 비용은 제외 (/dev/null로 출력)"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    latency = result["latency_ms"]
+    print(
+        f"{result['journey']:<12} c={result['concurrency']:<4} "
+        f"{result['throughput_rps']:>9.1f} req/s  "
+        f"p50={latency['p50']:>8.2f}ms p95={latency['p95']:>8.2f}ms "
+        f"p99={latency['p99']:>8.2f}ms  errors={result['errors']}"
+    )
+
+
+def git_revision() -> Dict[str, Any]:
+    """결과 비교용 커밋 정보"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=project_root,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def save_results(
+    config: BaseModel,
+    results: List[Dict[str, Any]],
+    output: Optional[str],
+    benchmark: str = "http_journeys",
+) -> str:
+    revision = git_revision()
+    created_at = datetime.now(timezone.utc)
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(
+            RESULTS_DIR,
+            f"{benchmark}_{created_at:%Y%m%dT%H%M%S}_{revision['commit']}.json",
+        )
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "benchmark": benchmark,
+                "created_at": created_at.isoformat(),
+                "git": revision,
+                "config": config.model_dump(mode="json"),
+                "results": results,
+            },
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
+    return output
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: List[Dict[str, Any]]
+) -> List[str]:
+    """(여정, 동시성)별로 baseline 대비 처리량/p95 변화율을 문자열로 반환"""
+    base_index = {
+        (r["journey"], r["concurrency"]): r for r in baseline.get("results", [])
+    }
+    lines = []
+    for result in current:
+        base = base_index.get((result["journey"], result["concurrency"]))
+        if base is None:
+            continue
+        rps_change = _change(base["throughput_rps"], result["throughput_rps"])
+        p95_change = _change(base["latency_ms"]["p95"], result["latency_ms"]["p95"])
+        lines.append(
+            f"{result['journey']:<12} c={result['concurrency']:<4} "
+            f"throughput {rps_change:+7.1f}%  p95 {p95_change:+7.1f}%"
+        )
+    return lines
+
+
+def _change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="핵심 사용자 여정 HTTP 벤치마크")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--login-requests", type=int, default=40)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--actors", type=int, default=20)
+    parser.add_argument("--assets", type=int, default=20)
+    parser.add_argument(
+        "--journeys", nargs="+", choices=list(JOURNEYS), default=list(JOURNEYS)
+    )
+    parser.add_argument(
+        "--verifier-latency-ms",
+        type=float,
+        default=0.0,
+        help="로컬 검증기가 외부 AI API 호출을 흉내 내는 지연시간",
+    )
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument(
+        "--verbose", action="store_true", help="앱의 print 로그를 그대로 출력"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    config = BenchmarkConfig(
+        concurrency=args.concurrency,
+        requests=args.requests,
+        login_requests=args.login_requests,
+        warmup=args.warmup,
+        actors=args.actors,
+        assets=args.assets,
+        journeys=args.journeys,
+        verifier_latency_ms=args.verifier_latency_ms,
+    )
+    results = asyncio.run(run_benchmark(config, verbose=args.verbose))
+    output = save_results(config, results, args.output)
+    print(f"✅ 결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\n📊 {baseline['git']['commit']} 대비 변화")
+        for line in compare_results(baseline, results):
+            print(line)
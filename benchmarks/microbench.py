@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+행(row) 단위 변환 함수 마이크로벤치마크 (실행 시간 + tracemalloc 할당량)
+
+사용법:
+    python -m benchmarks.microbench                    # 측정 결과 출력
+    python -m benchmarks.microbench --check            # baseline 대비 회귀 시 exit 1
+    python -m benchmarks.microbench --update-baseline  # 최적화 후 baseline 갱신
+
+- 목록 조회 요청마다 행 수만큼 호출되는 함수들을 1 / 100 / 10k 행 입력으로 측정
+- 할당량(블록 수, 바이트)은 실행 환경 간 편차가 작아 CI 회귀 기준으로 사용
+  (test/test_repositories/test_row_mapping_benchmarks.py)
+- 실행 시간은 머신마다 다르므로 --check에서 같은 머신의 baseline과 비교할 때만 사용
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+# 현재 파일 기준 프로젝트 루트 디렉토리 sys.path에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.models.challenge_model import ChallengeResponse
+from app.models.decoration_model import AssetBase
+from app.models.stamp_model import StampResponse, StampType
+from app.repositories.challenge_repository import ChallengeRepository
+from app.repositories.stamp_repository import StampRepository
+
+SIZES = (1, 100, 10_000)
+BASELINE_PATH = os.path.join(project_root, "benchmarks", "microbench_baseline.json")
+
+# 회귀 판정 허용치: baseline * (1 + ratio) + slack
+ALLOC_TOLERANCE_RATIO = 0.10
+ALLOC_TOLERANCE_BLOCKS = 32
+ALLOC_TOLERANCE_BYTES = 4096
+TIME_TOLERANCE_RATIO = 0.50
+TIME_TOLERANCE_SECONDS = 20e-6  # 1행 측정값처럼 us 단위 노이즈 흡수
+
+# challenge_stamp JOIN 결과에서 챌린지 하나에 붙는 스탬프 수
+STAMPS_PER_CHALLENGE = 10
+ANCHOR = datetime(2025, 5, 1, tzinfo=timezone.utc)
+
+
+class Case(NamedTuple):
+    """측정 대상 함수와 size개 행 입력 생성기"""
+
+    name: str
+    build: Callable[[int], Any]
+    run: Callable[[Any], Any]
+
+
+def _challenge_stamp_rows(size: int) -> List[Dict[str, Any]]:
+    """get_challenge_response_by_uid의 LEFT JOIN 결과와 같은 모양의 행"""
+    rows = []
+    for i in range(size):
+        cid = i // STAMPS_PER_CHALLENGE + 1
+        is_od = cid % 2 == 1
+        rows.append(
+            {
+                "id": cid,
+                "uid": 1,
+                "title": f"challenge {cid}",
+                "description": "microbench challenge",
+                "is_done": False,
+                "od_obj": 30 if is_od else None,
+                "od_ach": 10 if is_od else None,
+                "tb_obj": None if is_od else 30,
+                "tb_ach": None if is_od else 10,
+                "start_at": ANCHOR,
+                "due_at": ANCHOR + timedelta(days=30),
+                "sid": i + 1,
+                "type": "od" if is_od else "tb",
+                "saved_at": ANCHOR + timedelta(minutes=i),
+                "save_url": "no-url",
+            }
+        )
+    return rows
+
+
+def _challenge_kwargs(size: int) -> List[Dict[str, Any]]:
+    """challenge_controller가 timestamp_to_datestr에 넘기는 인자"""
+    return [
+        {
+            "id": i + 1,
+            "uid": 1,
+            "title": f"challenge {i + 1}",
+            "description": "microbench challenge",
+            "is_done": False,
+            "od_obj": 30,
+            "od_ach": 10,
+            "tb_obj": None,
+            "tb_ach": None,
+            "start_at": ANCHOR,
+            "due_at": ANCHOR + timedelta(days=30),
+            "stamps": None,
+            "type": StampType.ORDER_DETAILS,
+        }
+        for i in range(size)
+    ]
+
+
+def _stamp_kwargs(size: int) -> List[Dict[str, Any]]:
+    """stamp_controller가 timestamp_to_datestr에 넘기는 인자"""
+    return [
+        {
+            "id": i + 1,
+            "saved_at": ANCHOR + timedelta(minutes=i),
+            "save_url": "no-url",
+            "type": StampType.TUMBLER if i % 2 else StampType.ORDER_DETAILS,
+        }
+        for i in range(size)
+    ]
+
+
+def _stamp_type_strings(size: int) -> List[str]:
+    return ["tb" if i % 2 else "od" for i in range(size)]
+
+
+def _colors(size: int) -> List[str]:
+    return [
+        json.dumps({"trunk": f"#{i % 0xFFFFFF:06X}", "leaf": "#00FF00"})
+        for i in range(size)
+    ]
+
+
+CASES: Tuple[Case, ...] = (
+    Case(
+        "ChallengeRepository._map_rows_to_challenge_with_stamps",
+        _challenge_stamp_rows,
+        ChallengeRepository._map_rows_to_challenge_with_stamps,
+    ),
+    Case(
+        "ChallengeResponse.timestamp_to_datestr",
+        _challenge_kwargs,
+        lambda rows: [ChallengeResponse.timestamp_to_datestr(**row) for row in rows],
+    ),
+    Case(
+        "StampResponse.timestamp_to_datestr",
+        _stamp_kwargs,
+        lambda rows: [StampResponse.timestamp_to_datestr(**row) for row in rows],
+    ),
+    Case(
+        "StampRepository._type_string_mapper",
+        _stamp_type_strings,
+        lambda rows: [StampRepository._type_string_mapper(row) for row in rows],
+    ),
+    Case(
+        "AssetBase.validate_color",
+        _colors,
+        lambda rows: [AssetBase.validate_color(row) for row in rows],
+    ),
+)
+
+
+@contextlib.contextmanager
+def _silence_stdout() -> Any:
+    """대상 함수의 print 로그는 측정에 포함하되 터미널 출력 비용은 제외"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure_allocations(case: Case, size: int) -> Dict[str, int]:
+    """
+    1회 호출의 할당량 측정
+    - blocks / bytes: 호출 후 결과가 살아있는 상태에서 새로 잡힌 메모리 블록 수와 크기
+    - peak_bytes: 호출 도중 최대로 늘어난 메모리 (임시 객체 포함)
+    """
+    rows = case.build(size)
+    with _silence_stdout():
+        case.run(rows)  # 지연 import, 캐시 등 1회성 할당 제외
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            base_current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            result = case.run(rows)
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+    size_bytes = sum(stat.size_diff for stat in diff if stat.size_diff > 0)
+    del result
+    return {
+        "blocks": blocks,
+        "bytes": size_bytes,
+        "peak_bytes": peak - base_current,
+    }
+
+
+def measure_time(case: Case, size: int, repeat: int = 5) -> float:
+    """1회 호출 최소 실행 시간 (초)"""
+    rows = case.build(size)
+    with _silence_stdout():
+        timer = timeit.Timer(lambda: case.run(rows))
+        number, _ = timer.autorange()
+        return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_microbench(
+    sizes: Tuple[int, ...] = SIZES, with_time: bool = True
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """{case 이름: {size: 측정값}} 형태로 반환"""
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for case in CASES:
+        results[case.name] = {}
+        for size in sizes:
+            measured: Dict[str, float] = dict(measure_allocations(case, size))
+            if with_time:
+                measured["seconds"] = measure_time(case, size)
+            results[case.name][str(size)] = measured
+    return results
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Dict[str, Dict[str, float]]]:
+    with open(path) as f:
+        return json.load(f)["cases"]
+
+
+def alloc_limit(baseline: float, slack: int) -> int:
+    return int(baseline * (1 + ALLOC_TOLERANCE_RATIO) + slack)
+
+
+def find_regressions(
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    check_time: bool = True,
+) -> List[str]:
+    """baseline 허용치를 넘은 (case, size) 목록"""
+    regressions = []
+    for name, by_size in results.items():
+        for size, measured in by_size.items():
+            base = baseline.get(name, {}).get(size)
+            if base is None:
+                continue
+            if measured["blocks"] > alloc_limit(base["blocks"], ALLOC_TOLERANCE_BLOCKS):
+                regressions.append(
+                    f"{name} [{size} rows] blocks {base['blocks']} -> {measured['blocks']}"
+                )
+            if measured["peak_bytes"] > alloc_limit(
+                base["peak_bytes"], ALLOC_TOLERANCE_BYTES
+            ):
+                regressions.append(
+                    f"{name} [{size} rows] peak "
+                    f"{base['peak_bytes']}B -> {measured['peak_bytes']}B"
+                )
+            if (
+                check_time
+                and "seconds" in measured
+                and measured["seconds"]
+                > base["seconds"] * (1 + TIME_TOLERANCE_RATIO) + TIME_TOLERANCE_SECONDS
+            ):
+                regressions.append(
+                    f"{name} [{size} rows] time "
+                    f"{base['seconds'] * 1e6:.1f}us -> {measured['seconds'] * 1e6:.1f}us"
+                )
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    for name, by_size in results.items():
+        print(name)
+        for size, measured in by_size.items():
+            seconds = measured.get("seconds")
+            timing = f"{seconds * 1e3:>10.3f}ms" if seconds is not None else ""
+            print(
+                f"  {size:>6} rows {timing} "
+                f"blocks={measured['blocks']:<8} bytes={measured['bytes']:<10} "
+                f"peak={measured['peak_bytes']}"
+            )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="행 단위 변환 함수 마이크로벤치마크")
+    parser.add_argument(
+        "--check", action="store_true", help="baseline 대비 회귀 시 exit 1"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="측정 결과를 baseline으로 저장"
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = run_microbench()
+    print_results(results)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({"python": sys.version.split()[0], "cases": results}, f, indent=2)
+            f.write("\n")
+        print(f"✅ baseline 저장: {args.baseline}")
+
+    if args.check:
+        regressions = find_regressions(load_baseline(args.baseline), results)
+        if regressions:
+            print("❌ 회귀 발견:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("✅ baseline 허용치 이내")
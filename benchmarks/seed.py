@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+벤치마크/부하 테스트용 대용량 합성 데이터 생성기
+
+사용법:
+    python -m benchmarks.seed --users 100000 --stamps 20000000 --skew 1.1
+
+- 대상 테이블을 TRUNCATE 한 뒤 id를 직접 부여하여 copy_records_to_table(COPY)로 적재
+- 적재는 트리거를 끄고(session_replication_role = replica, superuser 필요) 한 트랜잭션에서 하고,
+  트리거가 채우던 값(stamps.uid, 동기화 순번, user_data_versions, 리더보드 점수)은 직접 채움
+- 같은 --seed, --anchor면 같은 데이터셋이 생성됨 (재현 가능한 baseline)
+- --skew는 사용자 활동량의 Zipf 지수 (0이면 균등, 클수록 소수 사용자에게 몰림)
+- 모든 사용자의 비밀번호는 BENCHMARK_PASSWORD (로그인 벤치마크용)
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import asyncpg
+from pydantic import BaseModel, Field
+
+# 현재 파일 기준 프로젝트 루트 디렉토리 sys.path에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.config import settings
+from app.models.decoration_model import AssetType, DecorationType
+from app.repositories.user_repository import UserRepository
+
+BENCHMARK_PASSWORD = "benchmark-password"
+BENCHMARK_EMAIL_FORMAT = "bench{uid}@example.com"
+
+# FK 역순 (TRUNCATE 및 적재 순서 참고용)
+SEEDED_TABLES = (
+    "decoration_user",
+    "challenge_decoration",
+    "challenge_stamp",
+    "stamps",
+    "challenges",
+    "decorations",
+    "users",
+)
+# 적재한 행에서 파생되는 테이블 (트리거가 채우는 버전 / 동기화 기록 / 리더보드 점수와 멱등성 키)
+# FK가 없어 CASCADE로 비워지지 않고, TRUNCATE는 DELETE 트리거를 실행하지 않으므로 함께 비움
+DERIVED_TABLES = (
+    "user_data_versions",
+    "sync_tombstones",
+    "idempotency_keys",
+    "stamp_scores",
+    "stamp_weekly_scores",
+)
+SERIAL_TABLES = ("users", "decorations", "challenges", "stamps")
+# 챌린지 하나의 최대 스탬프 수 (od_obj / od_ach / tb_obj / tb_ach가 SMALLINT)
+MAX_CHALLENGE_STAMPS = 32767
+
+
+class SeedConfig(BaseModel):
+    """합성 데이터 생성 설정"""
+
+    users: int = Field(default=100_000, ge=1, description="사용자 수")
+    challenges_per_user: int = Field(default=5, ge=1, description="사용자당 챌린지 수")
+    stamps: int = Field(default=20_000_000, ge=0, description="전체 스탬프 수")
+    decorations: int = Field(default=300, ge=1, description="장식 카탈로그 크기")
+    decorations_per_user: int = Field(
+        default=20, ge=0, description="사용자당 평균 보유 장식 수"
+    )
+    skew: float = Field(
+        default=1.0, ge=0, description="사용자 활동량 Zipf 지수 (0이면 균등)"
+    )
+    seed: int = Field(default=42, description="난수 시드")
+    anchor: datetime = Field(..., description="데이터 기준 시각 (가장 최근 시각)")
+    batch_size: int = Field(default=50_000, ge=1, description="COPY 배치 크기")
+
+
+class DatasetPlan(BaseModel):
+    """
+    챌린지 단위 스탬프 배분 결과.
+    challenge id는 인덱스 + 1, 스탬프 id는 챌린지 순서대로 연속 부여됨.
+    """
+
+    challenge_uids: List[int]
+    challenge_types: List[str]  # "od" | "tb"
+    challenge_stamps: List[int]
+    user_decorations: List[int]
+
+
+def _zipf_weights(n: int, skew: float, rng: random.Random) -> List[float]:
+    """순위를 섞은 Zipf 가중치 (id 순서와 활동량이 상관없도록)"""
+    ranks = list(range(1, n + 1))
+    rng.shuffle(ranks)
+    return [rank**-skew for rank in ranks]
+
+
+def _allocate(total: int, weights: List[float], rng: random.Random) -> List[int]:
+    """가중치에 비례하게 total개를 배분 (합계가 정확히 total)"""
+    weight_sum = sum(weights)
+    counts = [int(total * weight / weight_sum) for weight in weights]
+    remainder = total - sum(counts)
+    if remainder:
+        for idx in rng.choices(range(len(weights)), weights=weights, k=remainder):
+            counts[idx] += 1
+    return counts
+
+
+def _spread(total: int, slots: int, rng: random.Random) -> List[int]:
+    """
+    total개를 slots개 챌린지에 무작위로 배분 (챌린지당 MAX_CHALLENGE_STAMPS 이하)
+    slots * MAX_CHALLENGE_STAMPS >= total이어야 함
+    """
+    counts = [0] * slots
+    for idx in rng.choices(range(slots), k=total):
+        counts[idx] += 1
+    overflow = sum(max(count - MAX_CHALLENGE_STAMPS, 0) for count in counts)
+    if overflow:
+        # 넘친 만큼 앞 챌린지의 남는 자리로 옮김
+        counts = [min(count, MAX_CHALLENGE_STAMPS) for count in counts]
+        for idx in range(slots):
+            moved = min(MAX_CHALLENGE_STAMPS - counts[idx], overflow)
+            counts[idx] += moved
+            overflow -= moved
+    return counts
+
+
+def plan_dataset(config: SeedConfig) -> DatasetPlan:
+    """
+    사용자별 활동량을 skew에 따라 정하고 챌린지별 스탬프 수로 배분
+    활동량이 많은 사용자는 챌린지당 MAX_CHALLENGE_STAMPS를 넘지 않도록 챌린지 수를 늘림
+    """
+    rng = random.Random(config.seed)
+    weights = _zipf_weights(config.users, config.skew, rng)
+    user_stamps = _allocate(config.stamps, weights, rng)
+    user_decorations = [
+        min(count, config.decorations)
+        for count in _allocate(config.users * config.decorations_per_user, weights, rng)
+    ]
+
+    challenge_uids: List[int] = []
+    challenge_types: List[str] = []
+    challenge_stamps: List[int] = []
+    for uid, stamp_count in enumerate(user_stamps, start=1):
+        challenge_count = max(
+            config.challenges_per_user, -(-stamp_count // MAX_CHALLENGE_STAMPS)
+        )
+        for idx, count in enumerate(_spread(stamp_count, challenge_count, rng)):
+            challenge_uids.append(uid)
+            challenge_types.append("od" if idx % 2 == 0 else "tb")
+            challenge_stamps.append(count)
+
+    return DatasetPlan(
+        challenge_uids=challenge_uids,
+        challenge_types=challenge_types,
+        challenge_stamps=challenge_stamps,
+        user_decorations=user_decorations,
+    )
+
+
+def _sync_seq_offsets(plan: DatasetPlan) -> Tuple[List[int], List[int]]:
+    """
+    사용자별 (챌린지 수, 챌린지 + 스탬프 수) (인덱스: uid - 1)
+    동기화 순번(sync_seq)은 사용자마다 챌린지 -> 스탬프 -> 보유 장식 순으로 1부터 부여
+    """
+    users = len(plan.user_decorations)
+    challenges = [0] * users
+    stamps = [0] * users
+    for uid, count in zip(plan.challenge_uids, plan.challenge_stamps):
+        challenges[uid - 1] += 1
+        stamps[uid - 1] += count
+    return challenges, [c + s for c, s in zip(challenges, stamps)]
+
+
+def _challenge_window(
+    rng: random.Random, anchor: datetime
+) -> Tuple[datetime, datetime]:
+    start_at = anchor - timedelta(days=rng.randint(0, 90))
+    due_at = start_at + timedelta(days=rng.randint(7, 60))
+    return start_at, due_at
+
+
+def user_records(config: SeedConfig) -> Iterator[Tuple[Any, ...]]:
+    """users: (id, email, username, hashed_password, is_active, is_superuser, created_at, updated_at)"""
+    # bcrypt는 느리므로 한 번만 해시하여 모든 사용자가 공유
+    hashed_password = UserRepository._hash_password(BENCHMARK_PASSWORD)
+    created_at = config.anchor - timedelta(days=365)
+    for uid in range(1, config.users + 1):
+        yield (
+            uid,
+            BENCHMARK_EMAIL_FORMAT.format(uid=uid),
+            f"bench{uid}",
+            hashed_password,
+            True,
+            False,
+            created_at,
+            created_at,
+        )
+
+
+def decoration_records(config: SeedConfig) -> Iterator[Tuple[Any, ...]]:
+    """decorations: (id, name, version, type, rarity, color)"""
+    rng = random.Random(config.seed + 1)
+    decoration_types = list(DecorationType)
+    asset_types = {asset_type.value for asset_type in AssetType}
+    for did in range(1, config.decorations + 1):
+        decoration_type = decoration_types[did % len(decoration_types)].value
+        color = None
+        if decoration_type in asset_types:
+            color = json.dumps(
+                {"main": "#%06X" % rng.randrange(0x1000000)}, separators=(",", ":")
+            )
+        yield (
+            did,
+            f"{decoration_type}_{did}",
+            1,
+            decoration_type,
+            rng.choices((1, 2, 3, 4, 5), weights=(50, 25, 15, 7, 3))[0],
+            color,
+        )
+
+
+def challenge_records(
+    config: SeedConfig, plan: DatasetPlan
+) -> Iterator[Tuple[Any, ...]]:
+    """challenges: (id, uid, title, description, is_done, od_obj, od_ach, tb_obj, tb_ach, start_at, due_at, sync_seq)"""
+    rng = random.Random(config.seed + 2)
+    previous_uid, sync_seq = 0, 0
+    for idx, (uid, ctype, count) in enumerate(
+        zip(plan.challenge_uids, plan.challenge_types, plan.challenge_stamps)
+    ):
+        # 같은 사용자의 챌린지는 연속으로 배치됨
+        sync_seq = sync_seq + 1 if uid == previous_uid else 1
+        previous_uid = uid
+        objective = max(rng.randint(10, 60), count)
+        start_at, due_at = _challenge_window(rng, config.anchor)
+        od = (objective, count) if ctype == "od" else (None, None)
+        tb = (objective, count) if ctype == "tb" else (None, None)
+        yield (
+            idx + 1,
+            uid,
+            f"{'주문상세' if ctype == 'od' else '텀블러'} 챌린지 {idx + 1}",
+            "benchmark seed",
+            count >= objective,
+            od[0],
+            od[1],
+            tb[0],
+            tb[1],
+            start_at,
+            due_at,
+            sync_seq,
+        )
+
+
+def stamp_records(config: SeedConfig, plan: DatasetPlan) -> Iterator[Tuple[Any, ...]]:
+    """
+    stamps: (id, saved_at, save_url, type, uid, sync_seq) - 챌린지 기간 안에서 저장 시각 생성
+    소유자(uid)는 연결될 챌린지의 사용자 (트리거 대신 직접 기록)
+    """
+    rng = random.Random(config.seed + 2)
+    stamp_rng = random.Random(config.seed + 4)
+    challenge_counts, _ = _sync_seq_offsets(plan)
+    sid = 0
+    previous_uid, sync_seq = 0, 0
+    for uid, ctype, count in zip(
+        plan.challenge_uids, plan.challenge_types, plan.challenge_stamps
+    ):
+        if uid != previous_uid:
+            previous_uid, sync_seq = uid, challenge_counts[uid - 1]
+        # challenge_records와 같은 시드/순서로 기간을 재현
+        rng.randint(10, 60)
+        start_at, due_at = _challenge_window(rng, config.anchor)
+        span = max((min(due_at, config.anchor) - start_at).total_seconds(), 1.0)
+        for _ in range(count):
+            sid += 1
+            sync_seq += 1
+            saved_at = start_at + timedelta(seconds=stamp_rng.random() * span)
+            yield (sid, saved_at, "no-url", ctype, uid, sync_seq)
+
+
+def challenge_stamp_records(plan: DatasetPlan) -> Iterator[Tuple[int, int]]:
+    """challenge_stamp: (cid, sid)"""
+    sid = 0
+    for cid, count in enumerate(plan.challenge_stamps, start=1):
+        for _ in range(count):
+            sid += 1
+            yield (cid, sid)
+
+
+def decoration_user_records(
+    config: SeedConfig, plan: DatasetPlan
+) -> Iterator[Tuple[Any, ...]]:
+    """decoration_user: (did, uid, acquired_at, is_equipped, type, sync_seq)"""
+    rng = random.Random(config.seed + 3)
+    decoration_types = list(DecorationType)
+    catalog = range(1, config.decorations + 1)
+    _, seq_offsets = _sync_seq_offsets(plan)
+    for uid, count in enumerate(plan.user_decorations, start=1):
+        for seq, did in enumerate(rng.sample(catalog, count), start=1):
+            yield (
+                did,
+                uid,
+                config.anchor - timedelta(seconds=rng.randrange(180 * 24 * 3600)),
+                rng.random() < 0.2,
+                decoration_types[did % len(decoration_types)].value,
+                seq_offsets[uid - 1] + seq,
+            )
+
+
+def _batched(
+    records: Iterable[Tuple[Any, ...]], batch_size: int
+) -> Iterator[List[Tuple[Any, ...]]]:
+    batch: List[Tuple[Any, ...]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def copy_in_batches(
+    conn: asyncpg.Connection,
+    table: str,
+    columns: List[str],
+    records: Iterable[Tuple[Any, ...]],
+    batch_size: int,
+) -> int:
+    """배치 단위 COPY 적재 (메모리 사용량을 batch_size로 제한)"""
+    started = time.perf_counter()
+    total = 0
+    for batch in _batched(records, batch_size):
+        await conn.copy_records_to_table(table, records=batch, columns=columns)
+        total += len(batch)
+    elapsed = time.perf_counter() - started
+    print(
+        f"✅ {table}: {total:,} rows ({elapsed:.1f}s, {total / max(elapsed, 1e-9):,.0f} rows/s)"
+    )
+    return total
+
+
+# 트리거를 끄고 적재한 뒤 트리거가 채웠을 값을 한 번에 계산
+# (stamps.uid / sync_seq는 COPY에서 직접 기록)
+DERIVED_TABLE_QUERIES = (
+    # 데이터 버전 + 마지막 동기화 순번
+    (
+        "user_data_versions",
+        """
+        INSERT INTO user_data_versions (uid, challenges_version, stamps_version, decorations_version, sync_seq)
+        SELECT uid, 1, 1, 1, max(sync_seq)
+        FROM (
+            SELECT uid, sync_seq FROM challenges
+            UNION ALL
+            SELECT uid, sync_seq FROM stamps WHERE uid IS NOT NULL
+            UNION ALL
+            SELECT uid, sync_seq FROM decoration_user
+        ) AS rows
+        GROUP BY uid
+        """,
+    ),
+    # 주간 리더보드 점수 (migrations/sql/015와 같은 주 기준)
+    (
+        "stamp_weekly_scores",
+        """
+        INSERT INTO stamp_weekly_scores (week_start, uid, tumbler, order_details)
+        SELECT date_trunc('week', saved_at AT TIME ZONE 'Asia/Seoul')::date,
+               uid,
+               count(*) FILTER (WHERE type = 'tb'),
+               count(*) FILTER (WHERE type = 'od')
+        FROM stamps
+        WHERE uid IS NOT NULL
+        GROUP BY 1, 2
+        """,
+    ),
+    # 전체 기간 리더보드 점수
+    (
+        "stamp_scores",
+        """
+        INSERT INTO stamp_scores (uid, tumbler, order_details)
+        SELECT uid, sum(tumbler), sum(order_details)
+        FROM stamp_weekly_scores
+        GROUP BY uid
+        """,
+    ),
+)
+
+
+async def rebuild_derived_tables(conn: asyncpg.Connection) -> None:
+    """트리거가 유지하는 테이블을 적재된 행으로 다시 계산"""
+    for table, query in DERIVED_TABLE_QUERIES:
+        started = time.perf_counter()
+        status = await conn.execute(query)
+        print(
+            f"✅ {table}: {status.split()[-1]} rows ({time.perf_counter() - started:.1f}s)"
+        )
+
+
+async def seed(config: SeedConfig, dsn: str) -> None:
+    """대상 테이블을 비우고 합성 데이터 적재"""
+    print(f"데이터 배분 계산 중: {config.model_dump()}")
+    plan = plan_dataset(config)
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        # 실패하면 TRUNCATE까지 롤백되어 기존 데이터가 남음
+        async with conn.transaction():
+            await conn.execute(
+                f"TRUNCATE {', '.join(SEEDED_TABLES + DERIVED_TABLES)} "
+                "RESTART IDENTITY CASCADE"
+            )
+            # 행 / 문장 단위 트리거(동기화 순번, 버전, 점수)와 FK 검사를 건너뜀
+            await conn.execute("SET LOCAL session_replication_role = replica")
+            await copy_in_batches(
+                conn,
+                "users",
+                [
+                    "id",
+                    "email",
+                    "username",
+                    "hashed_password",
+                    "is_active",
+                    "is_superuser",
+                    "created_at",
+                    "updated_at",
+                ],
+                user_records(config),
+                config.batch_size,
+            )
+            await copy_in_batches(
+                conn,
+                "decorations",
+                ["id", "name", "version", "type", "rarity", "color"],
+                decoration_records(config),
+                config.batch_size,
+            )
+            await copy_in_batches(
+                conn,
+                "challenges",
+                [
+                    "id",
+                    "uid",
+                    "title",
+                    "description",
+                    "is_done",
+                    "od_obj",
+                    "od_ach",
+                    "tb_obj",
+                    "tb_ach",
+                    "start_at",
+                    "due_at",
+                    "sync_seq",
+                ],
+                challenge_records(config, plan),
+                config.batch_size,
+            )
+            await copy_in_batches(
+                conn,
+                "stamps",
+                ["id", "saved_at", "save_url", "type", "uid", "sync_seq"],
+                stamp_records(config, plan),
+                config.batch_size,
+            )
+            await copy_in_batches(
+                conn,
+                "challenge_stamp",
+                ["cid", "sid"],
+                challenge_stamp_records(plan),
+                config.batch_size,
+            )
+            await copy_in_batches(
+                conn,
+                "decoration_user",
+                ["did", "uid", "acquired_at", "is_equipped", "type", "sync_seq"],
+                decoration_user_records(config, plan),
+                config.batch_size,
+            )
+
+            # id를 직접 넣었으므로 SERIAL 시퀀스를 맞춰줌
+            for table in SERIAL_TABLES:
+                await conn.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"COALESCE((SELECT max(id) FROM {table}), 0) + 1, false)"
+                )
+            await conn.execute("SET LOCAL session_replication_role = DEFAULT")
+            await rebuild_derived_tables(conn)
+        print("ANALYZE 실행 중")
+        await conn.execute("ANALYZE")
+    finally:
+        await conn.close()
+    print("합성 데이터 적재 완료")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Tuple[SeedConfig, str]:
+    defaults = SeedConfig(anchor=datetime.now(timezone.utc))
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--dsn", default=settings.DATABASE_URL)
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument(
+        "--challenges-per-user", type=int, default=defaults.challenges_per_user
+    )
+    parser.add_argument("--stamps", type=int, default=defaults.stamps)
+    parser.add_argument("--decorations", type=int, default=defaults.decorations)
+    parser.add_argument(
+        "--decorations-per-user", type=int, default=defaults.decorations_per_user
+    )
+    parser.add_argument("--skew", type=float, default=defaults.skew)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--anchor",
+        type=date.fromisoformat,
+        default=None,
+        help="기준 날짜 (YYYY-MM-DD, 기본값: 오늘). 고정하면 완전히 같은 데이터가 생성됨",
+    )
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    args = parser.parse_args(argv)
+
+    anchor_date = args.anchor or datetime.now(timezone.utc).date()
+    config = SeedConfig(
+        users=args.users,
+        challenges_per_user=args.challenges_per_user,
+        stamps=args.stamps,
+        decorations=args.decorations,
+        decorations_per_user=args.decorations_per_user,
+        skew=args.skew,
+        seed=args.seed,
+        anchor=datetime.combine(anchor_date, datetime.min.time(), timezone.utc),
+        batch_size=args.batch_size,
+    )
+    return config, args.dsn
+
+
+if __name__ == "__main__":
+    seed_config, seed_dsn = parse_args()
+    asyncio.run(seed(seed_config, seed_dsn))
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+단일 워커 vs 멀티 워커 처리량 벤치마크
+
+사용법:
+    python -m benchmarks.seed --users 10000 --stamps 1000000   # 먼저 데이터셋 적재
+    python -m benchmarks.server_workers                        # 1 워커 vs CPU 수만큼 워커
+    python -m benchmarks.server_workers --workers 1 2 4 --concurrency 16 64
+
+- 워커 수별로 python -m app.server를 실제 프로세스로 띄우고 (uvloop/httptools) TCP로 요청
+- 여정은 benchmarks.http_journeys와 동일 (스탬프 / 파일 조회는 서버 프로세스의 검증기·static 디렉토리를
+  바꿀 수 없어 제외)
+- 부하 생성기는 이 프로세스 하나이므로 워커 수가 CPU 수에 가까우면 부하 생성기가 먼저 포화될 수 있음
+  (가능하면 서버와 다른 머신 / 코어에서 실행)
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import httpx
+from pydantic import BaseModel, Field
+
+# 현재 파일 기준 프로젝트 루트 디렉토리 sys.path에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.server import available_cpus
+from benchmarks.http_journeys import (
+    BenchmarkContext,
+    cleanup_actors,
+    prepare_actors,
+    print_result,
+    run_level,
+    save_results,
+)
+
+SERVER_JOURNEYS = ["login", "challenges", "decorations", "random_draw"]
+SERVER_START_TIMEOUT_SECONDS = 60
+
+
+class WorkerBenchmarkConfig(BaseModel):
+    """워커 수 비교 벤치마크 설정"""
+
+    workers: List[int] = Field(..., description="비교할 워커 수")
+    concurrency: List[int] = Field(default=[64], description="동시성 단계")
+    requests: int = Field(default=1000, ge=1, description="단계별 측정 요청 수")
+    login_requests: int = Field(
+        default=200, ge=1, description="로그인 단계별 요청 수 (bcrypt 비용이 커서 별도)"
+    )
+    warmup: int = Field(default=20, ge=0, description="단계별 워밍업 요청 수")
+    actors: int = Field(
+        default=20, ge=1, description="요청을 나눠 보낼 bench 사용자 수"
+    )
+    journeys: List[str] = Field(default=SERVER_JOURNEYS, description="실행할 여정")
+    port: int = Field(default=8765, description="벤치마크 서버 포트")
+
+
+def start_server(
+    workers: int, port: int, workdir: str, verbose: bool
+) -> subprocess.Popen:
+    """python -m app.server를 workdir(static 디렉토리 포함)에서 실행"""
+    env = dict(os.environ, PYTHONPATH=project_root)
+    output = None if verbose else subprocess.DEVNULL
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "app.server",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+        ],
+        cwd=workdir,
+        env=env,
+        stdout=output,
+        stderr=output,
+    )
+
+
+async def wait_until_ready(client: httpx.AsyncClient, server: subprocess.Popen) -> None:
+    """모든 워커가 뜰 때까지는 알 수 없으므로, 준비 응답 후 잠시 더 대기"""
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"서버가 종료되었습니다 (exit code {server.returncode})")
+        try:
+            response = await client.get("/health/ready")
+            if response.status_code == 200:
+                # 나머지 워커도 풀 워밍업을 마치도록 여유를 둠
+                await asyncio.sleep(3)
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.5)
+    raise TimeoutError("서버가 준비되지 않았습니다")
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    """SIGTERM으로 graceful shutdown, 시간이 지나면 강제 종료"""
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=SERVER_START_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+async def run_workers(
+    config: WorkerBenchmarkConfig, workers: int, workdir: str, verbose: bool
+) -> List[Dict[str, Any]]:
+    """워커 workers개로 서버를 띄워 모든 여정 x 동시성 단계를 실행"""
+    server = start_server(workers, config.port, workdir, verbose)
+    limits = httpx.Limits(
+        max_connections=max(config.concurrency), max_keepalive_connections=None
+    )
+    results = []
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{config.port}", limits=limits, timeout=60
+        ) as client:
+            await wait_until_ready(client, server)
+            actors = await prepare_actors(client, config.actors)
+            context = BenchmarkContext(actors=actors, assets=[])
+            try:
+                for journey in config.journeys:
+                    total = (
+                        config.login_requests if journey == "login" else config.requests
+                    )
+                    for concurrency in config.concurrency:
+                        result = await run_level(
+                            client, context, journey, concurrency, total, config.warmup
+                        )
+                        result["workers"] = workers
+                        print(f"workers={workers:<3}", end=" ")
+                        print_result(result)
+                        results.append(result)
+            finally:
+                await cleanup_actors(actors)
+    finally:
+        stop_server(server)
+    return results
+
+
+async def run_benchmark(
+    config: WorkerBenchmarkConfig, verbose: bool
+) -> List[Dict[str, Any]]:
+    workdir = tempfile.mkdtemp(prefix="kkook-bench-")
+    # app.main은 상대경로 static 디렉토리를 마운트
+    os.makedirs(os.path.join(workdir, "static"), exist_ok=True)
+    results = []
+    for workers in config.workers:
+        results.extend(await run_workers(config, workers, workdir, verbose))
+    return results
+
+
+def compare_workers(results: List[Dict[str, Any]]) -> List[str]:
+    """(여정, 동시성)별로 가장 적은 워커 수 대비 처리량 배율"""
+    base_index: Dict[Any, Dict[str, Any]] = {}
+    for result in sorted(results, key=lambda r: r["workers"]):
+        base_index.setdefault((result["journey"], result["concurrency"]), result)
+
+    lines = []
+    for result in results:
+        base = base_index[(result["journey"], result["concurrency"])]
+        if base is result or not base["throughput_rps"]:
+            continue
+        speedup = result["throughput_rps"] / base["throughput_rps"]
+        lines.append(
+            f"{result['journey']:<12} c={result['concurrency']:<4} "
+            f"workers {base['workers']} -> {result['workers']}: x{speedup:.2f}"
+        )
+    return lines
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="단일 워커 vs 멀티 워커 처리량 벤치마크"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, available_cpus()}),
+        help="비교할 워커 수 (기본: 1과 CPU 수)",
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[64])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--login-requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--actors", type=int, default=20)
+    parser.add_argument(
+        "--journeys", nargs="+", choices=SERVER_JOURNEYS, default=SERVER_JOURNEYS
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument(
+        "--verbose", action="store_true", help="서버 로그를 그대로 출력"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    config = WorkerBenchmarkConfig(
+        workers=args.workers,
+        concurrency=args.concurrency,
+        requests=args.requests,
+        login_requests=args.login_requests,
+        warmup=args.warmup,
+        actors=args.actors,
+        journeys=args.journeys,
+        port=args.port,
+    )
+    results = asyncio.run(run_benchmark(config, verbose=args.verbose))
+    output = save_results(config, results, args.output, benchmark="server_workers")
+    print(f"✅ 결과 저장: {output}")
+
+    print("\n📊 워커 수별 처리량 배율")
+    for line in compare_workers(results):
+        print(line)
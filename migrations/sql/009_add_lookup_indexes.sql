@@ -0,0 +1,15 @@
+-- 사용자별 조회 및 CASCADE 삭제 시 full scan을 막기 위한 인덱스
+-- (migrate.py가 트랜잭션 안에서 실행하므로 CONCURRENTLY는 사용하지 않음)
+
+-- 사용자별 챌린지 조회 (get_challenge_by_uid, get_challenge_response_by_uid, get_stamp_by_uid)
+CREATE INDEX IF NOT EXISTS "idx_challenges_uid" ON challenges (uid);
+
+-- challenge_stamp의 PK는 (cid, sid)라 sid 단독 조회에 사용되지 않음
+-- stamps 삭제 시 ON DELETE CASCADE가 sid로 challenge_stamp를 찾음
+CREATE INDEX IF NOT EXISTS "idx_challenge_stamp_sid" ON challenge_stamp (sid);
+
+-- challenge_decoration의 PK는 (did, cid)라 challenges 삭제 시 cid 조회에 사용되지 않음
+CREATE INDEX IF NOT EXISTS "idx_challenge_decoration_cid" ON challenge_decoration (cid);
+
+-- 기간별 스탬프 조회
+CREATE INDEX IF NOT EXISTS "idx_stamps_saved_at" ON stamps (saved_at);
@@ -0,0 +1,15 @@
+-- Idempotency-Key 요청 결과 저장 테이블
+-- status_code가 NULL이면 처리 중 (다른 요청이 같은 키로 들어오면 결과를 기다림)
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    uid BIGINT NOT NULL,
+    key VARCHAR(255) NOT NULL,
+    fingerprint BYTEA NOT NULL,  -- 요청 본문의 sha256 (같은 키로 다른 요청을 보내면 거절)
+    status_code SMALLINT NULL,
+    response JSONB NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT "pk_idempotency_keys" PRIMARY KEY (uid, key),
+    CONSTRAINT "fkey_uid" FOREIGN KEY (uid) REFERENCES users (id) ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- 만료된 키 정리
+CREATE INDEX IF NOT EXISTS "idx_idempotency_keys_created_at" ON idempotency_keys (created_at);
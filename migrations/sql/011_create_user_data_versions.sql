@@ -0,0 +1,131 @@
+-- 사용자별 데이터 버전 (ETag / If-None-Match 조건부 조회용)
+-- 챌린지 / 스탬프 / 장식이 바뀌면 같은 트랜잭션 안에서 트리거가 해당 사용자의 버전을 올림
+-- 행이 없으면 버전 0 (사용자 삭제 중 CASCADE 삭제에서도 트리거가 동작하도록 users FK는 두지 않음)
+CREATE TABLE IF NOT EXISTS user_data_versions (
+    uid BIGINT PRIMARY KEY,
+    challenges_version BIGINT NOT NULL DEFAULT 0,
+    stamps_version BIGINT NOT NULL DEFAULT 0,
+    decorations_version BIGINT NOT NULL DEFAULT 0
+);
+
+-- 사용자 목록(중복 가능)의 버전을 종류별로 올림 (0이면 그대로)
+CREATE OR REPLACE FUNCTION bump_user_data_versions(
+    p_uids BIGINT[], p_challenges INT, p_stamps INT, p_decorations INT
+) RETURNS void AS $$
+    INSERT INTO user_data_versions AS v (uid, challenges_version, stamps_version, decorations_version)
+    SELECT DISTINCT u, p_challenges, p_stamps, p_decorations
+    FROM unnest(p_uids) AS u
+    WHERE u IS NOT NULL
+    ON CONFLICT (uid) DO UPDATE
+    SET challenges_version = v.challenges_version + EXCLUDED.challenges_version,
+        stamps_version = v.stamps_version + EXCLUDED.stamps_version,
+        decorations_version = v.decorations_version + EXCLUDED.decorations_version
+$$ LANGUAGE sql;
+
+-- 문장 단위 트리거: 여러 행을 한 번에 바꿔도 사용자당 한 번만 올림 (transition table 사용)
+
+-- challenges: 챌린지 목록
+CREATE OR REPLACE FUNCTION challenges_bump_versions() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_user_data_versions(ARRAY(SELECT uid FROM new_rows), 1, 0, 0);
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM bump_user_data_versions(
+            ARRAY(SELECT uid FROM new_rows UNION SELECT uid FROM old_rows), 1, 0, 0
+        );
+    ELSE
+        PERFORM bump_user_data_versions(ARRAY(SELECT uid FROM old_rows), 1, 0, 0);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_challenges_versions_insert" ON challenges;
+CREATE TRIGGER "trg_challenges_versions_insert" AFTER INSERT ON challenges
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION challenges_bump_versions();
+DROP TRIGGER IF EXISTS "trg_challenges_versions_update" ON challenges;
+CREATE TRIGGER "trg_challenges_versions_update" AFTER UPDATE ON challenges
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION challenges_bump_versions();
+DROP TRIGGER IF EXISTS "trg_challenges_versions_delete" ON challenges;
+CREATE TRIGGER "trg_challenges_versions_delete" AFTER DELETE ON challenges
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION challenges_bump_versions();
+
+-- challenge_stamp: 챌린지에 달린 스탬프 + 스탬프 목록
+CREATE OR REPLACE FUNCTION challenge_stamp_bump_versions() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_user_data_versions(
+            ARRAY(SELECT c.uid FROM new_rows AS r INNER JOIN challenges AS c ON c.id = r.cid),
+            1, 1, 0
+        );
+    ELSE
+        PERFORM bump_user_data_versions(
+            ARRAY(SELECT c.uid FROM old_rows AS r INNER JOIN challenges AS c ON c.id = r.cid),
+            1, 1, 0
+        );
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_challenge_stamp_versions_insert" ON challenge_stamp;
+CREATE TRIGGER "trg_challenge_stamp_versions_insert" AFTER INSERT ON challenge_stamp
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION challenge_stamp_bump_versions();
+DROP TRIGGER IF EXISTS "trg_challenge_stamp_versions_delete" ON challenge_stamp;
+CREATE TRIGGER "trg_challenge_stamp_versions_delete" AFTER DELETE ON challenge_stamp
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION challenge_stamp_bump_versions();
+
+-- stamps: 스탬프 내용 변경 (삭제는 challenge_stamp CASCADE 삭제에서 처리)
+CREATE OR REPLACE FUNCTION stamps_bump_versions() RETURNS trigger AS $$
+BEGIN
+    PERFORM bump_user_data_versions(
+        ARRAY(
+            SELECT c.uid
+            FROM new_rows AS s
+            INNER JOIN challenge_stamp AS cs ON cs.sid = s.id
+            INNER JOIN challenges AS c ON c.id = cs.cid
+        ),
+        1, 1, 0
+    );
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_stamps_versions_update" ON stamps;
+CREATE TRIGGER "trg_stamps_versions_update" AFTER UPDATE ON stamps
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION stamps_bump_versions();
+
+-- decoration_user: 보유 장식
+CREATE OR REPLACE FUNCTION decoration_user_bump_versions() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_user_data_versions(ARRAY(SELECT uid FROM new_rows), 0, 0, 1);
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM bump_user_data_versions(
+            ARRAY(SELECT uid FROM new_rows UNION SELECT uid FROM old_rows), 0, 0, 1
+        );
+    ELSE
+        PERFORM bump_user_data_versions(ARRAY(SELECT uid FROM old_rows), 0, 0, 1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_decoration_user_versions_insert" ON decoration_user;
+CREATE TRIGGER "trg_decoration_user_versions_insert" AFTER INSERT ON decoration_user
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION decoration_user_bump_versions();
+DROP TRIGGER IF EXISTS "trg_decoration_user_versions_update" ON decoration_user;
+CREATE TRIGGER "trg_decoration_user_versions_update" AFTER UPDATE ON decoration_user
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION decoration_user_bump_versions();
+DROP TRIGGER IF EXISTS "trg_decoration_user_versions_delete" ON decoration_user;
+CREATE TRIGGER "trg_decoration_user_versions_delete" AFTER DELETE ON decoration_user
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION decoration_user_bump_versions();
@@ -0,0 +1,150 @@
+-- 오프라인 이후 변경분만 받는 동기화(GET /api/sync) 지원
+-- 챌린지 / 스탬프 / 보유 장식 행마다 updated_at과 사용자별 동기화 순번(sync_seq)을 기록
+-- 순번은 user_data_versions 행을 잠그고 올리므로 같은 사용자의 쓰기는 커밋 순서대로 순번을 가짐
+-- (updated_at만으로는 늦게 커밋된 트랜잭션의 변경을 커서가 건너뛸 수 있음)
+
+-- sync_seq: 마지막으로 발급한 순번 (= 동기화 커서)
+-- sync_floor: 정리된 삭제 기록(tombstone)의 최대 순번. 이보다 오래된 커서는 전체 동기화
+ALTER TABLE user_data_versions
+    ADD COLUMN IF NOT EXISTS sync_seq BIGINT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS sync_floor BIGINT NOT NULL DEFAULT 0;
+
+ALTER TABLE challenges
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    ADD COLUMN IF NOT EXISTS sync_seq BIGINT NOT NULL DEFAULT 0;
+
+-- stamps.uid: 스탬프 소유자 (challenge_stamp가 생길 때 트리거가 채움, 동기화 조회용)
+ALTER TABLE stamps
+    ADD COLUMN IF NOT EXISTS uid BIGINT NULL,
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    ADD COLUMN IF NOT EXISTS sync_seq BIGINT NOT NULL DEFAULT 0;
+
+ALTER TABLE decoration_user
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    ADD COLUMN IF NOT EXISTS sync_seq BIGINT NOT NULL DEFAULT 0;
+
+UPDATE stamps AS s
+SET uid = c.uid
+FROM challenge_stamp AS cs
+INNER JOIN challenges AS c ON c.id = cs.cid
+WHERE cs.sid = s.id AND s.uid IS NULL;
+
+-- 삭제 기록: 삭제된 행을 클라이언트가 지울 수 있도록 (entity: challenge / stamp / decoration)
+CREATE TABLE IF NOT EXISTS sync_tombstones (
+    uid BIGINT NOT NULL,
+    entity VARCHAR(32) NOT NULL,
+    entity_id BIGINT NOT NULL,
+    sync_seq BIGINT NOT NULL,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT "pk_sync_tombstones" PRIMARY KEY (uid, entity, entity_id)
+);
+
+-- 사용자별 "커서 이후 변경분" 조회
+CREATE INDEX IF NOT EXISTS "idx_challenges_uid_sync_seq" ON challenges (uid, sync_seq);
+CREATE INDEX IF NOT EXISTS "idx_stamps_uid_sync_seq" ON stamps (uid, sync_seq);
+CREATE INDEX IF NOT EXISTS "idx_decoration_user_uid_sync_seq" ON decoration_user (uid, sync_seq);
+CREATE INDEX IF NOT EXISTS "idx_sync_tombstones_uid_sync_seq" ON sync_tombstones (uid, sync_seq);
+-- 보관 기간이 지난 삭제 기록 정리
+CREATE INDEX IF NOT EXISTS "idx_sync_tombstones_deleted_at" ON sync_tombstones (deleted_at);
+
+-- 사용자의 다음 동기화 순번 (user_data_versions 행 잠금은 트랜잭션이 끝날 때까지 유지)
+CREATE OR REPLACE FUNCTION next_user_sync_seq(p_uid BIGINT) RETURNS BIGINT AS $$
+    INSERT INTO user_data_versions AS v (uid, sync_seq)
+    VALUES (p_uid, 1)
+    ON CONFLICT (uid) DO UPDATE SET sync_seq = v.sync_seq + 1
+    RETURNING sync_seq
+$$ LANGUAGE sql;
+
+-- 행 단위: 생성 / 수정 시 updated_at과 순번 갱신 (소유자가 없는 스탬프는 updated_at만)
+CREATE OR REPLACE FUNCTION sync_touch_row() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    IF NEW.uid IS NOT NULL THEN
+        NEW.sync_seq := next_user_sync_seq(NEW.uid);
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_challenges_sync_touch" ON challenges;
+CREATE TRIGGER "trg_challenges_sync_touch" BEFORE INSERT OR UPDATE ON challenges
+    FOR EACH ROW EXECUTE FUNCTION sync_touch_row();
+DROP TRIGGER IF EXISTS "trg_stamps_sync_touch" ON stamps;
+CREATE TRIGGER "trg_stamps_sync_touch" BEFORE INSERT OR UPDATE ON stamps
+    FOR EACH ROW EXECUTE FUNCTION sync_touch_row();
+DROP TRIGGER IF EXISTS "trg_decoration_user_sync_touch" ON decoration_user;
+CREATE TRIGGER "trg_decoration_user_sync_touch" BEFORE INSERT OR UPDATE ON decoration_user
+    FOR EACH ROW EXECUTE FUNCTION sync_touch_row();
+
+-- 삭제 기록 (같은 행이 다시 삭제되면 순번만 갱신)
+CREATE OR REPLACE FUNCTION challenges_sync_tombstones() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sync_tombstones AS t (uid, entity, entity_id, sync_seq)
+    SELECT uid, 'challenge', id, next_user_sync_seq(uid) FROM old_rows
+    ON CONFLICT (uid, entity, entity_id) DO UPDATE
+    SET sync_seq = EXCLUDED.sync_seq, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_challenges_sync_tombstones" ON challenges;
+CREATE TRIGGER "trg_challenges_sync_tombstones" AFTER DELETE ON challenges
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION challenges_sync_tombstones();
+
+CREATE OR REPLACE FUNCTION decoration_user_sync_tombstones() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sync_tombstones AS t (uid, entity, entity_id, sync_seq)
+    SELECT uid, 'decoration', did, next_user_sync_seq(uid) FROM old_rows
+    ON CONFLICT (uid, entity, entity_id) DO UPDATE
+    SET sync_seq = EXCLUDED.sync_seq, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_decoration_user_sync_tombstones" ON decoration_user;
+CREATE TRIGGER "trg_decoration_user_sync_tombstones" AFTER DELETE ON decoration_user
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION decoration_user_sync_tombstones();
+
+-- challenge_stamp 생성: 스탬프 소유자 기록 (스탬프는 챌린지에 연결될 때 동기화 대상이 됨)
+CREATE OR REPLACE FUNCTION challenge_stamp_sync_link() RETURNS trigger AS $$
+BEGIN
+    UPDATE stamps AS s
+    SET uid = c.uid
+    FROM new_rows AS r
+    INNER JOIN challenges AS c ON c.id = r.cid
+    WHERE s.id = r.sid;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_challenge_stamp_sync_link" ON challenge_stamp;
+CREATE TRIGGER "trg_challenge_stamp_sync_link" AFTER INSERT ON challenge_stamp
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION challenge_stamp_sync_link();
+
+-- challenge_stamp 삭제: 더 이상 어느 챌린지에도 연결되지 않은 스탬프는 삭제 기록
+-- (스탬프 삭제 / 챌린지 삭제의 CASCADE 모두 여기를 거침. 소유자는 남아 있는 쪽에서 찾음)
+CREATE OR REPLACE FUNCTION challenge_stamp_sync_tombstones() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sync_tombstones AS t (uid, entity, entity_id, sync_seq)
+    SELECT unlinked.uid, 'stamp', unlinked.sid, next_user_sync_seq(unlinked.uid)
+    FROM (
+        SELECT DISTINCT r.sid, COALESCE(s.uid, c.uid) AS uid
+        FROM old_rows AS r
+        LEFT JOIN stamps AS s ON s.id = r.sid
+        LEFT JOIN challenges AS c ON c.id = r.cid
+        WHERE NOT EXISTS (SELECT 1 FROM challenge_stamp AS cs WHERE cs.sid = r.sid)
+    ) AS unlinked
+    WHERE unlinked.uid IS NOT NULL
+    ON CONFLICT (uid, entity, entity_id) DO UPDATE
+    SET sync_seq = EXCLUDED.sync_seq, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_challenge_stamp_sync_tombstones" ON challenge_stamp;
+CREATE TRIGGER "trg_challenge_stamp_sync_tombstones" AFTER DELETE ON challenge_stamp
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION challenge_stamp_sync_tombstones();
@@ -0,0 +1,20 @@
+-- 사용자별 토큰 버전: 액세스 토큰에 담긴 버전과 다르면 토큰을 거부 (토큰 폐기)
+-- 토큰에 담는 정보(활성 / 관리자 여부, 이메일)나 비밀번호가 바뀌면 트리거가 버전을 올림
+ALTER TABLE users
+    ADD COLUMN IF NOT EXISTS token_version INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION bump_user_token_version() RETURNS trigger AS $$
+BEGIN
+    IF NEW.is_active IS DISTINCT FROM OLD.is_active
+        OR NEW.is_superuser IS DISTINCT FROM OLD.is_superuser
+        OR NEW.email IS DISTINCT FROM OLD.email
+        OR NEW.hashed_password IS DISTINCT FROM OLD.hashed_password THEN
+        NEW.token_version := OLD.token_version + 1;
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_users_token_version" ON users;
+CREATE TRIGGER "trg_users_token_version" BEFORE UPDATE ON users
+    FOR EACH ROW EXECUTE FUNCTION bump_user_token_version();
@@ -0,0 +1,20 @@
+-- 리프레시 토큰 세션 (로그인마다 1행)
+-- 토큰은 "세션 ID.비밀 값" 형식이며 비밀 값의 sha256만 저장
+-- 갱신할 때마다 비밀 값을 새로 발급(rotation)하고, 이전 비밀 값이 다시 쓰이면 탈취로 보고 세션을 폐기
+CREATE TABLE IF NOT EXISTS user_sessions (
+    id BYTEA NOT NULL,  -- 무작위 16바이트
+    uid BIGINT NOT NULL,
+    secret_hash BYTEA NOT NULL,
+    previous_hash BYTEA NULL,  -- 직전 비밀 값 (응답을 받지 못한 클라이언트의 재시도는 폐기하지 않음)
+    token_version INTEGER NOT NULL,  -- 발급 시점의 users.token_version (바뀌면 세션도 무효)
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    rotated_at TIMESTAMPTZ NULL,
+    expires_at TIMESTAMPTZ NOT NULL,
+    revoked_at TIMESTAMPTZ NULL,
+    CONSTRAINT "pk_user_sessions" PRIMARY KEY (id),
+    CONSTRAINT "fkey_uid" FOREIGN KEY (uid) REFERENCES users (id) ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS "idx_user_sessions_uid" ON user_sessions (uid);
+-- 만료된 세션 정리
+CREATE INDEX IF NOT EXISTS "idx_user_sessions_expires_at" ON user_sessions (expires_at);
@@ -0,0 +1,108 @@
+-- 리더보드용 사용자별 인증 스탬프 수 (텀블러 / 주문 내역)
+-- 스탬프가 챌린지에 연결되어 소유자(stamps.uid)가 생길 때 같은 트랜잭션 안에서 트리거가 올림
+-- (요청마다 stamps를 GROUP BY uid로 세지 않도록, 앱은 이 테이블로 워커 메모리 순위표를 다시 만듦)
+-- 주간 기준: saved_at의 Asia/Seoul 날짜가 속한 주의 월요일
+
+-- 전체 기간
+CREATE TABLE IF NOT EXISTS stamp_scores (
+    uid BIGINT PRIMARY KEY,
+    tumbler INTEGER NOT NULL DEFAULT 0,
+    order_details INTEGER NOT NULL DEFAULT 0
+);
+
+-- 주간
+CREATE TABLE IF NOT EXISTS stamp_weekly_scores (
+    week_start DATE NOT NULL,
+    uid BIGINT NOT NULL,
+    tumbler INTEGER NOT NULL DEFAULT 0,
+    order_details INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT "pk_stamp_weekly_scores" PRIMARY KEY (week_start, uid)
+);
+
+-- 스탬프 행 하나의 증감 (sign: 1 = 추가, -1 = 제거)
+DO $$
+BEGIN
+    IF to_regtype('stamp_score_delta') IS NULL THEN
+        CREATE TYPE stamp_score_delta AS (
+            uid BIGINT, saved_at TIMESTAMPTZ, type STAMP_TYPE, sign INT
+        );
+    END IF;
+END
+$$;
+
+-- 증감을 (사용자, 주)별로 모아 두 테이블에 반영 (소유자가 없는 스탬프는 세지 않음)
+CREATE OR REPLACE FUNCTION apply_stamp_score_deltas(p_deltas stamp_score_delta[])
+RETURNS void AS $$
+    WITH grouped AS (
+        SELECT d.uid,
+               date_trunc('week', d.saved_at AT TIME ZONE 'Asia/Seoul')::date AS week_start,
+               SUM(d.sign) FILTER (WHERE d.type = 'tb') AS tumbler,
+               SUM(d.sign) FILTER (WHERE d.type = 'od') AS order_details
+        FROM unnest(p_deltas) AS d
+        WHERE d.uid IS NOT NULL
+        GROUP BY 1, 2
+    ), weekly AS (
+        INSERT INTO stamp_weekly_scores AS w (week_start, uid, tumbler, order_details)
+        SELECT week_start, uid, COALESCE(tumbler, 0), COALESCE(order_details, 0)
+        FROM grouped
+        ORDER BY week_start, uid
+        ON CONFLICT (week_start, uid) DO UPDATE
+        SET tumbler = w.tumbler + EXCLUDED.tumbler,
+            order_details = w.order_details + EXCLUDED.order_details
+    )
+    INSERT INTO stamp_scores AS t (uid, tumbler, order_details)
+    SELECT uid, COALESCE(SUM(tumbler), 0), COALESCE(SUM(order_details), 0)
+    FROM grouped
+    GROUP BY uid
+    ORDER BY uid
+    ON CONFLICT (uid) DO UPDATE
+    SET tumbler = t.tumbler + EXCLUDED.tumbler,
+        order_details = t.order_details + EXCLUDED.order_details
+$$ LANGUAGE sql;
+
+-- 문장 단위 트리거: 수정은 소유자 / 타입 / 저장 시각이 바뀐 행만 (이전 값 제거 + 새 값 추가)
+CREATE OR REPLACE FUNCTION stamps_apply_scores() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM apply_stamp_score_deltas(ARRAY(
+            SELECT (r.uid, r.saved_at, r.type, 1)::stamp_score_delta FROM new_rows AS r
+        ));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM apply_stamp_score_deltas(ARRAY(
+            SELECT d
+            FROM new_rows AS n
+            INNER JOIN old_rows AS o ON o.id = n.id
+            CROSS JOIN LATERAL (VALUES
+                ((n.uid, n.saved_at, n.type, 1)::stamp_score_delta),
+                ((o.uid, o.saved_at, o.type, -1)::stamp_score_delta)
+            ) AS v (d)
+            WHERE (n.uid, n.saved_at, n.type) IS DISTINCT FROM (o.uid, o.saved_at, o.type)
+        ));
+    ELSE
+        PERFORM apply_stamp_score_deltas(ARRAY(
+            SELECT (r.uid, r.saved_at, r.type, -1)::stamp_score_delta FROM old_rows AS r
+        ));
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "trg_stamps_scores_insert" ON stamps;
+CREATE TRIGGER "trg_stamps_scores_insert" AFTER INSERT ON stamps
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION stamps_apply_scores();
+DROP TRIGGER IF EXISTS "trg_stamps_scores_update" ON stamps;
+CREATE TRIGGER "trg_stamps_scores_update" AFTER UPDATE ON stamps
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION stamps_apply_scores();
+DROP TRIGGER IF EXISTS "trg_stamps_scores_delete" ON stamps;
+CREATE TRIGGER "trg_stamps_scores_delete" AFTER DELETE ON stamps
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION stamps_apply_scores();
+
+-- 기존 스탬프로 다시 계산 (마이그레이션을 다시 실행해도 같은 결과)
+TRUNCATE stamp_scores, stamp_weekly_scores;
+SELECT apply_stamp_score_deltas(ARRAY(
+    SELECT (s.uid, s.saved_at, s.type, 1)::stamp_score_delta FROM stamps AS s WHERE s.uid IS NOT NULL
+));
+
@@ -1,15 +1,22 @@
 import asyncio
+import glob
 import pytest
 import aiosqlite
+import asyncpg
+import httpx
+from dataclasses import dataclass
 from fastapi.testclient import TestClient
-from typing import AsyncGenerator, Generator, Dict, Any, List
+from typing import AsyncGenerator, Awaitable, Callable, Generator, Dict, Any, List, Optional
 import os
 from passlib.context import CryptContext
 
 from app.main import app
+from app.core.cache import get_cache
+from app.database import database
 from app.database.database import get_pool
 from app.config import settings
 from app.models.user_model import User
+from migrations import migrate
 
 # 비밀번호 해싱
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -212,4 +219,115 @@ def authorized_client(client, test_user_token) -> Generator:
         **client.headers,
         "Authorization": f"Bearer {test_user_token}"
     }
-    yield client
\ No newline at end of file
+    yield client
+
+@pytest.fixture
+def assert_max_queries(monkeypatch):
+    """
+    엔드포인트별 최대 쿼리 수 검사 (N+1 회귀 방지)
+    디버그 모드로 켜서 QueryStatsMiddleware가 붙인 X-DB-Queries 헤더를 확인한다.
+    사용: assert_max_queries(response, 3)
+    """
+    from app.core.middleware import DB_QUERIES_HEADER
+
+    monkeypatch.setattr(settings, "DEBUG", True)
+
+    def _assert_max_queries(response, max_queries: int) -> int:
+        queries = int(response.headers[DB_QUERIES_HEADER])
+        assert queries <= max_queries, (
+            f"{response.request.method} {response.request.url.path}: "
+            f"{queries} queries (max {max_queries})"
+        )
+        return queries
+
+    return _assert_max_queries
+
+
+# 로컬 Postgres 통합 테스트: 테스트 모듈마다 별도 스키마에 migrations/sql 전체를 적용
+MIGRATION_DIR = os.path.join(os.path.dirname(migrate.__file__), "sql")
+
+
+@dataclass
+class MigratedDB:
+    """migrated_db 픽스처 값"""
+
+    schema: str
+    # search_path가 schema인 관리용 연결 (시딩 / 검증 쿼리)
+    conn: asyncpg.Connection
+    # database.pool로 교체된 앱 풀
+    pool: asyncpg.Pool
+    # db_seed가 반환한 값
+    seeded: Any
+
+
+async def _connect_or_skip() -> asyncpg.Connection:
+    try:
+        return await asyncpg.connect(settings.DATABASE_URL)
+    except (OSError, asyncpg.PostgresError) as e:
+        pytest.skip(f"로컬 Postgres에 연결할 수 없습니다: {e}")
+
+
+@pytest.fixture
+async def postgres_available() -> None:
+    """로컬 Postgres에 연결할 수 없으면 테스트를 건너뜀"""
+    conn = await _connect_or_skip()
+    await conn.close()
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Optional[Callable[[asyncpg.Connection], Awaitable[Any]]]:
+    """
+    migrated_db가 마이그레이션 직후 실행할 시딩 함수 (테스트 모듈에서 재정의)
+    반환값은 migrated_db.seeded로 전달
+    """
+    return None
+
+
+@pytest.fixture(scope="module")
+async def migrated_db(
+    request: Any, db_seed: Optional[Callable[[asyncpg.Connection], Awaitable[Any]]]
+) -> AsyncGenerator[MigratedDB, None]:
+    """
+    테스트 모듈 이름의 스키마에 마이그레이션 + 시딩을 하고,
+    모듈이 끝날 때까지 그 스키마를 가리키는 풀을 database.pool로 사용
+    """
+    schema = request.module.__name__.rsplit(".", 1)[-1]
+    conn = await _connect_or_skip()
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await conn.execute(f"CREATE SCHEMA {schema}")
+        await conn.execute(f"SET search_path TO {schema}")
+        for migration_file in sorted(glob.glob(os.path.join(MIGRATION_DIR, "*.sql"))):
+            await migrate.run_migration(conn, migration_file)
+        seeded = await db_seed(conn) if db_seed is not None else None
+    except Exception:
+        await conn.close()
+        raise
+
+    pool = await asyncpg.create_pool(
+        dsn=settings.DATABASE_URL,
+        min_size=1,
+        max_size=8,
+        server_settings={"search_path": schema},
+    )
+    original_pool = database.pool
+    database.pool = pool
+    # 다른 테스트 스키마에서 같은 uid로 캐시된 값이 섞이지 않도록
+    get_cache().clear()
+    try:
+        yield MigratedDB(schema=schema, conn=conn, pool=pool, seeded=seeded)
+    finally:
+        database.pool = original_pool
+        get_cache().clear()
+        await pool.close()
+        await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await conn.close()
+
+
+@pytest.fixture(scope="module")
+async def api_client(migrated_db: MigratedDB) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """migrated_db 스키마로 실제 앱을 ASGI로 구동하는 클라이언트"""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
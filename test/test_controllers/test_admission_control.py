@@ -0,0 +1,104 @@
+"""
+경로 그룹별 동시 실행 수 제한 테스트
+
+- AdmissionMiddleware만 붙인 작은 앱에서 업로드 경로를 이벤트로 붙잡아 두고 확인
+- 동시 실행 1 / 대기열 1: 세 번째 업로드는 429, 조회 경로는 계속 바로 응답
+"""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.config import settings
+from app.core import admission
+from app.core.metrics import render_metrics
+from app.core.middleware import AdmissionMiddleware
+
+
+@pytest.fixture
+def release_uploads() -> asyncio.Event:
+    return asyncio.Event()
+
+
+@pytest.fixture
+async def admission_client(monkeypatch: Any, release_uploads: asyncio.Event) -> Any:
+    monkeypatch.setattr(settings, "ADMISSION_UPLOAD_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "ADMISSION_UPLOAD_QUEUE_SIZE", 1)
+    monkeypatch.setattr(settings, "ADMISSION_QUEUE_TIMEOUT_SECONDS", 5)
+    monkeypatch.setattr(admission, "_limiters", {})
+
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware)
+
+    @app.post("/api/stamps/order_details")
+    async def upload() -> dict:
+        await release_uploads.wait()
+        return {"uploaded": True}
+
+    @app.get("/api/challenges/")
+    async def catalog() -> list:
+        return []
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+async def _wait_for_queue_depth(depth: int) -> None:
+    limiter = admission.get_limiter("upload")
+    for _ in range(100):
+        if limiter.active == 1 and limiter.queue_depth == depth:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"queue depth {limiter.queue_depth} != {depth}")
+
+
+async def test_full_queue_rejects_fast_and_reads_stay_responsive(
+    admission_client, release_uploads
+):
+    # Given - 1개 실행 중, 1개 대기 중
+    running = asyncio.ensure_future(admission_client.post("/api/stamps/order_details"))
+    queued = asyncio.ensure_future(admission_client.post("/api/stamps/order_details"))
+    await _wait_for_queue_depth(1)
+
+    # When
+    rejected = await admission_client.post("/api/stamps/order_details")
+    catalog = await admission_client.get("/api/challenges/")
+
+    # Then
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert catalog.status_code == 200
+
+    release_uploads.set()
+    assert (await running).status_code == 200
+    assert (await queued).status_code == 200
+
+    metrics = render_metrics()
+    assert (
+        'admission_rejected_total{reason="queue_full",route_class="upload"} 1'
+        in metrics
+    )
+    assert 'admission_queue_depth_max{route_class="upload"} 1' in metrics
+    assert 'admission_active{route_class="upload"} 0' in metrics
+
+
+async def test_queue_timeout_returns_503(
+    admission_client, release_uploads, monkeypatch
+):
+    monkeypatch.setattr(admission.get_limiter("upload"), "queue_timeout", 0.05)
+    running = asyncio.ensure_future(admission_client.post("/api/stamps/order_details"))
+    await _wait_for_queue_depth(0)
+
+    # When
+    timed_out = await admission_client.post("/api/stamps/order_details")
+
+    # Then
+    assert timed_out.status_code == 503
+    assert "Retry-After" in timed_out.headers
+    release_uploads.set()
+    assert (await running).status_code == 200
@@ -0,0 +1,184 @@
+"""
+사용자 데이터 버전(ETag) / If-None-Match 조건부 조회 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 일치하는 If-None-Match는 인증 + 버전 조회만으로 304
+- 스탬프 생성 / 장식 뽑기는 같은 트랜잭션에서 트리거가 버전을 올려 해당 목록의 ETag만 바뀜
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict
+
+import asyncpg
+import httpx
+import pytest
+
+from app.core.cache import get_cache
+from app.models.user_model import TokenUser
+from app.services.user_service import UserService
+
+ETAG_EMAIL = "etag@example.com"
+LIST_PATHS = ("/api/challenges/", "/api/stamps/", "/api/users/decorations/")
+# 인증 + 데이터 버전
+NOT_MODIFIED_BUDGET = 2
+
+
+async def _seed_dataset(conn: asyncpg.Connection) -> int:
+    """사용자 1명 + od 챌린지 1개 + 장식 카탈로그"""
+    uid = await conn.fetchval(
+        """
+        INSERT INTO users (email, username, hashed_password)
+        VALUES ($1, 'etag', 'not-a-real-hash')
+        RETURNING id
+        """,
+        ETAG_EMAIL,
+    )
+    await conn.execute(
+        """
+        INSERT INTO challenges (uid, title, description, od_obj, od_ach, start_at, due_at)
+        VALUES ($1, 'challenge', 'etag challenge', 100, 0,
+                now() - interval '1 day', now() + interval '7 days')
+        """,
+        uid,
+    )
+    await conn.execute(
+        """
+        INSERT INTO decorations (name, version, type, rarity, color)
+        SELECT 'decoration ' || g, 1, 'tree', 1, NULL
+        FROM generate_series(1, 5) AS g
+        """
+    )
+    return uid
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[int]]:
+    return _seed_dataset
+
+
+@pytest.fixture(scope="module")
+def etag_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """시딩한 사용자로 인증된 클라이언트"""
+    token = UserService.create_user_token(
+        TokenUser(
+            id=migrated_db.seeded,
+            email=ETAG_EMAIL,
+            is_active=True,
+            is_superuser=False,
+            token_version=0,
+        )
+    )
+    api_client.headers["Authorization"] = f"Bearer {token}"
+    api_client.uid = migrated_db.seeded
+    api_client.conn = migrated_db.conn
+    return api_client
+
+
+@pytest.fixture
+def local_verifier(monkeypatch: Any) -> None:
+    """스탬프 검증을 외부 Vision/Gemini API 대신 항상 통과하도록 대체"""
+    from app.controllers import stamp_controller
+
+    monkeypatch.setattr(stamp_controller, "vision_api_verify", lambda file, t: True)
+
+
+async def _etags(client: Any) -> Dict[str, str]:
+    etags = {}
+    for path in LIST_PATHS:
+        response = await client.get(path)
+        assert "ETag" in response.headers, path
+        etags[path] = response.headers["ETag"]
+    return etags
+
+
+async def test_matching_if_none_match_returns_304(
+    etag_client: Any, assert_max_queries: Any
+) -> None:
+    # Given
+    first = await etag_client.get("/api/challenges/")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    # When
+    get_cache().clear()
+    response = await etag_client.get(
+        "/api/challenges/", headers={"If-None-Match": f'"other", {etag}'}
+    )
+
+    # Then
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert_max_queries(response, NOT_MODIFIED_BUDGET)
+
+
+async def test_stamp_and_draw_change_only_their_etags(
+    etag_client: Any, local_verifier: None
+) -> None:
+    # Given
+    before = await _etags(etag_client)
+    challenges = await etag_client.get("/api/challenges/")
+
+    # When - 스탬프 생성
+    created = await etag_client.post(
+        "/api/stamps/order_details",
+        data={
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "uid": str(etag_client.uid),
+            "challenges_ids_json": str(challenges.json()[0]["id"]),
+        },
+        files={"file": ("stamp.png", b"not-an-image", "image/png")},
+    )
+    after_stamp = await _etags(etag_client)
+
+    # Then - 챌린지(스탬프 포함) / 스탬프 목록만 바뀜
+    assert created.status_code == 201
+    assert after_stamp["/api/challenges/"] != before["/api/challenges/"]
+    assert after_stamp["/api/stamps/"] != before["/api/stamps/"]
+    assert after_stamp["/api/users/decorations/"] == before["/api/users/decorations/"]
+    stale = await etag_client.get(
+        "/api/challenges/",
+        headers={"If-None-Match": before["/api/challenges/"]},
+    )
+    assert stale.status_code == 200
+    assert stale.json()[0]["od_ach"] == 1
+
+    # When - 장식 뽑기
+    drawn = await etag_client.post(
+        "/api/users/decorations/random", json={"uid": etag_client.uid}
+    )
+    after_draw = await _etags(etag_client)
+
+    # Then
+    assert drawn.status_code == 200
+    assert after_draw["/api/users/decorations/"] != before["/api/users/decorations/"]
+    assert after_draw["/api/challenges/"] == after_stamp["/api/challenges/"]
+
+
+async def test_versions_are_bumped_in_the_writing_transaction(
+    etag_client: Any,
+) -> None:
+    """롤백된 쓰기는 버전을 올리지 않고, 한 문장으로 여러 행을 바꿔도 한 번만 올림"""
+    conn = etag_client.conn
+    query = "SELECT challenges_version FROM user_data_versions WHERE uid = $1"
+    before = await conn.fetchval(query, etag_client.uid)
+
+    transaction = conn.transaction()
+    await transaction.start()
+    await conn.execute(
+        "UPDATE challenges SET title = 'rolled back' WHERE uid = $1",
+        etag_client.uid,
+    )
+    await transaction.rollback()
+    assert await conn.fetchval(query, etag_client.uid) == before
+
+    await conn.execute(
+        """
+        INSERT INTO challenges (uid, title, description, tb_obj, tb_ach, start_at, due_at)
+        SELECT $1, 'bulk ' || g, 'etag challenge', 1, 0, now(), now() + interval '1 day'
+        FROM generate_series(1, 3) AS g
+        """,
+        etag_client.uid,
+    )
+    assert await conn.fetchval(query, etag_client.uid) == before + 1
@@ -0,0 +1,137 @@
+"""
+운영 분석용 CSV 내보내기 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- COPY TO STDOUT 결과를 받는 대로 전달, 기간 조건은 UTC 날짜 (둘 다 포함)
+"""
+
+import csv
+import io
+from typing import Any, Awaitable, Callable, Dict
+
+import asyncpg
+import httpx
+import pytest
+
+from app.models.export_model import ExportDataset
+from app.models.user_model import TokenUser
+from app.services.export_service import ExportService
+from app.services.user_service import UserService
+
+# 2026-01-01부터 하루에 100개씩 30일
+STAMPS_PER_DAY = 100
+STAMP_DAYS = 30
+
+
+async def _seed_dataset(conn: asyncpg.Connection) -> None:
+    """관리자 + 일반 사용자, 일반 사용자의 스탬프와 완료한 챌린지 1개"""
+    await conn.execute(
+        """
+        INSERT INTO users (email, username, hashed_password, is_superuser)
+        VALUES ('admin@example.com', 'admin', '!', TRUE),
+               ('member@example.com', 'member', '!', FALSE)
+        """
+    )
+    await conn.execute(
+        """
+        INSERT INTO stamps (saved_at, save_url, type, uid)
+        SELECT TIMESTAMPTZ '2026-01-01 00:00:00+00'
+                   + (n / $1::int) * INTERVAL '1 day' + (n % $1::int) * INTERVAL '1 minute',
+               'static/stamps/' || n || '.jpg', 'tb', 2
+        FROM generate_series(0, $1::int * $2::int - 1) AS n
+        """,
+        STAMPS_PER_DAY,
+        STAMP_DAYS,
+    )
+    cid = await conn.fetchval(
+        """
+        INSERT INTO challenges (uid, title, is_done, tb_obj, tb_ach, start_at, due_at)
+        VALUES (2, 'tumbler', TRUE, 3, 3, '2026-01-01', '2026-01-10')
+        RETURNING id
+        """
+    )
+    await conn.execute(
+        "INSERT INTO challenge_stamp (cid, sid) SELECT $1, id FROM stamps LIMIT 3",
+        cid,
+    )
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[None]]:
+    return _seed_dataset
+
+
+@pytest.fixture(scope="module")
+def export_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """테스트 스키마 풀을 붙인 클라이언트"""
+    api_client.pool = migrated_db.pool
+    return api_client
+
+
+def _headers(uid: int, email: str, is_superuser: bool) -> Dict[str, str]:
+    token = UserService.create_user_token(
+        TokenUser(id=uid, email=email, is_superuser=is_superuser)
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+ADMIN = _headers(1, "admin@example.com", True)
+MEMBER = _headers(2, "member@example.com", False)
+
+
+async def test_export_stamps_in_date_range(export_client: Any) -> None:
+    # When - 1월 3일 ~ 1월 5일 (3일)
+    response = await export_client.get(
+        "/api/exports/stamps?start=2026-01-03&end=2026-01-05", headers=ADMIN
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="stamps_2026-01-03_2026-01-05.csv"' in (
+        response.headers["content-disposition"]
+    )
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 3 * STAMPS_PER_DAY
+    assert rows[0]["saved_at"] == "2026-01-03 00:00:00+00"
+    assert rows[-1]["saved_at"].startswith("2026-01-05 ")
+    assert set(rows[0]) == {"id", "uid", "type", "saved_at", "updated_at"}
+
+
+async def test_export_challenges_with_stamp_counts(export_client: Any) -> None:
+    response = await export_client.get("/api/exports/challenges", headers=ADMIN)
+
+    assert response.status_code == 200
+    (row,) = csv.DictReader(io.StringIO(response.text))
+    assert row["is_done"] == "t"
+    assert row["stamp_count"] == "3"
+
+
+async def test_export_rejects_members_and_bad_ranges(export_client: Any) -> None:
+    forbidden = await export_client.get("/api/exports/stamps", headers=MEMBER)
+    reversed_range = await export_client.get(
+        "/api/exports/stamps?start=2026-02-01&end=2026-01-01", headers=ADMIN
+    )
+    unknown = await export_client.get("/api/exports/passwords", headers=ADMIN)
+
+    assert forbidden.status_code == 403
+    assert reversed_range.status_code == 400
+    assert unknown.status_code == 422
+
+
+async def test_stopping_early_cancels_copy_and_returns_connection(
+    export_client: Any,
+) -> None:
+    # Given
+    free_before = export_client.pool.get_idle_size()
+    stream = ExportService.export_csv(ExportDataset.STAMPS)
+
+    # When - 첫 조각만 받고 중단
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    # Then
+    assert first.startswith(b"id,uid,type,saved_at,updated_at\n")
+    assert export_client.pool.get_idle_size() >= free_before
+    async with export_client.pool.acquire() as conn:
+        assert await conn.fetchval("SELECT 1") == 1
@@ -0,0 +1,88 @@
+"""
+Google 로그인 가입 / 조회 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 검증된 Google 계정 정보로 INSERT ... ON CONFLICT 한 문장이 사용자를 만들거나 불러옴
+- 같은 계정의 첫 로그인이 동시에 들어와도 사용자는 하나
+"""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from app.services.google_service import GoogleAuthService
+
+GOOGLE_USER = {
+    "email": "google-user@example.com",
+    "name": "Google User",
+    "picture": None,
+    "sub": "109876543210987654321",
+}
+# 인증(토큰 버전) + 프로필
+GET_USER_BUDGET = 2
+
+
+@pytest.fixture(scope="module")
+def google_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """관리용 연결을 붙인 클라이언트"""
+    api_client.conn = migrated_db.conn
+    return api_client
+
+
+async def test_concurrent_first_logins_create_one_user(google_client: Any) -> None:
+    # When
+    results = await asyncio.gather(
+        *(GoogleAuthService.login_or_register(GOOGLE_USER) for _ in range(5))
+    )
+
+    # Then
+    assert all(result is not None for result in results)
+    rows = await google_client.conn.fetch(
+        "SELECT id, username, hashed_password FROM users WHERE email = $1",
+        GOOGLE_USER["email"],
+    )
+    assert len(rows) == 1
+    assert rows[0]["username"] == f"Google User_{GOOGLE_USER['sub']}"
+
+    # 비밀번호 로그인은 불가
+    response = await google_client.post(
+        "/api/users/token",
+        data={"username": GOOGLE_USER["email"], "password": rows[0]["hashed_password"]},
+    )
+    assert response.status_code == 401
+
+
+async def test_login_returns_existing_user_and_profile_is_cached(
+    google_client: Any, assert_max_queries: Any
+) -> None:
+    # Given
+    tokens = await GoogleAuthService.login_or_register(GOOGLE_USER)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    uid = await google_client.conn.fetchval(
+        "SELECT id FROM users WHERE email = $1", GOOGLE_USER["email"]
+    )
+
+    # When
+    first = await google_client.get(f"/api/users/{uid}", headers=headers)
+    second = await google_client.get(f"/api/users/{uid}", headers=headers)
+
+    # Then
+    assert first.status_code == 200
+    assert first.json()["email"] == GOOGLE_USER["email"]
+    assert_max_queries(first, GET_USER_BUDGET)
+    assert_max_queries(second, 0)
+
+
+async def test_deactivated_user_cannot_log_in(google_client: Any) -> None:
+    # Given
+    await google_client.conn.execute(
+        "UPDATE users SET is_active = FALSE WHERE email = $1", GOOGLE_USER["email"]
+    )
+
+    # When
+    tokens = await GoogleAuthService.login_or_register(GOOGLE_USER)
+
+    # Then
+    assert tokens is None
@@ -0,0 +1,188 @@
+"""
+Idempotency-Key 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 스탬프 검증은 호출 횟수를 세는 로컬 함수로 대체 (외부 AI 호출 없음)
+- 재시도 / 동시 중복 요청은 검증과 DB 저장을 한 번만 하고 같은 응답을 받음
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, List
+
+import asyncpg
+import httpx
+import pytest
+
+from app.core import idempotency
+from app.core.idempotency import IDEMPOTENCY_KEY_HEADER, IDEMPOTENT_REPLAYED_HEADER
+from app.models.user_model import TokenUser
+from app.services.user_service import UserService
+
+IDEMPOTENCY_EMAIL = "idempotency@example.com"
+
+
+async def _seed_dataset(conn: asyncpg.Connection) -> int:
+    """사용자 1명 + od 챌린지 1개 + 장식 카탈로그"""
+    uid = await conn.fetchval(
+        """
+        INSERT INTO users (email, username, hashed_password)
+        VALUES ($1, 'idempotency', 'not-a-real-hash')
+        RETURNING id
+        """,
+        IDEMPOTENCY_EMAIL,
+    )
+    await conn.execute(
+        """
+        INSERT INTO challenges (uid, title, description, od_obj, od_ach, start_at, due_at)
+        VALUES ($1, 'challenge', 'idempotency challenge', 100, 0,
+                now() - interval '1 day', now() + interval '7 days')
+        """,
+        uid,
+    )
+    await conn.execute(
+        """
+        INSERT INTO decorations (name, version, type, rarity, color)
+        SELECT 'decoration ' || g, 1, 'tree', 1, NULL
+        FROM generate_series(1, 20) AS g
+        """
+    )
+    return uid
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[int]]:
+    return _seed_dataset
+
+
+@pytest.fixture(scope="module")
+def idempotency_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """시딩한 사용자로 인증된 클라이언트"""
+    token = UserService.create_user_token(
+        TokenUser(
+            id=migrated_db.seeded,
+            email=IDEMPOTENCY_EMAIL,
+            is_active=True,
+            is_superuser=False,
+            token_version=0,
+        )
+    )
+    api_client.headers["Authorization"] = f"Bearer {token}"
+    api_client.uid = migrated_db.seeded
+    api_client.conn = migrated_db.conn
+    return api_client
+
+
+@pytest.fixture
+def verify_calls(monkeypatch: Any) -> List[str]:
+    """스탬프 검증을 항상 통과하는 느린 로컬 함수로 대체하고 호출 기록"""
+    from app.controllers import stamp_controller
+
+    calls: List[str] = []
+
+    def verify(file: Any, stamp_type: Any) -> bool:
+        calls.append(file.filename)
+        time.sleep(0.2)
+        return True
+
+    monkeypatch.setattr(stamp_controller, "vision_api_verify", verify)
+    monkeypatch.setattr(idempotency, "_completed", idempotency.OrderedDict())
+    return calls
+
+
+async def _post_stamp(client: Any, key: str, saved_at: str) -> httpx.Response:
+    challenges = await client.get("/api/challenges/")
+    return await client.post(
+        "/api/stamps/order_details",
+        data={
+            "saved_at": saved_at,
+            "uid": str(client.uid),
+            "challenges_ids_json": str(challenges.json()[0]["id"]),
+        },
+        files={"file": ("stamp.png", b"not-an-image", "image/png")},
+        headers={IDEMPOTENCY_KEY_HEADER: key},
+    )
+
+
+async def _stamp_count(client: Any) -> int:
+    return await client.conn.fetchval("SELECT count(*) FROM stamps")
+
+
+async def test_retry_replays_stored_response(idempotency_client, verify_calls):
+    """같은 키의 재시도는 검증 / 저장 없이 처음 응답을 그대로 (메모리, DB 순)"""
+    saved_at = datetime.now(timezone.utc).isoformat()
+    before = await _stamp_count(idempotency_client)
+
+    # When
+    first = await _post_stamp(idempotency_client, "retry-key", saved_at)
+    retried = await _post_stamp(idempotency_client, "retry-key", saved_at)
+    # 다른 워커처럼 메모리 캐시가 비어 있어도 DB에 저장된 결과를 사용
+    idempotency._completed.clear()
+    from_database = await _post_stamp(idempotency_client, "retry-key", saved_at)
+
+    # Then
+    assert first.status_code == 201
+    assert IDEMPOTENT_REPLAYED_HEADER not in first.headers
+    for replay in (retried, from_database):
+        assert replay.status_code == 201
+        assert replay.headers[IDEMPOTENT_REPLAYED_HEADER] == "true"
+        assert replay.json() == first.json()
+    assert verify_calls == ["stamp.png"]
+    assert await _stamp_count(idempotency_client) == before + 1
+
+
+async def test_concurrent_duplicates_wait_for_in_flight_result(
+    idempotency_client, verify_calls
+):
+    """처리 중인 키로 동시에 들어온 요청은 처음 요청의 결과를 기다림"""
+    saved_at = datetime.now(timezone.utc).isoformat()
+    before = await _stamp_count(idempotency_client)
+
+    # When
+    responses = await asyncio.gather(
+        *(_post_stamp(idempotency_client, "concurrent-key", saved_at) for _ in range(3))
+    )
+
+    # Then
+    assert [r.status_code for r in responses] == [201, 201, 201]
+    assert all(r.json() == responses[0].json() for r in responses)
+    assert len(verify_calls) == 1
+    assert await _stamp_count(idempotency_client) == before + 1
+
+
+async def test_key_reused_with_different_request_is_rejected(
+    idempotency_client, verify_calls
+):
+    """같은 키로 다른 요청을 보내면 422, 키가 다르면 새로 처리"""
+    first = await _post_stamp(idempotency_client, "reused-key", "2025-01-01T00:00:00Z")
+    reused = await _post_stamp(idempotency_client, "reused-key", "2025-01-02T00:00:00Z")
+    other_key = await _post_stamp(
+        idempotency_client, "other-key", "2025-01-02T00:00:00Z"
+    )
+
+    assert first.status_code == 201
+    assert reused.status_code == 422
+    assert other_key.status_code == 201
+    assert len(verify_calls) == 2
+
+
+async def test_random_draw_retry_returns_same_decoration(idempotency_client):
+    """랜덤 장식 뽑기 재시도는 다시 뽑지 않고 같은 장식"""
+    body = {"uid": idempotency_client.uid}
+    headers = {IDEMPOTENCY_KEY_HEADER: "draw-key"}
+
+    first = await idempotency_client.post(
+        "/api/users/decorations/random", json=body, headers=headers
+    )
+    retried = await idempotency_client.post(
+        "/api/users/decorations/random", json=body, headers=headers
+    )
+
+    assert first.status_code == 200
+    assert retried.json() == first.json()
+    owned = await idempotency_client.conn.fetchval(
+        "SELECT count(*) FROM decoration_user WHERE uid = $1",
+        idempotency_client.uid,
+    )
+    assert owned == 1
@@ -0,0 +1,230 @@
+"""
+스탬프 리더보드 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 점수는 스탬프가 챌린지에 연결될 때 트리거가 올리고, 순위는 워커 메모리 순위표에서 계산
+- 재구성과 겹친 스탬프도 점수 테이블과 같게 한 번만 반영
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List
+
+import asyncpg
+import httpx
+import pytest
+
+from app.models.leaderboard_model import LeaderboardPeriod
+from app.models.stamp_model import StampCreate, StampType
+from app.models.user_model import TokenUser
+from app.repositories.leaderboard_repository import LeaderboardRepository
+from app.services import leaderboard_service
+from app.services.leaderboard_service import LeaderboardService
+from app.services.stamp_service import StampService
+from app.services.user_service import UserService
+
+# uid -> (이번 주 텀블러, 이번 주 주문 내역, 예전 주 텀블러)
+SEED_STAMPS = {
+    1: (1, 0, 10),
+    2: (2, 1, 0),
+    3: (1, 2, 0),
+    4: (0, 0, 0),
+}
+
+
+async def _seed_dataset(conn: asyncpg.Connection) -> None:
+    """SEED_STAMPS대로 사용자마다 챌린지 1개와 인증된 스탬프"""
+    for uid, (tumbler, order_details, old_tumbler) in SEED_STAMPS.items():
+        await conn.execute(
+            """
+            INSERT INTO users (id, email, username, hashed_password)
+            VALUES ($1::int, 'user' || $1::int || '@example.com', 'user' || $1::int, '!')
+            """,
+            uid,
+        )
+        cid = await conn.fetchval(
+            """
+            INSERT INTO challenges (uid, title, description, tb_obj, tb_ach, od_obj, od_ach, start_at, due_at)
+            VALUES ($1, 'stamps', '', 100, 0, 100, 0, now() - INTERVAL '1 year', now() + INTERVAL '1 day')
+            RETURNING id
+            """,
+            uid,
+        )
+        await conn.execute(
+            """
+            WITH new_stamps AS (
+                INSERT INTO stamps (saved_at, save_url, type)
+                SELECT now(), 'static/stamps/x.jpg', 'tb'::stamp_type FROM generate_series(1, $2::int)
+                UNION ALL
+                SELECT now(), 'static/stamps/x.jpg', 'od'::stamp_type FROM generate_series(1, $3::int)
+                UNION ALL
+                SELECT TIMESTAMPTZ '2020-01-01 12:00:00+09', 'static/stamps/x.jpg', 'tb'::stamp_type
+                FROM generate_series(1, $4::int)
+                RETURNING id
+            )
+            INSERT INTO challenge_stamp (cid, sid) SELECT $1, id FROM new_stamps
+            """,
+            cid,
+            tumbler,
+            order_details,
+            old_tumbler,
+        )
+    await conn.execute(
+        "SELECT setval(pg_get_serial_sequence('users', 'id'), MAX(id)) FROM users"
+    )
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[None]]:
+    return _seed_dataset
+
+
+@pytest.fixture(scope="module")
+def leaderboard_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """테스트 스키마 풀을 붙인 클라이언트 (메모리 순위표는 테스트 스키마로 다시 만듦)"""
+    LeaderboardService.clear()
+    api_client.pool = migrated_db.pool
+    yield api_client
+    LeaderboardService.clear()
+
+
+def _headers(uid: int) -> Dict[str, str]:
+    token = UserService.create_user_token(
+        TokenUser(id=uid, email=f"user{uid}@example.com", is_superuser=False)
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _ranking(body: Dict[str, Any]) -> Any:
+    return [(e["rank"], e["uid"], e["score"]) for e in body["entries"]]
+
+
+async def test_weekly_and_all_time_rankings(leaderboard_client: Any) -> None:
+    # When
+    weekly = await leaderboard_client.get(
+        "/api/leaderboard?period=weekly", headers=_headers(1)
+    )
+    all_time = await leaderboard_client.get(
+        "/api/leaderboard?period=all&limit=2", headers=_headers(4)
+    )
+
+    # Then - 이번 주: 2, 3번이 3점 공동 1위, 예전 주 스탬프는 세지 않음
+    assert weekly.status_code == 200
+    body = weekly.json()
+    assert _ranking(body) == [(1, 2, 3), (1, 3, 3), (3, 1, 1)]
+    assert body["entries"][0]["username"] == "user2"
+    assert body["entries"][1]["tumbler"] == 1
+    assert body["entries"][1]["order_details"] == 2
+    assert body["me"]["rank"] == 3
+    assert body["total_users"] == 3
+
+    # 전체 기간: 1번이 11점으로 1위, 스탬프가 없는 4번은 순위 없음
+    body = all_time.json()
+    assert _ranking(body) == [(1, 1, 11), (2, 2, 3)]
+    assert body["me"] is None
+    assert body["total_users"] == 3
+
+
+async def test_created_stamp_updates_rank_without_rebuild(
+    leaderboard_client: Any,
+) -> None:
+    # Given
+    await leaderboard_client.get("/api/leaderboard", headers=_headers(4))
+    rebuilds = dict(leaderboard_service._rebuilds)
+    cid = await leaderboard_client.pool.fetchval(
+        "SELECT id FROM challenges WHERE uid = 4"
+    )
+
+    # When - 4번이 텀블러 스탬프 4개를 인증
+    for _ in range(4):
+        await StampService.create_stamp(
+            4,
+            StampCreate(
+                saved_at=datetime.now(timezone.utc),
+                save_url="static/stamps/new.jpg",
+                type=StampType.TUMBLER,
+                challenge_ids=[cid],
+            ),
+        )
+    response = await leaderboard_client.get("/api/leaderboard", headers=_headers(4))
+
+    # Then - 메모리 순위표가 바로 반영, DB 점수는 트리거가 올림
+    body = response.json()
+    assert body["me"] == {
+        "rank": 1,
+        "uid": 4,
+        "username": "user4",
+        "tumbler": 4,
+        "order_details": 0,
+        "score": 4,
+    }
+    assert body["entries"][0]["uid"] == 4
+    assert leaderboard_service._rebuilds == rebuilds
+    row = await leaderboard_client.pool.fetchrow(
+        "SELECT tumbler, order_details FROM stamp_scores WHERE uid = 4"
+    )
+    assert tuple(row) == (4, 0)
+
+    # 다시 만들어도 같은 결과
+    LeaderboardService.clear()
+    rebuilt = await LeaderboardService.get_leaderboard(LeaderboardPeriod.WEEKLY, 10, 4)
+    assert rebuilt.me.rank == 1 and rebuilt.me.score == 4
+
+
+async def test_stamps_overlapping_rebuild_are_counted_once(
+    leaderboard_client: Any, monkeypatch: Any
+) -> None:
+    # Given - 3번 사용자의 주간 순위표
+    pool = leaderboard_client.pool
+    cid = await pool.fetchval("SELECT id FROM challenges WHERE uid = 3")
+    await LeaderboardService.get_leaderboard(LeaderboardPeriod.WEEKLY, 10, 3)
+    get_scores = LeaderboardRepository.get_scores
+    delayed: List[Any] = []
+
+    async def create_stamp(stamp_type: StampType) -> None:
+        await StampService.create_stamp(
+            3,
+            StampCreate(
+                saved_at=datetime.now(timezone.utc),
+                save_url="static/stamps/new.jpg",
+                type=stamp_type,
+                challenge_ids=[cid],
+            ),
+        )
+
+    async def get_scores_between_stamps(week_start: Any) -> Any:
+        # 점수를 읽기 전에 커밋됐지만 순위표 반영은 재구성이 끝난 뒤에 도착하는 스탬프
+        with monkeypatch.context() as m:
+            m.setattr(LeaderboardService, "record_stamp", lambda *a: delayed.append(a))
+            await create_stamp(StampType.TUMBLER)
+        scores = await get_scores(week_start)
+        # 점수를 읽은 뒤, 새 순위표로 바뀌기 전에 커밋되고 반영되는 스탬프
+        await create_stamp(StampType.ORDER_DETAILS)
+        return scores
+
+    # When
+    monkeypatch.setattr(LeaderboardRepository, "get_scores", get_scores_between_stamps)
+    board = await LeaderboardService._rebuild(
+        LeaderboardPeriod.WEEKLY, leaderboard_service.week_start_of(datetime.now())
+    )
+    for args in delayed:
+        LeaderboardService.record_stamp(*args)
+
+    # Then - 메모리 순위표가 점수 테이블과 같음
+    row = await pool.fetchrow(
+        "SELECT tumbler, order_details FROM stamp_weekly_scores WHERE uid = 3"
+    )
+    assert len(delayed) == 1
+    assert board.counts[3] == [row["tumbler"], row["order_details"]]
+    assert tuple(row) == (SEED_STAMPS[3][0] + 1, SEED_STAMPS[3][1] + 1)
+
+
+async def test_leaderboard_requires_login_and_valid_period(
+    leaderboard_client: Any,
+) -> None:
+    anonymous = await leaderboard_client.get("/api/leaderboard")
+    unknown = await leaderboard_client.get(
+        "/api/leaderboard?period=monthly", headers=_headers(1)
+    )
+
+    assert anonymous.status_code == 401
+    assert unknown.status_code == 422
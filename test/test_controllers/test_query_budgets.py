@@ -0,0 +1,167 @@
+"""
+엔드포인트별 쿼리 수 예산 테스트 (N+1 회귀 방지)
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- QueryStatsMiddleware의 X-DB-Queries 헤더로 요청당 쿼리 수를 확인 (assert_max_queries)
+- 예산은 "인증 1 + 엔드포인트 고유 쿼리" 기준. 쿼리 수가 늘었다면 N+1 여부부터 확인할 것
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+import asyncpg
+import httpx
+import pytest
+
+from app.config import settings
+from app.models.user_model import TokenUser
+from app.services.user_service import UserService
+
+BUDGET_EMAIL = "budget@example.com"
+BUDGET_OD_CHALLENGES = 3
+
+# 엔드포인트별 최대 쿼리 수
+# 목록 조회: 인증 + 데이터 버전(ETag) + 목록
+GET_CHALLENGES_BUDGET = 3
+GET_STAMPS_BUDGET = 3
+GET_DECORATIONS_BUDGET = 3
+RANDOM_DRAW_BUDGET = 3
+# 인증 + 스탬프 생성 + 달성 수 증가 + challenge_stamp 일괄 생성 + 챌린지 조회 (챌린지 수와 무관)
+CREATE_STAMP_BUDGET = 5
+
+
+async def _seed_budget_dataset(conn: asyncpg.Connection) -> int:
+    """사용자 1명 + od 챌린지 + 장식 카탈로그"""
+    uid = await conn.fetchval(
+        """
+        INSERT INTO users (email, username, hashed_password)
+        VALUES ($1, 'budget', 'not-a-real-hash')
+        RETURNING id
+        """,
+        BUDGET_EMAIL,
+    )
+    await conn.execute(
+        """
+        INSERT INTO challenges (uid, title, description, od_obj, od_ach, start_at, due_at)
+        SELECT $1, 'challenge ' || g, 'budget challenge', 100, 0,
+               now() - interval '1 day', now() + interval '7 days'
+        FROM generate_series(1, $2) AS g
+        """,
+        uid,
+        BUDGET_OD_CHALLENGES,
+    )
+    await conn.execute(
+        """
+        INSERT INTO decorations (name, version, type, rarity, color)
+        SELECT 'decoration ' || g, 1, 'tree', 1, NULL
+        FROM generate_series(1, 20) AS g
+        """
+    )
+    return uid
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[int]]:
+    return _seed_budget_dataset
+
+
+@pytest.fixture(scope="module")
+def budget_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """시딩한 사용자로 인증된 클라이언트"""
+    token = UserService.create_user_token(
+        TokenUser(
+            id=migrated_db.seeded,
+            email=BUDGET_EMAIL,
+            is_active=True,
+            is_superuser=False,
+            token_version=0,
+        )
+    )
+    api_client.headers["Authorization"] = f"Bearer {token}"
+    api_client.uid = migrated_db.seeded
+    return api_client
+
+
+@pytest.fixture
+def local_verifier(monkeypatch: Any) -> None:
+    """스탬프 검증을 외부 Vision/Gemini API 대신 항상 통과하도록 대체"""
+    from app.controllers import stamp_controller
+
+    monkeypatch.setattr(stamp_controller, "vision_api_verify", lambda file, t: True)
+
+
+async def test_create_stamp_query_budget(
+    budget_client: Any, local_verifier: None, assert_max_queries: Any
+) -> None:
+    """여러 챌린지에 스탬프 생성"""
+    # Given
+    challenges = await budget_client.get("/api/challenges/")
+    challenge_ids = ",".join(str(c["id"]) for c in challenges.json())
+
+    # When
+    response = await budget_client.post(
+        "/api/stamps/order_details",
+        data={
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "uid": str(budget_client.uid),
+            "challenges_ids_json": challenge_ids,
+        },
+        files={"file": ("stamp.png", b"not-an-image", "image/png")},
+    )
+
+    # Then
+    assert response.status_code == 201
+    assert len(response.json()) == BUDGET_OD_CHALLENGES
+    assert_max_queries(response, CREATE_STAMP_BUDGET)
+
+
+async def test_get_challenges_query_budget(
+    budget_client: Any, assert_max_queries: Any
+) -> None:
+    """챌린지 + 스탬프 목록 조회"""
+    response = await budget_client.get("/api/challenges/")
+
+    assert response.status_code == 200
+    assert_max_queries(response, GET_CHALLENGES_BUDGET)
+
+
+async def test_get_stamps_query_budget(
+    budget_client: Any, assert_max_queries: Any
+) -> None:
+    """스탬프 목록 조회"""
+    response = await budget_client.get("/api/stamps/")
+
+    assert response.status_code in (200, 204)
+    assert_max_queries(response, GET_STAMPS_BUDGET)
+
+
+async def test_random_draw_query_budget(
+    budget_client: Any, assert_max_queries: Any
+) -> None:
+    """랜덤 장식 뽑기"""
+    response = await budget_client.post(
+        "/api/users/decorations/random", json={"uid": budget_client.uid}
+    )
+
+    assert response.status_code == 200
+    assert_max_queries(response, RANDOM_DRAW_BUDGET)
+
+
+async def test_get_decorations_query_budget(
+    budget_client: Any, assert_max_queries: Any
+) -> None:
+    """보유 장식 목록 조회"""
+    response = await budget_client.get("/api/users/decorations/")
+
+    assert response.status_code == 200
+    assert_max_queries(response, GET_DECORATIONS_BUDGET)
+
+
+async def test_production_mode_has_no_db_headers(budget_client: Any) -> None:
+    """디버그 모드가 아니면 DB 사용량 헤더를 노출하지 않음"""
+    from app.core.middleware import DB_QUERIES_HEADER
+
+    response = await budget_client.get("/api/challenges/")
+
+    assert not settings.DEBUG
+    assert DB_QUERIES_HEADER not in response.headers
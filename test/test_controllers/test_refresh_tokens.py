@@ -0,0 +1,155 @@
+"""
+리프레시 토큰 세션 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 갱신은 세션 행 UPDATE 한 번 (비밀번호 확인 없음), 갱신할 때마다 리프레시 토큰 교체
+- 교체된 토큰이 다시 쓰이면 세션 전체를 폐기
+"""
+
+import secrets
+from typing import Any, Awaitable, Callable, Dict
+
+import asyncpg
+import httpx
+import pytest
+from passlib.context import CryptContext
+
+from app.config import settings
+from app.services import session_service
+
+SESSION_EMAIL = "session@example.com"
+PASSWORD = "session-password"
+# 세션 교체 + 사용자 claim 조회를 한 문장으로
+REFRESH_BUDGET = 1
+
+
+async def _seed_dataset(conn: asyncpg.Connection) -> int:
+    """비밀번호로 로그인할 사용자 1명"""
+    return await conn.fetchval(
+        """
+        INSERT INTO users (email, username, hashed_password)
+        VALUES ($1, 'session', $2)
+        RETURNING id
+        """,
+        SESSION_EMAIL,
+        CryptContext(schemes=["bcrypt"], deprecated="auto").hash(PASSWORD),
+    )
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[int]]:
+    return _seed_dataset
+
+
+@pytest.fixture(scope="module")
+def session_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """시딩한 사용자 uid와 관리용 연결을 붙인 클라이언트"""
+    api_client.uid = migrated_db.seeded
+    api_client.conn = migrated_db.conn
+    return api_client
+
+
+async def _login(client: Any) -> Dict[str, Any]:
+    response = await client.post(
+        "/api/users/token", data={"username": SESSION_EMAIL, "password": PASSWORD}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+async def _refresh(client: Any, refresh_token: str) -> httpx.Response:
+    return await client.post(
+        "/api/users/refresh", json={"refresh_token": refresh_token}
+    )
+
+
+async def test_refresh_rotates_token_with_one_query(
+    session_client: Any, assert_max_queries: Any
+) -> None:
+    # Given
+    tokens = await _login(session_client)
+
+    # When
+    response = await _refresh(session_client, tokens["refresh_token"])
+
+    # Then
+    assert response.status_code == 200
+    refreshed = response.json()
+    assert refreshed["refresh_token"] != tokens["refresh_token"]
+    assert_max_queries(response, REFRESH_BUDGET)
+    me = await session_client.get(
+        "/api/users/me",
+        headers={"Authorization": f"Bearer {refreshed['access_token']}"},
+    )
+    assert me.status_code == 200
+
+    # 응답을 받지 못한 재시도는 같은 리프레시 토큰을 받음
+    retried = await _refresh(session_client, tokens["refresh_token"])
+    assert retried.status_code == 200
+    assert retried.json()["refresh_token"] == refreshed["refresh_token"]
+
+
+async def test_reused_refresh_token_revokes_session(
+    session_client: Any, monkeypatch: Any
+) -> None:
+    # Given - 유예 시간 없이, 교체 후 다른 워커(메모리 캐시 없음)로 재사용
+    monkeypatch.setattr(settings, "REFRESH_TOKEN_REUSE_GRACE_SECONDS", 0)
+    tokens = await _login(session_client)
+    rotated = (await _refresh(session_client, tokens["refresh_token"])).json()
+    session_service._recent.clear()
+
+    # When
+    reused = await _refresh(session_client, tokens["refresh_token"])
+
+    # Then - 이전 토큰과 함께 새 토큰도 거부
+    assert reused.status_code == 401
+    assert (await _refresh(session_client, rotated["refresh_token"])).status_code == 401
+    revoked_at = await session_client.conn.fetchval(
+        "SELECT revoked_at FROM user_sessions WHERE uid = $1 ORDER BY created_at DESC LIMIT 1",
+        session_client.uid,
+    )
+    assert revoked_at is not None
+
+
+async def test_unknown_secret_does_not_revoke_session(session_client: Any) -> None:
+    # Given - 세션 ID는 맞지만 비밀 값이 현재 / 직전 어느 것도 아닌 토큰
+    tokens = await _login(session_client)
+    session_part = tokens["refresh_token"].partition(".")[0]
+    forged = f"{session_part}.{session_service._encode(secrets.token_bytes(32))}"
+
+    # When
+    refreshed = await _refresh(session_client, forged)
+    logged_out = await session_client.post(
+        "/api/users/logout", json={"refresh_token": forged}
+    )
+
+    # Then - 거부만 하고 세션은 유지
+    assert refreshed.status_code == 401
+    assert logged_out.status_code == 204
+    assert (await _refresh(session_client, tokens["refresh_token"])).status_code == 200
+
+
+async def test_logout_and_password_change_end_sessions(session_client: Any) -> None:
+    # Given
+    logged_out = await _login(session_client)
+    other = await _login(session_client)
+
+    # When - 로그아웃
+    response = await session_client.post(
+        "/api/users/logout", json={"refresh_token": logged_out["refresh_token"]}
+    )
+
+    # Then
+    assert response.status_code == 204
+    assert (
+        await _refresh(session_client, logged_out["refresh_token"])
+    ).status_code == 401
+
+    # When - 비밀번호 변경 (토큰 버전이 올라 발급된 세션 모두 무효)
+    await session_client.conn.execute(
+        "UPDATE users SET hashed_password = 'changed' WHERE id = $1",
+        session_client.uid,
+    )
+
+    # Then
+    assert (await _refresh(session_client, other["refresh_token"])).status_code == 401
@@ -0,0 +1,126 @@
+"""
+요청 deadline 테스트
+
+- DeadlineMiddleware만 붙인 작은 앱으로 DB 헬퍼(pg_sleep)를 호출
+- 예산을 넘기면 504, 실행 중이던 쿼리는 서버에서 취소되어 연결이 풀로 돌아옴
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import asyncpg
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from app.config import settings
+from app.core.deadline import REQUEST_TIMEOUT_HEADER, remaining
+from app.core.middleware import DeadlineMiddleware
+from app.database import database
+
+SLEEP_APP_NAME = "deadline_test"
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/sleep/{seconds}")
+    async def sleep(seconds: float) -> dict:
+        await database.fetch_one("SELECT pg_sleep($1)", (seconds,))
+        return {"slept": seconds}
+
+    @app.get("/swallow/{seconds}")
+    async def swallow(seconds: float) -> dict:
+        # 기존 핸들러처럼 모든 예외를 400으로 바꾸는 경우
+        try:
+            await database.fetch_one("SELECT pg_sleep($1)", (seconds,))
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"slept": seconds}
+
+    @app.get("/remaining")
+    async def get_remaining() -> dict:
+        return {"remaining": remaining()}
+
+    return app
+
+
+@pytest.fixture
+async def deadline_client(postgres_available: None, monkeypatch: Any) -> Any:
+    pool = await asyncpg.create_pool(
+        dsn=settings.DATABASE_URL,
+        min_size=1,
+        max_size=1,
+        server_settings={"application_name": SLEEP_APP_NAME},
+    )
+
+    monkeypatch.setattr(database, "pool", pool)
+    monkeypatch.setattr(settings, "REQUEST_TIMEOUT_SECONDS", 0.5)
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=_build_app()), base_url="http://test"
+        ) as client:
+            yield client
+    finally:
+        await pool.close()
+
+
+async def _running_sleeps() -> int:
+    conn = await asyncpg.connect(settings.DATABASE_URL)
+    try:
+        return await conn.fetchval(
+            """
+            SELECT count(*) FROM pg_stat_activity
+            WHERE application_name = $1 AND state = 'active'
+                AND query LIKE '%pg_sleep%'
+            """,
+            SLEEP_APP_NAME,
+        )
+    finally:
+        await conn.close()
+
+
+async def test_slow_query_is_cancelled_at_deadline(deadline_client):
+    """예산(0.5초)을 넘긴 쿼리는 504 + 서버에서 취소, 연결은 다시 사용 가능"""
+    # When
+    started = time.monotonic()
+    response = await deadline_client.get("/sleep/5")
+    elapsed = time.monotonic() - started
+
+    # Then
+    assert response.status_code == 504
+    assert elapsed < 2
+    await asyncio.sleep(0.1)
+    assert await _running_sleeps() == 0
+
+    # 풀 연결이 1개뿐이어도 다음 요청은 정상 처리
+    response = await deadline_client.get("/sleep/0")
+    assert response.status_code == 200
+
+
+async def test_swallowed_timeout_still_returns_504(deadline_client):
+    """핸들러가 timeout 예외를 잡아 다른 응답으로 바꿔도 deadline 이후 응답은 504"""
+    response = await deadline_client.get("/swallow/5")
+
+    assert response.status_code == 504
+
+
+async def test_client_header_can_only_shorten_budget(deadline_client):
+    """X-Request-Timeout-Ms는 경로 예산보다 짧을 때만 적용"""
+    shorter = await deadline_client.get(
+        "/remaining", headers={REQUEST_TIMEOUT_HEADER: "100"}
+    )
+    longer = await deadline_client.get(
+        "/remaining", headers={REQUEST_TIMEOUT_HEADER: "60000"}
+    )
+
+    assert 0 < shorter.json()["remaining"] <= 0.1
+    assert 0.1 < longer.json()["remaining"] <= 0.5
+
+    # 짧은 예산 안에 끝나지 않는 쿼리는 504
+    response = await deadline_client.get(
+        "/sleep/1", headers={REQUEST_TIMEOUT_HEADER: "100"}
+    )
+    assert response.status_code == 504
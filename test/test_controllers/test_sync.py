@@ -0,0 +1,185 @@
+"""
+동기화(GET /api/sync) 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 커서 이후 생성 / 변경 / 삭제(tombstone)된 행만 받고, 변경이 없으면 커서 조회만 함
+- 삭제 기록이 정리된 범위보다 오래된 커서는 전체 데이터(reset)
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+import asyncpg
+import httpx
+import pytest
+
+from app.models.user_model import TokenUser
+from app.repositories.sync_repository import SyncRepository
+from app.services.user_service import UserService
+
+SYNC_EMAIL = "sync@example.com"
+# 인증 + 커서
+UNCHANGED_BUDGET = 2
+
+
+async def _seed_dataset(conn: asyncpg.Connection) -> int:
+    """사용자 1명 + od 챌린지 2개 + 장식 카탈로그"""
+    uid = await conn.fetchval(
+        """
+        INSERT INTO users (email, username, hashed_password)
+        VALUES ($1, 'sync', 'not-a-real-hash')
+        RETURNING id
+        """,
+        SYNC_EMAIL,
+    )
+    await conn.execute(
+        """
+        INSERT INTO challenges (uid, title, description, od_obj, od_ach, start_at, due_at)
+        SELECT $1, 'challenge ' || g, 'sync challenge', 100, 0,
+               now() - interval '1 day', now() + interval '7 days'
+        FROM generate_series(1, 2) AS g
+        """,
+        uid,
+    )
+    await conn.execute(
+        """
+        INSERT INTO decorations (name, version, type, rarity, color)
+        SELECT 'decoration ' || g, 1, 'tree', 1, NULL
+        FROM generate_series(1, 5) AS g
+        """
+    )
+    return uid
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[int]]:
+    return _seed_dataset
+
+
+@pytest.fixture(scope="module")
+def sync_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """시딩한 사용자로 인증된 클라이언트"""
+    token = UserService.create_user_token(
+        TokenUser(
+            id=migrated_db.seeded,
+            email=SYNC_EMAIL,
+            is_active=True,
+            is_superuser=False,
+            token_version=0,
+        )
+    )
+    api_client.headers["Authorization"] = f"Bearer {token}"
+    api_client.uid = migrated_db.seeded
+    api_client.conn = migrated_db.conn
+    return api_client
+
+
+@pytest.fixture
+def local_verifier(monkeypatch: Any) -> None:
+    """스탬프 검증을 외부 Vision/Gemini API 대신 항상 통과하도록 대체"""
+    from app.controllers import stamp_controller
+
+    monkeypatch.setattr(stamp_controller, "vision_api_verify", lambda file, t: True)
+
+
+async def _sync(client: Any, since: int) -> dict:
+    response = await client.get("/api/sync", params={"since": since})
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_sync_returns_only_changes_since_cursor(
+    sync_client: Any, local_verifier: None, assert_max_queries: Any
+) -> None:
+    # Given - 처음 동기화는 전체 데이터
+    initial = await _sync(sync_client, 0)
+    assert initial["reset"] is True
+    assert len(initial["challenges"]) == 2
+    cursor = initial["cursor"]
+
+    # When - 챌린지 하나에 스탬프 생성 + 장식 뽑기
+    target = initial["challenges"][0]["id"]
+    created = await sync_client.post(
+        "/api/stamps/order_details",
+        data={
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "uid": str(sync_client.uid),
+            "challenges_ids_json": str(target),
+        },
+        files={"file": ("stamp.png", b"not-an-image", "image/png")},
+    )
+    drawn = await sync_client.post(
+        "/api/users/decorations/random", json={"uid": sync_client.uid}
+    )
+    changes = await _sync(sync_client, cursor)
+
+    # Then - 바뀐 챌린지 / 새 스탬프 / 새 장식만
+    assert created.status_code == 201 and drawn.status_code == 200
+    assert changes["reset"] is False
+    assert changes["cursor"] > cursor
+    assert [c["id"] for c in changes["challenges"]] == [target]
+    assert len(changes["challenges"][0]["stamps"]) == 1
+    assert [s["id"] for s in changes["stamps"]] == [
+        changes["challenges"][0]["stamps"][0]["id"]
+    ]
+    assert [d["did"] for d in changes["decorations"]] == [drawn.json()["id"]]
+
+    # When - 변경 없음
+    unchanged = await sync_client.get("/api/sync", params={"since": changes["cursor"]})
+
+    # Then
+    assert unchanged.json()["cursor"] == changes["cursor"]
+    assert unchanged.json()["challenges"] == []
+    assert_max_queries(unchanged, UNCHANGED_BUDGET)
+
+
+async def test_deletions_are_returned_as_tombstones(sync_client: Any) -> None:
+    # Given
+    conn = sync_client.conn
+    cursor = (await _sync(sync_client, 0))["cursor"]
+    stamp_id = await conn.fetchval(
+        "SELECT sid FROM challenge_stamp ORDER BY sid LIMIT 1"
+    )
+    challenge_id = await conn.fetchval(
+        "SELECT id FROM challenges WHERE uid = $1 ORDER BY id DESC LIMIT 1",
+        sync_client.uid,
+    )
+    did = await conn.fetchval(
+        "SELECT did FROM decoration_user WHERE uid = $1 LIMIT 1", sync_client.uid
+    )
+
+    # When
+    await conn.execute("DELETE FROM stamps WHERE id = $1", stamp_id)
+    await conn.execute("DELETE FROM challenges WHERE id = $1", challenge_id)
+    await conn.execute(
+        "DELETE FROM decoration_user WHERE uid = $1 AND did = $2",
+        sync_client.uid,
+        did,
+    )
+    changes = await _sync(sync_client, cursor)
+
+    # Then
+    assert changes["deleted"] == {
+        "challenges": [challenge_id],
+        "stamps": [stamp_id],
+        "decorations": [did],
+    }
+
+
+async def test_cursor_older_than_pruned_tombstones_resets(sync_client: Any) -> None:
+    # Given - 삭제 기록이 있는 상태에서 받은 커서
+    conn = sync_client.conn
+    old_cursor = 1
+    await conn.execute(
+        "UPDATE sync_tombstones SET deleted_at = now() - interval '90 days'"
+    )
+
+    # When
+    pruned = await SyncRepository.delete_expired_tombstones(30 * 86400)
+    changes = await _sync(sync_client, old_cursor)
+
+    # Then
+    assert pruned == 3
+    assert changes["reset"] is True
+    assert changes["deleted"] == {"challenges": [], "stamps": [], "decorations": []}
+    assert len(changes["challenges"]) == 1
@@ -0,0 +1,168 @@
+"""
+토큰 claim 인증 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 로그인 토큰에는 사용자 ID / 활성 / 관리자 여부 / 토큰 버전이 담겨 캐시가 채워지면 인증에 쿼리가 없음
+- 비활성화 / 권한 변경은 트리거가 토큰 버전을 올려 이미 발급된 토큰을 거부
+- claim 없이 sub(이메일)만 있는 이전 형식의 토큰은 거부
+"""
+
+from typing import Any, Awaitable, Callable, Dict
+
+import asyncpg
+import httpx
+import pytest
+from jose import jwt
+from passlib.context import CryptContext
+
+from app.config import settings
+from app.core.cache import get_cache, invalidate_tags
+from app.services.user_service import UserService
+
+PASSWORD = "claims-password"
+USERS = {
+    "member": ("member@example.com", False),
+    "revoked": ("revoked@example.com", False),
+    "admin": ("admin@example.com", True),
+}
+
+
+async def _seed_dataset(conn: asyncpg.Connection) -> Dict[str, int]:
+    """일반 사용자 2명 + 관리자 1명 (사용자마다 챌린지 1개)"""
+    hashed_password = CryptContext(schemes=["bcrypt"], deprecated="auto").hash(PASSWORD)
+    uids = {}
+    for name, (email, is_superuser) in USERS.items():
+        uids[name] = await conn.fetchval(
+            """
+            INSERT INTO users (email, username, hashed_password, is_superuser)
+            VALUES ($1, $2, $3, $4)
+            RETURNING id
+            """,
+            email,
+            name,
+            hashed_password,
+            is_superuser,
+        )
+        await conn.execute(
+            """
+            INSERT INTO challenges (uid, title, description, od_obj, od_ach, start_at, due_at)
+            VALUES ($1, 'challenge', 'claims challenge', 100, 0,
+                    now() - interval '1 day', now() + interval '7 days')
+            """,
+            uids[name],
+        )
+    return uids
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[Dict[str, int]]]:
+    return _seed_dataset
+
+
+@pytest.fixture(scope="module")
+def claims_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """시딩한 사용자 uid와 관리용 연결을 붙인 클라이언트"""
+    api_client.uids = migrated_db.seeded
+    api_client.conn = migrated_db.conn
+    return api_client
+
+
+async def _login(client: Any, name: str) -> Dict[str, str]:
+    response = await client.post(
+        "/api/users/token",
+        data={"username": USERS[name][0], "password": PASSWORD},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def test_login_token_carries_claims(claims_client: Any) -> None:
+    # When
+    headers = await _login(claims_client, "admin")
+
+    # Then
+    token = headers["Authorization"].split()[1]
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    assert payload["uid"] == claims_client.uids["admin"]
+    assert payload["active"] is True
+    assert payload["superuser"] is True
+    assert payload["tv"] == 0
+
+
+async def test_claims_token_authorizes_without_query(
+    claims_client: Any, assert_max_queries: Any
+) -> None:
+    # Given - 토큰 버전 / 데이터 버전이 캐시됨
+    headers = await _login(claims_client, "member")
+    first = await claims_client.get("/api/challenges/", headers=headers)
+    assert first.status_code == 200
+
+    # When
+    response = await claims_client.get(
+        "/api/challenges/",
+        headers={**headers, "If-None-Match": first.headers["ETag"]},
+    )
+
+    # Then
+    assert response.status_code == 304
+    assert_max_queries(response, 0)
+
+    # 프로필이 필요한 엔드포인트는 따로 조회
+    me = await claims_client.get("/api/users/me", headers=headers)
+    assert me.status_code == 200
+    assert me.json()["username"] == "member"
+
+
+async def test_deactivation_revokes_issued_token(claims_client: Any) -> None:
+    # Given
+    headers = await _login(claims_client, "revoked")
+    uid = claims_client.uids["revoked"]
+    assert (
+        await claims_client.get("/api/challenges/", headers=headers)
+    ).status_code == 200
+
+    # When - UserService.update_user와 같이 커밋 후 토큰 버전 캐시 무효화
+    await claims_client.conn.execute(
+        "UPDATE users SET is_active = FALSE WHERE id = $1", uid
+    )
+    await invalidate_tags(f"user:{uid}:token")
+
+    # Then - 토큰의 active claim은 그대로지만 토큰 버전이 올라 거부됨
+    response = await claims_client.get("/api/challenges/", headers=headers)
+    assert response.status_code == 401
+
+
+async def test_token_without_claims_is_rejected(claims_client: Any) -> None:
+    # Given - 토큰 버전 claim이 생기기 전 형식 (sub만 있음)
+    token = UserService.create_access_token(data={"sub": USERS["member"][0]})
+
+    # When
+    response = await claims_client.get(
+        "/api/challenges/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    # Then
+    assert response.status_code == 401
+
+
+async def test_superuser_claim_is_revoked_by_direct_update(claims_client: Any) -> None:
+    # Given
+    admin = await _login(claims_client, "admin")
+    member = await _login(claims_client, "member")
+    assert (
+        await claims_client.get("/api/decorations/", headers=admin)
+    ).status_code == 200
+    assert (
+        await claims_client.get("/api/decorations/", headers=member)
+    ).status_code == 401
+
+    # When - 앱을 거치지 않은 권한 변경 (캐시는 TTL이 지나면 반영되므로 비움)
+    await claims_client.conn.execute(
+        "UPDATE users SET is_superuser = FALSE WHERE id = $1",
+        claims_client.uids["admin"],
+    )
+    get_cache().clear()
+
+    # Then
+    response = await claims_client.get("/api/decorations/", headers=admin)
+    assert response.status_code == 401
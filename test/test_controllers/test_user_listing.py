@@ -0,0 +1,105 @@
+"""
+사용자 목록 페이지 / 내보내기 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 목록은 ID 순 keyset 페이지 (Link rel="next"), 전체 내보내기는 서버 측 커서로 NDJSON 스트리밍
+"""
+
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+import asyncpg
+import httpx
+import pytest
+
+from app.config import settings
+from app.models.user_model import TokenUser
+from app.services.user_service import UserService
+
+SEEDED_USERS = 250
+
+
+async def _seed_dataset(conn: asyncpg.Connection) -> None:
+    """관리자(user1) 1명 + 일반 사용자"""
+    await conn.execute(
+        """
+        INSERT INTO users (email, username, hashed_password, is_superuser)
+        SELECT 'user' || n || '@example.com', 'user' || n, '!', n = 1
+        FROM generate_series(1, $1) AS n
+        """,
+        SEEDED_USERS,
+    )
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[None]]:
+    return _seed_dataset
+
+
+@pytest.fixture(scope="module")
+def listing_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """관리용 연결을 붙인 클라이언트"""
+    api_client.conn = migrated_db.conn
+    return api_client
+
+
+async def _headers(client: Any, username: str) -> Dict[str, str]:
+    row = await client.conn.fetchrow(
+        "SELECT id, email, is_superuser FROM users WHERE username = $1", username
+    )
+    token = UserService.create_user_token(
+        TokenUser(id=row["id"], email=row["email"], is_superuser=row["is_superuser"])
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def test_list_users_by_keyset_pages(listing_client: Any) -> None:
+    # Given
+    headers = await _headers(listing_client, "user2")
+    url = "/api/users/?limit=100"
+
+    # When - Link 헤더를 따라 끝까지
+    ids = []
+    pages = 0
+    while url:
+        response = await listing_client.get(url, headers=headers)
+        assert response.status_code == 200
+        ids.extend(user["id"] for user in response.json())
+        pages += 1
+        url = response.links.get("next", {}).get("url")
+
+    # Then
+    assert pages == 3
+    assert len(ids) == SEEDED_USERS
+    assert ids == sorted(set(ids))
+
+
+async def test_export_streams_ndjson_in_chunks(
+    listing_client: Any, monkeypatch: Any
+) -> None:
+    # Given
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_ROWS", 64)
+    headers = await _headers(listing_client, "user1")
+
+    # When
+    response = await listing_client.get("/api/users/export", headers=headers)
+    chunks = [chunk async for chunk in UserService.export_users_ndjson()]
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert len(lines) == SEEDED_USERS
+    assert json.loads(lines[0])["username"] == "user1"
+    assert "hashed_password" not in json.loads(lines[-1])
+    # 한 chunk에 사용자 64명 (마지막 chunk 제외)
+    assert len(chunks) == -(-SEEDED_USERS // 64)
+    assert b"".join(chunks).decode().splitlines() == lines
+
+
+async def test_export_requires_superuser(listing_client: Any) -> None:
+    headers = await _headers(listing_client, "user2")
+
+    response = await listing_client.get("/api/users/export", headers=headers)
+
+    assert response.status_code == 403
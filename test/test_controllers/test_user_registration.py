@@ -0,0 +1,111 @@
+"""
+회원가입 / 프로필 수정 중복 확인 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용한 로컬 Postgres에 실제 앱을 ASGI로 구동
+- 가입 / 수정은 각각 한 문장, 중복은 UNIQUE 제약 이름으로 이메일 / 사용자 이름을 구분
+"""
+
+import asyncio
+from typing import Any, Dict
+
+import httpx
+import pytest
+
+PASSWORD = "registration-password"
+# INSERT ... RETURNING 한 문장
+REGISTER_BUDGET = 1
+# 인증(토큰 버전) + UPDATE ... RETURNING
+UPDATE_BUDGET = 2
+
+
+@pytest.fixture(scope="module")
+def registration_client(api_client: httpx.AsyncClient, migrated_db: Any) -> Any:
+    """관리용 연결을 붙인 클라이언트"""
+    api_client.conn = migrated_db.conn
+    return api_client
+
+
+def _user(name: str) -> Dict[str, str]:
+    return {"email": f"{name}@example.com", "username": name, "password": PASSWORD}
+
+
+async def _login(client: Any, email: str) -> Dict[str, str]:
+    response = await client.post(
+        "/api/users/token", data={"username": email, "password": PASSWORD}
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def test_register_reports_conflicting_field(
+    registration_client: Any, assert_max_queries: Any
+) -> None:
+    # When
+    created = await registration_client.post("/api/users/", json=_user("alice"))
+    same_email = await registration_client.post(
+        "/api/users/", json={**_user("alice2"), "email": "alice@example.com"}
+    )
+    same_username = await registration_client.post(
+        "/api/users/", json={**_user("alice"), "email": "other@example.com"}
+    )
+
+    # Then
+    assert created.status_code == 201
+    assert_max_queries(created, REGISTER_BUDGET)
+    assert same_email.status_code == 400
+    assert same_email.json()["detail"] == "이미 존재하는 이메일입니다."
+    assert same_username.status_code == 400
+    assert same_username.json()["detail"] == "이미 존재하는 사용자 이름입니다."
+
+
+async def test_concurrent_registrations_create_one_user(
+    registration_client: Any,
+) -> None:
+    # When
+    responses = await asyncio.gather(
+        *(registration_client.post("/api/users/", json=_user("bob")) for _ in range(4))
+    )
+
+    # Then
+    assert sorted(r.status_code for r in responses) == [201, 400, 400, 400]
+    count = await registration_client.conn.fetchval(
+        "SELECT COUNT(*) FROM users WHERE email = 'bob@example.com'"
+    )
+    assert count == 1
+
+
+async def test_update_profile_in_one_statement(
+    registration_client: Any, assert_max_queries: Any
+) -> None:
+    # Given
+    created = await registration_client.post("/api/users/", json=_user("carol"))
+    uid = created.json()["id"]
+    headers = await _login(registration_client, "carol@example.com")
+
+    # When
+    renamed = await registration_client.put(
+        f"/api/users/{uid}", json={"username": "carol2"}, headers=headers
+    )
+    taken = await registration_client.put(
+        f"/api/users/{uid}", json={"username": "alice"}, headers=headers
+    )
+    empty = await registration_client.put(f"/api/users/{uid}", json={}, headers=headers)
+
+    # Then
+    assert renamed.status_code == 200
+    assert renamed.json()["username"] == "carol2"
+    assert_max_queries(renamed, UPDATE_BUDGET)
+    assert taken.status_code == 400
+    assert taken.json()["detail"] == "이미 존재하는 사용자 이름입니다."
+    assert empty.status_code == 400
+
+    # When - falsy 값(is_active=False)도 변경 대상
+    deactivated = await registration_client.put(
+        f"/api/users/{uid}", json={"is_active": False}, headers=headers
+    )
+
+    # Then - 비활성화로 토큰 버전이 올라 발급된 토큰은 거부
+    assert deactivated.status_code == 200
+    assert deactivated.json()["is_active"] is False
+    me = await registration_client.get("/api/users/me", headers=headers)
+    assert me.status_code == 401
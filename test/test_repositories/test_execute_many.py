@@ -0,0 +1,80 @@
+"""
+execute_many 테스트
+
+- 하나의 트랜잭션: 중간 행이 실패하면 앞선 배치까지 모두 롤백
+- batch_size개씩 executemany로 보내고, 왕복 수는 배치 수 + 2 (BEGIN / COMMIT)
+"""
+
+from typing import Any, List
+
+import asyncpg
+import pytest
+
+from app.database import database
+
+INSERT_DECORATION = (
+    "INSERT INTO decorations (name, version, type, rarity) VALUES ($1, $2, $3, $4)"
+)
+
+
+def _rows(count: int, prefix: str) -> List[tuple]:
+    return [(f"{prefix}-{i}", 1, "tree", 1) for i in range(count)]
+
+
+async def _count(migrated_db: Any, prefix: str) -> int:
+    return await migrated_db.conn.fetchval(
+        "SELECT count(*) FROM decorations WHERE name LIKE $1", f"{prefix}-%"
+    )
+
+
+@pytest.fixture
+def executemany_calls(monkeypatch: Any) -> List[int]:
+    """실제로 보낸 executemany 호출마다 행 수 기록"""
+    calls: List[int] = []
+    original = asyncpg.Connection.executemany
+
+    async def executemany(self: Any, command: str, args: Any, **kwargs: Any) -> Any:
+        calls.append(len(args))
+        return await original(self, command, args, **kwargs)
+
+    monkeypatch.setattr(asyncpg.Connection, "executemany", executemany)
+    return calls
+
+
+async def test_batches_and_round_trips(migrated_db, executemany_calls):
+    # Given
+    rows = _rows(25, "batched")
+
+    # When
+    with database.track_queries() as stats:
+        await database.execute_many(INSERT_DECORATION, rows, batch_size=10)
+
+    # Then
+    assert executemany_calls == [10, 10, 5]
+    assert stats.queries == 25
+    assert stats.round_trips == len(executemany_calls) + 2
+    assert await _count(migrated_db, "batched") == 25
+
+
+async def test_failing_middle_row_commits_nothing(migrated_db, executemany_calls):
+    # Given - 두 번째 배치 중간에 (name, version) 중복 행
+    rows = _rows(25, "atomic")
+    rows[15] = rows[3]
+
+    # When
+    with database.track_queries() as stats:
+        with pytest.raises(asyncpg.UniqueViolationError):
+            await database.execute_many(INSERT_DECORATION, rows, batch_size=10)
+
+    # Then - 첫 배치도 롤백되고, 실패한 배치까지 집계
+    assert await _count(migrated_db, "atomic") == 0
+    assert executemany_calls == [10, 10]
+    assert stats.round_trips == 4
+
+
+async def test_empty_values_skip_the_database(migrated_db, executemany_calls):
+    with database.track_queries() as stats:
+        assert await database.execute_many(INSERT_DECORATION, []) is None
+
+    assert executemany_calls == []
+    assert stats.round_trips == 0
@@ -0,0 +1,99 @@
+"""
+DB 연결 풀 수명 주기 테스트
+
+- init_db: min_size개 연결을 미리 열고 등록된 쿼리를 prepare한 뒤에만 ready
+- close_db: ready를 먼저 내리고, 반환되지 않는 연결이 있어도 deadline 안에 종료
+- 멀티 워커 풀 크기: 워커 수 x 워커당 max_size가 전체 연결 예산 이내
+"""
+
+import time
+from typing import Any
+
+import asyncpg
+import pytest
+
+from app.config import settings
+from app.database import database
+
+WARMUP_PROBE_QUERY = "SELECT $1::BIGINT AS warmup_probe"
+
+
+@pytest.fixture
+async def fresh_pool_state(postgres_available: None, monkeypatch: Any) -> Any:
+    """풀이 없는 상태에서 시작 (작은 풀 크기 + 테스트용 워밍업 쿼리)"""
+    monkeypatch.setattr(settings, "DB_POOL_MIN_SIZE", 2)
+    monkeypatch.setattr(settings, "DB_POOL_MAX_SIZE", 3)
+    monkeypatch.setattr(settings, "DATABASE_REPLICA_URLS", "")
+    monkeypatch.setattr(database, "pool", None)
+    monkeypatch.setattr(database, "replicas", None)
+    monkeypatch.setattr(database, "_ready", False)
+    monkeypatch.setattr(database, "_warmup_queries", [])
+    database.register_warmup_query(WARMUP_PROBE_QUERY)
+    try:
+        yield
+    finally:
+        await database.close_db(timeout=1)
+
+
+async def test_init_db_warms_pool_before_ready(fresh_pool_state):
+    """min_size개 연결이 모두 열려 있고, 각 연결에 워밍업 쿼리가 prepare되어 있음"""
+    assert not database.is_ready()
+
+    # When
+    await database.init_db()
+
+    # Then
+    assert database.is_ready()
+    pool = database.pool
+    assert pool.get_size() == settings.DB_POOL_MIN_SIZE
+    assert pool.get_idle_size() == settings.DB_POOL_MIN_SIZE
+
+    connections = [await pool.acquire() for _ in range(settings.DB_POOL_MIN_SIZE)]
+    try:
+        for conn in connections:
+            prepared = await conn.fetch("SELECT statement FROM pg_prepared_statements")
+            assert WARMUP_PROBE_QUERY in {row["statement"] for row in prepared}
+    finally:
+        for conn in connections:
+            await pool.release(conn)
+
+
+async def test_close_db_terminates_within_deadline(fresh_pool_state):
+    """반환되지 않은 연결이 있어도 deadline이 지나면 강제로 닫고 not ready"""
+    # Given
+    await database.init_db()
+    pool = database.pool
+    held = await pool.acquire()
+
+    # When
+    started = time.monotonic()
+    await database.close_db(timeout=0.2)
+    elapsed = time.monotonic() - started
+
+    # Then
+    assert elapsed < 2
+    assert not database.is_ready()
+    assert database.pool is None
+    # 강제로 끊긴 연결은 더 이상 쓸 수 없음
+    with pytest.raises(asyncpg.InterfaceError):
+        await held.fetchval("SELECT 1")
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4, 8, 16, 64])
+def test_pool_sizes_fit_connection_budget(workers):
+    """워커 수를 늘려도 워커 수 x 풀 max_size가 연결 예산을 넘지 않음"""
+    from app.server import plan_pool_sizes
+
+    min_size, max_size = plan_pool_sizes(
+        budget=87, workers=workers, min_size=5, max_size=20
+    )
+
+    assert workers * max_size <= 87
+    assert 1 <= min_size <= max_size <= 20
+
+
+def test_pool_sizes_reject_more_workers_than_budget():
+    from app.server import plan_pool_sizes
+
+    with pytest.raises(ValueError):
+        plan_pool_sizes(budget=3, workers=4, min_size=5, max_size=20)
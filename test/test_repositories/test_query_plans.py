@@ -0,0 +1,373 @@
+"""
+Repository 쿼리 실행 계획 회귀 테스트
+
+- 별도 스키마에 migrations/sql 전체를 적용하고 데이터를 시딩한 뒤 ANALYZE
+- 실제 Repository 메서드를 호출하면서 fetch_one/fetch_all로 나가는 쿼리를
+  EXPLAIN (ANALYZE, FORMAT JSON)으로 캡처 (롤백되는 트랜잭션 안에서 실행)
+- hot query에 Seq Scan이 생기거나 row 추정치가 크게 어긋나면 실패
+"""
+
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence
+
+import asyncpg
+import pytest
+
+from app.database import database
+from app.models.stamp_model import StampType
+from app.repositories import (
+    challenge_repository,
+    challenge_stamp_repository,
+    decoration_repository,
+    decoration_user_repository,
+    stamp_repository,
+    sync_repository,
+    user_repository,
+)
+from app.repositories.challenge_repository import ChallengeRepository
+from app.repositories.challenge_stamp_repository import ChallengeStampRepository
+from app.repositories.decoration_user_repository import DecorationUserRepository
+from app.repositories.stamp_repository import StampRepository
+from app.repositories.sync_repository import SyncRepository
+from app.repositories.user_repository import UserRepository
+
+# 시딩 규모 (planner가 인덱스를 고를 만큼은 커야 함)
+SEED_USERS = 5000
+SEED_CHALLENGES_PER_USER = 4
+SEED_STAMPS_PER_CHALLENGE = 3
+SEED_DECORATIONS = 60
+SEED_DECORATIONS_PER_USER = 10
+# 이 값으로 나누어떨어지는 uid는 보유 장식을 삭제 (삭제 기록 시딩)
+SEED_TOMBSTONE_USER_MODULUS = 10
+
+# 추정 row 수와 실제 row 수의 허용 배율
+MAX_ROW_ESTIMATE_RATIO = 100
+# 이 row 수 미만의 노드는 배율 검사에서 제외 (작은 값의 오차는 의미 없음)
+ROW_ESTIMATE_MIN_ROWS = 100
+
+# 장식 카탈로그는 작은 테이블이라 Seq Scan 허용
+CATALOG_TABLES = ("decorations",)
+
+REPOSITORY_MODULES = (
+    challenge_repository,
+    challenge_stamp_repository,
+    decoration_repository,
+    decoration_user_repository,
+    stamp_repository,
+    sync_repository,
+    user_repository,
+)
+
+
+async def _seed_plan_dataset(conn: asyncpg.Connection) -> None:
+    """hot query 검사용 데이터 시딩"""
+    await conn.execute(
+        """
+        INSERT INTO users (email, username, hashed_password)
+        SELECT 'user' || g || '@example.com', 'user' || g, 'not-a-real-hash'
+        FROM generate_series(1, $1) AS g
+        """,
+        SEED_USERS,
+    )
+    await conn.execute(
+        """
+        INSERT INTO challenges (uid, title, description, od_obj, od_ach, tb_obj, tb_ach, start_at, due_at)
+        SELECT u.id,
+               'challenge ' || g,
+               'seeded challenge',
+               CASE WHEN g % 2 = 0 THEN 10 END,
+               CASE WHEN g % 2 = 0 THEN 0 END,
+               CASE WHEN g % 2 = 1 THEN 10 END,
+               CASE WHEN g % 2 = 1 THEN 0 END,
+               now() - interval '7 days',
+               now() + interval '7 days'
+        FROM users AS u, generate_series(1, $1) AS g
+        """,
+        SEED_CHALLENGES_PER_USER,
+    )
+    await conn.execute(
+        """
+        INSERT INTO stamps (saved_at, save_url, type)
+        SELECT now() - (g % 365) * interval '1 day',
+               'no-url',
+               CASE WHEN g % 2 = 0 THEN 'od' ELSE 'tb' END::STAMP_TYPE
+        FROM generate_series(1, (SELECT count(*) FROM challenges) * $1) AS g
+        """,
+        SEED_STAMPS_PER_CHALLENGE,
+    )
+    await conn.execute(
+        """
+        INSERT INTO challenge_stamp (cid, sid)
+        SELECT c.id, (c.id - 1) * $1 + g
+        FROM challenges AS c, generate_series(1, $1) AS g
+        """,
+        SEED_STAMPS_PER_CHALLENGE,
+    )
+    await conn.execute(
+        """
+        INSERT INTO decorations (name, version, type, rarity, color)
+        SELECT 'decoration ' || g,
+               1,
+               (ARRAY['terrain', 'sky', 'grass', 'tree', 'flower', 'animal'])[g % 6 + 1]::DECO_TYPE,
+               g % 5 + 1,
+               NULL
+        FROM generate_series(1, $1) AS g
+        """,
+        SEED_DECORATIONS,
+    )
+    await conn.execute(
+        """
+        INSERT INTO decoration_user (did, uid, acquired_at, is_equipped, type)
+        SELECT d.id, u.id, now(), FALSE, d.type
+        FROM users AS u
+        CROSS JOIN LATERAL (
+            SELECT id, type FROM decorations
+            WHERE id % $1::int = u.id % $1::int
+        ) AS d
+        """,
+        SEED_DECORATIONS // SEED_DECORATIONS_PER_USER,
+    )
+    # 동기화 삭제 기록 (트리거가 sync_tombstones에 기록)
+    await conn.execute(
+        "DELETE FROM decoration_user WHERE uid % $1::int = 0",
+        SEED_TOMBSTONE_USER_MODULUS,
+    )
+    await conn.execute("ANALYZE")
+
+
+@pytest.fixture(scope="module")
+def db_seed() -> Callable[[asyncpg.Connection], Awaitable[None]]:
+    return _seed_plan_dataset
+
+
+@pytest.fixture(scope="module")
+def plan_pool(migrated_db: Any) -> asyncpg.Pool:
+    """마이그레이션과 시딩이 끝난 테스트 스키마를 가리키는 연결 풀"""
+    return migrated_db.pool
+
+
+@pytest.fixture
+def captured_plans(plan_pool: Any, monkeypatch: Any) -> List[Dict[str, Any]]:
+    """Repository가 실행하는 쿼리마다 EXPLAIN (ANALYZE) 결과를 수집"""
+    plans: List[Dict[str, Any]] = []
+
+    def explaining(original: Callable) -> Callable:
+        async def wrapper(
+            query: str, values: Optional[tuple] = None, **kwargs: Any
+        ) -> Any:
+            async with plan_pool.acquire() as conn:
+                # ANALYZE는 쿼리를 실제로 실행하므로 쓰기 쿼리도 롤백되게 감쌈
+                tr = conn.transaction()
+                await tr.start()
+                try:
+                    raw = await conn.fetchval(
+                        "EXPLAIN (ANALYZE, FORMAT JSON) " + query, *(values or ())
+                    )
+                finally:
+                    await tr.rollback()
+            plans.append({"query": query, "plan": json.loads(raw)[0]["Plan"]})
+            return await original(query, values, **kwargs)
+
+        return wrapper
+
+    for module in REPOSITORY_MODULES:
+        for name in ("fetch_one", "fetch_all"):
+            if hasattr(module, name):
+                monkeypatch.setattr(module, name, explaining(getattr(database, name)))
+    return plans
+
+
+def _walk(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+def assert_healthy_plans(
+    plans: List[Dict[str, Any]],
+    allowed_seq_scans: Sequence[str] = (),
+) -> None:
+    """Seq Scan 및 row 추정치 폭주 검사"""
+    assert plans, "캡처된 쿼리가 없습니다."
+    for captured in plans:
+        for node in _walk(captured["plan"]):
+            relation = node.get("Relation Name")
+            assert not (
+                node["Node Type"] == "Seq Scan" and relation not in allowed_seq_scans
+            ), f"Seq Scan on {relation}:\n{captured['query']}"
+
+            if not node.get("Actual Loops"):
+                continue  # 실행되지 않은 노드
+            estimated, actual = node["Plan Rows"], node["Actual Rows"]
+            if max(estimated, actual) < ROW_ESTIMATE_MIN_ROWS:
+                continue
+            ratio = max(estimated, actual) / max(min(estimated, actual), 1)
+            assert ratio <= MAX_ROW_ESTIMATE_RATIO, (
+                f"{node['Node Type']} row 추정치 오차 {ratio:.0f}배 "
+                f"(estimated={estimated}, actual={actual}):\n{captured['query']}"
+            )
+
+
+async def _some_uid(pool: Any) -> int:
+    async with pool.acquire() as conn:
+        return int(
+            await conn.fetchval("SELECT id FROM users ORDER BY id LIMIT 1 OFFSET 42")
+        )
+
+
+async def test_get_challenge_by_uid_plan(plan_pool, captured_plans):
+    """uid로 챌린지 조회"""
+    uid = await _some_uid(plan_pool)
+    challenges = await ChallengeRepository.get_challenge_by_uid(uid)
+
+    assert challenges and len(challenges) == SEED_CHALLENGES_PER_USER
+    assert_healthy_plans(captured_plans)
+
+
+async def test_get_challenge_response_by_uid_plan(plan_pool, captured_plans):
+    """uid로 챌린지 + 스탬프 조인 조회"""
+    uid = await _some_uid(plan_pool)
+    challenges = await ChallengeRepository.get_challenge_response_by_uid(uid)
+
+    assert challenges and len(challenges) == SEED_CHALLENGES_PER_USER
+    assert_healthy_plans(captured_plans)
+
+
+async def test_get_challenge_response_by_challenge_ids_plan(plan_pool, captured_plans):
+    """챌린지 ID 목록으로 챌린지 + 스탬프 조인 조회"""
+    uid = await _some_uid(plan_pool)
+    async with plan_pool.acquire() as conn:
+        rows = await conn.fetch("SELECT id FROM challenges WHERE uid = $1", uid)
+    challenge_ids = [row["id"] for row in rows]
+
+    challenges = await ChallengeRepository.get_challenge_response_by_challenge_ids(
+        challenge_ids
+    )
+
+    assert challenges and len(challenges) == len(challenge_ids)
+    assert_healthy_plans(captured_plans)
+
+
+async def test_increment_challenge_achievements_plan(plan_pool, captured_plans):
+    """스탬프 생성 시 챌린지 달성 수 업데이트"""
+    uid = await _some_uid(plan_pool)
+    async with plan_pool.acquire() as conn:
+        cid = await conn.fetchval(
+            "SELECT id FROM challenges WHERE uid = $1 AND tb_obj IS NOT NULL LIMIT 1",
+            uid,
+        )
+
+    await ChallengeRepository.increment_challenge_achievements(
+        uid=uid, challenge_ids=[cid], stamp_type=StampType.TUMBLER
+    )
+
+    assert_healthy_plans(captured_plans)
+
+
+async def test_create_challenge_stamp_plan(plan_pool, captured_plans):
+    """스탬프를 여러 챌린지에 연결 (한 번의 INSERT)"""
+    # 다른 조회 테스트의 기대 row 수에 영향을 주지 않도록 별도 사용자 사용
+    uid = await _some_uid(plan_pool) + 1
+    async with plan_pool.acquire() as conn:
+        rows = await conn.fetch("SELECT id FROM challenges WHERE uid = $1", uid)
+        sid = await conn.fetchval(
+            "INSERT INTO stamps (saved_at, save_url, type) "
+            "VALUES (now(), 'no-url', 'od') RETURNING id"
+        )
+    challenge_ids = [row["id"] for row in rows]
+
+    challenge_stamps = await ChallengeStampRepository.create_challenge_stamp(
+        challenge_ids, sid
+    )
+
+    assert challenge_stamps and len(challenge_stamps) == len(challenge_ids)
+    assert len(captured_plans) == 1
+    assert_healthy_plans(captured_plans)
+
+
+async def test_get_stamp_by_uid_plan(plan_pool, captured_plans):
+    """uid로 스탬프 조회"""
+    uid = await _some_uid(plan_pool)
+    stamps = await StampRepository.get_stamp_by_uid(uid)
+
+    assert stamps and len(stamps) == (
+        SEED_CHALLENGES_PER_USER * SEED_STAMPS_PER_CHALLENGE
+    )
+    assert_healthy_plans(captured_plans)
+
+
+async def test_delete_stamp_plan(plan_pool, captured_plans):
+    """스탬프 삭제 (challenge_stamp로 CASCADE)"""
+    async with plan_pool.acquire() as conn:
+        sid = await conn.fetchval("SELECT max(id) FROM stamps")
+
+    deleted = await StampRepository.delete_stamp(sid)
+
+    assert deleted is not None
+    assert_healthy_plans(captured_plans)
+
+
+async def test_get_decoration_user_by_user_id_plan(plan_pool, captured_plans):
+    """사용자 장식 목록 조회"""
+    uid = await _some_uid(plan_pool)
+    decorations = await DecorationUserRepository.get_by_user_id(uid)
+
+    assert len(decorations) == SEED_DECORATIONS_PER_USER
+    assert_healthy_plans(captured_plans, allowed_seq_scans=CATALOG_TABLES)
+
+
+async def test_draw_random_decoration_plan(plan_pool, captured_plans):
+    """사용자가 갖지 않은 랜덤 장식 조회"""
+    uid = await _some_uid(plan_pool)
+    decoration = await DecorationUserRepository.draw_random_decoration(uid)
+
+    assert decoration is not None
+    assert_healthy_plans(captured_plans, allowed_seq_scans=CATALOG_TABLES)
+
+
+async def test_sync_changes_since_cursor_plan(plan_pool, captured_plans):
+    """커서 이후 변경분 조회 (챌린지 / 스탬프 / 보유 장식 / 삭제 기록)"""
+    uid = await _some_uid(plan_pool)
+    current = await SyncRepository.get_cursor(uid)
+    since = current.cursor - 1
+
+    assert current.cursor > 0
+    await SyncRepository.get_challenges_since(uid, since)
+    await SyncRepository.get_stamps_since(uid, since)
+    await SyncRepository.get_decorations_since(uid, since)
+    await SyncRepository.get_tombstones_since(uid, since)
+
+    assert_healthy_plans(captured_plans, allowed_seq_scans=CATALOG_TABLES)
+
+
+async def test_get_user_by_email_and_username_plan(plan_pool, captured_plans):
+    """로그인/인증 시 사용자 조회"""
+    user = await UserRepository.get_user_by_email("user42@example.com")
+    assert user is not None
+    by_username = await UserRepository.get_user_by_username("user42")
+    assert by_username is not None
+
+    assert_healthy_plans(captured_plans)
+
+
+async def test_foreign_keys_have_supporting_index(plan_pool, migrated_db):
+    """모든 FK 컬럼에 선두 컬럼이 일치하는 인덱스가 있어야 CASCADE 삭제가 scan하지 않음"""
+    async with plan_pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT c.conrelid::regclass::text AS table_name, c.conname
+            FROM pg_constraint AS c
+            WHERE c.contype = 'f'
+              AND c.connamespace = $1::text::regnamespace
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM pg_index AS i
+                  WHERE i.indrelid = c.conrelid
+                    AND (i.indkey::int2[])[0:cardinality(c.conkey) - 1] @> c.conkey
+              )
+            """,
+            migrated_db.schema,
+        )
+
+    missing = [f"{row['table_name']}.{row['conname']}" for row in rows]
+    assert not missing, f"인덱스가 없는 FK: {missing}"
@@ -0,0 +1,197 @@
+"""
+읽기 복제본 라우팅 테스트
+
+- primary / 복제본 모두 로컬 Postgres를 가리키되 application_name으로 어느 풀이 쓰였는지 구분
+- read_only 조회만 복제본으로, 최근 쓰기 사용자와 지연된 복제본은 primary로
+"""
+
+import asyncio
+import time
+from typing import Any, List, Optional
+
+import asyncpg
+import pytest
+from starlette.datastructures import Headers
+
+from app.config import settings
+from app.core.middleware import ReadYourWritesMiddleware
+from app.database import database
+
+PRIMARY_APP_NAME = "routing_primary"
+REPLICA_APP_NAME = "routing_replica"
+WHO_AM_I = "SELECT current_setting('application_name') AS app"
+
+
+@pytest.fixture
+async def routed_pools(postgres_available: None, monkeypatch: Any) -> Any:
+    """primary 풀 1개 + 복제본 1개가 설정된 상태"""
+    primary = await asyncpg.create_pool(
+        dsn=settings.DATABASE_URL,
+        min_size=1,
+        max_size=2,
+        server_settings={"application_name": PRIMARY_APP_NAME},
+    )
+
+    monkeypatch.setattr(
+        settings,
+        "DATABASE_REPLICA_URLS",
+        f"{settings.DATABASE_URL}?application_name={REPLICA_APP_NAME}",
+    )
+    monkeypatch.setattr(database, "pool", primary)
+    monkeypatch.setattr(database, "replicas", None)
+    monkeypatch.setattr(database, "_last_write_at", {})
+    try:
+        yield primary
+    finally:
+        for replica in database.replicas or []:
+            if replica.pool is not None:
+                await replica.pool.close()
+        await primary.close()
+
+
+async def _served_by(read_only: bool) -> str:
+    row = await database.fetch_one(WHO_AM_I, read_only=read_only)
+    return row["app"]
+
+
+async def test_read_only_queries_go_to_replica(routed_pools):
+    """read_only 조회는 복제본, 나머지는 primary"""
+    assert await _served_by(read_only=True) == REPLICA_APP_NAME
+    assert await _served_by(read_only=False) == PRIMARY_APP_NAME
+
+
+async def test_recent_writer_reads_from_primary(routed_pools, monkeypatch):
+    """쓰기 직후 같은 사용자의 읽기는 primary로 (read-your-writes)"""
+    # Given
+    database.bind_session_user(42)
+    await database.execute_query(
+        "CREATE TEMP TABLE IF NOT EXISTS routing_probe (x INT)"
+    )
+
+    # Then
+    assert await _served_by(read_only=True) == PRIMARY_APP_NAME
+
+    # 다른 사용자는 영향 없음
+    database.bind_session_user(43)
+    assert await _served_by(read_only=True) == REPLICA_APP_NAME
+
+    # 고정 시간이 지나면 다시 복제본으로
+    database.bind_session_user(42)
+    monkeypatch.setattr(settings, "REPLICA_STICKY_SECONDS", 0)
+    assert await _served_by(read_only=True) == REPLICA_APP_NAME
+
+
+async def test_write_on_another_worker_reads_from_primary(routed_pools):
+    """다른 워커에서 한 쓰기도 응답 쿠키로 전달받아 해당 사용자의 읽기를 primary로"""
+    served: List[str] = []
+
+    async def endpoint(scope: Any, receive: Any, send: Any) -> None:
+        database.bind_session_user(42)
+        if scope["method"] == "POST":
+            await database.execute_query(
+                "CREATE TEMP TABLE IF NOT EXISTS routing_probe (x INT)"
+            )
+        else:
+            served.append(await _served_by(read_only=True))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    worker = ReadYourWritesMiddleware(endpoint)
+
+    async def request(method: str, cookie: str = "") -> Optional[str]:
+        messages: List[Any] = []
+
+        async def send(message: Any) -> None:
+            messages.append(message)
+
+        headers = [(b"cookie", cookie.encode())] if cookie else []
+        scope = {"type": "http", "method": method, "path": "/", "headers": headers}
+        await worker(scope, None, send)
+        return Headers(raw=messages[0]["headers"]).get("set-cookie")
+
+    # Given - 쓰기 요청의 응답 쿠키, 다음 요청은 쓰기 기록이 없는 다른 워커가 받음
+    set_cookie = await request("POST")
+    assert set_cookie is not None
+    database._last_write_at.clear()
+    cookie = set_cookie.split(";")[0]
+    name, _, value = cookie.partition("=")
+    uid, written_ms, signature = value.split(":")
+
+    # When
+    assert (
+        await request("GET", cookie) is None
+    )  # 읽기만 한 요청은 쿠키를 다시 내려주지 않음
+    await request("GET")
+    await request("GET", f"{name}={uid}:{int(written_ms) + 60_000}:{signature}")
+
+    # Then - 쿠키가 있으면 primary, 없거나 변조되면 복제본
+    assert uid == "42"
+    assert served == [PRIMARY_APP_NAME, REPLICA_APP_NAME, REPLICA_APP_NAME]
+
+
+async def test_lagging_replica_is_excluded(routed_pools):
+    """지연 허용치를 넘은 복제본은 제외되고, 따라잡으면 다시 사용"""
+    # Given
+    [replica] = await database.get_replicas()
+    replica.lag = settings.REPLICA_MAX_LAG_SECONDS + 1
+
+    # Then
+    assert await _served_by(read_only=True) == PRIMARY_APP_NAME
+
+    # When - 지연 재측정 (primary에 연결된 복제본이므로 0)
+    assert await replica.check_lag() == 0
+    assert await _served_by(read_only=True) == REPLICA_APP_NAME
+
+
+async def test_unreachable_replica_falls_back_to_primary(routed_pools, monkeypatch):
+    """연결할 수 없는 복제본은 unhealthy로 표시되고 읽기는 primary로"""
+    monkeypatch.setattr(
+        settings, "DATABASE_REPLICA_URLS", "postgresql://postgres@127.0.0.1:1/none"
+    )
+
+    assert await _served_by(read_only=True) == PRIMARY_APP_NAME
+    [replica] = await database.get_replicas()
+    assert not replica.is_healthy()
+
+
+async def test_hanging_replica_is_excluded_within_timeout(routed_pools, monkeypatch):
+    """연결은 되지만 응답하지 않는 복제본은 제한 시간 안에 unhealthy로 표시"""
+    # Given
+    [replica] = await database.get_replicas()
+    assert replica.is_healthy()
+    monkeypatch.setattr(settings, "REPLICA_LAG_CHECK_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(replica, "LAG_QUERY", "SELECT pg_sleep(5)")
+
+    # When
+    started = time.monotonic()
+    lag = await replica.check_lag()
+
+    # Then
+    assert lag is None
+    assert time.monotonic() - started < 2
+    assert await _served_by(read_only=True) == PRIMARY_APP_NAME
+
+
+async def test_monitor_keeps_running_after_failed_iteration(monkeypatch):
+    """측정 중 예외가 나도 모니터는 다음 주기에 다시 측정"""
+    calls: List[int] = []
+
+    async def get_replicas() -> List[Any]:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return []
+
+    monkeypatch.setattr(database, "get_replicas", get_replicas)
+    monkeypatch.setattr(settings, "REPLICA_LAG_CHECK_INTERVAL_SECONDS", 0.01)
+
+    monitor = asyncio.ensure_future(database.monitor_replica_lag())
+    try:
+        for _ in range(100):
+            if len(calls) >= 3:
+                break
+            await asyncio.sleep(0.01)
+        assert not monitor.done()
+        assert len(calls) >= 3
+    finally:
+        monitor.cancel()
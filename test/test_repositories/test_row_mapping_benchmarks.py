@@ -0,0 +1,42 @@
+"""
+행 단위 변환 함수 할당량 회귀 테스트
+benchmarks/microbench_baseline.json 대비 허용치를 넘으면 실패한다.
+최적화로 할당량이 줄었다면 python -m benchmarks.microbench --update-baseline으로 기준을 낮춰 유지한다.
+"""
+
+import pytest
+
+from benchmarks.microbench import (
+    CASES,
+    SIZES,
+    find_regressions,
+    load_baseline,
+    measure_allocations,
+)
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    return load_baseline()
+
+
+def test_baseline_covers_all_cases(baseline):
+    """모든 측정 대상 / 입력 크기에 baseline이 있어야 함"""
+    for case in CASES:
+        assert case.name in baseline
+        for size in SIZES:
+            assert str(size) in baseline[case.name]
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_row_mapping_allocations_within_baseline(baseline, case, size):
+    """할당 블록 수 / peak 메모리가 baseline 허용치 이내인지 확인"""
+    # When
+    measured = measure_allocations(case, size)
+
+    # Then
+    regressions = find_regressions(
+        baseline, {case.name: {str(size): measured}}, check_time=False
+    )
+    assert not regressions, regressions
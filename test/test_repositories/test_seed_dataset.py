@@ -0,0 +1,44 @@
+"""
+합성 데이터셋 배분 테스트
+문서에 나온 크기(README 예시 / 기본값)로 배분했을 때 챌린지별 스탬프 수와 목표가
+SMALLINT 컬럼(od_obj / od_ach / tb_obj / tb_ach) 범위를 넘지 않는지 확인한다.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from benchmarks.seed import (
+    MAX_CHALLENGE_STAMPS,
+    SeedConfig,
+    challenge_records,
+    plan_dataset,
+)
+
+ANCHOR = datetime(2025, 5, 1, tzinfo=timezone.utc)
+INT16_MAX = 32767
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        SeedConfig(users=100_000, stamps=20_000_000, skew=1.1, anchor=ANCHOR),
+        SeedConfig(anchor=ANCHOR),
+    ],
+    ids=["readme", "defaults"],
+)
+def test_challenge_counts_fit_smallint(config):
+    # When
+    plan = plan_dataset(config)
+
+    # Then - 스탬프 수는 그대로, 챌린지 하나에 몰려도 SMALLINT 이하
+    assert MAX_CHALLENGE_STAMPS == INT16_MAX
+    assert sum(plan.challenge_stamps) == config.stamps
+    assert max(plan.challenge_stamps) <= INT16_MAX
+    # 모든 사용자가 최소 challenges_per_user개의 챌린지를 가짐
+    assert len(set(plan.challenge_uids)) == config.users
+    assert len(plan.challenge_uids) >= config.users * config.challenges_per_user
+    for record in challenge_records(config, plan):
+        od_obj, od_ach, tb_obj, tb_ach = record[5:9]
+        for value in (od_obj, od_ach, tb_obj, tb_ach):
+            assert value is None or 0 <= value <= INT16_MAX
@@ -0,0 +1,201 @@
+"""
+조회 캐시 테스트
+
+- Redis 계층은 fakeredis로 대체, 리포지토리는 호출 횟수를 세는 함수로 대체 (DB 불필요)
+- 태그 무효화, 워커 간 Redis 공유, 조기 갱신, hit 비율 메트릭 확인
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any, List
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.config import settings
+from app.core import cache
+from app.core.cache import Cache, MemoryTier, RedisTier, cached, invalidate_tags
+from app.core.metrics import render_metrics
+from app.models.challenge_model import ChallengeResponse
+from app.models.challenge_stamp_model import ChallengeStampInDB
+from app.models.stamp_model import StampCreate, StampInDB, StampType
+from app.repositories.challenge_repository import ChallengeRepository
+from app.repositories.challenge_stamp_repository import ChallengeStampRepository
+from app.repositories.stamp_repository import StampRepository
+from app.services.challenge_service import ChallengeService
+from app.services.stamp_service import StampService
+
+
+@pytest.fixture
+def redis_client() -> FakeAsyncRedis:
+    return FakeAsyncRedis()
+
+
+@pytest.fixture
+def worker_cache(monkeypatch: Any, redis_client: FakeAsyncRedis) -> Cache:
+    """Redis를 공유하는 워커 하나의 캐시"""
+    worker = Cache(MemoryTier(100), RedisTier(redis_client))
+    monkeypatch.setattr(cache, "_cache", worker)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "CACHE_EARLY_REFRESH_BETA", 0)
+    return worker
+
+
+def _challenge(uid: int, title: str) -> ChallengeResponse:
+    return ChallengeResponse(
+        id=1,
+        uid=uid,
+        title=title,
+        description=None,
+        start_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        due_at=datetime(2026, 1, 31, tzinfo=timezone.utc),
+        stamps=[],
+        type=StampType.TUMBLER,
+    )
+
+
+async def _titles(uid: int) -> List[str]:
+    challenges = await ChallengeService.get_challenge_response_by_uid(uid)
+    assert all(isinstance(c, ChallengeResponse) for c in challenges)
+    return [challenge.title for challenge in challenges]
+
+
+@pytest.fixture
+def challenge_loads(monkeypatch: Any) -> List[int]:
+    loads: List[int] = []
+
+    async def get_challenge_response_by_uid(uid: int) -> List[ChallengeResponse]:
+        loads.append(uid)
+        return [_challenge(uid, f"challenges-{uid}-{len(loads)}")]
+
+    monkeypatch.setattr(
+        ChallengeRepository,
+        "get_challenge_response_by_uid",
+        get_challenge_response_by_uid,
+    )
+    return loads
+
+
+async def test_create_stamp_invalidates_user_challenges(
+    worker_cache, challenge_loads, monkeypatch
+):
+    """스탬프 생성 후에는 그 사용자의 챌린지만 다시 조회"""
+
+    async def create_stamp(stamp: Any) -> StampInDB:
+        return StampInDB(id=1, saved_at=stamp.saved_at, save_url="-", type=stamp.type)
+
+    async def increment(**kwargs: Any) -> List[int]:
+        return [1]
+
+    async def link(**kwargs: Any) -> List[ChallengeStampInDB]:
+        return [ChallengeStampInDB(cid=1, sid=1, xid=1)]
+
+    monkeypatch.setattr(StampRepository, "create_stamp", create_stamp)
+    monkeypatch.setattr(
+        ChallengeRepository, "increment_challenge_achievements", increment
+    )
+    monkeypatch.setattr(ChallengeStampRepository, "create_challenge_stamp", link)
+
+    # Given
+    assert await _titles(1) == ["challenges-1-1"]
+    assert await _titles(2) == ["challenges-2-2"]
+    assert await _titles(1) == ["challenges-1-1"]
+
+    # When
+    await StampService.create_stamp(
+        uid=1,
+        stamp_data=StampCreate(
+            saved_at=datetime.now(timezone.utc),
+            save_url="-",
+            type=StampType.ORDER_DETAILS,
+            challenge_ids=[1],
+        ),
+    )
+
+    # Then
+    assert await _titles(1) == ["challenges-1-3"]
+    assert await _titles(2) == ["challenges-2-2"]
+    assert challenge_loads == [1, 2, 1]
+
+    metrics = render_metrics()
+    assert (
+        'cache_hits_total{family="challenge_response_by_uid",tier="memory"} 2'
+        in metrics
+    )
+    assert 'cache_hit_ratio{family="challenge_response_by_uid"} 0.4' in metrics
+
+
+async def test_workers_share_redis_tier_and_invalidations(
+    worker_cache, redis_client, challenge_loads, monkeypatch
+):
+    """다른 워커가 채운 값은 Redis에서 읽고, 무효화도 Redis를 통해 전달"""
+    await ChallengeService.get_challenge_response_by_uid(1)
+
+    # 메모리가 빈 다른 워커
+    other_worker = Cache(MemoryTier(100), RedisTier(redis_client))
+    monkeypatch.setattr(cache, "_cache", other_worker)
+    assert await _titles(1) == ["challenges-1-1"]
+    assert other_worker.stats["challenge_response_by_uid"].hits["redis"] == 1
+
+    # 처음 워커가 무효화
+    await worker_cache.invalidate_tags("user:1:challenges")
+    other_worker.clear()
+    assert await _titles(1) == ["challenges-1-2"]
+
+
+async def test_unreadable_redis_value_is_a_miss(
+    worker_cache, redis_client, challenge_loads
+):
+    """Redis 값은 JSON으로만 저장하고, 복원할 수 없는 값은 miss로 다시 조회"""
+    await _titles(1)
+    (key,) = [k for k in await redis_client.keys("*") if b":tag:" not in k]
+    assert json.loads(await redis_client.get(key))["value"][0]["title"] == (
+        "challenges-1-1"
+    )
+
+    # When - 다른 형식(예: pickle)이나 깨진 값
+    await redis_client.set(key, b"\x80\x04garbage")
+    worker_cache.clear()
+
+    # Then
+    assert await _titles(1) == ["challenges-1-2"]
+    assert challenge_loads == [1, 1]
+
+
+async def test_value_loaded_across_invalidation_is_not_stored(worker_cache):
+    """읽는 도중 쓰기로 무효화된 값은 캐시에 남기지 않음"""
+    release = asyncio.Event()
+    loads: List[int] = []
+
+    @cached("probe", key="{uid}", ttl=60, tags=("user:{uid}",))
+    async def load(uid: int) -> int:
+        loads.append(uid)
+        await release.wait()
+        return len(loads)
+
+    first = asyncio.ensure_future(load(1))
+    await asyncio.sleep(0)
+    await invalidate_tags("user:1")
+    release.set()
+
+    assert await first == 1
+    assert await load(1) == 2
+
+
+async def test_early_refresh_recomputes_before_expiry(worker_cache, monkeypatch):
+    """만료가 가까우면 만료 전에 미리 다시 계산"""
+    loads: List[int] = []
+
+    @cached("probe", key="{uid}", ttl=60)
+    async def load(uid: int) -> int:
+        loads.append(uid)
+        return len(loads)
+
+    assert await load(1) == 1
+    assert await load(1) == 1
+
+    # 계산 시간에 비해 만료가 충분히 가까운 상황
+    monkeypatch.setattr(settings, "CACHE_EARLY_REFRESH_BETA", 1e9)
+    assert await load(1) == 2
+    assert worker_cache.stats["probe"].early_refreshes == 1
@@ -0,0 +1,234 @@
+"""
+Google id_token 로컬 검증 테스트
+
+- discovery 문서 / JWKS는 로컬 스텁 앱(httpx ASGITransport)이 응답 (네트워크 불필요)
+- 두 문서는 Cache-Control 만큼 캐시, 모르는 kid는 JWKS를 한 번 다시 받음
+- 다시 받지 못하면 캐시된 키로 계속 검증
+"""
+
+import time
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.google_openid import GoogleOpenID, InvalidIdToken, cache_lifetime
+
+DISCOVERY_URL = "https://google.test/.well-known/openid-configuration"
+CLIENT_ID = "client-id.apps.googleusercontent.com"
+NONCE = "nonce-value"
+
+
+def _key_pair(kid: str) -> Tuple[str, Dict[str, Any]]:
+    """(서명용 PEM, JWKS에 올릴 공개키 JWK)"""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk.update({"kid": kid, "use": "sig"})
+    return private_pem, public_jwk
+
+
+class GoogleStub:
+    """discovery / JWKS 엔드포인트 스텁 (요청 경로를 기록, failing이면 503)"""
+
+    def __init__(self) -> None:
+        self.requests: List[str] = []
+        self.keys: List[Dict[str, Any]] = []
+        self.failing = False
+        self.app = Starlette(
+            routes=[
+                Route("/.well-known/openid-configuration", self.discovery),
+                Route("/oauth2/v3/certs", self.certs),
+            ]
+        )
+
+    async def discovery(self, request: Request) -> JSONResponse:
+        self.requests.append(request.url.path)
+        return JSONResponse(
+            {
+                "issuer": "https://accounts.google.com",
+                "authorization_endpoint": "https://google.test/o/oauth2/v2/auth",
+                "token_endpoint": "https://google.test/token",
+                "jwks_uri": "https://google.test/oauth2/v3/certs",
+            },
+            headers={"Cache-Control": "public, max-age=3600"},
+        )
+
+    async def certs(self, request: Request) -> JSONResponse:
+        self.requests.append(request.url.path)
+        if self.failing:
+            return JSONResponse({}, status_code=503)
+        return JSONResponse(
+            {"keys": self.keys},
+            headers={"Cache-Control": "public, max-age=20000, must-revalidate"},
+        )
+
+
+@pytest.fixture
+def google() -> GoogleStub:
+    return GoogleStub()
+
+
+@pytest.fixture
+def openid(google: GoogleStub) -> GoogleOpenID:
+    return GoogleOpenID(
+        DISCOVERY_URL, CLIENT_ID, transport=httpx.ASGITransport(app=google.app)
+    )
+
+
+def _id_token(private_pem: str, kid: str, **overrides: Any) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "1234567890",
+        "email": "google@example.com",
+        "email_verified": True,
+        "nonce": NONCE,
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+async def test_verifies_locally_with_cached_documents(
+    google: GoogleStub, openid: GoogleOpenID
+) -> None:
+    # Given
+    private_pem, public_jwk = _key_pair("k1")
+    google.keys = [public_jwk]
+
+    # When
+    first = await openid.verify_id_token(_id_token(private_pem, "k1"), NONCE)
+    second = await openid.verify_id_token(_id_token(private_pem, "k1"), NONCE)
+
+    # Then - discovery / JWKS는 한 번씩만 받음
+    assert first["email"] == second["email"] == "google@example.com"
+    assert google.requests == [
+        "/.well-known/openid-configuration",
+        "/oauth2/v3/certs",
+    ]
+    assert openid._jwks.expires_at - openid._jwks.fetched_at == pytest.approx(20000)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"aud": "someone-else"},
+        {"iss": "https://evil.test"},
+        {"nonce": "replayed"},
+        {"exp": int(time.time()) - 10},
+    ],
+)
+async def test_rejects_invalid_claims(
+    google: GoogleStub, openid: GoogleOpenID, overrides: Dict[str, Any]
+) -> None:
+    private_pem, public_jwk = _key_pair("k1")
+    google.keys = [public_jwk]
+
+    with pytest.raises(InvalidIdToken):
+        await openid.verify_id_token(_id_token(private_pem, "k1", **overrides), NONCE)
+
+
+async def test_unknown_kid_refetches_jwks_once(
+    google: GoogleStub, openid: GoogleOpenID
+) -> None:
+    # Given - 키 교체 전 JWKS가 캐시됨
+    old_pem, old_jwk = _key_pair("old")
+    new_pem, new_jwk = _key_pair("new")
+    google.keys = [old_jwk]
+    await openid.verify_id_token(_id_token(old_pem, "old"), NONCE)
+
+    # When
+    google.keys = [old_jwk, new_jwk]
+    claims = await openid.verify_id_token(_id_token(new_pem, "new"), NONCE)
+
+    # Then
+    assert claims["sub"] == "1234567890"
+    assert google.requests.count("/oauth2/v3/certs") == 2
+
+    # 서명 키를 찾지 못한 토큰이 반복돼도 JWKS를 계속 받지 않음
+    forged_pem, _ = _key_pair("forged")
+    for _ in range(3):
+        with pytest.raises(InvalidIdToken):
+            await openid.verify_id_token(_id_token(forged_pem, "forged"), NONCE)
+    assert google.requests.count("/oauth2/v3/certs") == 2
+
+
+async def test_refreshes_in_background_before_expiry(
+    google: GoogleStub, openid: GoogleOpenID
+) -> None:
+    # Given - 유지 시간의 80%가 지남
+    private_pem, public_jwk = _key_pair("k1")
+    google.keys = [public_jwk]
+    await openid.verify_id_token(_id_token(private_pem, "k1"), NONCE)
+    now = time.monotonic()
+    openid._jwks = openid._jwks._replace(fetched_at=now - 90, expires_at=now + 10)
+
+    # When - 요청은 캐시된 키로 처리
+    await openid.verify_id_token(_id_token(private_pem, "k1"), NONCE)
+    await openid._refreshes["jwks"]
+
+    # Then
+    assert google.requests.count("/oauth2/v3/certs") == 2
+    assert openid._jwks.expires_at > now + 10000
+
+
+async def test_keeps_cached_keys_when_refresh_fails(
+    google: GoogleStub, openid: GoogleOpenID
+) -> None:
+    # Given - 캐시된 JWKS가 만료됨
+    private_pem, public_jwk = _key_pair("k1")
+    google.keys = [public_jwk]
+    await openid.verify_id_token(_id_token(private_pem, "k1"), NONCE)
+    openid._jwks = openid._jwks._replace(expires_at=time.monotonic() - 1)
+
+    # When - Google 장애
+    google.failing = True
+    claims = await openid.verify_id_token(_id_token(private_pem, "k1"), NONCE)
+
+    # Then
+    assert claims["email"] == "google@example.com"
+    assert openid.fetch_errors["jwks"] == 1
+
+
+def test_cache_lifetime_from_headers() -> None:
+    assert cache_lifetime(httpx.Headers({"Cache-Control": "max-age=600"})) == 600
+    assert (
+        cache_lifetime(httpx.Headers({"Cache-Control": "max-age=600", "Age": "100"}))
+        == 500
+    )
+    assert (
+        cache_lifetime(
+            httpx.Headers(
+                {
+                    "Date": "Mon, 19 Oct 2026 00:00:00 GMT",
+                    "Expires": "Mon, 19 Oct 2026 02:00:00 GMT",
+                }
+            )
+        )
+        == 7200
+    )
+    # 하한 / 헤더 없음
+    assert cache_lifetime(httpx.Headers({"Cache-Control": "no-cache"})) == 60
+    assert cache_lifetime(httpx.Headers({})) == 3600
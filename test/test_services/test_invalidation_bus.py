@@ -0,0 +1,153 @@
+"""
+워커 간 캐시 무효화 버스 테스트
+
+- 워커 2개를 각자의 메모리 캐시 + InvalidationBus(로컬 Postgres LISTEN 연결)로 구성
+- 한 워커가 발행한 태그는 다른 워커의 메모리 캐시에서 제거
+- LISTEN 연결이 끊기면 재연결 후 메모리 캐시 전체를 비움
+- 발행이 멈춘 연결에 막혀도 예외 없이 연결 풀로 발행하거나 메모리 캐시를 비움
+"""
+
+import asyncio
+from typing import Any, Callable, Tuple
+
+import asyncpg
+import pytest
+
+from app.config import settings
+from app.core import invalidation_bus
+from app.core.cache import Cache, MemoryTier, register_publisher, unregister_publisher
+from app.core.invalidation_bus import InvalidationBus
+from app.database import database
+
+TAG = "user:1:decorations"
+
+
+def _loader(value: str) -> Callable[[], Any]:
+    async def loader() -> str:
+        return value
+
+    return loader
+
+
+async def _load(worker: Cache, value: str) -> str:
+    return await worker.get_or_load("probe", "probe:1", [TAG], 60, _loader(value))
+
+
+async def _eventually(condition: Callable[[], bool]) -> None:
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError("condition not met")
+
+
+@pytest.fixture
+async def workers(postgres_available: None, monkeypatch: Any) -> Any:
+    """버스로 연결된 워커 2개의 (캐시, 버스)"""
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_BUS_CHECK_INTERVAL_SECONDS", 0.2)
+    monkeypatch.setattr(invalidation_bus, "_RECONNECT_MIN_SECONDS", 0.05)
+
+    pairs: Tuple[Tuple[Cache, InvalidationBus], ...] = ()
+    for _ in range(2):
+        worker = Cache(MemoryTier(100))
+        bus = InvalidationBus(settings.DATABASE_URL, worker)
+        await bus.start()
+        pairs += ((worker, bus),)
+    try:
+        yield pairs
+    finally:
+        for _, bus in pairs:
+            await bus.stop()
+
+
+async def test_publish_evicts_entry_in_other_worker(workers):
+    (cache_a, bus_a), (cache_b, bus_b) = workers
+    assert cache_a.synchronized and cache_b.synchronized
+    await _load(cache_a, "a-before")
+    await _load(cache_b, "b-before")
+
+    # When - A에서 쓰기 후 무효화 발행
+    cache_a.local.invalidate([TAG])
+    await bus_a.publish([TAG])
+
+    # Then
+    await _eventually(lambda: cache_b.local.get("probe:1", [TAG]) is None)
+    assert await _load(cache_b, "b-after") == "b-after"
+    assert bus_b.received == 1
+    assert bus_a.received == 0  # 자기 이벤트는 무시
+
+
+async def test_reconnect_gap_flushes_local_cache(workers):
+    (cache_a, bus_a), (cache_b, bus_b) = workers
+    await _load(cache_b, "b-before")
+
+    # When - B의 LISTEN 연결이 끊김
+    conn = await asyncpg.connect(settings.DATABASE_URL)
+    try:
+        await conn.execute(
+            "SELECT pg_terminate_backend($1)", bus_b._conn.get_server_pid()
+        )
+    finally:
+        await conn.close()
+
+    # Then - 재연결 후 메모리 캐시가 비어 있고, 이후 이벤트도 다시 수신
+    await _eventually(lambda: bus_b.reconnects == 1 and bus_b.connected.is_set())
+    assert cache_b.local.get("probe:1", [TAG]) is None
+    assert cache_b.synchronized
+
+    await _load(cache_b, "b-reloaded")
+    await bus_a.publish([TAG])
+    await _eventually(lambda: cache_b.local.get("probe:1", [TAG]) is None)
+
+
+class HangingConnection:
+    """응답하지 않는 리스너 연결 (asyncpg처럼 timeout이 지나면 asyncio.TimeoutError)"""
+
+    async def execute(self, query: str, *args: Any, timeout: float) -> None:
+        await asyncio.sleep(timeout)
+        raise asyncio.TimeoutError()
+
+
+async def test_hanging_listener_publishes_via_pool(workers, monkeypatch):
+    (cache_a, bus_a), (cache_b, bus_b) = workers
+    monkeypatch.setattr(invalidation_bus, "_QUERY_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(bus_a, "_conn", HangingConnection())
+    pool = await asyncpg.create_pool(settings.DATABASE_URL, min_size=1, max_size=1)
+    monkeypatch.setattr(database, "pool", pool)
+    await _load(cache_b, "b-before")
+
+    # When
+    try:
+        await bus_a.publish([TAG])
+    finally:
+        await pool.close()
+
+    # Then - 연결 풀로 발행되어 B도 무효화
+    await _eventually(lambda: cache_b.local.get("probe:1", [TAG]) is None)
+    assert bus_a.published == 1
+    assert cache_a.synchronized
+
+
+async def test_failed_publish_does_not_fail_write(workers, monkeypatch):
+    (cache_a, bus_a), _ = workers
+    monkeypatch.setattr(invalidation_bus, "_QUERY_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(bus_a, "_conn", HangingConnection())
+
+    async def pool_down(query: str, values: Any = None) -> None:
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(invalidation_bus, "execute_query", pool_down)
+    await _load(cache_a, "a-before")
+    await cache_a.get_or_load("probe", "probe:2", ["other"], 60, _loader("other"))
+
+    # When - 쓰기가 커밋된 뒤의 무효화 (발행 실패가 요청까지 올라가면 안 됨)
+    register_publisher(bus_a.publish)
+    try:
+        await cache_a.invalidate_tags(TAG)
+    finally:
+        unregister_publisher(bus_a.publish)
+
+    # Then - 메모리 캐시 전체를 비우고 짧은 TTL로 전환
+    assert cache_a.local.get("probe:2", ["other"]) is None
+    assert not cache_a.synchronized
+    assert bus_a.published == 0 and bus_a.flushes == 1
@@ -0,0 +1,56 @@
+"""
+메모리 순위표(RankIndex) 테스트
+
+- 무작위로 점수를 바꾸며 매번 정렬해 구한 순위 / 상위 목록과 비교
+"""
+
+import random
+
+from app.core.ranking import RankIndex
+
+
+def _expected_ranks(scores: dict) -> dict:
+    positive = {uid: score for uid, score in scores.items() if score > 0}
+    return {
+        uid: 1 + sum(1 for other in positive.values() if other > score)
+        for uid, score in positive.items()
+    }
+
+
+def test_rank_and_top_match_sorting() -> None:
+    # Given
+    rng = random.Random(7)
+    index = RankIndex([(1, 3), (2, 0), (3, 3)])
+    scores = {1: 3, 2: 0, 3: 3}
+
+    # When - 점수 증감 (트리 크기를 넘는 점수 포함)
+    for _ in range(5000):
+        uid = rng.randrange(200)
+        delta = rng.choice([1, 1, 1, -1, 7, 150])
+        index.add(uid, delta)
+        scores[uid] = max(scores.get(uid, 0) + delta, 0)
+
+    # Then
+    expected = _expected_ranks(scores)
+    assert len(index) == len(expected)
+    for uid in range(200):
+        assert index.rank(uid) == expected.get(uid)
+
+    ordered = sorted(expected, key=lambda uid: (expected[uid], uid))
+    top = index.top(25)
+    assert [uid for _, uid, _ in top] == ordered[:25]
+    assert all(rank == expected[uid] for rank, uid, _ in top)
+    assert all(score == scores[uid] for _, uid, score in top)
+
+
+def test_ties_share_rank_and_zero_is_unranked() -> None:
+    index = RankIndex([(10, 5), (11, 5), (12, 2), (13, 0)])
+
+    assert index.top(10) == [(1, 10, 5), (1, 11, 5), (3, 12, 2)]
+    assert index.top(1) == [(1, 10, 5)]
+    assert index.rank(12) == 3
+    assert index.rank(13) is None
+
+    index.add(12, -2)
+    assert index.rank(12) is None
+    assert len(index) == 2
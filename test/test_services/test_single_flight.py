@@ -0,0 +1,80 @@
+"""
+single-flight 조회 테스트
+
+- 리포지토리를 호출 횟수를 세는 느린 함수로 대체 (DB 불필요)
+- 동시에 들어온 같은 조회는 한 번만 실행, 끝난 뒤의 호출이나 쓰기 이후의 호출은 새로 실행
+"""
+
+import asyncio
+import time
+from typing import Any, List
+
+import pytest
+
+from app.config import settings
+from app.database import database
+from app.repositories.stamp_repository import StampRepository
+from app.services.stamp_service import StampService
+
+
+@pytest.fixture
+def repository_calls(monkeypatch: Any) -> List[int]:
+    calls: List[int] = []
+
+    async def get_stamp_by_uid(uid: int) -> List[str]:
+        calls.append(uid)
+        stamp = f"stamp-{uid}-{len(calls)}"
+        await asyncio.sleep(0.05)
+        return [stamp]
+
+    monkeypatch.setattr(StampRepository, "get_stamp_by_uid", get_stamp_by_uid)
+    monkeypatch.setattr(database, "_last_write_at", {})
+    # 캐시 없이 single-flight만 확인
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    return calls
+
+
+async def test_concurrent_identical_reads_share_one_query(repository_calls):
+    # When
+    results = await asyncio.gather(
+        *(StampService.get_stamp_by_uid(1) for _ in range(5)),
+        StampService.get_stamp_by_uid(2),
+    )
+    after = await StampService.get_stamp_by_uid(1)
+
+    # Then - uid별 1번씩, 끝난 뒤의 호출은 결과를 재사용하지 않음
+    assert results[:5] == [["stamp-1-1"]] * 5
+    assert results[5] == ["stamp-2-2"]
+    assert after == ["stamp-1-3"]
+    assert repository_calls == [1, 2, 1]
+
+
+async def test_reader_does_not_join_flight_started_before_its_write(
+    repository_calls,
+):
+    # Given - 실행 중인 조회
+    database.bind_session_user(1)
+    first = asyncio.ensure_future(StampService.get_stamp_by_uid(1))
+    await asyncio.sleep(0)
+
+    # When - 그 뒤에 같은 사용자가 쓰기를 하고 다시 조회
+    database._last_write_at[1] = time.monotonic()
+    second = await StampService.get_stamp_by_uid(1)
+
+    # Then
+    assert await first == ["stamp-1-1"]
+    assert second == ["stamp-1-2"]
+
+
+async def test_cancelled_caller_does_not_cancel_shared_query(repository_calls):
+    first = asyncio.ensure_future(StampService.get_stamp_by_uid(1))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(StampService.get_stamp_by_uid(1))
+    await asyncio.sleep(0)
+
+    # When
+    first.cancel()
+
+    # Then
+    assert await second == ["stamp-1-1"]
+    assert repository_calls == [1]